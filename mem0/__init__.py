@@ -4,3 +4,4 @@ __version__ = importlib.metadata.version("mem0_avater")
 
 from mem0.client.main import MemoryClient  # noqa
 from mem0.memory.memory import Memory  # noqa
+from mem0.memory.async_memory import AsyncMemory  # noqa
@@ -0,0 +1 @@
+from mem0.benchmarks.harness import load_demo_workload, run_benchmark, synthetic_workload  # noqa
@@ -0,0 +1,3 @@
+from mem0.benchmarks.harness import main
+
+main()
@@ -0,0 +1,350 @@
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.base.telemetry import telemetry
+from mem0.memory.base.tracing import InMemorySpanExporter
+
+logger = logging.getLogger(__name__)
+
+DEMO_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "demo_data.json")
+
+TARGETS = ("memory", "avater")
+
+_NAMES = ["alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi"]
+_HOBBIES = ["tennis", "golf", "chess", "painting", "hiking", "cooking", "cycling", "piano"]
+_CITIES = ["Paris", "Berlin", "Tokyo", "Lisbon", "Toronto", "Shanghai", "Nairobi", "Lima"]
+_FOODS = ["sushi", "pasta", "dumplings", "tacos", "curry", "paella", "ramen", "falafel"]
+_JOBS = ["a software engineer", "a teacher", "a nurse", "an architect", "a chef", "a designer"]
+_TURNS = [
+    ("I really enjoy {hobby} on weekends.", "That sounds fun, how long have you been into {hobby}?"),
+    ("I moved to {city} last year.", "How are you finding life in {city}?"),
+    ("My favourite food is {food}.", "Good choice, {food} is popular."),
+    ("I work as {job}.", "What do you like most about your job?"),
+    ("I stopped doing {hobby} and started {hobby2} instead.", "Switching to {hobby2} is a nice change."),
+]
+_QUERIES = [
+    "What does {name} do on weekends?",
+    "Where does {name} live?",
+    "What food does {name} like?",
+    "What is {name}'s job?",
+]
+
+
+def load_demo_workload(path=DEMO_DATA_PATH):
+    """
+    Turn the dialogs of `tests/demo_data.json` into add and search calls.
+
+    Every user message and the assistant reply after it form one `add` call; user messages marked
+    `requires_context` also become search queries.
+
+    Returns:
+        list: One dict per dialog with "user_id", "turns" (message lists) and "queries".
+    """
+    if not os.path.exists(path):
+        logger.warning(f"Demo data not found at {path}, skipping it")
+        return []
+    with open(path, encoding="utf-8") as f:
+        dialogs = json.load(f)
+    workload = []
+    for index, dialog in enumerate(dialogs):
+        turns, queries = [], []
+        for position, message in enumerate(dialog):
+            if message["role"] != "user":
+                continue
+            turn = [{"role": "user", "content": message["content"]}]
+            if position + 1 < len(dialog) and dialog[position + 1]["role"] == "assistant":
+                turn.append({"role": "assistant", "content": dialog[position + 1]["content"]})
+            turns.append(turn)
+            if message.get("requires_context"):
+                queries.append(message["content"])
+        workload.append({"user_id": f"demo-{index}", "turns": turns, "queries": queries})
+    return workload
+
+
+def synthetic_workload(conversations=20, turns=5, queries=4, seed=0):
+    """
+    Build reproducible conversations about hobbies, cities, food and jobs.
+
+    Returns:
+        list: One dict per conversation with "user_id", "turns" (message lists) and "queries".
+    """
+    rng = random.Random(seed)
+    workload = []
+    for index in range(conversations):
+        name = f"{rng.choice(_NAMES)}-{index}"
+        values = {
+            "name": name,
+            "hobby": rng.choice(_HOBBIES),
+            "hobby2": rng.choice(_HOBBIES),
+            "city": rng.choice(_CITIES),
+            "food": rng.choice(_FOODS),
+            "job": rng.choice(_JOBS),
+        }
+        conversation = []
+        for _ in range(turns):
+            user, assistant = rng.choice(_TURNS)
+            conversation.append(
+                [
+                    {"role": "user", "content": user.format(**values)},
+                    {"role": "assistant", "content": assistant.format(**values)},
+                ]
+            )
+        workload.append(
+            {
+                "user_id": name,
+                "turns": conversation,
+                "queries": [rng.choice(_QUERIES).format(**values) for _ in range(queries)],
+            }
+        )
+    return workload
+
+
+def build_config(
+    directory, llm_latency=0.0, embedder_latency=0.0, embedding_dims=64, max_workers=None, vector_store="qdrant"
+):
+    """
+    Memory configuration backed by the fake providers, a local Qdrant collection (or the in-process
+    "numpy" store) and SQLite history, all stored under `directory`.
+    """
+    return MemoryConfig(
+        version="v1.1",
+        llm={"provider": "fake", "config": {"latency": llm_latency}},
+        embedder={"provider": "fake", "config": {"latency": embedder_latency, "embedding_dims": embedding_dims}},
+        vector_store={
+            "provider": vector_store,
+            "config": {
+                "collection_name": "benchmark",
+                "embedding_model_dims": embedding_dims,
+                "path": os.path.join(directory, vector_store),
+            },
+        },
+        history_db={"provider": "sqlite", "config": {"db_path": os.path.join(directory, "history.db")}},
+        executor={"shared": False, "max_workers": max_workers},
+        tracing={"enabled": True},
+    )
+
+
+def create_memory(target, config):
+    """
+    Instantiate the benchmarked class. `Memory` needs a profile database on top of `MemoryBase`; when
+    it cannot be created offline, its add/search pipeline is benchmarked through `MemoryBase`.
+    """
+    if target == "avater":
+        from mem0.memory.observation.main import AvaterMemory
+
+        return AvaterMemory(config)
+    try:
+        from mem0.memory.memory import Memory
+
+        return Memory(config)
+    except Exception as e:
+        from mem0.memory.base.base import MemoryBase
+
+        logger.warning(f"Memory could not be created offline ({e}), benchmarking MemoryBase instead")
+        return MemoryBase(config)
+
+
+def percentile(values, q):
+    """Linearly interpolated percentile `q` (0-100) of `values`."""
+    if not values:
+        return None
+    values = sorted(values)
+    rank = (len(values) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def summarize(durations):
+    """
+    Returns:
+        dict: Count, mean and p50/p95/p99 of `durations` (seconds), in milliseconds.
+    """
+    if not durations:
+        return {"count": 0}
+    return {
+        "count": len(durations),
+        "mean_ms": round(sum(durations) / len(durations) * 1000, 3),
+        "p50_ms": round(percentile(durations, 50) * 1000, 3),
+        "p95_ms": round(percentile(durations, 95) * 1000, 3),
+        "p99_ms": round(percentile(durations, 99) * 1000, 3),
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB, or None where `resource` is unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _run_phase(workload, call, concurrency):
+    """Run `call(item, request)` for every request, one conversation per worker, preserving turn order."""
+    durations, errors = [], []
+
+    def run_conversation(item, requests):
+        for request in requests:
+            start = time.perf_counter()
+            try:
+                call(item, request)
+            except Exception as e:
+                errors.append(repr(e))
+                continue
+            durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(run_conversation, item, requests) for item, requests in workload]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    return {
+        "ops": len(durations),
+        "errors": len(errors),
+        "seconds": round(elapsed, 3),
+        "ops_per_sec": round(len(durations) / elapsed, 2) if elapsed else None,
+        "latency": summarize(durations),
+        "first_error": errors[0] if errors else None,
+    }
+
+
+def _stage_latencies(spans):
+    durations = {}
+    pending = [child for span in spans for child in span.children]
+    while pending:
+        span = pending.pop()
+        if span.duration is not None:
+            durations.setdefault(span.name, []).append(span.duration)
+        pending.extend(span.children)
+    return {name: summarize(values) for name, values in sorted(durations.items())}
+
+
+def run_benchmark(target="memory", workload=None, concurrency=1, **config_kwargs):
+    """
+    Replay a workload through one Memory class with the offline fake providers.
+
+    Args:
+        target (str, optional): "memory" or "avater". Defaults to "memory".
+        workload (list, optional): Output of `load_demo_workload` / `synthetic_workload`. Defaults to
+            a small synthetic workload.
+        concurrency (int, optional): Conversations replayed in parallel. The local Qdrant collection is
+            not thread-safe, so with it values above 1 measure contention errors as much as throughput;
+            the "numpy" store is. Defaults to 1.
+        **config_kwargs: Passed to `build_config` (e.g. llm_latency, embedder_latency, vector_store).
+
+    Returns:
+        dict: Throughput and latency of the add and search phases, per-stage latency percentiles and
+            the peak RSS, or a "skipped" reason when the target cannot be created.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"Unsupported benchmark target: {target}. Expected one of {TARGETS}")
+    workload = synthetic_workload() if workload is None else workload
+    # The benchmark must not depend on the network, including the anonymous usage events.
+    telemetry.posthog.disabled = True
+    with tempfile.TemporaryDirectory(prefix="mem0-bench-") as directory:
+        try:
+            memory = create_memory(target, build_config(directory, **config_kwargs))
+        except ImportError as e:
+            return {"target": target, "skipped": f"{type(e).__name__}: {e}"}
+        exporter = InMemorySpanExporter(max_spans=sum(len(item["turns"]) + len(item["queries"]) for item in workload))
+        memory.tracer.add_exporter(exporter)
+        with memory:
+            add = _run_phase(
+                [(item, item["turns"]) for item in workload],
+                lambda item, turn: memory.add(turn, user_id=item["user_id"]),
+                concurrency,
+            )
+            search = _run_phase(
+                [(item, item["queries"]) for item in workload],
+                lambda item, query: memory.search(query, user_id=item["user_id"], limit=5),
+                concurrency,
+            )
+        return {
+            "target": target,
+            "implementation": type(memory).__name__,
+            "conversations": len(workload),
+            "concurrency": concurrency,
+            "add": add,
+            "search": search,
+            "stages": _stage_latencies(exporter.spans),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+
+def format_report(report):
+    if "skipped" in report:
+        return f"[{report['target']}] skipped: {report['skipped']}"
+    lines = [f"[{report['target']}] {report['implementation']}, {report['conversations']} conversations, "
+             f"concurrency {report['concurrency']}, peak RSS {report['peak_rss_mb']} MiB"]
+    header = f"  {'operation':<32} {'count':>7} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    lines.append(header)
+    for name in ("add", "search"):
+        phase = report[name]
+        latency = phase["latency"]
+        lines.append(
+            f"  {name:<32} {phase['ops']:>7} {phase['ops_per_sec'] or 0:>9} {latency.get('p50_ms', '-'):>9} "
+            f"{latency.get('p95_ms', '-'):>9} {latency.get('p99_ms', '-'):>9}"
+        )
+        if phase["errors"]:
+            lines.append(f"    {phase['errors']} errors, first: {phase['first_error']}")
+    for name, stage in report["stages"].items():
+        lines.append(
+            f"  {name:<32} {stage['count']:>7} {'':>9} {stage['p50_ms']:>9} {stage['p95_ms']:>9} {stage['p99_ms']:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark of Memory with fake LLM and embedder.")
+    parser.add_argument("--target", choices=TARGETS + ("all",), default="all")
+    parser.add_argument("--conversations", type=int, default=20, help="Number of synthetic conversations")
+    parser.add_argument("--turns", type=int, default=5, help="Turns per synthetic conversation")
+    parser.add_argument("--queries", type=int, default=4, help="Search queries per synthetic conversation")
+    parser.add_argument("--no-demo", action="store_true", help="Do not replay tests/demo_data.json")
+    parser.add_argument("--demo-path", default=DEMO_DATA_PATH)
+    parser.add_argument("--concurrency", type=int, default=1, help="Conversations replayed in parallel")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Seconds injected per LLM call")
+    parser.add_argument("--embedder-latency", type=float, default=0.0, help="Seconds injected per embedding request")
+    parser.add_argument("--embedding-dims", type=int, default=64)
+    parser.add_argument("--max-workers", type=int, help="Worker threads of the Memory executor")
+    parser.add_argument("--vector-store", choices=("qdrant", "numpy", "hnswlib"), default="qdrant")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="Also write the reports to this JSON file")
+    args = parser.parse_args(argv)
+
+    workload = [] if args.no_demo else load_demo_workload(args.demo_path)
+    workload += synthetic_workload(args.conversations, args.turns, args.queries, args.seed)
+    targets = TARGETS if args.target == "all" else (args.target,)
+    reports = [
+        run_benchmark(
+            target,
+            workload,
+            concurrency=args.concurrency,
+            llm_latency=args.llm_latency,
+            embedder_latency=args.embedder_latency,
+            embedding_dims=args.embedding_dims,
+            max_workers=args.max_workers,
+            vector_store=args.vector_store,
+        )
+        for target in targets
+    ]
+    for report in reports:
+        print(format_report(report))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -7,6 +7,7 @@ from mem0.embeddings.configs import EmbedderConfig
 from mem0.graphs.configs import GraphStoreConfig
 from mem0.database.configs import DBConfig
 from mem0.llms.configs import LlmConfig
+from mem0.rerankers.configs import RerankerConfig
 from mem0.memory.base.setup import mem0_dir
 from mem0.vector_stores.configs import VectorStoreConfig
 
@@ -24,6 +25,112 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class ExecutorConfig(BaseModel):
+    shared: bool = Field(
+        description="Share one process-wide executor between Memory instances with the same settings",
+        default=True,
+    )
+    max_workers: Optional[int] = Field(
+        description="Maximum number of worker threads (defaults to the ThreadPoolExecutor default)",
+        default=None,
+        gt=0,
+    )
+    max_queue_size: Optional[int] = Field(
+        description="Maximum number of pending tasks before submissions block",
+        default=256,
+        gt=0,
+    )
+    llm_concurrency: Optional[int] = Field(description="Maximum concurrent LLM calls", default=None, gt=0)
+    embedder_concurrency: Optional[int] = Field(description="Maximum concurrent embedder calls", default=None, gt=0)
+    vector_store_concurrency: Optional[int] = Field(
+        description="Maximum concurrent vector store calls", default=None, gt=0
+    )
+    graph_concurrency: Optional[int] = Field(description="Maximum concurrent graph store calls", default=None, gt=0)
+    reranker_concurrency: Optional[int] = Field(description="Maximum concurrent reranker calls", default=None, gt=0)
+
+
+class IngestionConfig(BaseModel):
+    max_size: int = Field(description="Maximum number of queued add_async writes", default=1000, gt=0)
+    overflow: Literal["block", "drop_oldest", "reject"] = Field(
+        description="What add_async does when the queue is full", default="block"
+    )
+    block_timeout: Optional[float] = Field(
+        description="Seconds the 'block' policy waits for space before rejecting (None waits forever)", default=None
+    )
+    workers: int = Field(description="Number of worker threads draining the queue", default=2, gt=0)
+    max_retries: int = Field(
+        description="Retries for a write that failed before changing any stored memory", default=3, ge=0
+    )
+    backoff_base: float = Field(description="Delay before the first retry in seconds", default=0.5, ge=0)
+    backoff_max: float = Field(description="Upper bound of the retry delay in seconds", default=30.0, ge=0)
+
+
+class HybridSearchConfig(BaseModel):
+    keyword_weight: float = Field(
+        description="Weight of the keyword ranking in reciprocal-rank fusion; the vector ranking gets the rest",
+        default=0.5,
+        ge=0,
+        le=1,
+    )
+    rrf_k: int = Field(description="Rank constant of reciprocal-rank fusion", default=60, gt=0)
+    candidates: int = Field(
+        description="Hits fetched from each retriever before fusion (at least the search limit)", default=50, gt=0
+    )
+
+
+class RetentionPolicy(BaseModel):
+    max_memories: Optional[int] = Field(
+        description="Maximum number of memories of one user/agent/run partition", default=None, gt=0
+    )
+    ttl: Optional[float] = Field(
+        description="Seconds after its last update before a memory expires", default=None, gt=0
+    )
+    eviction: Literal["least_recently_retrieved", "oldest"] = Field(
+        description="Which memories are evicted first when a partition is over capacity",
+        default="least_recently_retrieved",
+    )
+
+
+class RetentionConfig(BaseModel):
+    default: Optional[RetentionPolicy] = Field(
+        description="Policy of the partitions without a specific policy; no limits when not set", default=None
+    )
+    partitions: Dict[str, RetentionPolicy] = Field(
+        description="Policies keyed by the agent_id of the partition (e.g. 'context', 'observation')",
+        default_factory=dict,
+    )
+    sweep_interval: Optional[float] = Field(
+        description="Seconds between background sweeps of expired memories; no sweeper when not set",
+        default=None,
+        gt=0,
+    )
+
+
+class TracingConfig(BaseModel):
+    enabled: bool = Field(description="Record per-stage timing spans of add and search", default=False)
+    exporters: List[Literal["memory", "jsonl", "otel"]] = Field(
+        description="Where finished traces are sent: in-memory collector, JSON-lines file or OpenTelemetry",
+        default_factory=list,
+    )
+    path: Optional[str] = Field(
+        description="Path of the JSON-lines trace file (defaults to traces.jsonl under mem0_dir)", default=None
+    )
+    include_timings: bool = Field(
+        description="Attach a per-stage timing breakdown to add and search results", default=False
+    )
+
+
+class MetricsConfig(BaseModel):
+    port: Optional[int] = Field(
+        description="Serve Prometheus metrics at http://<host>:<port>/metrics; no endpoint when not set",
+        default=None,
+    )
+    host: str = Field(
+        description="Address the metrics endpoint binds to; '0.0.0.0' exposes it on every interface",
+        default="127.0.0.1",
+    )
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -37,6 +144,14 @@ class MemoryConfig(BaseModel):
         description="Configuration for the embedding model",
         default_factory=EmbedderConfig,
     )
+    reranker: Optional[RerankerConfig] = Field(
+        description="Configuration for reranking search results; disabled when not set",
+        default=None,
+    )
+    hybrid_search: HybridSearchConfig = Field(
+        description="Configuration for search(mode='hybrid')",
+        default_factory=HybridSearchConfig,
+    )
     history_db: DBConfig = Field(
         description="Configuration for the history db",
         default_factory=DBConfig,
@@ -57,6 +172,26 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the memory",
         default=None,
     )
+    executor: ExecutorConfig = Field(
+        description="Configuration for the executor used to fan out memory operations",
+        default_factory=ExecutorConfig,
+    )
+    ingestion: IngestionConfig = Field(
+        description="Configuration for the add_async write-behind queue",
+        default_factory=IngestionConfig,
+    )
+    tracing: TracingConfig = Field(
+        description="Configuration for latency tracing",
+        default_factory=TracingConfig,
+    )
+    retention: RetentionConfig = Field(
+        description="TTL and capacity limits of the memory partitions",
+        default_factory=RetentionConfig,
+    )
+    metrics: MetricsConfig = Field(
+        description="Configuration of the Prometheus metrics endpoint",
+        default_factory=MetricsConfig,
+    )
 
     # TODO
     profile_schema: Optional[str] = Field(
@@ -0,0 +1,17 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CassetteConfig(BaseModel):
+    mode: Literal["record", "replay", "auto"] = Field(
+        description="record: call the provider and store every exchange; replay: serve stored exchanges only "
+        "(a missing one raises CassetteMiss); auto: replay stored exchanges and record missing ones",
+        default="replay",
+    )
+    path: Optional[str] = Field(
+        description="Path of the JSON-lines cassette file (defaults to cassette.jsonl under mem0_dir)", default=None
+    )
+    latency: Literal["recorded", "none"] = Field(
+        description="On replay, wait as long as the recorded call took, or answer immediately", default="none"
+    )
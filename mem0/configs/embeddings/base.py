@@ -20,6 +20,7 @@ class BaseEmbedderConfig(ABC):
         ollama_base_url: Optional[str] = None,
         # Openai specific
         openai_base_url: Optional[str] = None,
+        native_dimensions: Optional[bool] = None,
         # Huggingface specific
         model_kwargs: Optional[dict] = None,
         # AzureOpenAI specific
@@ -27,6 +28,8 @@ class BaseEmbedderConfig(ABC):
         http_client_proxies: Optional[Union[Dict, str]] = None,
         # VertexAI specific
         vertex_credentials_json: Optional[str] = None,
+        # Fake specific
+        latency: float = 0.0,
     ):
         """
         Initializes a configuration class instance for the Embeddings.
@@ -43,19 +46,26 @@ class BaseEmbedderConfig(ABC):
         :type model_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
         :param openai_base_url: Openai base URL to be use, defaults to "https://api.openai.com/v1"
         :type openai_base_url: Optional[str], optional
+        :param native_dimensions: Send `embedding_dims` as the `dimensions` parameter of OpenAI and Azure OpenAI
+            requests, defaults to None which only sends it to text-embedding-3 models
+        :type native_dimensions: Optional[bool], optional
         :param azure_kwargs: key-value arguments for the AzureOpenAI embedding model, defaults a dict inside init
         :type azure_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
         :param http_client_proxies: The proxy server settings used to create self.http_client, defaults to None
         :type http_client_proxies: Optional[Dict | str], optional
+        :param latency: Seconds the fake embedder sleeps per request, defaults to 0
+        :type latency: float, optional
         """
 
         self.model = model
         self.api_key = api_key
         self.openai_base_url = openai_base_url
+        self.native_dimensions = native_dimensions
         self.embedding_dims = embedding_dims
 
         # AzureOpenAI specific
         self.http_client = httpx.Client(proxies=http_client_proxies) if http_client_proxies else None
+        self.http_client_proxies = http_client_proxies
 
         # Ollama specific
         self.ollama_base_url = ollama_base_url
@@ -68,3 +78,6 @@ class BaseEmbedderConfig(ABC):
 
         # VertexAI specific
         self.vertex_credentials_json = vertex_credentials_json
+
+        # Fake specific
+        self.latency = latency
@@ -33,6 +33,8 @@ class BaseLlmConfig(ABC):
         azure_kwargs: Optional[AzureConfig] = {},
         # AzureOpenAI specific
         http_client_proxies: Optional[Union[Dict, str]] = None,
+        # Fake specific
+        latency: float = 0.0,
     ):
         """
         Initializes a configuration class instance for the LLM.
@@ -69,6 +71,8 @@ class BaseLlmConfig(ABC):
         :type azure_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
         :param http_client_proxies: The proxy server(s) settings used to create self.http_client, defaults to None
         :type http_client_proxies: Optional[Dict | str], optional
+        :param latency: Seconds the fake provider sleeps per call, defaults to 0
+        :type latency: float, optional
         """
 
         self.model = model
@@ -80,6 +84,7 @@ class BaseLlmConfig(ABC):
 
         # AzureOpenAI specific
         self.http_client = httpx.Client(proxies=http_client_proxies) if http_client_proxies else None
+        self.http_client_proxies = http_client_proxies
 
         # Openrouter specific
         self.models = models
@@ -94,3 +99,6 @@ class BaseLlmConfig(ABC):
 
         # AzureOpenAI specific
         self.azure_kwargs = AzureConfig(**azure_kwargs) or {}
+
+        # Fake specific
+        self.latency = latency
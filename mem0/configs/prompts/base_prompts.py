@@ -231,3 +231,20 @@ def get_update_memory_messages(retrieved_old_memory_dict, response_content):
 
     Do not return anything except the JSON format.
     """
+
+
+def get_merge_memory_messages(memories):
+    memory_list = "\n".join(f"- {memory}" for memory in memories)
+    return f"""You are a smart memory manager which keeps the memory of a system compact.
+    The following memories about the same person are near-duplicates of each other. Merge them into a single memory that keeps every distinct piece of information, drops repetitions, and resolves contradictions in favour of the most specific statement.
+
+    ```
+    {memory_list}
+    ```
+
+    Write the merged memory in the language of the original memories, as one concise statement of facts.
+    Return only JSON in the following format:
+    {{
+        "memory": "<merged memory>"
+    }}
+    """
@@ -0,0 +1,44 @@
+from abc import ABC
+from typing import Optional
+
+
+class BaseRerankerConfig(ABC):
+    """
+    Config for Rerankers.
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        batch_size: int = 32,
+        device: Optional[str] = None,
+        max_length: Optional[int] = None,
+        # sentence-transformers specific
+        backend: str = "torch",
+        model_kwargs: Optional[dict] = None,
+    ):
+        """
+        Initializes a configuration class instance for the Rerankers.
+
+        :param model: Reranking model to use, defaults to None
+        :type model: Optional[str], optional
+        :param batch_size: Number of (query, document) pairs scored per forward pass, defaults to 32
+        :type batch_size: int, optional
+        :param device: Device the model runs on (e.g. "cpu", "cuda"), defaults to None
+        :type device: Optional[str], optional
+        :param max_length: Maximum number of tokens of a (query, document) pair, defaults to None
+        :type max_length: Optional[int], optional
+        :param backend: Inference backend of the cross-encoder ("torch" or "onnx"), defaults to "torch"
+        :type backend: str, optional
+        :param model_kwargs: key-value arguments for the cross-encoder model, defaults a dict inside init
+        :type model_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
+        """
+
+        self.model = model
+        self.batch_size = batch_size
+        self.device = device
+        self.max_length = max_length
+
+        # sentence-transformers specific
+        self.backend = backend
+        self.model_kwargs = model_kwargs or {}
@@ -111,11 +111,16 @@ class ApproxRetrievalStrategy(BaseRetrievalStrategy):
     except ImportError:
         raise ImportError("The 'elasticsearch' library is required. Please install it using 'pip install elasticsearch'.")
 
+    # Quantized HNSW index types of the dense_vector field.
+    QUANTIZED_INDEX_TYPES = {"int8": "int8_hnsw", "int4": "int4_hnsw", "binary": "bbq_hnsw"}
+
     def __init__(
         self,
         query_model_id: Optional[str] = None,
         hybrid: Optional[bool] = False,
         rrf: Optional[Union[dict, bool]] = True,
+        quantization: Optional[str] = None,
+        rescore_oversample: Optional[float] = None,
     ):
         self.query_model_id = query_model_id
         self.hybrid = hybrid
@@ -125,6 +130,14 @@ class ApproxRetrievalStrategy(BaseRetrievalStrategy):
         # https://www.elastic.co/guide/en/elasticsearch/reference/current/rrf.html
         self.rrf = rrf
 
+        if quantization is not None and quantization not in self.QUANTIZED_INDEX_TYPES:
+            raise ValueError(
+                f"Quantization {quantization} not supported. Expected one of {list(self.QUANTIZED_INDEX_TYPES)}."
+            )
+        self.quantization = quantization
+        # Rescoring re-ranks the oversampled quantized candidates with the original float vectors.
+        self.rescore_oversample = rescore_oversample
+
     def query(
         self,
         query_vector: Union[List[float], None],
@@ -142,6 +155,8 @@ class ApproxRetrievalStrategy(BaseRetrievalStrategy):
             "k": k,
             "num_candidates": fetch_k,
         }
+        if self.quantization and self.rescore_oversample:
+            knn["rescore_vector"] = {"oversample": self.rescore_oversample}
 
         # Embedding provided via the embedding function
         if query_vector is not None and not self.query_model_id:
@@ -221,15 +236,19 @@ class ApproxRetrievalStrategy(BaseRetrievalStrategy):
         else:
             raise ValueError(f"Similarity {similarity} not supported.")
 
+        vector_field = {
+            "type": "dense_vector",
+            "dims": dims_length,
+            "index": True,
+            "similarity": similarityAlgo,
+        }
+        if self.quantization:
+            vector_field["index_options"] = {"type": self.QUANTIZED_INDEX_TYPES[self.quantization]}
+
         return {
             "mappings": {
                 "properties": {
-                    vector_query_field: {
-                        "type": "dense_vector",
-                        "dims": dims_length,
-                        "index": True,
-                        "similarity": similarityAlgo,
-                    },
+                    vector_query_field: vector_field,
                 }
             }
         }
@@ -489,6 +508,13 @@ class ESVectorConfig(BaseModel):
         ApproxRetrievalStrategy(),
         description="Retrieva strategy for search"
     )
+    quantization: Optional[Literal["int8", "int4", "binary"]] = Field(
+        None, description="Index vectors as int8_hnsw, int4_hnsw or bbq_hnsw (approximate strategy only)"
+    )
+    rescore: Optional[bool] = Field(True, description="Rescore quantized candidates with the original vectors")
+    oversampling: Optional[float] = Field(
+        2.0, description="Quantized candidates fetched per requested result before rescoring", ge=1.0
+    )
 
     class Config:
         arbitrary_types_allowed = True
@@ -505,6 +531,8 @@ class ESVectorConfig(BaseModel):
         query_model_id: Optional[str] = None,
         hybrid: Optional[bool] = False,
         rrf: Optional[Union[dict, bool]] = True,
+        quantization: Optional[str] = None,
+        rescore_oversample: Optional[float] = None,
     ) -> "ApproxRetrievalStrategy":
         """Used to perform approximate nearest neighbor search
         using the HNSW algorithm.
@@ -533,9 +561,17 @@ class ESVectorConfig(BaseModel):
                     and `rrf` is False, then rrf is omitted.
                     and isinstance(rrf, dict) is True, then pass in the dict values.
                  rrf could be passed for adjusting 'rank_constant' and 'window_size'.
+            quantization: Optional. "int8", "int4" or "binary" index the vectors
+                          as int8_hnsw, int4_hnsw or bbq_hnsw. Defaults to None.
+            rescore_oversample: Optional. Rescore quantized candidates with the
+                                original vectors, fetching this many per result.
         """
         return ApproxRetrievalStrategy(
-            query_model_id=query_model_id, hybrid=hybrid, rrf=rrf
+            query_model_id=query_model_id,
+            hybrid=hybrid,
+            rrf=rrf,
+            quantization=quantization,
+            rescore_oversample=rescore_oversample,
         )
 
     @staticmethod
@@ -0,0 +1,35 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class HnswlibConfig(BaseModel):
+    collection_name: str = Field("mem0", description="Name of the collection")
+    embedding_model_dims: Optional[int] = Field(1536, description="Dimensions of the embedding model")
+    path: Optional[str] = Field("/tmp/hnswlib", description="Directory holding the index and payload files")
+    on_disk: Optional[bool] = Field(False, description="Persist the collection under `path` across restarts")
+    M: int = Field(16, description="Number of graph neighbours per element", gt=1)
+    ef_construction: int = Field(200, description="Candidate list size while building the graph", gt=0)
+    ef_search: int = Field(64, description="Candidate list size while searching; higher is slower and more exact", gt=0)
+    max_elements: int = Field(10000, description="Initial index capacity; the index grows as needed", gt=0)
+    brute_force_threshold: int = Field(
+        1000, description="Filters selecting at most this many vectors are answered by exact search", ge=0
+    )
+    compaction_threshold: float = Field(
+        0.2, description="Rebuild the index once this fraction of its elements are deleted", gt=0, le=1
+    )
+    maintenance_interval: Optional[float] = Field(
+        60.0, description="Seconds between background snapshots and compactions (None disables them)", gt=0
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
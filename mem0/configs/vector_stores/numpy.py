@@ -0,0 +1,34 @@
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class NumpyConfig(BaseModel):
+    collection_name: str = Field("mem0", description="Name of the collection")
+    embedding_model_dims: Optional[int] = Field(1536, description="Dimensions of the embedding model")
+    path: Optional[str] = Field(None, description="Directory holding the saved collection")
+    on_disk: Optional[bool] = Field(False, description="Load the collection from `path` and snapshot it there")
+    quantization: Optional[Literal["float16", "int8", "binary"]] = Field(
+        None, description="Store vectors as float16, int8 or binary codes (2x, 4x or 32x smaller)"
+    )
+    rescore: Optional[bool] = Field(
+        False, description="Keep float32 originals to rescore quantized candidates (gives back the memory saving)"
+    )
+    oversampling: Optional[float] = Field(
+        2.0, description="Quantized candidates fetched per requested result before rescoring", ge=1.0
+    )
+    save_interval: Optional[float] = Field(
+        60.0, description="Seconds between background snapshots (None snapshots only on flush and close)", gt=0
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
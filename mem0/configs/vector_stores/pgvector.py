@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -12,6 +12,13 @@ class PGVectorConfig(BaseModel):
     host: Optional[str] = Field(None, description="Database host. Default is localhost")
     port: Optional[int] = Field(None, description="Database port. Default is 1536")
     diskann: Optional[bool] = Field(True, description="Use diskann for approximate nearest neighbors search")
+    quantization: Optional[Literal["float16", "binary"]] = Field(
+        None, description="Store vectors as halfvec, or search an HNSW index over their binary quantization"
+    )
+    rescore: Optional[bool] = Field(True, description="Rescore binary quantized candidates with the original vectors")
+    oversampling: Optional[float] = Field(
+        2.0, description="Binary quantized candidates fetched per requested result before rescoring", ge=1.0
+    )
 
     @model_validator(mode="before")
     def check_auth_and_connection(cls, values):
@@ -1,4 +1,4 @@
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -17,6 +17,17 @@ class QdrantConfig(BaseModel):
     url: Optional[str] = Field(None, description="Full URL for Qdrant server")
     api_key: Optional[str] = Field(None, description="API key for Qdrant server")
     on_disk: Optional[bool] = Field(False, description="Enables persistent storage")
+    quantization: Optional[Literal["float16", "int8", "binary"]] = Field(
+        None, description="Store vectors as float16, or search int8 scalar / binary quantized copies kept in RAM"
+    )
+    rescore: Optional[bool] = Field(True, description="Rescore quantized candidates with the original vectors")
+    oversampling: Optional[float] = Field(
+        2.0, description="Quantized candidates fetched per requested result before rescoring", ge=1.0
+    )
+    payload_indexes: Optional[List[str]] = Field(
+        None, description="Metadata fields indexed as keywords in addition to user_id, agent_id and run_id"
+    )
+    is_tenant: Optional[bool] = Field(False, description="Index user_id as a tenant key (Qdrant multitenancy)")
 
     @model_validator(mode="before")
     @classmethod
@@ -15,6 +15,19 @@ class HistoryDBBase(ABC):
     ):
         pass
     
+    def add_history_many(self, entries):
+        """
+        Record several history entries at once.
+
+        Backends should override this to write all entries in a single transaction. The default
+        calls `add_history` once per entry.
+
+        Args:
+            entries (list): Dicts with the keyword arguments of `add_history`.
+        """
+        for entry in entries:
+            self.add_history(**entry)
+
     @abstractmethod
     def get_history(self, memory_id):
         pass
@@ -103,6 +103,37 @@ class Mysql(HistoryDBBase):
             )
         self.conn.commit()
         
+    def add_history_many(self, entries):
+        rows = [
+            (
+                str(uuid.uuid4()),
+                entry["memory_id"],
+                entry.get("old_memory"),
+                entry.get("new_memory"),
+                entry["event"],
+                entry.get("created_at"),
+                entry.get("updated_at"),
+                entry.get("is_deleted", 0),
+            )
+            for entry in entries
+        ]
+        if not rows:
+            return
+        try:
+            with self.conn.cursor() as cursor:
+                cursor.executemany(
+                    """
+                    INSERT INTO mem_history
+                    (id, memory_id, old_memory, new_memory, event, created_at, updated_at, is_deleted)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    """,
+                    rows,
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
     def get_history(self, memory_id):
         with self.conn.cursor(dictionary=True) as cursor:
             cursor.execute(
@@ -8,7 +8,7 @@ except ImportError:
         "The 'sqlite' library is required. "
         "Please install it using 'pip install sqlite'."
     )
-from mem0.history.base import HistoryDBBase
+from mem0.database.history.base import HistoryDBBase
 
 
 class Sqlite(HistoryDBBase):
@@ -133,6 +133,29 @@ class Sqlite(HistoryDBBase):
                 ),
             )
 
+    def add_history_many(self, entries):
+        with self.connection:
+            self.connection.executemany(
+                """
+                INSERT INTO mem_history
+                (id, memory_id, old_memory, new_memory, event, created_at, updated_at, is_deleted)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        str(uuid.uuid4()),
+                        entry["memory_id"],
+                        entry.get("old_memory"),
+                        entry.get("new_memory"),
+                        entry["event"],
+                        entry.get("created_at"),
+                        entry.get("updated_at"),
+                        entry.get("is_deleted", 0),
+                    )
+                    for entry in entries
+                ],
+            )
+
     def get_history(self, memory_id):
         cursor = self.connection.execute(
             """
@@ -1,16 +1,29 @@
 import os
 from typing import Optional
 
-from openai import AzureOpenAI
+import httpx
+from openai import AsyncAzureOpenAI, AzureOpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.openai import dimensions_kwargs, truncate_embeddings
 
 
 class AzureOpenAIEmbedding(EmbeddingBase):
+    """
+    Azure OpenAI embeddings.
+
+    A configured `embedding_dims` is sent as the `dimensions` parameter when `native_dimensions` is
+    set, or when it is unset and `model` names a text-embedding-3 model. As `model` is often a
+    deployment name, set `native_dimensions=True` for text-embedding-3 deployments; otherwise longer
+    vectors are truncated and re-normalized locally.
+    """
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
+        self.request_kwargs = dimensions_kwargs(self.config, self.config.embedding_dims)
+
         api_key = self.config.azure_kwargs.api_key or os.getenv("EMBEDDING_AZURE_OPENAI_API_KEY")
         azure_deployment = self.config.azure_kwargs.azure_deployment or os.getenv("EMBEDDING_AZURE_DEPLOYMENT")
         azure_endpoint = self.config.azure_kwargs.azure_endpoint or os.getenv("EMBEDDING_AZURE_ENDPOINT")
@@ -23,6 +36,22 @@ class AzureOpenAIEmbedding(EmbeddingBase):
             api_key=api_key,
             http_client=self.config.http_client,
         )
+        self.client_kwargs = {
+            "azure_deployment": azure_deployment,
+            "azure_endpoint": azure_endpoint,
+            "api_version": api_version,
+            "api_key": api_key,
+        }
+        self._async_client = None
+
+    @property
+    def async_client(self):
+        """Lazily created AsyncAzureOpenAI client sharing the sync client's credentials."""
+        if self._async_client is None:
+            proxies = self.config.http_client_proxies
+            async_http_client = httpx.AsyncClient(proxies=proxies) if proxies else None
+            self._async_client = AsyncAzureOpenAI(**self.client_kwargs, http_client=async_http_client)
+        return self._async_client
 
     def embed(self, text):
         """
@@ -35,4 +64,67 @@ class AzureOpenAIEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         text = text.replace("\n", " ")
-        return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
+        self._record_call(1)
+        response = self.client.embeddings.create(input=[text], model=self.config.model, **self.request_kwargs)
+        return truncate_embeddings([response.data[0].embedding], self.config.model, self.config.embedding_dims)[0]
+
+    def embed_batch(self, texts):
+        """
+        Get the embeddings for a list of texts using a single Azure OpenAI request.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        self._record_call(len(texts))
+        response = self.client.embeddings.create(input=texts, model=self.config.model, **self.request_kwargs)
+        return truncate_embeddings(
+            [item.embedding for item in sorted(response.data, key=lambda item: item.index)],
+            self.config.model,
+            self.config.embedding_dims,
+        )
+
+    async def aembed(self, text):
+        """
+        Asynchronously get the embedding for the given text using AsyncAzureOpenAI.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            list: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        self._record_call(1)
+        response = await self.async_client.embeddings.create(
+            input=[text], model=self.config.model, **self.request_kwargs
+        )
+        return truncate_embeddings([response.data[0].embedding], self.config.model, self.config.embedding_dims)[0]
+
+    async def aembed_batch(self, texts):
+        """
+        Asynchronously get the embeddings for a list of texts using a single AsyncAzureOpenAI request.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        self._record_call(len(texts))
+        response = await self.async_client.embeddings.create(
+            input=texts, model=self.config.model, **self.request_kwargs
+        )
+        return truncate_embeddings(
+            [item.embedding for item in sorted(response.data, key=lambda item: item.index)],
+            self.config.model,
+            self.config.embedding_dims,
+        )
@@ -1,7 +1,32 @@
+import asyncio
+import math
 from abc import ABC, abstractmethod
 from typing import Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.memory.base import metrics
+
+
+def truncate_embedding(vector, dims):
+    """
+    Keep the first `dims` components of an embedding and re-normalize them to unit length.
+
+    Matryoshka-trained models (such as OpenAI's text-embedding-3 family) put the most important
+    information first, so the prefix is a good embedding on its own. Vectors that are already at
+    most `dims` long are returned unchanged.
+
+    Args:
+        vector (list): The embedding vector.
+        dims (int): Number of dimensions to keep, or None to keep all of them.
+
+    Returns:
+        list: The truncated embedding vector.
+    """
+    if not dims or len(vector) <= dims:
+        return vector
+    head = vector[:dims]
+    norm = math.sqrt(sum(value * value for value in head)) or 1.0
+    return [value / norm for value in head]
 
 
 class EmbeddingBase(ABC):
@@ -29,3 +54,53 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    def embed_batch(self, texts):
+        """
+        Get the embeddings for a list of texts.
+
+        Providers that support multiple inputs per request should override this so that
+        all texts are embedded in a single round trip. The default falls back to one
+        `embed` call per text.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        return [self.embed(text) for text in texts]
+
+    async def aembed(self, text):
+        """
+        Asynchronously get the embedding for the given text.
+
+        Providers with an asyncio-native client override this. The default runs `embed`
+        in a worker thread so the event loop is never blocked.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            list: The embedding vector.
+        """
+        return await asyncio.to_thread(self.embed, text)
+
+    async def aembed_batch(self, texts):
+        """
+        Asynchronously get the embeddings for a list of texts.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        return await asyncio.to_thread(self.embed_batch, texts)
+
+    def _record_call(self, count):
+        """Count one provider request embedding `count` texts in the metrics registry."""
+        provider = getattr(self, "provider", None) or type(self).__name__
+        model = self.config.model or "unknown"
+        metrics.EMBEDDING_CALLS.inc(provider=provider, model=model)
+        metrics.EMBEDDED_TEXTS.inc(count, provider=provider, model=model)
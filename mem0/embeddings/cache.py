@@ -0,0 +1,207 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+
+from mem0.embeddings.base import EmbeddingBase
+from mem0.memory.base import metrics
+from mem0.memory.base.setup import mem0_dir
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding store: a bounded in-memory LRU in front of an optional SQLite file.
+
+    Keys are opaque strings built by `CachedEmbedding`; vectors are stored as float64 arrays on
+    disk so cached values are identical to the ones returned by the provider. The memory tier holds
+    tuples, so a caller mutating its vector cannot corrupt the cache.
+    """
+
+    def __init__(self, max_size=10000, path=None):
+        self.max_size = max_size
+        self.path = path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.connection = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            with self.connection:
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+                )
+
+    def get_many(self, keys):
+        """
+        Look up several keys, promoting disk hits into the memory tier.
+
+        Returns:
+            dict: Mapping of the keys that were found to their vectors, as tuples.
+        """
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+
+            missing = [key for key in dict.fromkeys(keys) if key not in found]
+            if missing and self.connection is not None:
+                placeholders = ", ".join("?" for _ in missing)
+                rows = self.connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", missing
+                ).fetchall()
+                for key, blob in rows:
+                    vector = tuple(array("d", blob))
+                    found[key] = vector
+                    self._put(key, vector)
+                self.disk_hits += len(rows)
+
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        if hits:
+            metrics.CACHE_LOOKUPS.inc(hits, cache="embedding", result="hit")
+        if len(keys) > hits:
+            metrics.CACHE_LOOKUPS.inc(len(keys) - hits, cache="embedding", result="miss")
+        return found
+
+    def set_many(self, items):
+        """
+        Store several (key, vector) pairs in both tiers.
+
+        Args:
+            items (dict): Mapping of keys to vectors.
+        """
+        if not items:
+            return
+        with self._lock:
+            for key, vector in items.items():
+                self._put(key, tuple(vector))
+            if self.connection is not None:
+                with self.connection:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [(key, array("d", vector).tobytes()) for key, vector in items.items()],
+                    )
+
+    def _put(self, key, vector):
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        """
+        Returns:
+            dict: Hit/miss counters and the current size of the memory tier.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+    def clear(self):
+        """Drop every cached embedding from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self.connection is not None:
+                with self.connection:
+                    self.connection.execute("DELETE FROM embeddings")
+
+
+_shared_caches = {}
+_shared_lock = threading.Lock()
+
+
+def get_embedding_cache(config):
+    """
+    Return the process-wide cache for the given EmbeddingCacheConfig, creating it on first use.
+
+    Embedders built from the same settings (e.g. the one used by Memory and the one used by
+    MemoryGraph) share one cache.
+    """
+    path = (config.path or os.path.join(mem0_dir, "embedding_cache.db")) if config.disk else None
+    key = (config.max_size, path)
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = EmbeddingCache(max_size=config.max_size, path=path)
+        return cache
+
+
+class CachedEmbedding(EmbeddingBase):
+    """
+    Wraps any EmbeddingBase and serves repeated texts from an EmbeddingCache.
+
+    Entries are keyed by (provider, model, dims, sha256 of the text), so switching models or
+    dimensions never returns a stale vector.
+    """
+
+    def __init__(self, embedder, cache, provider=None):
+        self.embedder = embedder
+        self.cache = cache
+        self.provider = provider or type(embedder).__name__
+        self.config = embedder.config
+
+    def __getattr__(self, name):
+        return getattr(self.embedder, name)
+
+    def _key(self, text):
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.provider}:{self.config.model}:{self.config.embedding_dims}:{digest}"
+
+    def embed(self, text):
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts):
+        keys = [self._key(text) for text in texts]
+        found = self.cache.get_many(keys)
+        missing = self._missing(texts, keys, found)
+        if missing:
+            vectors = self.embedder.embed_batch(list(missing))
+            computed = {missing[text]: vector for text, vector in zip(missing, vectors)}
+            self.cache.set_many(computed)
+            found.update(computed)
+        # Every caller gets its own list, even for texts repeated within the batch.
+        return [list(found[key]) for key in keys]
+
+    async def aembed(self, text):
+        return (await self.aembed_batch([text]))[0]
+
+    async def aembed_batch(self, texts):
+        keys = [self._key(text) for text in texts]
+        found = self.cache.get_many(keys)
+        missing = self._missing(texts, keys, found)
+        if missing:
+            vectors = await self.embedder.aembed_batch(list(missing))
+            computed = {missing[text]: vector for text, vector in zip(missing, vectors)}
+            self.cache.set_many(computed)
+            found.update(computed)
+        # Every caller gets its own list, even for texts repeated within the batch.
+        return [list(found[key]) for key in keys]
+
+    @staticmethod
+    def _missing(texts, keys, found):
+        missing = {}
+        for text, key in zip(texts, keys):
+            if key not in found and text not in missing:
+                missing[text] = key
+        return missing
+
+    def stats(self):
+        return self.cache.stats()
@@ -0,0 +1,113 @@
+import asyncio
+import base64
+import hashlib
+import time
+from array import array
+
+from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.cassette import CassetteMiss
+
+
+def _encode(vector):
+    return base64.b64encode(array("d", vector).tobytes()).decode("ascii")
+
+
+def _decode(encoded):
+    return array("d", base64.b64decode(encoded)).tolist()
+
+
+class CassetteEmbedding(EmbeddingBase):
+    """
+    Records embeddings to a cassette, or serves them back without reaching the provider.
+
+    Entries are keyed per text by (provider, model, dims, sha256 of the text), like `CachedEmbedding`.
+    Vectors are stored as base64 float64 arrays, which keeps cassettes compact and replays exact.
+    The provider is only built when a text actually has to reach it.
+    """
+
+    def __init__(self, factory, config, cassette, mode="replay", latency="none", provider=None):
+        self._factory = factory
+        self._embedder = None
+        self.config = config
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+        self.provider = provider
+        # Captured before the provider may fill in its defaults, see CassetteLLM.
+        self.model = config.model
+        self.embedding_dims = config.embedding_dims
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            self._embedder = self._factory()
+        return self._embedder
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.embedder, name)
+
+    def _key(self, text):
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"embedding:{self.provider}:{self.model}:{self.embedding_dims}:{digest}"
+
+    def _lookup(self, texts):
+        """
+        Returns:
+            tuple: The keys of `texts`, the recorded entries found for them, and the texts still to embed.
+        """
+        keys = [self._key(text) for text in texts]
+        found = {}
+        if self.mode != "record":
+            for key in keys:
+                entry = self.cassette.get(key)
+                if entry is not None:
+                    found[key] = entry
+        missing = {}
+        for text, key in zip(texts, keys):
+            if key not in found and text not in missing:
+                missing[text] = key
+        if missing and self.mode == "replay":
+            raise CassetteMiss(f"No recorded embedding for {len(missing)} text(s) in {self.cassette.path}")
+        return keys, found, missing
+
+    def _record(self, missing, vectors, latency):
+        # A batch is one provider call; every text in it is stamped with the call's latency.
+        recorded = {}
+        for (text, key), vector in zip(missing.items(), vectors):
+            self.cassette.record(key, _encode(vector), latency)
+            recorded[key] = list(vector)
+        return recorded
+
+    @staticmethod
+    def _replay_delay(found):
+        return max((entry["latency"] for entry in found.values()), default=0.0)
+
+    def embed(self, text):
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts):
+        keys, found, missing = self._lookup(texts)
+        if found and self.latency == "recorded":
+            time.sleep(self._replay_delay(found))
+        vectors = {key: _decode(entry["response"]) for key, entry in found.items()}
+        if missing:
+            started = time.perf_counter()
+            computed = self.embedder.embed_batch(list(missing))
+            vectors.update(self._record(missing, computed, time.perf_counter() - started))
+        return [vectors[key] for key in keys]
+
+    async def aembed(self, text):
+        return (await self.aembed_batch([text]))[0]
+
+    async def aembed_batch(self, texts):
+        keys, found, missing = self._lookup(texts)
+        if found and self.latency == "recorded":
+            await asyncio.sleep(self._replay_delay(found))
+        vectors = {key: _decode(entry["response"]) for key, entry in found.items()}
+        if missing:
+            started = time.perf_counter()
+            computed = await self.embedder.aembed_batch(list(missing))
+            vectors.update(self._record(missing, computed, time.perf_counter() - started))
+        return [vectors[key] for key in keys]
@@ -2,6 +2,16 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from mem0.configs.cassette import CassetteConfig
+
+
+class EmbeddingCacheConfig(BaseModel):
+    max_size: int = Field(description="Maximum number of embeddings kept in the in-memory LRU tier", default=10000, gt=0)
+    disk: bool = Field(description="Also persist embeddings to an on-disk SQLite tier", default=False)
+    path: Optional[str] = Field(
+        description="Path of the SQLite cache file (defaults to embedding_cache.db under mem0_dir)", default=None
+    )
+
 
 class EmbedderConfig(BaseModel):
     provider: str = Field(
@@ -9,11 +19,18 @@ class EmbedderConfig(BaseModel):
         default="openai",
     )
     config: Optional[dict] = Field(description="Configuration for the specific embedding model", default={})
+    cache: Optional[EmbeddingCacheConfig] = Field(
+        description="Cache embeddings by (provider, model, dims, text); disabled when not set", default=None
+    )
+    cassette: Optional[CassetteConfig] = Field(
+        description="Record embedding requests to, or replay them from, a cassette file; disabled when not set",
+        default=None,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
         provider = values.data.get("provider")
-        if provider in ["openai", "ollama", "huggingface", "azure_openai", "gemini", "vertexai"]:
+        if provider in ["openai", "ollama", "huggingface", "azure_openai", "gemini", "vertexai", "fake"]:
             return v
         else:
             raise ValueError(f"Unsupported embedding provider: {provider}")
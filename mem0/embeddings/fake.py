@@ -0,0 +1,63 @@
+import hashlib
+import math
+import time
+from typing import Optional
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.vector_stores.keyword import tokenize
+
+
+class FakeEmbedding(EmbeddingBase):
+    """
+    Deterministic offline embedder for benchmarks and tests. It never touches the network.
+
+    Texts are embedded by hashing their keyword tokens into `embedding_dims` signed buckets, so texts
+    sharing words get similar vectors. Every request sleeps `config.latency` seconds to stand in for
+    the provider round trip.
+    """
+
+    def __init__(self, config: Optional[BaseEmbedderConfig] = None):
+        super().__init__(config)
+
+        self.config.model = self.config.model or "fake"
+        self.config.embedding_dims = self.config.embedding_dims or 64
+
+    def embed(self, text):
+        """
+        Get the embedding for the given text.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            list: The embedding vector.
+        """
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts):
+        """
+        Get the embeddings for a list of texts in one simulated request.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        self._record_call(len(texts))
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        return [self._vector(text) for text in texts]
+
+    def _vector(self, text):
+        dims = self.config.embedding_dims
+        vector = [0.0] * dims
+        for token in tokenize(text) or [text]:
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % dims
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
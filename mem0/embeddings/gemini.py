@@ -26,5 +26,21 @@ class GoogleGenAIEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         text = text.replace("\n", " ")
+        self._record_call(1)
         response = genai.embed_content(model=self.config.model, content=text)
-        return response['embedding']
\ No newline at end of file
+        return response['embedding']
+
+    def embed_batch(self, texts):
+        """
+        Get the embeddings for a list of texts using Google Generative AI.
+        Args:
+            texts (list): The texts to embed.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        self._record_call(len(texts))
+        response = genai.embed_content(model=self.config.model, content=texts)
+        return response['embedding']
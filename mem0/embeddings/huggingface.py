@@ -26,4 +26,20 @@ class HuggingFaceEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
+        self._record_call(1)
         return self.model.encode(text, convert_to_numpy = True).tolist()
+
+    def embed_batch(self, texts):
+        """
+        Get the embeddings for a list of texts using Hugging Face.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        self._record_call(len(texts))
+        return self.model.encode(list(texts), convert_to_numpy=True).tolist()
@@ -49,5 +49,27 @@ class OllamaEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
+        self._record_call(1)
         response = self.client.embeddings(model=self.config.model, prompt=text)
         return response["embedding"]
+
+    def embed_batch(self, texts):
+        """
+        Get the embeddings for a list of texts using Ollama.
+
+        Uses the batch `embed` endpoint when the installed client provides it, and falls back
+        to one request per text for older Ollama clients.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        if not hasattr(self.client, "embed"):
+            return super().embed_batch(texts)
+        self._record_call(len(texts))
+        response = self.client.embed(model=self.config.model, input=list(texts))
+        return response["embeddings"]
@@ -1,22 +1,97 @@
+import logging
 import os
 from typing import Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
-from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.base import EmbeddingBase, truncate_embedding
+
+logger = logging.getLogger(__name__)
+
+_truncation_warned = set()
+
+NATIVE_DIMS = {"text-embedding-3-small": 1536, "text-embedding-3-large": 3072, "text-embedding-ada-002": 1536}
+
+
+def supports_dimensions(model):
+    """Whether the model accepts the `dimensions` request parameter (the text-embedding-3 family)."""
+    return bool(model) and model.startswith("text-embedding-3")
+
+
+def dimensions_kwargs(config, dims):
+    """
+    Request parameters asking the API for `dims`-dimensional embeddings.
+
+    `config.native_dimensions` decides whether `dimensions` is sent; when unset, it is only sent to the
+    text-embedding-3 models, as Azure deployments are named freely and cannot be recognized.
+
+    Args:
+        config (BaseEmbedderConfig): The embedder configuration.
+        dims (int): Requested dimensions, or None to keep the model's own.
+
+    Returns:
+        dict: Keyword arguments for `embeddings.create`.
+    """
+    native = config.native_dimensions
+    if native is None:
+        native = supports_dimensions(config.model)
+    return {"dimensions": dims} if dims and native else {}
+
+
+def truncate_embeddings(vectors, model, dims):
+    """
+    Truncate embeddings to `dims` dimensions, warning once per model that is not known to be
+    Matryoshka-trained, as only those keep their quality.
+
+    Args:
+        vectors (list): The embedding vectors returned by the API.
+        model (str): Model or Azure deployment name.
+        dims (int): Number of dimensions to keep, or None to keep all of them.
+
+    Returns:
+        list: The truncated embedding vectors.
+    """
+    if dims and model not in _truncation_warned and not supports_dimensions(model):
+        if any(len(vector) > dims for vector in vectors):
+            _truncation_warned.add(model)
+            logger.warning(
+                f"Truncating {model} embeddings to {dims} dimensions. Only Matryoshka-trained models such as "
+                "text-embedding-3 keep their quality; text-embedding-ada-002 embeddings degrade. Set "
+                "native_dimensions=True if the model accepts the dimensions parameter."
+            )
+    return [truncate_embedding(vector, dims) for vector in vectors]
 
 
 class OpenAIEmbedding(EmbeddingBase):
+    """
+    OpenAI embeddings.
+
+    A configured `embedding_dims` is sent as the `dimensions` parameter to models that support it (see
+    `native_dimensions`), so the API returns shorter vectors. Longer vectors from other models are truncated and re-normalized
+    locally, which only keeps their quality for Matryoshka-trained models.
+    """
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
         self.config.model = self.config.model or "text-embedding-3-small"
-        self.config.embedding_dims = self.config.embedding_dims or 1536
+        requested_dims = self.config.embedding_dims
+        self.config.embedding_dims = requested_dims or NATIVE_DIMS.get(self.config.model, 1536)
+        self.request_kwargs = dimensions_kwargs(self.config, requested_dims)
 
         api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
         base_url = self.config.openai_base_url or os.getenv("OPENAI_API_BASE")
         self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client_kwargs = {"api_key": api_key, "base_url": base_url}
+        self._async_client = None
+
+    @property
+    def async_client(self):
+        """Lazily created AsyncOpenAI client sharing the sync client's credentials."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self.client_kwargs)
+        return self._async_client
 
     def embed(self, text):
         """
@@ -29,4 +104,67 @@ class OpenAIEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         text = text.replace("\n", " ")
-        return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
+        self._record_call(1)
+        response = self.client.embeddings.create(input=[text], model=self.config.model, **self.request_kwargs)
+        return truncate_embeddings([response.data[0].embedding], self.config.model, self.config.embedding_dims)[0]
+
+    def embed_batch(self, texts):
+        """
+        Get the embeddings for a list of texts using a single OpenAI request.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        self._record_call(len(texts))
+        response = self.client.embeddings.create(input=texts, model=self.config.model, **self.request_kwargs)
+        return truncate_embeddings(
+            [item.embedding for item in sorted(response.data, key=lambda item: item.index)],
+            self.config.model,
+            self.config.embedding_dims,
+        )
+
+    async def aembed(self, text):
+        """
+        Asynchronously get the embedding for the given text using AsyncOpenAI.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            list: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        self._record_call(1)
+        response = await self.async_client.embeddings.create(
+            input=[text], model=self.config.model, **self.request_kwargs
+        )
+        return truncate_embeddings([response.data[0].embedding], self.config.model, self.config.embedding_dims)[0]
+
+    async def aembed_batch(self, texts):
+        """
+        Asynchronously get the embeddings for a list of texts using a single AsyncOpenAI request.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        self._record_call(len(texts))
+        response = await self.async_client.embeddings.create(
+            input=texts, model=self.config.model, **self.request_kwargs
+        )
+        return truncate_embeddings(
+            [item.embedding for item in sorted(response.data, key=lambda item: item.index)],
+            self.config.model,
+            self.config.embedding_dims,
+        )
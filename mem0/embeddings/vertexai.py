@@ -35,6 +35,24 @@ class VertexAIEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
+        self._record_call(1)
         embeddings = self.model.get_embeddings(texts=[text], output_dimensionality=self.config.embedding_dims)
 
         return embeddings[0].values
+
+    def embed_batch(self, texts):
+        """
+        Get the embeddings for a list of texts using Vertex AI.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        self._record_call(len(texts))
+        embeddings = self.model.get_embeddings(texts=list(texts), output_dimensionality=self.config.embedding_dims)
+
+        return [embedding.values for embedding in embeddings]
@@ -61,4 +61,5 @@ class AnthropicLLM(LLMBase):
             params["tool_choice"] = tool_choice
 
         response = self.client.messages.create(**params)
+        self._record_usage(response)
         return response.content[0].text
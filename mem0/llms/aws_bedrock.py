@@ -223,4 +223,5 @@ class AWSBedrockLLM(LLMBase):
                 contentType="application/json",
             )
 
+        self._record_usage(response)
         return self._parse_response(response, tools)
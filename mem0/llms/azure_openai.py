@@ -2,7 +2,8 @@ import json
 import os
 from typing import Dict, List, Optional
 
-from openai import AzureOpenAI
+import httpx
+from openai import AsyncAzureOpenAI, AzureOpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
@@ -21,13 +22,23 @@ class AzureOpenAILLM(LLMBase):
         azure_endpoint = self.config.azure_kwargs.azure_endpoint or os.getenv("LLM_AZURE_ENDPOINT")
         api_version = self.config.azure_kwargs.api_version or os.getenv("LLM_AZURE_API_VERSION")
 
-        self.client = AzureOpenAI(
-            azure_deployment=azure_deployment,
-            azure_endpoint=azure_endpoint,
-            api_version=api_version,
-            api_key=api_key,
-            http_client=self.config.http_client,
-        )
+        self.client_kwargs = {
+            "azure_deployment": azure_deployment,
+            "azure_endpoint": azure_endpoint,
+            "api_version": api_version,
+            "api_key": api_key,
+        }
+        self.client = AzureOpenAI(**self.client_kwargs, http_client=self.config.http_client)
+        self._async_client = None
+
+    @property
+    def async_client(self):
+        """Lazily created AsyncAzureOpenAI client sharing the sync client's credentials."""
+        if self._async_client is None:
+            proxies = self.config.http_client_proxies
+            async_http_client = httpx.AsyncClient(proxies=proxies) if proxies else None
+            self._async_client = AsyncAzureOpenAI(**self.client_kwargs, http_client=async_http_client)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -59,6 +70,21 @@ class AzureOpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
+    def _get_params(self, messages, response_format=None, tools=None, tool_choice="auto"):
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+        if response_format:
+            params["response_format"] = response_format
+        if tools:  # TODO: Remove tools if no issues found with new memory addition logic
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -78,18 +104,31 @@ class AzureOpenAILLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "top_p": self.config.top_p,
-        }
-        if response_format:
-            params["response_format"] = response_format
-        if tools:  # TODO: Remove tools if no issues found with new memory addition logic
-            params["tools"] = tools
-            params["tool_choice"] = tool_choice
-
+        params = self._get_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
+        self._record_usage(response)
+        return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Asynchronously generate a response based on the given messages using AsyncAzureOpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._get_params(messages, response_format, tools, tool_choice)
+        response = await self.async_client.chat.completions.create(**params)
+        self._record_usage(response)
         return self._parse_response(response, tools)
@@ -1,7 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
 from mem0.configs.llms.base import BaseLlmConfig
+from mem0.memory.base import metrics, tracing
 
 
 class LLMBase(ABC):
@@ -28,3 +30,35 @@ class LLMBase(ABC):
             str: The generated response.
         """
         pass
+
+    async def agenerate_response(self, messages, **kwargs):
+        """
+        Asynchronously generate a response based on the given messages.
+
+        Providers with an asyncio-native client override this. The default runs
+        `generate_response` in a worker thread so the event loop is never blocked.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+
+        Returns:
+            str: The generated response.
+        """
+        return await asyncio.to_thread(self.generate_response, messages=messages, **kwargs)
+
+    def _record_usage(self, response):
+        """
+        Count one provider call in the metrics registry, and add the token usage reported by the
+        response (OpenAI-style prompt/completion or Anthropic-style input/output tokens) to the
+        metrics and to the current trace span.
+        """
+        provider = getattr(self, "provider", None) or type(self).__name__
+        model = self.config.model or "unknown"
+        metrics.LLM_CALLS.inc(provider=provider, model=model)
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", getattr(usage, "input_tokens", None))
+        completion_tokens = getattr(usage, "completion_tokens", getattr(usage, "output_tokens", None))
+        if isinstance(prompt_tokens, int) and isinstance(completion_tokens, int):
+            metrics.LLM_TOKENS.inc(prompt_tokens, provider=provider, model=model, type="prompt")
+            metrics.LLM_TOKENS.inc(completion_tokens, provider=provider, model=model, type="completion")
+            tracing.record_llm_usage(prompt_tokens, completion_tokens, model=self.config.model)
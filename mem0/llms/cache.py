@@ -0,0 +1,251 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+
+from mem0.llms.base import LLMBase
+from mem0.memory.base import metrics
+from mem0.memory.base.setup import mem0_dir
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LlmCacheBackend:
+    """Base class for LLM response stores. Tracks hit/miss counters for every backend."""
+
+    def __init__(self, max_size=1000, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Returns:
+            The cached response, or `_MISSING` if absent or expired.
+        """
+        with self._lock:
+            value = self._get(key, time.time())
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        metrics.CACHE_LOOKUPS.inc(cache="llm", result="miss" if value is _MISSING else "hit")
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            expires_at = time.time() + self.ttl if self.ttl else None
+            self._set(key, value, expires_at)
+
+    def _get(self, key, now):
+        raise NotImplementedError
+
+    def _set(self, key, value, expires_at):
+        raise NotImplementedError
+
+    def size(self):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self):
+        """
+        Returns:
+            dict: Hit/miss counters, hit ratio and number of stored responses.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "size": self.size(),
+        }
+
+
+class InMemoryLlmCache(LlmCacheBackend):
+    """In-process LRU store with per-entry expiry."""
+
+    def __init__(self, max_size=1000, ttl=None):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self._entries = OrderedDict()
+
+    def _get(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return deepcopy(value)
+
+    def _set(self, key, value, expires_at):
+        self._entries[key] = (deepcopy(value), expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def size(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteLlmCache(LlmCacheBackend):
+    """
+    SQLite store shared across processes. Responses must be JSON serializable; others are not cached.
+    """
+
+    def __init__(self, path, max_size=1000, ttl=None):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+
+    def _get(self, key, now):
+        row = self.connection.execute("SELECT value, expires_at FROM llm_responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return _MISSING
+        value, expires_at = row
+        with self.connection:
+            if expires_at is not None and expires_at <= now:
+                self.connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return _MISSING
+            self.connection.execute("UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+
+    def _set(self, key, value, expires_at):
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug("Skipping LLM cache write for a response that is not JSON serializable")
+            return
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, serialized, expires_at, time.time()),
+            )
+            self.connection.execute(
+                """
+                DELETE FROM llm_responses WHERE key IN (
+                    SELECT key FROM llm_responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_size,),
+            )
+
+    def size(self):
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM llm_responses")
+
+
+_shared_caches = {}
+_shared_lock = threading.Lock()
+
+
+def get_llm_cache(config):
+    """
+    Return the process-wide cache backend for the given LlmCacheConfig, creating it on first use.
+    """
+    path = (config.path or os.path.join(mem0_dir, "llm_cache.db")) if config.backend == "sqlite" else None
+    key = (config.backend, config.max_size, config.ttl, path)
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            if config.backend == "sqlite":
+                cache = SqliteLlmCache(path, max_size=config.max_size, ttl=config.ttl)
+            else:
+                cache = InMemoryLlmCache(max_size=config.max_size, ttl=config.ttl)
+            _shared_caches[key] = cache
+        return cache
+
+
+def _json_default(obj):
+    if isinstance(obj, type) and hasattr(obj, "model_json_schema"):
+        return {"__schema__": obj.__name__, "schema": obj.model_json_schema()}
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return repr(obj)
+
+
+class CachedLLM(LLMBase):
+    """
+    Wraps any LLMBase and replays responses of deterministic (temperature=0) calls.
+
+    Entries are keyed by a sha256 of (provider, model, messages, tools, tool_choice, response_format)
+    and any other keyword arguments. Calls with a non-zero temperature always reach the provider.
+    """
+
+    def __init__(self, llm, cache, provider=None):
+        self.llm = llm
+        self.cache = cache
+        self.provider = provider or type(llm).__name__
+        self.config = llm.config
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
+
+    def _key(self, messages, kwargs):
+        payload = {
+            "provider": self.provider,
+            "model": self.config.model,
+            "max_tokens": getattr(self.config, "max_tokens", None),
+            "messages": messages,
+            **kwargs,
+        }
+        serialized = json.dumps(payload, sort_keys=True, default=_json_default)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _cacheable(self):
+        return not self.config.temperature
+
+    def generate_response(self, messages, **kwargs):
+        if not self._cacheable():
+            return self.llm.generate_response(messages=messages, **kwargs)
+        key = self._key(messages, kwargs)
+        response = self.cache.get(key)
+        if response is _MISSING:
+            response = self.llm.generate_response(messages=messages, **kwargs)
+            self.cache.set(key, response)
+        return response
+
+    async def agenerate_response(self, messages, **kwargs):
+        if not self._cacheable():
+            return await self.llm.agenerate_response(messages=messages, **kwargs)
+        key = self._key(messages, kwargs)
+        response = self.cache.get(key)
+        if response is _MISSING:
+            response = await self.llm.agenerate_response(messages=messages, **kwargs)
+            self.cache.set(key, response)
+        return response
+
+    def stats(self):
+        return self.cache.stats()
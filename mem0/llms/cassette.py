@@ -0,0 +1,93 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+from mem0.llms.base import LLMBase
+from mem0.llms.cache import _json_default
+from mem0.utils.cassette import CassetteMiss
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteLLM(LLMBase):
+    """
+    Records LLM exchanges to a cassette, or serves them back without reaching the provider.
+
+    Entries are keyed by a sha256 of (provider, model, max_tokens, messages) and every keyword argument,
+    so tool calls made by MemoryGraph replay as faithfully as plain completions. The provider is only
+    built when a request actually has to reach it, so a full replay needs no credentials.
+    """
+
+    def __init__(self, factory, config, cassette, mode="replay", latency="none", provider=None):
+        self._factory = factory
+        self._llm = None
+        self.config = config
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+        self.provider = provider
+        # Providers fill in a default model when they are built; key on the configured one so
+        # recordings and replays agree whether or not the provider was ever constructed.
+        self.model = config.model
+
+    @property
+    def llm(self):
+        if self._llm is None:
+            self._llm = self._factory()
+        return self._llm
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def _key(self, messages, kwargs):
+        payload = {
+            "provider": self.provider,
+            "model": self.model,
+            "max_tokens": getattr(self.config, "max_tokens", None),
+            "messages": messages,
+            **kwargs,
+        }
+        serialized = json.dumps(payload, sort_keys=True, default=_json_default)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key):
+        if self.mode == "record":
+            return None
+        entry = self.cassette.get(key)
+        if entry is None and self.mode == "replay":
+            raise CassetteMiss(f"No recorded LLM response for request {key} in {self.cassette.path}")
+        return entry
+
+    def _record(self, key, response, latency):
+        try:
+            self.cassette.record(key, response, latency)
+        except (TypeError, ValueError):
+            logger.warning("Skipping cassette write for an LLM response that is not JSON serializable")
+
+    def generate_response(self, messages, **kwargs):
+        key = self._key(messages, kwargs)
+        entry = self._lookup(key)
+        if entry is not None:
+            if self.latency == "recorded":
+                time.sleep(entry["latency"])
+            return entry["response"]
+        started = time.perf_counter()
+        response = self.llm.generate_response(messages=messages, **kwargs)
+        self._record(key, response, time.perf_counter() - started)
+        return response
+
+    async def agenerate_response(self, messages, **kwargs):
+        key = self._key(messages, kwargs)
+        entry = self._lookup(key)
+        if entry is not None:
+            if self.latency == "recorded":
+                await asyncio.sleep(entry["latency"])
+            return entry["response"]
+        started = time.perf_counter()
+        response = await self.llm.agenerate_response(messages=messages, **kwargs)
+        self._record(key, response, time.perf_counter() - started)
+        return response
@@ -1,11 +1,29 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from mem0.configs.cassette import CassetteConfig
+
+
+class LlmCacheConfig(BaseModel):
+    backend: Literal["memory", "sqlite"] = Field(description="Where cached responses are stored", default="memory")
+    max_size: int = Field(description="Maximum number of cached responses", default=1000, gt=0)
+    ttl: Optional[float] = Field(description="Seconds a cached response stays valid (None keeps it forever)", default=3600)
+    path: Optional[str] = Field(
+        description="Path of the SQLite cache file (defaults to llm_cache.db under mem0_dir)", default=None
+    )
+
 
 class LlmConfig(BaseModel):
     provider: str = Field(description="Provider of the LLM (e.g., 'ollama', 'openai')", default="openai")
     config: Optional[dict] = Field(description="Configuration for the specific LLM", default={})
+    cache: Optional[LlmCacheConfig] = Field(
+        description="Cache responses of temperature=0 calls; disabled when not set", default=None
+    )
+    cassette: Optional[CassetteConfig] = Field(
+        description="Record LLM requests to, or replay them from, a cassette file; disabled when not set",
+        default=None,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -20,6 +38,7 @@ class LlmConfig(BaseModel):
             "azure_openai",
             "openai_structured",
             "azure_openai_structured",
+            "fake",
         ):
             return v
         else:
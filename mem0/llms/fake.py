@@ -0,0 +1,104 @@
+import ast
+import json
+import re
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.base import LLMBase
+from mem0.vector_stores.keyword import tokenize
+
+_SENTENCE_RE = re.compile(r"[^.!?。！？\n]+")
+_OLD_MEMORY_RE = re.compile(r"\n\s*``\n\s*(.*?)\n\s*``\n", re.DOTALL)
+_NEW_FACTS_RE = re.compile(r"```\n\s*(.*?)\n\s*```", re.DOTALL)
+
+
+class FakeLLM(LLMBase):
+    """
+    Deterministic offline LLM for benchmarks and tests. It never touches the network.
+
+    Fact extraction returns the sentences of the user turns, and the memory update step returns ADD for
+    new facts, NONE for facts already stored and UPDATE for facts sharing most of their words with a
+    stored memory. Every call sleeps `config.latency` seconds to stand in for the provider round trip.
+    """
+
+    def __init__(self, config: Optional[BaseLlmConfig] = None):
+        super().__init__(config)
+
+        if not self.config.model:
+            self.config.model = "fake"
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a deterministic response for the given messages.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str or dict: The generated response, or a dict without tool calls when tools are given.
+        """
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        prompt = messages[-1]["content"]
+        if tools:
+            response = {"content": None, "tool_calls": []}
+        elif prompt.startswith("Input:"):
+            response = json.dumps({"facts": self._extract_facts(prompt)}, ensure_ascii=False)
+        elif _NEW_FACTS_RE.search(prompt) and _OLD_MEMORY_RE.search(prompt):
+            response = json.dumps({"memory": self._update_memory(prompt)}, ensure_ascii=False)
+        else:
+            response = prompt.strip().splitlines()[-1] if prompt.strip() else ""
+        usage = SimpleNamespace(
+            prompt_tokens=sum(len(message["content"]) for message in messages) // 4,
+            completion_tokens=len(str(response)) // 4,
+        )
+        self._record_usage(SimpleNamespace(usage=usage))
+        return response
+
+    @staticmethod
+    def _extract_facts(prompt):
+        facts = []
+        for line in prompt[len("Input:"):].splitlines():
+            line = line.strip()
+            if not line.startswith("user:"):
+                continue
+            for sentence in _SENTENCE_RE.findall(line[len("user:"):]):
+                sentence = sentence.strip(" ,;:，；：")
+                if sentence and sentence not in facts:
+                    facts.append(sentence)
+        return facts
+
+    @staticmethod
+    def _update_memory(prompt):
+        old_memories = ast.literal_eval(_OLD_MEMORY_RE.search(prompt).group(1))
+        new_facts = ast.literal_eval(_NEW_FACTS_RE.findall(prompt)[-1])
+        old_tokens = {memory["id"]: set(tokenize(memory["text"])) for memory in old_memories}
+        actions = []
+        for fact in new_facts:
+            match = next((memory for memory in old_memories if memory["text"] == fact), None)
+            if match is not None:
+                actions.append({"id": match["id"], "text": fact, "event": "NONE"})
+                continue
+            tokens = set(tokenize(fact))
+            similar = None
+            for memory in old_memories:
+                overlap = tokens & old_tokens[memory["id"]]
+                if tokens and len(overlap) / len(tokens | old_tokens[memory["id"]]) >= 0.5:
+                    similar = memory
+                    break
+            if similar is not None:
+                actions.append({"id": similar["id"], "text": fact, "event": "UPDATE", "old_memory": similar["text"]})
+            else:
+                actions.append({"id": str(len(old_memories) + len(actions)), "text": fact, "event": "ADD"})
+        return actions
@@ -83,4 +83,5 @@ class LiteLLM(LLMBase):
             params["tool_choice"] = tool_choice
 
         response = litellm.completion(**params)
+        self._record_usage(response)
         return self._parse_response(response, tools)
@@ -91,4 +91,5 @@ class OllamaLLM(LLMBase):
             params["tools"] = tools
 
         response = self.client.chat(**params)
+        self._record_usage(response)
         return self._parse_response(response, tools)
@@ -2,7 +2,7 @@ import json
 import os
 from typing import Dict, List, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
@@ -16,14 +16,25 @@ class OpenAILLM(LLMBase):
             self.config.model = "gpt-4o-mini"
 
         if os.environ.get("OPENROUTER_API_KEY"):  # Use OpenRouter
-            self.client = OpenAI(
-                api_key=os.environ.get("OPENROUTER_API_KEY"),
-                base_url=self.config.openrouter_base_url or os.getenv("OPENROUTER_API_BASE") or "https://openrouter.ai/api/v1",
-            )
+            self.client_kwargs = {
+                "api_key": os.environ.get("OPENROUTER_API_KEY"),
+                "base_url": self.config.openrouter_base_url
+                or os.getenv("OPENROUTER_API_BASE")
+                or "https://openrouter.ai/api/v1",
+            }
         else:
             api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
             base_url = self.config.openai_base_url or os.getenv("OPENAI_API_BASE") or "https://api.openai.com/v1"
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
+            self.client_kwargs = {"api_key": api_key, "base_url": base_url}
+        self.client = OpenAI(**self.client_kwargs)
+        self._async_client = None
+
+    @property
+    def async_client(self):
+        """Lazily created AsyncOpenAI client sharing the sync client's credentials."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self.client_kwargs)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -55,25 +66,7 @@ class OpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-    ):
-        """
-        Generate a response based on the given messages using OpenAI.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-
-        Returns:
-            str: The generated response.
-        """
+    def _get_params(self, messages, response_format=None, tools=None, tool_choice="auto"):
         params = {
             "model": self.config.model,
             "messages": messages,
@@ -103,6 +96,52 @@ class OpenAILLM(LLMBase):
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
+        return params
 
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._get_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
+        self._record_usage(response)
+        return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Asynchronously generate a response based on the given messages using AsyncOpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._get_params(messages, response_format, tools, tool_choice)
+        response = await self.async_client.chat.completions.create(**params)
+        self._record_usage(response)
         return self._parse_response(response, tools)
@@ -83,5 +83,6 @@ class OpenAIStructuredLLM(LLMBase):
             params["tool_choice"] = tool_choice
 
         response = self.client.beta.chat.completions.parse(**params)
+        self._record_usage(response)
 
         return self._parse_response(response, tools)
@@ -1 +1,4 @@
-from .memory import Memory
\ No newline at end of file
+from .memory import Memory
+from .async_memory import AsyncMemory
+
+__all__ = ["Memory", "AsyncMemory"]
@@ -0,0 +1,550 @@
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import warnings
+from datetime import datetime
+
+import pytz
+
+from mem0.configs.base import MemoryConfig
+from mem0.configs.prompts.base_prompts import get_update_memory_messages
+from mem0.memory.base import tracing
+from mem0.memory.base.base import MemoryBase
+from mem0.memory.base.ingest import mark_write_started
+from mem0.memory.base.telemetry import capture_event
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMemory(MemoryBase):
+    """
+    asyncio-native counterpart of `MemoryBase`.
+
+    The memory operations are coroutines. LLM, embedding and vector store calls go through the
+    providers' async methods (`agenerate_response`, `aembed`, `asearch`, ...), which use
+    asyncio-native clients where the provider has one and a worker thread otherwise. Vector
+    store and graph work is fanned out with `asyncio.gather` instead of a per-call thread pool.
+    The batch operations (`add_many`, `delete_all`, `compact`, `iter_all`, `sweep`, `reset`) run
+    the `MemoryBase` implementation in a worker thread.
+
+    `add_async`, `flush`, `close` and `ingestion_stats` stay synchronous. `flush` and `close` block
+    until queued writes finish, and so does `add_async` under the "block" overflow policy when the
+    queue is full; inside a running event loop call them through `asyncio.to_thread`.
+    """
+
+    def __init__(self, config: MemoryConfig = MemoryConfig()):
+        super().__init__(config)
+        self._ingest_loop = None
+        self._ingest_loop_thread = None
+
+    async def add(
+        self,
+        messages,
+        user_id=None,
+        agent_id=None,
+        run_id=None,
+        metadata=None,
+        filters=None,
+        prompt=None,
+    ):
+        """
+        Create a new memory.
+
+        Args:
+            messages (str or List[Dict[str, str]]): Messages to store in the memory.
+            user_id (str, optional): ID of the user creating the memory. Defaults to None.
+            agent_id (str, optional): ID of the agent creating the memory. Defaults to None.
+            run_id (str, optional): ID of the run creating the memory. Defaults to None.
+            metadata (dict, optional): Metadata to store with the memory. Defaults to None.
+            filters (dict, optional): Filters to apply to the search. Defaults to None.
+            prompt (str, optional): Prompt to use for memory deduction. Defaults to None.
+
+        Returns:
+            dict: A dictionary containing the result of the memory addition operation.
+        """
+        messages, metadata, filters = self._prepare_add(messages, user_id, agent_id, run_id, metadata, filters)
+
+        with self.tracer.trace("add", version=self.version) as trace:
+            vector_store_result, graph_result = await asyncio.gather(
+                self._add_to_vector_store(messages, metadata, filters),
+                asyncio.to_thread(self._add_to_graph, messages, filters),
+            )
+
+        if self.version == "v1.1":
+            return self._with_timings(
+                {
+                    "results": vector_store_result,
+                    "relations": graph_result,
+                },
+                trace,
+            )
+        else:
+            warnings.warn(
+                "The current add API output format is deprecated. "
+                "To use the latest format, set `api_version='v1.1'`. "
+                "The current format will be removed in mem0ai 1.1.0 and later versions.",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+            return {"message": "ok"}
+
+    def _ingest(self, *args, **kwargs):
+        # add_async workers are plain threads; they hand their writes to one long-lived event loop. The
+        # task inherits the worker's context, so the queue still sees which stage a write failed in.
+        return asyncio.run_coroutine_threadsafe(self.add(*args, **kwargs), self._get_ingest_loop()).result()
+
+    def _get_ingest_loop(self):
+        with self._ingestion_lock:
+            if self._ingest_loop is None:
+                self._ingest_loop = asyncio.new_event_loop()
+                self._ingest_loop_thread = threading.Thread(
+                    target=self._run_ingest_loop, args=(self._ingest_loop,), name="mem0-ingest-loop", daemon=True
+                )
+                self._ingest_loop_thread.start()
+            return self._ingest_loop
+
+    @staticmethod
+    def _run_ingest_loop(loop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def close(self, wait=True):
+        """
+        Drain the add_async queue, stop the event loop its writes run on and release what
+        `MemoryBase.close` releases.
+
+        Args:
+            wait (bool, optional): Wait for queued and in-flight work to finish. Defaults to True.
+        """
+        super().close(wait=wait)
+        with self._ingestion_lock:
+            loop, self._ingest_loop = self._ingest_loop, None
+            thread, self._ingest_loop_thread = self._ingest_loop_thread, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+    async def _add_to_vector_store(self, messages, metadata, filters):
+        with tracing.span("llm.extract_facts", stage="llm"):
+            response = await self.llm.agenerate_response(
+                messages=self._get_fact_extraction_messages(messages),
+                response_format={"type": "json_object"},
+            )
+        new_retrieved_facts = await self._adrop_known_facts(self._parse_facts(response), filters)
+        if not new_retrieved_facts:
+            capture_event("mem0.add", self)
+            return []
+
+        with tracing.span("embedder.embed_batch", stage="embedder", count=len(new_retrieved_facts)):
+            new_message_embeddings = dict(
+                zip(new_retrieved_facts, await self.embedding_model.aembed_batch(new_retrieved_facts))
+            )
+        with tracing.span("vector_store.search_batch", stage="vector_store", count=len(new_retrieved_facts)):
+            existing_memories_per_fact = await self.vector_store.asearch_batch(
+                queries=[new_message_embeddings[new_mem] for new_mem in new_retrieved_facts],
+                limit=5,
+                filters=filters,
+            )
+        retrieved_old_memory = self._collect_old_memories(existing_memories_per_fact)
+
+        function_calling_prompt = get_update_memory_messages(retrieved_old_memory, new_retrieved_facts)
+        with tracing.span("llm.update_memory", stage="llm"):
+            new_memories_with_actions = await self.llm.agenerate_response(
+                messages=[{"role": "user", "content": function_calling_prompt}],
+                response_format={"type": "json_object"},
+            )
+        new_memories_with_actions = json.loads(new_memories_with_actions)
+        await self._aembed_missing(new_memories_with_actions.get("memory", []), new_message_embeddings)
+
+        known_memories = {mem.id: mem for existing_memories in existing_memories_per_fact for mem in existing_memories}
+        returned_memories = await self._aapply_memory_actions(
+            new_memories_with_actions.get("memory", []),
+            new_message_embeddings,
+            metadata,
+            known_memories=known_memories,
+        )
+
+        capture_event("mem0.add", self)
+
+        return returned_memories
+
+    async def _aapply_memory_actions(
+        self, actions, existing_embeddings, metadata, known_memories=None, id_mapping=None, include_ids=False
+    ):
+        """
+        Async counterpart of `MemoryBase._apply_memory_actions`: one insert, one batch update and one
+        batch delete, recorded with a single history write. Missing UPDATE and DELETE targets are
+        fetched concurrently.
+        """
+        known_memories = dict(known_memories or {})
+        missing = self._missing_targets(actions, known_memories, id_mapping)
+        if missing:
+            with tracing.span("vector_store.get", stage="vector_store", count=len(missing)):
+                fetched = await asyncio.gather(
+                    *(self.vector_store.aget(vector_id=memory_id) for memory_id in missing), return_exceptions=True
+                )
+            for memory_id, memory in zip(missing, fetched):
+                if isinstance(memory, Exception):
+                    logging.error(f"Error fetching memory {memory_id} for new_memories_with_actions: {memory}")
+                else:
+                    known_memories[memory_id] = memory
+        groups, applied = self._plan_memory_actions(
+            actions, existing_embeddings, metadata, known_memories, id_mapping, include_ids
+        )
+
+        if any(groups.values()):
+            mark_write_started()
+        failed = set()
+        for event, changes in groups.items():
+            if not changes:
+                continue
+            try:
+                with tracing.span(f"vector_store.{event.lower()}", stage="vector_store", count=len(changes)):
+                    await self._awrite_memory_changes(event, changes)
+            except Exception as e:
+                logging.error(f"Error in new_memories_with_actions: {e}")
+                failed.update(id(change) for change in changes)
+
+        applied = self._record_applied(applied, failed)
+        if applied:
+            try:
+                with tracing.span("history.add_history_many"):
+                    await asyncio.to_thread(self.db.add_history_many, [change["history"] for change in applied])
+            except Exception as e:
+                logging.error(f"Error recording history of new_memories_with_actions: {e}")
+        added = [change["payload"] for change in groups["ADD"] if id(change) not in failed]
+        if added:
+            await asyncio.to_thread(self._enforce_retention, added)
+        return [change["result"] for change in applied]
+
+    async def _awrite_memory_changes(self, event, changes):
+        if event == "ADD":
+            await self.vector_store.ainsert(
+                vectors=[change["vector"] for change in changes],
+                ids=[change["id"] for change in changes],
+                payloads=[change["payload"] for change in changes],
+            )
+        elif event == "UPDATE":
+            await self.vector_store.aupdate_batch(
+                [change["id"] for change in changes],
+                vectors=[change["vector"] for change in changes],
+                payloads=[change["payload"] for change in changes],
+            )
+        else:
+            await self.vector_store.adelete_batch([change["id"] for change in changes])
+
+    async def _adrop_known_facts(self, facts, filters):
+        facts = list(dict.fromkeys(facts))
+        if not facts or not hasattr(self.vector_store, "list"):
+            return facts
+        lookup = self._known_hash_lookup(facts, filters)
+        existing_memories = (await self.vector_store.alist(filters=lookup, limit=len(lookup["hash"]) * 5))[0]
+        return self._filter_known_facts(facts, existing_memories)
+
+    async def _aembed_missing(self, actions, existing_embeddings):
+        missing_texts = self._get_missing_texts(actions, existing_embeddings)
+        if missing_texts:
+            existing_embeddings.update(zip(missing_texts, await self.embedding_model.aembed_batch(missing_texts)))
+        return existing_embeddings
+
+    async def get(self, memory_id):
+        """
+        Retrieve a memory by ID.
+
+        Args:
+            memory_id (str): ID of the memory to retrieve.
+
+        Returns:
+            dict: Retrieved memory.
+        """
+        capture_event("mem0.get", self, {"memory_id": memory_id})
+        memory = await self.vector_store.aget(vector_id=memory_id)
+        if not memory:
+            return None
+        return self._format_memory(memory)
+
+    async def get_all(self, user_id=None, agent_id=None, run_id=None, limit=100):
+        """
+        List all memories.
+
+        Returns:
+            list: List of all memories.
+        """
+        filters = {}
+        if user_id:
+            filters["user_id"] = user_id
+        if agent_id:
+            filters["agent_id"] = agent_id
+        if run_id:
+            filters["run_id"] = run_id
+
+        capture_event("mem0.get_all", self, {"filters": len(filters), "limit": limit})
+
+        tasks = [self._get_all_from_vector_store(filters, limit)]
+        if self.version == "v1.1" and self.enable_graph:
+            tasks.append(asyncio.to_thread(self.graph.get_all, filters, limit))
+
+        all_memories, *graph_entities = await asyncio.gather(*tasks)
+
+        if self.version == "v1.1":
+            if self.enable_graph:
+                return {"results": all_memories, "relations": graph_entities[0]}
+            else:
+                return {"results": all_memories}
+        else:
+            warnings.warn(
+                "The current get_all API output format is deprecated. "
+                "To use the latest format, set `api_version='v1.1'`. "
+                "The current format will be removed in mem0ai 1.1.0 and later versions.",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+            return all_memories
+
+    async def _get_all_from_vector_store(self, filters, limit):
+        memories = await self.vector_store.alist(filters=filters, limit=limit)
+        return [self._format_memory(mem) for mem in memories[0]]
+
+    async def search(self, query, user_id=None, agent_id=None, run_id=None, limit=100, filters=None, mode="vector"):
+        """
+        Search for memories.
+
+        Args:
+            query (str): Query to search for.
+            user_id (str, optional): ID of the user to search for. Defaults to None.
+            agent_id (str, optional): ID of the agent to search for. Defaults to None.
+            run_id (str, optional): ID of the run to search for. Defaults to None.
+            limit (int, optional): Limit the number of results. Defaults to 100.
+            filters (dict, optional): Filters to apply to the search. Defaults to None.
+            mode (str, optional): "vector", or "hybrid" to fuse vector and keyword hits with
+                reciprocal-rank fusion. Defaults to "vector".
+
+        Returns:
+            list: List of search results.
+        """
+        filters = filters or {}
+        if user_id:
+            filters["user_id"] = user_id
+        if agent_id:
+            filters["agent_id"] = agent_id
+        if run_id:
+            filters["run_id"] = run_id
+
+        if not any(key in filters for key in ("user_id", "agent_id", "run_id")):
+            raise ValueError("One of the filters: user_id, agent_id or run_id is required!")
+        if mode not in ("vector", "hybrid"):
+            raise ValueError(f"Unsupported search mode: {mode}")
+
+        capture_event(
+            "mem0.search",
+            self,
+            {"filters": len(filters), "limit": limit, "version": self.version, "mode": mode},
+        )
+
+        with self.tracer.trace("search", version=self.version, mode=mode, limit=limit) as trace:
+            tasks = [self._search_vector_store(query, filters, limit, mode)]
+            if self.version == "v1.1" and self.enable_graph:
+                tasks.append(asyncio.to_thread(self.graph.search, query, filters, limit))
+
+            original_memories, *graph_entities = await asyncio.gather(*tasks)
+
+        if self.version == "v1.1":
+            if self.enable_graph:
+                return self._with_timings({"results": original_memories, "relations": graph_entities[0]}, trace)
+            else:
+                return self._with_timings({"results": original_memories}, trace)
+        else:
+            warnings.warn(
+                "The current get_all API output format is deprecated. "
+                "To use the latest format, set `api_version='v1.1'`. "
+                "The current format will be removed in mem0ai 1.1.0 and later versions.",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+            return original_memories
+
+    async def _search_vector_store(self, query, filters, limit, mode="vector"):
+        candidate_limit = self._candidate_limit(limit, mode)
+        with tracing.span("embedder.embed", stage="embedder"):
+            embeddings = await self.embedding_model.aembed(query)
+        searches = [self.vector_store.asearch(query=embeddings, limit=candidate_limit, filters=filters)]
+        if mode == "hybrid":
+            searches.append(
+                asyncio.to_thread(self.vector_store.keyword_search, query, limit=candidate_limit, filters=filters)
+            )
+        with tracing.span("vector_store.search", stage="vector_store", mode=mode):
+            memories, *keyword_hits = await asyncio.gather(*searches)
+
+        original_memories = self._format_hits(memories, keyword_hits[0] if keyword_hits else None)
+        if self.reranker:
+            with tracing.span("reranker.score", stage="reranker"):
+                scores = await self.reranker.ascore(query, [mem["memory"] for mem in original_memories])
+            original_memories = self._select_reranked(original_memories, scores, limit)
+        return self._record_retrieved(original_memories[:limit])
+
+    async def update(self, memory_id, data):
+        """
+        Update a memory by ID.
+
+        Args:
+            memory_id (str): ID of the memory to update.
+            data (dict): Data to update the memory with.
+
+        Returns:
+            dict: Updated memory.
+        """
+        capture_event("mem0.update", self, {"memory_id": memory_id})
+        await self._aupdate_memory(memory_id, data)
+        return {"message": "Memory updated successfully!"}
+
+    async def delete(self, memory_id):
+        """
+        Delete a memory by ID.
+
+        Args:
+            memory_id (str): ID of the memory to delete.
+        """
+        capture_event("mem0.delete", self, {"memory_id": memory_id})
+        await self._adelete_memory(memory_id)
+        return {"message": "Memory deleted successfully!"}
+
+    async def history(self, memory_id):
+        """
+        Get the history of changes for a memory by ID.
+
+        Args:
+            memory_id (str): ID of the memory to get history for.
+
+        Returns:
+            list: List of changes for the memory.
+        """
+        capture_event("mem0.history", self, {"memory_id": memory_id})
+        return await asyncio.to_thread(self.db.get_history, memory_id)
+
+    async def add_many(
+        self,
+        conversations,
+        user_ids=None,
+        agent_ids=None,
+        run_ids=None,
+        metadata=None,
+        filters=None,
+        max_concurrency=8,
+    ):
+        """
+        Create memories from many conversations at once; see `MemoryBase.add_many`. The batch runs in a
+        worker thread and fans out on the executor.
+        """
+        return await asyncio.to_thread(
+            super().add_many,
+            conversations,
+            user_ids=user_ids,
+            agent_ids=agent_ids,
+            run_ids=run_ids,
+            metadata=metadata,
+            filters=filters,
+            max_concurrency=max_concurrency,
+        )
+
+    async def iter_all(self, user_id=None, agent_id=None, run_id=None, filters=None, page_size=1000):
+        """
+        Iterate over every memory; see `MemoryBase.iter_all`. Each page is fetched in a worker thread.
+
+        Yields:
+            dict: Memories in the format returned by `get_all`.
+        """
+        memories = super().iter_all(
+            user_id=user_id, agent_id=agent_id, run_id=run_id, filters=filters, page_size=page_size
+        )
+        try:
+            while True:
+                page = await asyncio.to_thread(lambda: list(itertools.islice(memories, page_size)))
+                if not page:
+                    return
+                for memory in page:
+                    yield memory
+        finally:
+            await asyncio.to_thread(memories.close)
+
+    async def delete_all(self, user_id=None, agent_id=None, run_id=None):
+        """Delete all memories matching the filters; see `MemoryBase.delete_all`. Runs in a worker thread."""
+        return await asyncio.to_thread(super().delete_all, user_id=user_id, agent_id=agent_id, run_id=run_id)
+
+    async def compact(
+        self,
+        user_id=None,
+        agent_id=None,
+        run_id=None,
+        threshold=0.9,
+        max_cluster_size=20,
+        dry_run=False,
+        max_concurrency=8,
+    ):
+        """Merge near-duplicate memories; see `MemoryBase.compact`. Runs in a worker thread."""
+        return await asyncio.to_thread(
+            super().compact,
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            threshold=threshold,
+            max_cluster_size=max_cluster_size,
+            dry_run=dry_run,
+            max_concurrency=max_concurrency,
+        )
+
+    async def sweep(self):
+        """Delete every memory whose TTL expired; see `MemoryBase.sweep`. Runs in a worker thread."""
+        return await asyncio.to_thread(super().sweep)
+
+    async def reset(self):
+        """Reset the memory store; see `MemoryBase.reset`. Runs in a worker thread."""
+        return await asyncio.to_thread(super().reset)
+
+    async def _aupdate_memory(self, memory_id, data, existing_embeddings=None, metadata=None):
+        logger.info(f"Updating memory with {data=}")
+        existing_embeddings = existing_embeddings or {}
+        existing_memory = await self.vector_store.aget(vector_id=memory_id)
+        prev_value = existing_memory.payload.get("data")
+
+        new_metadata = self._updated_memory_payload(existing_memory, data, metadata)
+
+        if data in existing_embeddings:
+            embeddings = existing_embeddings[data]
+        else:
+            embeddings = await self.embedding_model.aembed(data)
+        await self.vector_store.aupdate(
+            vector_id=memory_id,
+            vector=embeddings,
+            payload=new_metadata,
+        )
+        logger.info(f"Updating memory with ID {memory_id=} with {data=}")
+        await asyncio.to_thread(
+            self.db.add_history,
+            memory_id,
+            prev_value,
+            data,
+            "UPDATE",
+            created_at=new_metadata["created_at"],
+            updated_at=new_metadata["updated_at"],
+        )
+
+    async def _adelete_memory(self, memory_id):
+        logging.info(f"Deleting memory with {memory_id=}")
+        existing_memory = await self.vector_store.aget(vector_id=memory_id)
+        prev_value = existing_memory.payload["data"]
+        await self.vector_store.adelete(vector_id=memory_id)
+        await asyncio.to_thread(
+            self.db.add_history,
+            memory_id,
+            prev_value,
+            None,
+            "DELETE",
+            created_at=existing_memory.payload.get("created_at"),
+            updated_at=datetime.now(pytz.timezone("US/Pacific")).isoformat(),
+            is_deleted=1,
+        )
@@ -1,9 +1,13 @@
-import concurrent
+import concurrent.futures
 import hashlib
+import itertools
 import json
 import logging
+import threading
+import time
 import uuid
 import warnings
+from copy import deepcopy
 from datetime import datetime
 from typing import Any, Dict
 
@@ -13,11 +17,15 @@ from pydantic import ValidationError
 from mem0.configs.base import MemoryConfig, MemoryItem
 from mem0.configs.prompts.base_prompts import get_update_memory_messages
 
+from mem0.memory.base.executor import create_executor, get_shared_executor
+from mem0.memory.base.ingest import IngestionQueue, mark_write_started
+from mem0.memory.base import metrics, tracing
+from mem0.memory.base.retention import RetentionManager
 from mem0.memory.base.setup import setup_config
 from mem0.memory.base.telemetry import capture_event
 from mem0.memory.utils import get_fact_retrieval_messages, parse_messages
 
-from mem0.utils.factory import EmbedderFactory, HistoryDBFactory, LlmFactory, VectorStoreFactory
+from mem0.utils.factory import EmbedderFactory, HistoryDBFactory, LlmFactory, RerankerFactory, VectorStoreFactory
 
 # Setup user config
 setup_config()
@@ -26,15 +34,30 @@ logger = logging.getLogger(__name__)
 
 
 class MemoryBase:
+    _DELETE_ALL_PAGE_SIZE = 1000
+
     def __init__(self, config: MemoryConfig = MemoryConfig()):
         self.config = config
 
         self.custom_prompt = self.config.custom_prompt
-        self.embedding_model = EmbedderFactory.create(self.config.embedder.provider, self.config.embedder.config)
+        self.embedding_model = EmbedderFactory.create(
+            self.config.embedder.provider,
+            self.config.embedder.config,
+            self.config.embedder.cache,
+            self.config.embedder.cassette,
+        )
+        self._sync_embedding_dims()
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.llm = LlmFactory.create(
+            self.config.llm.provider, self.config.llm.config, self.config.llm.cache, self.config.llm.cassette
+        )
+        self.reranker = (
+            RerankerFactory.create(self.config.reranker.provider, self.config.reranker.config)
+            if self.config.reranker
+            else None
+        )
         self.db = HistoryDBFactory.create(
             self.config.history_db.provider,
             self.config.history_db.config
@@ -42,6 +65,23 @@ class MemoryBase:
         self.collection_name = self.config.vector_store.config.collection_name
         self.version = self.config.version
 
+        if self.config.executor.shared:
+            self.executor = get_shared_executor(self.config.executor)
+            self._owns_executor = False
+        else:
+            self.executor = create_executor(self.config.executor)
+            self._owns_executor = True
+        self._ingestion = None
+        self._ingestion_lock = threading.Lock()
+        self.tracer = tracing.Tracer.from_config(self.config.tracing)
+        if self.config.metrics.port is not None:
+            metrics.start_http_server(self.config.metrics.port, self.config.metrics.host)
+
+        retention = self.config.retention
+        self._retention = RetentionManager(self, retention) if retention.default or retention.partitions else None
+        if self._retention is not None:
+            self._retention.start()
+
         self.enable_graph = False
 
         if self.version == "v1.1" and self.config.graph_store.config:
@@ -52,6 +92,24 @@ class MemoryBase:
 
         capture_event("mem0.init", self)
 
+    def _sync_embedding_dims(self):
+        """
+        Size the vector store collection for the embedder's output when its dimensions were not set explicitly,
+        so an embedder configured with reduced (Matryoshka) dimensions gets a matching collection.
+        """
+        store_config = self.config.vector_store.config
+        dims = self.embedding_model.config.embedding_dims
+        fields = getattr(type(store_config), "model_fields", {})
+        if not isinstance(dims, int) or "embedding_model_dims" not in fields:
+            return
+        if "embedding_model_dims" not in store_config.model_fields_set:
+            store_config.embedding_model_dims = dims
+        elif store_config.embedding_model_dims != dims:
+            logger.warning(
+                f"Vector store is configured for {store_config.embedding_model_dims}-dimensional vectors but the "
+                f"embedder produces {dims}; use mem0.memory.migration to move existing memories to a new collection"
+            )
+
     @classmethod
     def from_config(cls, config_dict: Dict[str, Any]):
         try:
@@ -61,6 +119,45 @@ class MemoryBase:
             raise
         return cls(config)
 
+    def close(self, wait=True):
+        """
+        Drain the add_async queue, release the executor if this instance owns it and close the vector
+        store. Call it (or use the instance as a context manager) before the interpreter exits: the exit
+        hook only drains queues left open as a last resort. Shared executors are shut down at exit.
+
+        Args:
+            wait (bool, optional): Wait for queued and in-flight work to finish. Defaults to True.
+        """
+        if self._ingestion is not None:
+            self._ingestion.close(wait=wait)
+        if self._retention is not None:
+            self._retention.stop()
+        if self._owns_executor:
+            self.executor.shutdown(wait=wait)
+        self.vector_store.close()
+        self.tracer.shutdown()
+
+    @staticmethod
+    def render_metrics():
+        """
+        Returns:
+            str: The process-wide metrics in the Prometheus text exposition format, for serving from
+                an existing web application instead of the built-in endpoint.
+        """
+        return metrics.REGISTRY.render()
+
+    def _with_timings(self, result, trace):
+        """Attach the per-stage timing breakdown of a finished trace when `tracing.include_timings` is set."""
+        if trace is not None and self.config.tracing.include_timings:
+            result["timings"] = trace.breakdown()
+        return result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def add(
         self,
         messages,
@@ -86,6 +183,119 @@ class MemoryBase:
         Returns:
             dict: A dictionary containing the result of the memory addition operation.
         """
+        messages, metadata, filters = self._prepare_add(messages, user_id, agent_id, run_id, metadata, filters)
+
+        with self.tracer.trace("add", version=self.version) as trace:
+            future1 = self.executor.submit(self._add_to_vector_store, messages, metadata, filters)
+            future2 = self.executor.submit(self._add_to_graph, messages, filters)
+
+            concurrent.futures.wait([future1, future2])
+
+            vector_store_result = future1.result()
+            graph_result = future2.result()
+
+        if self.version == "v1.1":
+            return self._with_timings(
+                {
+                    "results": vector_store_result,
+                    "relations": graph_result,
+                },
+                trace,
+            )
+        else:
+            warnings.warn(
+                "The current add API output format is deprecated. "
+                "To use the latest format, set `api_version='v1.1'`. "
+                "The current format will be removed in mem0ai 1.1.0 and later versions.",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+            return {"message": "ok"}
+
+    def add_async(
+        self,
+        messages,
+        user_id=None,
+        agent_id=None,
+        run_id=None,
+        metadata=None,
+        filters=None,
+        prompt=None,
+    ):
+        """
+        Queue a memory write and return immediately; the write runs `add` on a background worker.
+
+        Takes the same arguments as `add`. Writes that fail before changing any stored memory are retried
+        with backoff; a failure after that is final, since `add` is not idempotent (see the handle's
+        `failed_stage`). When the queue is full the configured overflow policy applies (see
+        `MemoryConfig.ingestion`). Use `flush` or `close` to wait for queued writes.
+
+        Returns:
+            IngestHandle: Handle whose `result()` is the return value of `add`.
+
+        Raises:
+            IngestionQueueFull: If the write is rejected by the overflow policy.
+        """
+        # Validate eagerly so bad arguments fail in the caller, and snapshot the mutable arguments
+        # since the write runs later on another thread.
+        metadata = deepcopy(metadata) if metadata else None
+        filters = dict(filters) if filters else None
+        self._prepare_add(messages, user_id, agent_id, run_id, deepcopy(metadata), dict(filters or {}))
+        return self._get_ingestion_queue().submit(
+            deepcopy(messages),
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            metadata=metadata,
+            filters=filters,
+            prompt=prompt,
+        )
+
+    def flush(self, timeout=None):
+        """
+        Wait until every write queued with `add_async` has been processed.
+
+        Returns:
+            bool: True if the queue drained, False if the timeout expired first.
+        """
+        if self._ingestion is None:
+            return True
+        return self._ingestion.flush(timeout=timeout)
+
+    def ingestion_stats(self):
+        """
+        Returns:
+            dict: Depth, lag and counters of the add_async queue.
+        """
+        if self._ingestion is None:
+            return {}
+        return self._ingestion.stats()
+
+    def _get_ingestion_queue(self):
+        with self._ingestion_lock:
+            if self._ingestion is None or self._ingestion.closed:
+                ingestion = self.config.ingestion
+                self._ingestion = IngestionQueue(
+                    self._ingest,
+                    max_size=ingestion.max_size,
+                    overflow=ingestion.overflow,
+                    workers=ingestion.workers,
+                    max_retries=ingestion.max_retries,
+                    backoff_base=ingestion.backoff_base,
+                    backoff_max=ingestion.backoff_max,
+                    block_timeout=ingestion.block_timeout,
+                )
+            return self._ingestion
+
+    def _ingest(self, *args, **kwargs):
+        return self.add(*args, **kwargs)
+
+    @staticmethod
+    def _prepare_add(messages, user_id=None, agent_id=None, run_id=None, metadata=None, filters=None):
+        """
+        Normalize the arguments of `add` into (messages, metadata, filters), copying the session ids
+        into both the stored metadata and the search filters.
+        """
         if metadata is None:
             metadata = {}
 
@@ -103,31 +313,158 @@ class MemoryBase:
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(self._add_to_vector_store, messages, metadata, filters)
-            future2 = executor.submit(self._add_to_graph, messages, filters)
+        return messages, metadata, filters
 
-            concurrent.futures.wait([future1, future2])
+    def add_many(
+        self,
+        conversations,
+        user_ids=None,
+        agent_ids=None,
+        run_ids=None,
+        metadata=None,
+        filters=None,
+        max_concurrency=8,
+    ):
+        """
+        Create memories from many conversations at once, e.g. to backfill chat logs.
 
-            vector_store_result = future1.result()
-            graph_result = future2.result()
+        Fact extraction runs in parallel for all conversations, the extracted facts are embedded in
+        one batch, and the search/update/write stage runs in parallel across sessions while the
+        conversations of one session (same user_id/agent_id/run_id) are applied in input order, so
+        UPDATE and DELETE decisions always see the memories written by earlier conversations.
 
-        if self.version == "v1.1":
-            return {
-                "results": vector_store_result,
-                "relations": graph_result,
-            }
-        else:
-            warnings.warn(
-                "The current add API output format is deprecated. "
-                "To use the latest format, set `api_version='v1.1'`. "
-                "The current format will be removed in mem0ai 1.1.0 and later versions.",
-                category=DeprecationWarning,
-                stacklevel=2,
+        Args:
+            conversations (list): Messages of each conversation (str or List[Dict[str, str]]).
+            user_ids (str or list, optional): User ID for all conversations, or one per conversation.
+            agent_ids (str or list, optional): Agent ID for all conversations, or one per conversation.
+            run_ids (str or list, optional): Run ID for all conversations, or one per conversation.
+            metadata (dict, optional): Metadata to store with every memory. Defaults to None.
+            filters (dict, optional): Filters to apply to every search. Defaults to None.
+            max_concurrency (int, optional): Maximum conversations processed concurrently in each
+                stage. Defaults to 8.
+
+        Returns:
+            dict: "results" holds one entry per conversation, in input order, shaped like the output
+                of `add` or {"error": str} when that conversation failed; "stats" holds counts and
+                throughput.
+        """
+        start = time.perf_counter()
+        items = self._prepare_add_many(conversations, user_ids, agent_ids, run_ids, metadata, filters)
+        limiter = threading.BoundedSemaphore(max_concurrency)
+        stage_seconds = {}
+
+        stage_start = time.perf_counter()
+        facts_per_item = self._map_limited(limiter, lambda item: self._extract_facts(item[0]), items)
+        stage_seconds["extraction"] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        unique_facts = list(
+            dict.fromkeys(fact for facts in facts_per_item if isinstance(facts, list) for fact in facts)
+        )
+        with self.executor.stage("embedder", "embedder.embed_batch"):
+            fact_embeddings = dict(zip(unique_facts, self.embedding_model.embed_batch(unique_facts)))
+        stage_seconds["embedding"] = time.perf_counter() - stage_start
+
+        def add_one(index):
+            messages, item_metadata, item_filters = items[index]
+            facts = facts_per_item[index]
+            if isinstance(facts, Exception):
+                raise facts
+            facts = self._drop_known_facts(facts, item_filters)
+            embeddings = {fact: fact_embeddings[fact] for fact in facts}
+            results = self._add_facts_to_vector_store(facts, embeddings, item_metadata, item_filters)
+            relations = self._add_to_graph(messages, item_filters)
+            return {"results": results, "relations": relations}
+
+        stage_start = time.perf_counter()
+        results = self._run_partitioned(limiter, items, add_one)
+        stage_seconds["update"] = time.perf_counter() - stage_start
+
+        capture_event("mem0.add_many", self, {"conversations": len(items)})
+        return {"results": results, "stats": self._add_many_stats(results, start, stage_seconds, len(unique_facts))}
+
+    def _prepare_add_many(self, conversations, user_ids, agent_ids, run_ids, metadata, filters):
+        def per_item(value, index):
+            if isinstance(value, (list, tuple)):
+                if len(value) != len(conversations):
+                    raise ValueError("Per-conversation ids must have the same length as conversations")
+                return value[index]
+            return value
+
+        return [
+            self._prepare_add(
+                messages,
+                per_item(user_ids, index),
+                per_item(agent_ids, index),
+                per_item(run_ids, index),
+                deepcopy(metadata) if metadata else None,
+                dict(filters) if filters else None,
             )
-            return {"message": "ok"}
+            for index, messages in enumerate(conversations)
+        ]
 
-    def _add_to_vector_store(self, messages, metadata, filters):
+    def _map_limited(self, limiter, fn, items):
+        """
+        Run `fn` over `items` on the executor with at most `limiter` calls in flight. Exceptions are
+        returned in place of results so one failing item does not abort the batch.
+        """
+
+        def run(item):
+            with limiter:
+                try:
+                    return fn(item)
+                except Exception as e:
+                    logger.error(f"Error in add_many: {e}")
+                    return e
+
+        futures = [self.executor.submit(run, item) for item in items]
+        return [future.result() for future in futures]
+
+    def _run_partitioned(self, limiter, items, fn):
+        """
+        Call `fn(index)` for every item, running sessions in parallel and the items of one session
+        (same user_id/agent_id/run_id filters) sequentially in input order.
+
+        Returns:
+            list: One result per item, in input order, or {"error": str} for items that failed.
+        """
+        partitions = {}
+        for index, (_, _, item_filters) in enumerate(items):
+            key = tuple(item_filters.get(k) for k in ("user_id", "agent_id", "run_id"))
+            partitions.setdefault(key, []).append(index)
+
+        results = [None] * len(items)
+
+        def run_partition(indexes):
+            for index in indexes:
+                with limiter:
+                    try:
+                        results[index] = fn(index)
+                    except Exception as e:
+                        logger.error(f"Error in add_many: {e}")
+                        results[index] = {"error": str(e)}
+
+        futures = [self.executor.submit(run_partition, indexes) for indexes in partitions.values()]
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+        return results
+
+    @staticmethod
+    def _add_many_stats(results, start, stage_seconds, facts):
+        elapsed = time.perf_counter() - start
+        succeeded = [result for result in results if "error" not in result]
+        return {
+            "conversations": len(results),
+            "failed": len(results) - len(succeeded),
+            "facts": facts,
+            "memories": sum(len(result.get("results", [])) for result in succeeded),
+            "elapsed_seconds": elapsed,
+            "conversations_per_second": len(results) / elapsed if elapsed else 0.0,
+            "stage_seconds": stage_seconds,
+        }
+
+    def _get_fact_extraction_messages(self, messages):
         parsed_messages = parse_messages(messages)
 
         if self.custom_prompt:
@@ -136,82 +473,344 @@ class MemoryBase:
         else:
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
 
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
+    @staticmethod
+    def _parse_facts(response):
         try:
-            new_retrieved_facts = json.loads(response)["facts"]
+            return json.loads(response)["facts"]
         except Exception as e:
             logging.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
+            return []
 
+    @staticmethod
+    def _collect_old_memories(existing_memories_per_fact):
         retrieved_old_memory = []
-        new_message_embeddings = {}
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem)
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=messages_embeddings,
-                limit=5,
-                filters=filters,
-            )
+        for existing_memories in existing_memories_per_fact:
             for mem in existing_memories:
                 retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
-
         logging.info(f"Total existing memories: {len(retrieved_old_memory)}")
+        return retrieved_old_memory
+
+    def _extract_facts(self, messages):
+        with self.executor.stage("llm", "llm.extract_facts"):
+            response = self.llm.generate_response(
+                messages=self._get_fact_extraction_messages(messages),
+                response_format={"type": "json_object"},
+            )
+        return self._parse_facts(response)
+
+    def _add_to_vector_store(self, messages, metadata, filters):
+        new_retrieved_facts = self._drop_known_facts(self._extract_facts(messages), filters)
+        if not new_retrieved_facts:
+            capture_event("mem0.add", self)
+            return []
+
+        with self.executor.stage("embedder", "embedder.embed_batch"):
+            new_message_embeddings = dict(
+                zip(new_retrieved_facts, self.embedding_model.embed_batch(new_retrieved_facts))
+            )
+        returned_memories = self._add_facts_to_vector_store(new_retrieved_facts, new_message_embeddings, metadata, filters)
+
+        capture_event("mem0.add", self)
+
+        return returned_memories
+
+    @staticmethod
+    def _hash(data):
+        return hashlib.md5(data.encode()).hexdigest()
+
+    def _known_hash_lookup(self, facts, filters):
+        """Return the vector store filters that find existing memories with the same hash as `facts`."""
+        return {**filters, "hash": list(dict.fromkeys(self._hash(fact) for fact in facts))}
+
+    @staticmethod
+    def _filter_known_facts(facts, existing_memories):
+        known_hashes = {mem.payload.get("hash") for mem in existing_memories}
+        new_facts = [fact for fact in facts if MemoryBase._hash(fact) not in known_hashes]
+        skipped = len(facts) - len(new_facts)
+        if skipped:
+            logger.info(f"Skipping {skipped} facts that exactly match existing memories")
+        return new_facts
+
+    def _drop_known_facts(self, facts, filters):
+        """
+        Drop facts that exactly match an existing memory of the same session, looked up by the
+        content hash stored in the payload. Such facts would only produce a NONE event, so they skip
+        embedding, similarity search and the update LLM call. Stores without `list` skip the lookup.
+        """
+        facts = list(dict.fromkeys(facts))
+        if not facts or not hasattr(self.vector_store, "list"):
+            return facts
+        lookup = self._known_hash_lookup(facts, filters)
+        # A hash missed because of the limit only means the fact takes the regular path.
+        with self.executor.stage("vector_store", "vector_store.find_duplicates"):
+            existing_memories = self.vector_store.list(filters=lookup, limit=len(lookup["hash"]) * 5)[0]
+        return self._filter_known_facts(facts, existing_memories)
+
+    def _add_facts_to_vector_store(self, new_retrieved_facts, new_message_embeddings, metadata, filters):
+        if not new_retrieved_facts:
+            return []
+        with self.executor.stage("vector_store", "vector_store.search_batch"):
+            existing_memories_per_fact = self.vector_store.search_batch(
+                queries=[new_message_embeddings[new_mem] for new_mem in new_retrieved_facts],
+                limit=5,
+                filters=filters,
+            )
+        retrieved_old_memory = self._collect_old_memories(existing_memories_per_fact)
 
         function_calling_prompt = get_update_memory_messages(retrieved_old_memory, new_retrieved_facts)
-        new_memories_with_actions = self.llm.generate_response(
-            messages=[{"role": "user", "content": function_calling_prompt}],
-            response_format={"type": "json_object"},
-        )
+        with self.executor.stage("llm", "llm.update_memory"):
+            new_memories_with_actions = self.llm.generate_response(
+                messages=[{"role": "user", "content": function_calling_prompt}],
+                response_format={"type": "json_object"},
+            )
         new_memories_with_actions = json.loads(new_memories_with_actions)
+        self._embed_missing(new_memories_with_actions.get("memory", []), new_message_embeddings)
+
+        known_memories = {mem.id: mem for existing_memories in existing_memories_per_fact for mem in existing_memories}
+        return self._apply_memory_actions(
+            new_memories_with_actions.get("memory", []),
+            new_message_embeddings,
+            metadata,
+            known_memories=known_memories,
+        )
 
-        returned_memories = []
+    def _apply_memory_actions(
+        self, actions, existing_embeddings, metadata, known_memories=None, id_mapping=None, include_ids=False
+    ):
+        """
+        Apply the actions of one update LLM response with one vector store insert, one batch update
+        and one batch delete, then record all of them with a single history write.
+
+        A group whose vector store write fails is logged and dropped from the results and the history.
+        Only the first action targeting a given memory is applied.
+
+        Args:
+            actions (list): The "memory" list of the update LLM response.
+            existing_embeddings (dict): Embeddings keyed by text, covering every ADD and UPDATE text.
+            metadata (dict): Metadata of the added and updated memories.
+            known_memories (dict, optional): Memories returned by the similarity search, keyed by ID.
+                UPDATE and DELETE targets missing from it are fetched from the vector store.
+            id_mapping (dict, optional): Maps the IDs seen by the LLM to memory IDs. Actions with an
+                unknown ID are skipped.
+            include_ids (bool, optional): Include the memory ID in the results. Defaults to False.
+
+        Returns:
+            list: The applied actions, in the order of `actions`.
+        """
+        known_memories = dict(known_memories or {})
+        for memory_id in self._missing_targets(actions, known_memories, id_mapping):
+            try:
+                with self.executor.stage("vector_store", "vector_store.get"):
+                    known_memories[memory_id] = self.vector_store.get(vector_id=memory_id)
+            except Exception as e:
+                logging.error(f"Error fetching memory {memory_id} for new_memories_with_actions: {e}")
+        groups, applied = self._plan_memory_actions(
+            actions, existing_embeddings, metadata, known_memories, id_mapping, include_ids
+        )
+
+        if any(groups.values()):
+            mark_write_started()
+        failed = set()
+        for event, changes in groups.items():
+            if not changes:
+                continue
+            try:
+                with self.executor.stage("vector_store", f"vector_store.{event.lower()}", count=len(changes)):
+                    self._write_memory_changes(event, changes)
+            except Exception as e:
+                logging.error(f"Error in new_memories_with_actions: {e}")
+                failed.update(id(change) for change in changes)
+
+        applied = self._record_applied(applied, failed)
+        if applied:
+            try:
+                with tracing.span("history.add_history_many"):
+                    self.db.add_history_many([change["history"] for change in applied])
+            except Exception as e:
+                logging.error(f"Error recording history of new_memories_with_actions: {e}")
+        self._enforce_retention([change["payload"] for change in groups["ADD"] if id(change) not in failed])
+        return [change["result"] for change in applied]
+
+    @staticmethod
+    def _missing_targets(actions, known_memories, id_mapping=None):
+        """
+        Returns:
+            list: IDs of the memories targeted by UPDATE and DELETE actions that are not in `known_memories`.
+        """
+        missing = []
+        for resp in actions:
+            if not isinstance(resp, dict) or resp.get("event") not in ("UPDATE", "DELETE"):
+                continue
+            memory_id = id_mapping.get(resp.get("id")) if id_mapping is not None else resp.get("id")
+            if memory_id is not None and memory_id not in known_memories and memory_id not in missing:
+                missing.append(memory_id)
+        return missing
+
+    def _plan_memory_actions(self, actions, existing_embeddings, metadata, known_memories, id_mapping, include_ids):
+        """
+        Turn the actions of one update LLM response into vector store changes, without any I/O.
+
+        Only the first action targeting a given memory is kept; invalid actions and actions on memories
+        missing from `known_memories` are logged and skipped.
+
+        Returns:
+            tuple: The changes grouped by event ("ADD", "UPDATE", "DELETE") and all changes in action order.
+        """
+        groups = {"ADD": [], "UPDATE": [], "DELETE": []}
+        applied = []
+        targeted = set()
+        for resp in actions:
+            logging.info(resp)
+            try:
+                event = resp["event"]
+                if event == "NONE":
+                    logging.info("NOOP for Memory.")
+                    metrics.record_memory_events(["NONE"])
+                    continue
+                if event not in groups:
+                    continue
+                if event == "ADD":
+                    change = self._add_change(resp, existing_embeddings, metadata)
+                else:
+                    memory_id = id_mapping[resp["id"]] if id_mapping is not None else resp["id"]
+                    if memory_id in targeted:
+                        logger.warning(f"Skipping {event} of memory {memory_id} already changed by this response")
+                        continue
+                    existing_memory = known_memories[memory_id]
+                    if existing_memory is None:
+                        raise KeyError(f"Memory {memory_id} not found")
+                    if event == "UPDATE":
+                        change = self._update_change(resp, memory_id, existing_memory, existing_embeddings, metadata)
+                    else:
+                        change = self._delete_change(resp, memory_id, existing_memory)
+                    targeted.add(memory_id)
+                if include_ids:
+                    change["result"] = {"id": change["id"], **change["result"]}
+                groups[event].append(change)
+                applied.append(change)
+            except Exception as e:
+                logging.error(f"Error in new_memories_with_actions: {e}")
+        return groups, applied
+
+    def _write_memory_changes(self, event, changes):
+        """Apply the changes of one event with a single vector store call."""
+        if event == "ADD":
+            self.vector_store.insert(
+                vectors=[change["vector"] for change in changes],
+                ids=[change["id"] for change in changes],
+                payloads=[change["payload"] for change in changes],
+            )
+        elif event == "UPDATE":
+            self.vector_store.update_batch(
+                [change["id"] for change in changes],
+                vectors=[change["vector"] for change in changes],
+                payloads=[change["payload"] for change in changes],
+            )
+        else:
+            self.vector_store.delete_batch([change["id"] for change in changes])
+
+    @staticmethod
+    def _record_applied(applied, failed):
+        """Drop the changes whose write failed and count the rest in the metrics registry."""
+        applied = [change for change in applied if id(change) not in failed]
+        metrics.record_memory_events(change["result"]["event"] for change in applied)
+        return applied
+
+    def _enforce_retention(self, payloads):
+        """Apply the retention policies to the partitions that received the new memories."""
+        if self._retention is None or not payloads:
+            return
         try:
-            for resp in new_memories_with_actions["memory"]:
-                logging.info(resp)
-                try:
-                    if resp["event"] == "ADD":
-                        _ = self._create_memory(data=resp["text"], existing_embeddings=new_message_embeddings, metadata=metadata)
-                        returned_memories.append(
-                            {
-                                "memory": resp["text"],
-                                "event": resp["event"],
-                            }
-                        )
-                    elif resp["event"] == "UPDATE":
-                        self._update_memory(memory_id=resp["id"], data=resp["text"], existing_embeddings=new_message_embeddings, metadata=metadata)
-                        returned_memories.append(
-                            {
-                                "memory": resp["text"],
-                                "event": resp["event"],
-                                "previous_memory": resp["old_memory"],
-                            }
-                        )
-                    elif resp["event"] == "DELETE":
-                        self._delete_memory(memory_id=resp["id"])
-                        returned_memories.append(
-                            {
-                                "memory": resp["text"],
-                                "event": resp["event"],
-                            }
-                        )
-                    elif resp["event"] == "NONE":
-                        logging.info("NOOP for Memory.")
-                except Exception as e:
-                    logging.error(f"Error in new_memories_with_actions: {e}")
+            self._retention.record_added(payloads)
         except Exception as e:
-            logging.error(f"Error in new_memories_with_actions: {e}")
+            logger.error(f"Error enforcing retention: {e}")
 
-        capture_event("mem0.add", self)
+    def sweep(self):
+        """
+        Delete every memory whose TTL expired. The background sweeper calls this every
+        `retention.sweep_interval` seconds.
 
-        return returned_memories
+        Returns:
+            int: Number of deleted memories.
+        """
+        return self._retention.sweep() if self._retention is not None else 0
+
+    def _add_change(self, resp, existing_embeddings, metadata):
+        memory_id = str(uuid.uuid4())
+        payload = self._new_memory_payload(resp["text"], metadata)
+        return {
+            "id": memory_id,
+            "vector": existing_embeddings[resp["text"]],
+            "payload": payload,
+            "result": {"memory": resp["text"], "event": "ADD"},
+            "history": {
+                "memory_id": memory_id,
+                "old_memory": None,
+                "new_memory": resp["text"],
+                "event": "ADD",
+                "created_at": payload["created_at"],
+                "updated_at": payload["updated_at"],
+            },
+        }
+
+    def _update_change(self, resp, memory_id, existing_memory, existing_embeddings, metadata):
+        payload = self._updated_memory_payload(existing_memory, resp["text"], metadata)
+        return {
+            "id": memory_id,
+            "vector": existing_embeddings[resp["text"]],
+            "payload": payload,
+            "result": {"memory": resp["text"], "event": "UPDATE", "previous_memory": resp["old_memory"]},
+            "history": {
+                "memory_id": memory_id,
+                "old_memory": existing_memory.payload.get("data"),
+                "new_memory": resp["text"],
+                "event": "UPDATE",
+                "created_at": payload["created_at"],
+                "updated_at": payload["updated_at"],
+            },
+        }
+
+    @staticmethod
+    def _delete_change(resp, memory_id, existing_memory):
+        return {
+            "id": memory_id,
+            "result": {"memory": resp["text"], "event": "DELETE"},
+            "history": {
+                "memory_id": memory_id,
+                "old_memory": existing_memory.payload["data"],
+                "new_memory": None,
+                "event": "DELETE",
+                "created_at": existing_memory.payload.get("created_at"),
+                "updated_at": datetime.now(pytz.timezone("US/Pacific")).isoformat(),
+                "is_deleted": 1,
+            },
+        }
+
+    @staticmethod
+    def _get_missing_texts(actions, existing_embeddings):
+        missing_texts = []
+        for resp in actions:
+            text = resp.get("text")
+            if resp.get("event") in ("ADD", "UPDATE") and text and text not in existing_embeddings:
+                if text not in missing_texts:
+                    missing_texts.append(text)
+        return missing_texts
+
+    def _embed_missing(self, actions, existing_embeddings):
+        """
+        Embed, in a single batch, the texts of ADD/UPDATE actions that were rewritten by the
+        update LLM and therefore have no embedding yet. `existing_embeddings` is updated in place.
+        """
+        missing_texts = self._get_missing_texts(actions, existing_embeddings)
+        if missing_texts:
+            with self.executor.stage("embedder", "embedder.embed_batch"):
+                existing_embeddings.update(zip(missing_texts, self.embedding_model.embed_batch(missing_texts)))
+        return existing_embeddings
 
     def _add_to_graph(self, messages, filters):
         added_entities = []
@@ -225,7 +824,9 @@ class MemoryBase:
             else:
                 self.graph.user_id = "USER"
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
-            added_entities = self.graph.add(data, filters)
+            mark_write_started()
+            with self.executor.stage("graph", "graph.add"):
+                added_entities = self.graph.add(data, filters)
 
         return added_entities
 
@@ -290,16 +891,17 @@ class MemoryBase:
 
         capture_event("mem0.get_all", self, {"filters": len(filters), "limit": limit})
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, filters, limit)
-            future_graph_entities = (
-                executor.submit(self.graph.get_all, filters, limit) if self.version == "v1.1" and self.enable_graph else None
-            )
+        future_memories = self.executor.submit(self._get_all_from_vector_store, filters, limit)
+        future_graph_entities = (
+            self.executor.submit(self._get_all_from_graph, filters, limit)
+            if self.version == "v1.1" and self.enable_graph
+            else None
+        )
 
-            concurrent.futures.wait([future_memories, future_graph_entities] if future_graph_entities else [future_memories])
+        concurrent.futures.wait([future_memories, future_graph_entities] if future_graph_entities else [future_memories])
 
-            all_memories = future_memories.result()
-            graph_entities = future_graph_entities.result() if future_graph_entities else None
+        all_memories = future_memories.result()
+        graph_entities = future_graph_entities.result() if future_graph_entities else None
 
         if self.version == "v1.1":
             if self.enable_graph:
@@ -316,9 +918,48 @@ class MemoryBase:
             )
             return all_memories
 
+    def iter_all(self, user_id=None, agent_id=None, run_id=None, filters=None, page_size=1000):
+        """
+        Iterate over every memory, fetching them from the vector store one page at a time.
+
+        Unlike `get_all`, the number of memories is not capped and only one page is held in memory,
+        which suits exports and audits of large users.
+
+        Args:
+            user_id (str, optional): ID of the user whose memories are listed. Defaults to None.
+            agent_id (str, optional): ID of the agent whose memories are listed. Defaults to None.
+            run_id (str, optional): ID of the run whose memories are listed. Defaults to None.
+            filters (dict, optional): Additional payload filters. Defaults to None.
+            page_size (int, optional): Number of memories fetched per request. Defaults to 1000.
+
+        Yields:
+            dict: Memories in the format returned by `get_all`.
+        """
+        filters = dict(filters or {})
+        if user_id:
+            filters["user_id"] = user_id
+        if agent_id:
+            filters["agent_id"] = agent_id
+        if run_id:
+            filters["run_id"] = run_id
+
+        capture_event("mem0.iter_all", self, {"filters": len(filters), "page_size": page_size})
+
+        for mem in self.vector_store.iter_all(filters=filters, page_size=page_size):
+            yield self._format_memory(mem)
+
     def _get_all_from_vector_store(self, filters, limit):
-        memories = self.vector_store.list(filters=filters, limit=limit)
+        with self.executor.stage("vector_store", "vector_store.list"):
+            memories = self.vector_store.list(filters=filters, limit=limit)
+        all_memories = [self._format_memory(mem) for mem in memories[0]]
+        return all_memories
 
+    def _get_all_from_graph(self, filters, limit):
+        with self.executor.stage("graph", "graph.get_all"):
+            return self.graph.get_all(filters, limit)
+
+    @staticmethod
+    def _format_memory(mem, with_score=False):
         excluded_keys = {
             "user_id",
             "agent_id",
@@ -328,27 +969,25 @@ class MemoryBase:
             "created_at",
             "updated_at",
         }
-        all_memories = [
-            {
-                **MemoryItem(
-                    id=mem.id,
-                    memory=mem.payload["data"],
-                    hash=mem.payload.get("hash"),
-                    created_at=mem.payload.get("created_at"),
-                    updated_at=mem.payload.get("updated_at"),
-                ).model_dump(exclude={"score"}),
-                **{key: mem.payload[key] for key in ["user_id", "agent_id", "run_id"] if key in mem.payload},
-                **(
-                    {"metadata": {k: v for k, v in mem.payload.items() if k not in excluded_keys}}
-                    if any(k for k in mem.payload if k not in excluded_keys)
-                    else {}
-                ),
-            }
-            for mem in memories[0]
-        ]
-        return all_memories
+        memory_item = MemoryItem(
+            id=mem.id,
+            memory=mem.payload["data"],
+            hash=mem.payload.get("hash"),
+            created_at=mem.payload.get("created_at"),
+            updated_at=mem.payload.get("updated_at"),
+            score=mem.score if with_score else None,
+        ).model_dump(exclude=None if with_score else {"score"})
+        return {
+            **memory_item,
+            **{key: mem.payload[key] for key in ["user_id", "agent_id", "run_id"] if key in mem.payload},
+            **(
+                {"metadata": {k: v for k, v in mem.payload.items() if k not in excluded_keys}}
+                if any(k for k in mem.payload if k not in excluded_keys)
+                else {}
+            ),
+        }
 
-    def search(self, query, user_id=None, agent_id=None, run_id=None, limit=100, filters=None):
+    def search(self, query, user_id=None, agent_id=None, run_id=None, limit=100, filters=None, mode="vector"):
         """
         Search for memories.
 
@@ -359,6 +998,8 @@ class MemoryBase:
             run_id (str, optional): ID of the run to search for. Defaults to None.
             limit (int, optional): Limit the number of results. Defaults to 100.
             filters (dict, optional): Filters to apply to the search. Defaults to None.
+            mode (str, optional): "vector", or "hybrid" to fuse vector and keyword hits with
+                reciprocal-rank fusion. Defaults to "vector".
 
         Returns:
             list: List of search results.
@@ -373,31 +1014,35 @@ class MemoryBase:
 
         if not any(key in filters for key in ("user_id", "agent_id", "run_id")):
             raise ValueError("One of the filters: user_id, agent_id or run_id is required!")
+        if mode not in ("vector", "hybrid"):
+            raise ValueError(f"Unsupported search mode: {mode}")
 
         capture_event(
             "mem0.search",
             self,
-            {"filters": len(filters), "limit": limit, "version": self.version},
+            {"filters": len(filters), "limit": limit, "version": self.version, "mode": mode},
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._search_vector_store, query, filters, limit)
+        with self.tracer.trace("search", version=self.version, mode=mode, limit=limit) as trace:
+            future_memories = self.executor.submit(self._search_vector_store, query, filters, limit, mode)
             future_graph_entities = (
-                executor.submit(self.graph.search, query, filters, limit)
+                self.executor.submit(self._search_graph, query, filters, limit)
                 if self.version == "v1.1" and self.enable_graph
                 else None
             )
 
-            concurrent.futures.wait([future_memories, future_graph_entities] if future_graph_entities else [future_memories])
+            concurrent.futures.wait(
+                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
+            )
 
             original_memories = future_memories.result()
             graph_entities = future_graph_entities.result() if future_graph_entities else None
 
         if self.version == "v1.1":
             if self.enable_graph:
-                return {"results": original_memories, "relations": graph_entities}
+                return self._with_timings({"results": original_memories, "relations": graph_entities}, trace)
             else:
-                return {"results": original_memories}
+                return self._with_timings({"results": original_memories}, trace)
         else:
             warnings.warn(
                 "The current get_all API output format is deprecated. "
@@ -408,41 +1053,78 @@ class MemoryBase:
             )
             return original_memories
 
-    def _search_vector_store(self, query, filters, limit):
-        embeddings = self.embedding_model.embed(query)
-        memories = self.vector_store.search(query=embeddings, limit=limit, filters=filters)
+    def _search_vector_store(self, query, filters, limit, mode="vector"):
+        candidate_limit = self._candidate_limit(limit, mode)
+        with self.executor.stage("embedder", "embedder.embed"):
+            embeddings = self.embedding_model.embed(query)
+        with self.executor.stage("vector_store", "vector_store.search"):
+            memories = self.vector_store.search(query=embeddings, limit=candidate_limit, filters=filters)
+        keyword_hits = None
+        if mode == "hybrid":
+            with self.executor.stage("vector_store", "vector_store.keyword_search"):
+                keyword_hits = self.vector_store.keyword_search(query, limit=candidate_limit, filters=filters)
+
+        original_memories = self._format_hits(memories, keyword_hits)
+        if self.reranker:
+            with self.executor.stage("reranker", "reranker.score"):
+                scores = self.reranker.score(query, [mem["memory"] for mem in original_memories])
+            original_memories = self._select_reranked(original_memories, scores, limit)
+        return self._record_retrieved(original_memories[:limit])
+
+    def _record_retrieved(self, memories):
+        if self._retention is not None:
+            self._retention.record_retrieved([mem["id"] for mem in memories])
+        return memories
+
+    def _candidate_limit(self, limit, mode="vector"):
+        """Number of hits to fetch per retriever: the search limit, over-fetched for hybrid search and reranking."""
+        candidates = limit
+        if mode == "hybrid":
+            candidates = max(candidates, self.config.hybrid_search.candidates)
+        if self.reranker:
+            candidates = max(candidates, self.config.reranker.candidates)
+        return candidates
+
+    def _format_hits(self, memories, keyword_hits=None):
+        """Format vector search hits, fused with the keyword hits when there are any."""
+        if keyword_hits is None:
+            return [self._format_memory(mem, with_score=True) for mem in memories]
+        return [
+            {**self._format_memory(mem, with_score=True), "score": score}
+            for mem, score in self._fuse_rrf(memories, keyword_hits)
+        ]
 
-        excluded_keys = {
-            "user_id",
-            "agent_id",
-            "run_id",
-            "hash",
-            "data",
-            "created_at",
-            "updated_at",
-        }
+    def _fuse_rrf(self, vector_hits, keyword_hits):
+        """
+        Fuse the vector and keyword rankings with weighted reciprocal-rank fusion, where a memory scores
+        `weight / (rrf_k + rank)` in each ranking it appears in.
 
-        original_memories = [
-            {
-                **MemoryItem(
-                    id=mem.id,
-                    memory=mem.payload["data"],
-                    hash=mem.payload.get("hash"),
-                    created_at=mem.payload.get("created_at"),
-                    updated_at=mem.payload.get("updated_at"),
-                    score=mem.score,
-                ).model_dump(),
-                **{key: mem.payload[key] for key in ["user_id", "agent_id", "run_id"] if key in mem.payload},
-                **(
-                    {"metadata": {k: v for k, v in mem.payload.items() if k not in excluded_keys}}
-                    if any(k for k in mem.payload if k not in excluded_keys)
-                    else {}
-                ),
-            }
-            for mem in memories
-        ]
+        Returns:
+            list: (memory, fused score) pairs, best first.
+        """
+        config = self.config.hybrid_search
+        scores = {}
+        memories = {}
+        for hits, weight in ((vector_hits, 1 - config.keyword_weight), (keyword_hits, config.keyword_weight)):
+            for rank, mem in enumerate(hits, start=1):
+                key = str(mem.id)
+                scores[key] = scores.get(key, 0.0) + weight / (config.rrf_k + rank)
+                memories.setdefault(key, mem)
+        return sorted(((memories[key], score) for key, score in scores.items()), key=lambda pair: pair[1], reverse=True)
+
+    def _select_reranked(self, memories, scores, limit):
+        """
+        Order the memories by reranker score, drop those below the configured threshold and keep the
+        top results. The reranker score replaces the vector similarity in "score".
+        """
+        threshold = self.config.reranker.score_threshold
+        top_n = min(limit, self.config.reranker.top_n or limit)
+        ranked = sorted(zip(scores, memories), key=lambda pair: pair[0], reverse=True)
+        return [{**mem, "score": score} for score, mem in ranked if threshold is None or score >= threshold][:top_n]
 
-        return original_memories
+    def _search_graph(self, query, filters, limit):
+        with self.executor.stage("graph", "graph.search"):
+            return self.graph.search(query, filters, limit)
 
     def update(self, memory_id, data):
         """
@@ -472,7 +1154,9 @@ class MemoryBase:
 
     def delete_all(self, user_id=None, agent_id=None, run_id=None):
         """
-        Delete all memories.
+        Delete all memories matching the filters, one page at a time: every page is deleted with one
+        `delete_batch` call and recorded with one history write, so memory use does not grow with the
+        number of memories.
 
         Args:
             user_id (str, optional): ID of the user to delete memories for. Defaults to None.
@@ -493,17 +1177,104 @@ class MemoryBase:
             )
 
         capture_event("mem0.delete_all", self, {"filters": len(filters)})
-        memories = self.vector_store.list(filters=filters)[0]
-        for memory in memories:
-            self._delete_memory(memory.id)
-
-        logger.info(f"Deleted {len(memories)} memories")
+        deleted = 0
+        previous = set()
+        while True:
+            memories = self._next_page(filters)
+            if not memories:
+                break
+            ids = [str(memory.id) for memory in memories]
+            if previous.intersection(ids):
+                raise RuntimeError(f"delete_all: the vector store still returns deleted memories ({ids[0]}, ...)")
+            with self.executor.stage("vector_store", "vector_store.delete_batch", count=len(ids)):
+                self.vector_store.delete_batch(ids)
+            self._record_deletions(memories)
+            deleted += len(ids)
+            previous = set(ids)
+
+        logger.info(f"Deleted {deleted} memories")
 
         if self.version == "v1.1" and self.enable_graph:
             self.graph.delete_all(filters)
 
         return {"message": "Memories deleted successfully!"}
 
+    def _next_page(self, filters):
+        """
+        Returns:
+            list: The first page of memories matching `filters`. Read from a fresh iterator every time,
+                since deleting under a cursor would make offset-paginated stores skip memories.
+        """
+        page_size = self._DELETE_ALL_PAGE_SIZE
+        memories = self.vector_store.iter_all(filters=filters, page_size=page_size)
+        try:
+            with self.executor.stage("vector_store", "vector_store.iter_all"):
+                return list(itertools.islice(memories, page_size))
+        finally:
+            # Release the cursor (e.g. an Elasticsearch point in time) right away.
+            if hasattr(memories, "close"):
+                memories.close()
+
+    def _record_deletions(self, memories):
+        deleted_at = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        with tracing.span("history.add_history_many"):
+            self.db.add_history_many(
+                [
+                    {
+                        "memory_id": memory.id,
+                        "old_memory": memory.payload.get("data"),
+                        "new_memory": None,
+                        "event": "DELETE",
+                        "created_at": memory.payload.get("created_at"),
+                        "updated_at": deleted_at,
+                        "is_deleted": 1,
+                    }
+                    for memory in memories
+                ]
+            )
+
+    def compact(
+        self,
+        user_id=None,
+        agent_id=None,
+        run_id=None,
+        threshold=0.9,
+        max_cluster_size=20,
+        dry_run=False,
+        max_concurrency=8,
+    ):
+        """
+        Merge near-duplicate memories of a user, agent or run.
+
+        Memories are clustered by embedding similarity and every cluster is merged into one memory with
+        a single LLM call. The merged memory replaces the originals and the history records the merge.
+
+        Args:
+            user_id (str, optional): ID of the user to compact. Defaults to None.
+            agent_id (str, optional): ID of the agent to compact. Defaults to None.
+            run_id (str, optional): ID of the run to compact. Defaults to None.
+            threshold (float, optional): Minimum cosine similarity within a cluster. Defaults to 0.9.
+            max_cluster_size (int, optional): Maximum number of memories merged at once. Defaults to 20.
+            dry_run (bool, optional): Only report what would be merged. Defaults to False.
+            max_concurrency (int, optional): Maximum number of merge LLM calls in flight. Defaults to 8.
+
+        Returns:
+            dict: Report with the memory and token counts before and after, and the merges.
+        """
+        from mem0.memory.compaction import compact
+
+        capture_event("mem0.compact", self, {"dry_run": dry_run, "threshold": threshold})
+        return compact(
+            self,
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            threshold=threshold,
+            max_cluster_size=max_cluster_size,
+            dry_run=dry_run,
+            max_concurrency=max_concurrency,
+        )
+
     def history(self, memory_id):
         """
         Get the history of changes for a memory by ID.
@@ -517,42 +1288,20 @@ class MemoryBase:
         capture_event("mem0.history", self, {"memory_id": memory_id})
         return self.db.get_history(memory_id)
 
-    def _create_memory(self, data, existing_embeddings, metadata=None):
-        logging.info(f"Creating memory with {data=}")
-        if data in existing_embeddings: 
-            embeddings = existing_embeddings[data]
-        else: 
-            embeddings = self.embedding_model.embed(data)
-        memory_id = str(uuid.uuid4())
-        metadata = metadata or {}
+    @staticmethod
+    def _new_memory_payload(data, metadata=None):
+        metadata = deepcopy(metadata) if metadata else {}
         metadata["data"] = data
-        metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
+        metadata["hash"] = MemoryBase._hash(data)
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
         metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        return metadata
 
-        self.vector_store.insert(
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[metadata],
-        )
-        self.db.add_history(
-            memory_id,
-            None,
-            data,
-            "ADD",
-            created_at=metadata["created_at"],
-            updated_at=metadata["updated_at"],
-            )
-        return memory_id
-
-    def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
-        logger.info(f"Updating memory with {data=}")
-        existing_memory = self.vector_store.get(vector_id=memory_id)
-        prev_value = existing_memory.payload.get("data")
-
-        new_metadata = metadata or {}
+    @staticmethod
+    def _updated_memory_payload(existing_memory, data, metadata=None):
+        new_metadata = deepcopy(metadata) if metadata else {}
         new_metadata["data"] = data
-        new_metadata["hash"] = existing_memory.payload.get("hash")
+        new_metadata["hash"] = MemoryBase._hash(data)
         new_metadata["created_at"] = existing_memory.payload.get("created_at")
         new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
@@ -562,40 +1311,85 @@ class MemoryBase:
             new_metadata["agent_id"] = existing_memory.payload["agent_id"]
         if "run_id" in existing_memory.payload:
             new_metadata["run_id"] = existing_memory.payload["run_id"]
+        return new_metadata
 
+    def _create_memory(self, data, existing_embeddings=None, metadata=None):
+        logging.info(f"Creating memory with {data=}")
+        existing_embeddings = existing_embeddings or {}
         if data in existing_embeddings: 
             embeddings = existing_embeddings[data]
         else: 
-            embeddings = self.embedding_model.embed(data)
-        self.vector_store.update(
-            vector_id=memory_id,
-            vector=embeddings,
-            payload=new_metadata,
-        )
+            with self.executor.stage("embedder", "embedder.embed"):
+                embeddings = self.embedding_model.embed(data)
+        memory_id = str(uuid.uuid4())
+        metadata = self._new_memory_payload(data, metadata)
+
+        mark_write_started()
+        with self.executor.stage("vector_store", "vector_store.insert"):
+            self.vector_store.insert(
+                vectors=[embeddings],
+                ids=[memory_id],
+                payloads=[metadata],
+            )
+        with tracing.span("history.add_history"):
+            self.db.add_history(
+                memory_id,
+                None,
+                data,
+                "ADD",
+                created_at=metadata["created_at"],
+                updated_at=metadata["updated_at"],
+            )
+        self._enforce_retention([metadata])
+        return memory_id
+
+    def _update_memory(self, memory_id, data, existing_embeddings=None, metadata=None):
+        logger.info(f"Updating memory with {data=}")
+        existing_embeddings = existing_embeddings or {}
+        with self.executor.stage("vector_store", "vector_store.get"):
+            existing_memory = self.vector_store.get(vector_id=memory_id)
+        prev_value = existing_memory.payload.get("data")
+
+        new_metadata = self._updated_memory_payload(existing_memory, data, metadata)
+
+        if data in existing_embeddings: 
+            embeddings = existing_embeddings[data]
+        else: 
+            with self.executor.stage("embedder", "embedder.embed"):
+                embeddings = self.embedding_model.embed(data)
+        with self.executor.stage("vector_store", "vector_store.update"):
+            self.vector_store.update(
+                vector_id=memory_id,
+                vector=embeddings,
+                payload=new_metadata,
+            )
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
-        self.db.add_history(
-            memory_id,
-            prev_value,
-            data,
-            "UPDATE",
-            created_at=new_metadata["created_at"],
-            updated_at=new_metadata["updated_at"],
-        )
+        with tracing.span("history.add_history"):
+            self.db.add_history(
+                memory_id,
+                prev_value,
+                data,
+                "UPDATE",
+                created_at=new_metadata["created_at"],
+                updated_at=new_metadata["updated_at"],
+            )
 
     def _delete_memory(self, memory_id):
         logging.info(f"Deleting memory with {memory_id=}")
-        existing_memory = self.vector_store.get(vector_id=memory_id)
-        prev_value = existing_memory.payload["data"]
-        self.vector_store.delete(vector_id=memory_id)
-        self.db.add_history(
-            memory_id,
-            prev_value,
-            None,
-            "DELETE",
-            create_at = existing_memory.payload.get("created_at"),
-            updated_at = datetime.now(pytz.timezone("US/Pacific")).isoformat(),
-            is_deleted=1,
-        )
+        with self.executor.stage("vector_store", "vector_store.delete"):
+            existing_memory = self.vector_store.get(vector_id=memory_id)
+            prev_value = existing_memory.payload["data"]
+            self.vector_store.delete(vector_id=memory_id)
+        with tracing.span("history.add_history"):
+            self.db.add_history(
+                memory_id,
+                prev_value,
+                None,
+                "DELETE",
+                created_at=existing_memory.payload.get("created_at"),
+                updated_at=datetime.now(pytz.timezone("US/Pacific")).isoformat(),
+                is_deleted=1,
+            )
 
     def reset(self):
         """
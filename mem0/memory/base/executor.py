@@ -0,0 +1,182 @@
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from mem0.memory.base import metrics, tracing
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("llm", "embedder", "vector_store", "graph", "reranker")
+
+
+class MemoryExecutor:
+    """
+    Long-lived thread pool used by Memory for its fan-out work.
+
+    Submissions beyond `max_queue_size` pending tasks block until a slot frees up, so a burst of
+    requests applies backpressure instead of queueing unbounded work. Each stage (llm, embedder,
+    vector_store, graph, reranker) can additionally be capped with its own semaphore via `stage()`.
+
+    Tasks that submit more work to the same executor (e.g. `add` listing memories through `get_all`)
+    run the nested work inline, since waiting on it from a worker could deadlock a saturated pool.
+    Work submitted once the interpreter is shutting down, when the pool refuses new tasks, also runs
+    inline, so the exit drain of `add_async` queues can still finish its writes.
+    """
+
+    def __init__(self, max_workers=None, max_queue_size=None, stage_limits=None, thread_name_prefix="mem0"):
+        """
+        Args:
+            max_workers (int, optional): Maximum number of worker threads. Defaults to the
+                ThreadPoolExecutor default.
+            max_queue_size (int, optional): Maximum number of submitted but unfinished tasks.
+                Defaults to None (unbounded).
+            stage_limits (dict, optional): Maximum concurrent calls per stage, e.g. {"llm": 4}.
+                Stages that are missing or set to None are not limited.
+            thread_name_prefix (str, optional): Prefix for worker thread names.
+        """
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(max_queue_size) if max_queue_size else None
+        self._stage_limits = {}
+        for stage, limit in (stage_limits or {}).items():
+            if stage not in STAGES:
+                raise ValueError(f"Unsupported stage: {stage}. Expected one of {STAGES}")
+            if limit:
+                self._stage_limits[stage] = threading.BoundedSemaphore(limit)
+        self._closed = False
+        self._worker = threading.local()
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedule `fn(*args, **kwargs)` on the pool, blocking while the queue is full.
+
+        The caller's context variables are copied into the worker so request-scoped state
+        survives the thread hop. Called from one of this executor's workers, `fn` runs inline.
+
+        Returns:
+            concurrent.futures.Future: Future for the submitted call.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot submit to a closed MemoryExecutor")
+        if getattr(self._worker, "active", False):
+            return self._run_inline(fn, *args, **kwargs)
+        if self._slots is not None:
+            self._slots.acquire()
+        ctx = contextvars.copy_context()
+        try:
+            future = self._pool.submit(ctx.run, self._run_in_worker, fn, *args, **kwargs)
+        except RuntimeError:
+            # The pool refuses new tasks once the interpreter is shutting down (or shutdown() raced us).
+            if self._slots is not None:
+                self._slots.release()
+            return self._run_inline(fn, *args, **kwargs)
+        except BaseException:
+            if self._slots is not None:
+                self._slots.release()
+            raise
+        metrics.QUEUE_DEPTH.inc(queue="executor")
+        future.add_done_callback(self._task_done)
+        return future
+
+    def _run_in_worker(self, fn, *args, **kwargs):
+        # Worker threads belong to this pool only, so the flag never needs resetting.
+        self._worker.active = True
+        return fn(*args, **kwargs)
+
+    @staticmethod
+    def _run_inline(fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def _task_done(self, future):
+        metrics.QUEUE_DEPTH.dec(queue="executor")
+        if self._slots is not None:
+            self._slots.release()
+
+    @contextmanager
+    def stage(self, name, operation=None, **attributes):
+        """
+        Hold one of the concurrency slots of the given stage. Inside a trace, the stage is also timed
+        as a span named `operation` (defaults to the stage name), recording the time spent waiting
+        for the slot as "wait_ms".
+
+        Args:
+            name (str): One of "llm", "embedder", "vector_store", "graph" or "reranker".
+            operation (str, optional): Name of the span. Defaults to None.
+        """
+        limit = self._stage_limits.get(name)
+        with tracing.span(operation or name, stage=name, **attributes) as current:
+            if limit is None:
+                yield current
+                return
+            waited = time.perf_counter()
+            with limit:
+                if current is not None:
+                    current.set_attribute("wait_ms", round((time.perf_counter() - waited) * 1000, 3))
+                yield current
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """
+        Stop accepting new work and release the worker threads.
+
+        Args:
+            wait (bool, optional): Wait for running tasks to finish. Defaults to True.
+            cancel_futures (bool, optional): Cancel tasks that have not started yet. Defaults to False.
+        """
+        self._closed = True
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    @property
+    def closed(self):
+        return self._closed
+
+
+_shared_executors = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_executor(config):
+    """
+    Return the process-wide executor for the given ExecutorConfig, creating it on first use.
+
+    Memory instances with identical executor settings share one pool and one set of stage limits.
+    """
+    key = (
+        config.max_workers,
+        config.max_queue_size,
+        tuple((stage, getattr(config, f"{stage}_concurrency")) for stage in STAGES),
+    )
+    with _shared_lock:
+        executor = _shared_executors.get(key)
+        if executor is None or executor.closed:
+            executor = _shared_executors[key] = create_executor(config)
+        return executor
+
+
+def create_executor(config):
+    """Create a new executor from an ExecutorConfig."""
+    return MemoryExecutor(
+        max_workers=config.max_workers,
+        max_queue_size=config.max_queue_size,
+        stage_limits={stage: getattr(config, f"{stage}_concurrency") for stage in STAGES},
+    )
+
+
+def shutdown_shared_executors():
+    """Stop the shared executors; called at interpreter exit by `mem0.memory.base.ingest.shutdown_at_exit`."""
+    with _shared_lock:
+        executors = list(_shared_executors.values())
+        _shared_executors.clear()
+    for executor in executors:
+        try:
+            executor.shutdown(wait=False, cancel_futures=True)
+        except Exception as e:
+            logger.warning(f"Error shutting down shared executor: {e}")
@@ -0,0 +1,298 @@
+import atexit
+import contextvars
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future
+
+from mem0.memory.base import metrics
+from mem0.memory.base.executor import shutdown_shared_executors
+
+logger = logging.getLogger(__name__)
+
+# Stage reached by the write running in the current context: "prepare" until it starts changing
+# stored data, "write" after. Shared by reference with the threads and tasks the write fans out to.
+_attempt = contextvars.ContextVar("mem0_ingest_attempt", default=None)
+
+
+def mark_write_started():
+    """
+    Record that the queued write running in this context started changing stored data. Failures from
+    here on are not retried, since running `add` again would apply its changes twice. Does nothing
+    outside a queued write.
+    """
+    attempt = _attempt.get()
+    if attempt is not None:
+        attempt["stage"] = "write"
+
+
+class IngestionQueueFull(Exception):
+    """Raised when a write is rejected because the ingestion queue is full or closed."""
+
+
+class IngestionDropped(Exception):
+    """Set on the handle of a queued write that was evicted by the drop_oldest overflow policy."""
+
+
+class IngestHandle:
+    """
+    Handle for a write queued with `add_async`.
+
+    Wraps a `concurrent.futures.Future` with the bookkeeping needed to measure queueing lag.
+    """
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+        self.started_at = None
+        self.attempts = 0
+        self.failed_stage = None
+
+    def result(self, timeout=None):
+        """Wait for the write and return the result of `add`, re-raising its final error."""
+        return self.future.result(timeout=timeout)
+
+    def exception(self, timeout=None):
+        return self.future.exception(timeout=timeout)
+
+    def done(self):
+        return self.future.done()
+
+    def add_done_callback(self, fn):
+        self.future.add_done_callback(lambda _: fn(self))
+
+
+class IngestionQueue:
+    """
+    Bounded write-behind queue drained by a small pool of dedicated worker threads.
+
+    Writes that fail before they call `mark_write_started` are retried with exponential backoff and
+    jitter; later failures are final, and the handle's `failed_stage` tells the two apart. When the
+    queue is full the overflow policy decides whether `submit` blocks, evicts the oldest queued
+    write, or raises `IngestionQueueFull`.
+    """
+
+    def __init__(
+        self,
+        fn,
+        max_size=1000,
+        overflow="block",
+        workers=2,
+        max_retries=3,
+        backoff_base=0.5,
+        backoff_max=30.0,
+        block_timeout=None,
+    ):
+        """
+        Args:
+            fn (callable): Function called with the arguments of each queued write (e.g. `Memory.add`).
+            max_size (int, optional): Maximum number of queued writes. Defaults to 1000.
+            overflow (str, optional): "block", "drop_oldest" or "reject". Defaults to "block".
+            workers (int, optional): Number of worker threads. Defaults to 2.
+            max_retries (int, optional): Retries after a first attempt that failed before writing. Defaults to 3.
+            backoff_base (float, optional): Delay before the first retry, in seconds. Defaults to 0.5.
+            backoff_max (float, optional): Upper bound of the retry delay, in seconds. Defaults to 30.
+            block_timeout (float, optional): How long "block" waits for space before raising
+                `IngestionQueueFull`. Defaults to None (wait forever).
+        """
+        if overflow not in ("block", "drop_oldest", "reject"):
+            raise ValueError(f"Unsupported overflow policy: {overflow}")
+        self.fn = fn
+        self.max_size = max_size
+        self.overflow = overflow
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.block_timeout = block_timeout
+
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self._abandon_retries = False
+        self._counters = {
+            "enqueued": 0,
+            "completed": 0,
+            "failed": 0,
+            "retries": 0,
+            "dropped": 0,
+            "rejected": 0,
+        }
+        self._last_lag = 0.0
+
+        self._workers = [
+            threading.Thread(target=self._run, name=f"mem0-ingest-{i}", daemon=True) for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        _live_queues.add(self)
+
+    def submit(self, *args, **kwargs):
+        """
+        Queue a call of `fn(*args, **kwargs)`.
+
+        Returns:
+            IngestHandle: Handle resolving to the result of the call.
+
+        Raises:
+            IngestionQueueFull: If the queue is closed, or full under the "reject" policy (or under
+                "block" once `block_timeout` expires).
+        """
+        handle = IngestHandle(args, kwargs)
+        with self._cond:
+            if self._closed:
+                raise IngestionQueueFull("Ingestion queue is closed")
+            if len(self._queue) >= self.max_size:
+                if self.overflow == "reject":
+                    self._counters["rejected"] += 1
+                    raise IngestionQueueFull(f"Ingestion queue is full ({self.max_size} pending writes)")
+                if self.overflow == "drop_oldest":
+                    dropped = self._queue.popleft()
+                    metrics.QUEUE_DEPTH.dec(queue="ingest")
+                    self._counters["dropped"] += 1
+                    dropped.future.set_exception(IngestionDropped("Evicted by a newer write"))
+                else:
+                    has_space = self._cond.wait_for(
+                        lambda: len(self._queue) < self.max_size or self._closed, timeout=self.block_timeout
+                    )
+                    if self._closed or not has_space:
+                        self._counters["rejected"] += 1
+                        raise IngestionQueueFull(f"Ingestion queue is full ({self.max_size} pending writes)")
+            self._queue.append(handle)
+            metrics.QUEUE_DEPTH.inc(queue="ingest")
+            self._counters["enqueued"] += 1
+            self._cond.notify_all()
+        return handle
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                handle = self._queue.popleft()
+                metrics.QUEUE_DEPTH.dec(queue="ingest")
+                self._in_flight += 1
+                self._cond.notify_all()
+
+            handle.started_at = time.monotonic()
+            self._last_lag = handle.started_at - handle.enqueued_at
+            try:
+                if handle.future.set_running_or_notify_cancel():
+                    self._process(handle)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _process(self, handle):
+        while True:
+            handle.attempts += 1
+            attempt = {"stage": "prepare"}
+            token = _attempt.set(attempt)
+            try:
+                result = self.fn(*handle.args, **handle.kwargs)
+            except Exception as e:
+                handle.failed_stage = attempt["stage"]
+                if attempt["stage"] == "write" or handle.attempts > self.max_retries or self._abandon_retries:
+                    stage = attempt["stage"]
+                    logger.error(f"Ingestion failed in the {stage} stage after {handle.attempts} attempts: {e}")
+                    with self._cond:
+                        self._counters["failed"] += 1
+                    handle.future.set_exception(e)
+                    return
+                delay = min(self.backoff_max, self.backoff_base * 2 ** (handle.attempts - 1))
+                delay *= random.uniform(0.5, 1.0)
+                logger.warning(f"Ingestion attempt {handle.attempts} failed, retrying in {delay:.2f}s: {e}")
+                with self._cond:
+                    self._counters["retries"] += 1
+                time.sleep(delay)
+            else:
+                with self._cond:
+                    self._counters["completed"] += 1
+                handle.future.set_result(result)
+                return
+            finally:
+                _attempt.reset(token)
+
+    def flush(self, timeout=None):
+        """
+        Wait until every queued write has been processed.
+
+        Returns:
+            bool: True if the queue drained, False if the timeout expired first.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._in_flight, timeout=timeout)
+
+    def close(self, wait=True, timeout=None):
+        """
+        Stop accepting writes and stop the workers.
+
+        Args:
+            wait (bool, optional): Drain the queue before stopping. Otherwise queued writes are
+                cancelled. Defaults to True.
+            timeout (float, optional): Maximum time to wait for the drain. Defaults to None.
+
+        Returns:
+            bool: True if every write was processed.
+        """
+        drained = self.flush(timeout=timeout) if wait else False
+        with self._cond:
+            self._closed = True
+            self._abandon_retries = not wait
+            while self._queue:
+                self._queue.popleft().future.cancel()
+                metrics.QUEUE_DEPTH.dec(queue="ingest")
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        _live_queues.discard(self)
+        return drained
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def stats(self):
+        """
+        Returns:
+            dict: Queue depth, in-flight writes, lag and cumulative counters.
+        """
+        with self._cond:
+            oldest = self._queue[0].enqueued_at if self._queue else None
+            return {
+                "depth": len(self._queue),
+                "in_flight": self._in_flight,
+                "oldest_lag_seconds": time.monotonic() - oldest if oldest is not None else 0.0,
+                "last_lag_seconds": self._last_lag,
+                **self._counters,
+            }
+
+
+_live_queues = weakref.WeakSet()
+
+
+def flush_ingestion_queues(timeout=30.0):
+    """Drain and close every open ingestion queue."""
+    for queue in list(_live_queues):
+        try:
+            queue.close(wait=True, timeout=timeout)
+        except Exception as e:
+            logger.warning(f"Error flushing ingestion queue: {e}")
+
+
+@atexit.register
+def shutdown_at_exit(timeout=30.0):
+    """
+    Interpreter exit hook: drain the ingestion queues of Memory instances that were never closed, so
+    accepted writes are not lost, then stop the shared executors. Call `Memory.close()` (or
+    `Memory.flush()`) to drain a queue at a point of your choosing instead.
+    """
+    flush_ingestion_queues(timeout=timeout)
+    shutdown_shared_executors()
@@ -0,0 +1,299 @@
+import logging
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key):
+        return list(zip(self.labelnames, key))
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, e.g. calls or tokens."""
+
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, self._labels(key), value) for key, value in self._values.items()]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, e.g. the number of queued tasks."""
+
+    type = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def get(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, self._labels(key), value) for key, value in self._values.items()]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (e.g. latencies in seconds) over cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["buckets"][i] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+
+    def get(self, **labels):
+        """
+        Returns:
+            dict: "count" and "sum" of the observations with the given labels.
+        """
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return {"count": state["count"], "sum": state["sum"]} if state else {"count": 0, "sum": 0.0}
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, state in self._values.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, state["buckets"]):
+                    cumulative += count
+                    labels = self._labels(key) + [("le", _format_value(bound))]
+                    samples.append((self.name + "_bucket", labels, cumulative))
+                samples.append((self.name + "_sum", self._labels(key), state["sum"]))
+                samples.append((self.name + "_count", self._labels(key), state["count"]))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics, rendered in the Prometheus text exposition format.
+
+    Nothing is sent anywhere: the metrics are read with `render()` / `snapshot()` or scraped from the
+    endpoint started with `start_http_server`, so they work without network access.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, documentation, labelnames=(), **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with a different type or labels")
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def render(self):
+        """
+        Returns:
+            str: Every metric in the Prometheus text exposition format (version 0.0.4).
+        """
+        lines = []
+        for metric in sorted(self._metrics.values(), key=lambda metric: metric.name):
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for sample_name, labels, value in metric.samples():
+                if labels:
+                    label_text = ",".join(f'{label}="{_escape_label(label_value)}"' for label, label_value in labels)
+                    sample_name = f"{sample_name}{{{label_text}}}"
+                lines.append(f"{sample_name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: Sample values keyed by metric name, then by a tuple of (label, value) pairs.
+        """
+        result = {}
+        for metric in list(self._metrics.values()):
+            for sample_name, labels, value in metric.samples():
+                result.setdefault(sample_name, {})[tuple(labels)] = value
+        return result
+
+    def clear(self):
+        """Reset every metric to zero, keeping the registrations."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    return str(value)
+
+
+def _escape_help(text):
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+REGISTRY = MetricsRegistry()
+
+OPERATION_LATENCY = REGISTRY.histogram(
+    "mem0_operation_duration_seconds", "Latency of Memory operations such as add and search", ("operation", "status")
+)
+STAGE_LATENCY = REGISTRY.histogram(
+    "mem0_stage_duration_seconds", "Latency of the individual steps of an operation", ("stage", "operation")
+)
+STAGE_ERRORS = REGISTRY.counter(
+    "mem0_stage_errors_total", "Steps that raised, e.g. failed vector store calls", ("stage", "operation")
+)
+LLM_CALLS = REGISTRY.counter("mem0_llm_calls_total", "Requests sent to the LLM provider", ("provider", "model"))
+LLM_TOKENS = REGISTRY.counter(
+    "mem0_llm_tokens_total", "Tokens reported by the LLM provider", ("provider", "model", "type")
+)
+EMBEDDING_CALLS = REGISTRY.counter(
+    "mem0_embedding_calls_total", "Requests sent to the embedding provider", ("provider", "model")
+)
+EMBEDDED_TEXTS = REGISTRY.counter(
+    "mem0_embedded_texts_total", "Texts sent to the embedding provider", ("provider", "model")
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "mem0_cache_lookups_total", "Cache lookups by cache (llm, embedding) and result (hit, miss)", ("cache", "result")
+)
+QUEUE_DEPTH = REGISTRY.gauge("mem0_queue_depth", "Submitted tasks that have not finished yet", ("queue",))
+MEMORY_EVENTS = REGISTRY.counter(
+    "mem0_memory_events_total", "Memory changes decided by the update step (ADD, UPDATE, DELETE, NONE)", ("event",)
+)
+
+
+def record_span(name, stage, seconds, error=False):
+    """Record the latency, and failure, of one step. Called by `tracing.span` for every step."""
+    stage = stage or name.split(".", 1)[0]
+    STAGE_LATENCY.observe(seconds, stage=stage, operation=name)
+    if error:
+        STAGE_ERRORS.inc(stage=stage, operation=name)
+
+
+def record_memory_events(events):
+    """Count the events (ADD, UPDATE, DELETE or NONE) applied by one update step."""
+    for event in events:
+        MEMORY_EVENTS.inc(event=event)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+_servers = {}
+_servers_lock = threading.Lock()
+
+
+def start_http_server(port, addr="127.0.0.1", registry=REGISTRY):
+    """
+    Serve the registry at http://<addr>:<port>/metrics from a daemon thread. Calling it again for
+    the same address returns the running server.
+
+    Args:
+        port (int): Port to listen on. 0 picks a free port (see `server.server_address`).
+        addr (str, optional): Address to bind; "0.0.0.0" serves every interface. Defaults to "127.0.0.1".
+        registry (MetricsRegistry, optional): Registry to expose. Defaults to the global registry.
+
+    Returns:
+        ThreadingHTTPServer: The running server; call `shutdown()` to stop it.
+    """
+    with _servers_lock:
+        server = _servers.get((addr, port)) if port else None
+        if server is not None:
+            return server
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+        server = ThreadingHTTPServer((addr, port), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="mem0-metrics", daemon=True).start()
+        if port:
+            _servers[(addr, port)] = server
+        logger.info(f"Serving metrics on http://{addr}:{server.server_address[1]}/metrics")
+        return server
@@ -0,0 +1,185 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+PARTITION_KEYS = ("user_id", "agent_id", "run_id")
+
+
+def _timestamp(value):
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class RetentionManager:
+    """
+    Enforces the TTL and capacity policies of `RetentionConfig`.
+
+    A partition is the set of memories sharing the user_id, agent_id and run_id of their payload,
+    and its policy is looked up by agent_id. Writes keep an approximate per-partition count, so a
+    partition is only listed when it may have gone over capacity. Expired memories are removed by
+    the periodic sweep and whenever a partition is enforced.
+
+    Retrieval times are tracked in process: memories that were never retrieved by this process are
+    ranked by their last update.
+    """
+
+    def __init__(self, memory, config, max_tracked=100000, batch_size=1000):
+        self.memory = memory
+        self.config = config
+        self.max_tracked = max_tracked
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._retrieved_at = OrderedDict()
+        self._stop = threading.Event()
+        self._sweeper = None
+
+    def policy_for(self, agent_id):
+        return self.config.partitions.get(agent_id, self.config.default)
+
+    @staticmethod
+    def partition_of(payload):
+        return tuple(payload.get(key) for key in PARTITION_KEYS)
+
+    def record_retrieved(self, memory_ids):
+        """Mark memories as retrieved now, for least-recently-retrieved eviction."""
+        now = time.time()
+        with self._lock:
+            for memory_id in memory_ids:
+                self._retrieved_at[memory_id] = now
+                self._retrieved_at.move_to_end(memory_id)
+            while len(self._retrieved_at) > self.max_tracked:
+                self._retrieved_at.popitem(last=False)
+
+    def record_added(self, payloads):
+        """
+        Count new memories per partition and enforce the partitions that may be over capacity.
+
+        Returns:
+            int: Number of evicted memories.
+        """
+        added = {}
+        for payload in payloads:
+            partition = self.partition_of(payload)
+            added[partition] = added.get(partition, 0) + 1
+
+        evicted = 0
+        for partition, count in added.items():
+            policy = self.policy_for(partition[1])
+            if policy is None or policy.max_memories is None:
+                continue
+            with self._lock:
+                known = self._counts.get(partition)
+                if known is not None:
+                    self._counts[partition] = known + count
+            if known is None or known + count > policy.max_memories:
+                evicted += self.enforce(partition)
+        return evicted
+
+    def enforce(self, partition):
+        """
+        Delete the expired memories of a partition and evict the lowest ranked ones above capacity.
+
+        Returns:
+            int: Number of deleted memories.
+        """
+        policy = self.policy_for(partition[1])
+        if policy is None:
+            return 0
+        filters = {key: value for key, value in zip(PARTITION_KEYS, partition) if value is not None}
+        with self.memory.executor.stage("vector_store"):
+            memories = list(self.memory.vector_store.iter_all(filters=filters, page_size=self.batch_size))
+        # Filters cannot express "key is missing", so drop memories of narrower partitions.
+        memories = [mem for mem in memories if self.partition_of(mem.payload) == partition]
+
+        expired = [mem for mem in memories if self._is_expired(mem, policy)]
+        alive = [mem for mem in memories if not self._is_expired(mem, policy)]
+        evicted = []
+        if policy.max_memories is not None and len(alive) > policy.max_memories:
+            alive.sort(key=lambda mem: self._rank(mem, policy))
+            evicted = alive[: len(alive) - policy.max_memories]
+            alive = alive[len(evicted) :]
+        with self._lock:
+            self._counts[partition] = len(alive)
+
+        deleted = expired + evicted
+        if deleted:
+            logger.info(f"Retention removed {len(expired)} expired and {len(evicted)} evicted memories of {filters}")
+            self._delete(deleted)
+        return len(deleted)
+
+    def sweep(self):
+        """
+        Delete every expired memory while streaming the partitions that have a TTL, with one bulk
+        delete per `batch_size` expired memories.
+
+        Returns:
+            int: Number of deleted memories.
+        """
+        deleted = 0
+        scopes = [({"agent_id": agent_id}, policy) for agent_id, policy in self.config.partitions.items()]
+        if self.config.default is not None:
+            scopes.append(({}, self.config.default))
+        for filters, policy in scopes:
+            if policy.ttl is None:
+                continue
+            batch = []
+            for mem in self.memory.vector_store.iter_all(filters=filters or None, page_size=self.batch_size):
+                # The default scope also lists the partitions that have their own policy.
+                if self.policy_for(mem.payload.get("agent_id")) is not policy or not self._is_expired(mem, policy):
+                    continue
+                batch.append(mem)
+                if len(batch) >= self.batch_size:
+                    deleted += self._delete(batch)
+                    batch = []
+            if batch:
+                deleted += self._delete(batch)
+        return deleted
+
+    def start(self):
+        """Start the background sweeper if `sweep_interval` is set."""
+        if self.config.sweep_interval is None or self._sweeper is not None:
+            return
+        self._sweeper = threading.Thread(target=self._run_sweeper, name="mem0-retention", daemon=True)
+        self._sweeper.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=timeout)
+            self._sweeper = None
+
+    def _run_sweeper(self):
+        while not self._stop.wait(self.config.sweep_interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Error in retention sweep: {e}")
+
+    @staticmethod
+    def _is_expired(mem, policy):
+        if policy.ttl is None:
+            return False
+        updated_at = mem.payload.get("updated_at") or mem.payload.get("created_at")
+        return _timestamp(updated_at) + policy.ttl < time.time()
+
+    def _rank(self, mem, policy):
+        updated_at = _timestamp(mem.payload.get("updated_at") or mem.payload.get("created_at"))
+        if policy.eviction == "oldest":
+            return updated_at
+        return max(updated_at, self._retrieved_at.get(str(mem.id), 0.0))
+
+    def _delete(self, memories):
+        with self.memory.executor.stage("vector_store"):
+            self.memory.vector_store.delete_batch([str(mem.id) for mem in memories])
+        self.memory._record_deletions(memories)
+        with self._lock:
+            for mem in memories:
+                self._retrieved_at.pop(str(mem.id), None)
+        return len(memories)
@@ -0,0 +1,272 @@
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+
+from mem0.memory.base import metrics
+
+logger = logging.getLogger(__name__)
+
+_current_span = contextvars.ContextVar("mem0_current_span", default=None)
+
+
+class Span:
+    """
+    A timed operation with attributes and child spans.
+
+    Spans opened while another span is current become its children, including spans opened on
+    executor threads, which inherit the caller's context.
+    """
+
+    def __init__(self, name, attributes=None, parent=None, tracer=None):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.tracer = tracer
+        self.children = []
+        self.start_time = time.time()
+        self.end_time = None
+        self._start = time.perf_counter()
+        self.duration = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def add_to_attribute(self, key, value):
+        self.attributes[key] = self.attributes.get(key, 0) + value
+
+    def end(self):
+        self.duration = time.perf_counter() - self._start
+        self.end_time = self.start_time + self.duration
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3) if self.duration is not None else None,
+            "attributes": self.attributes,
+            "children": [child.to_dict() for child in list(self.children)],
+        }
+
+    def breakdown(self):
+        """
+        Returns:
+            dict: Total milliseconds spent per span name below this span, plus "total".
+        """
+        totals = {}
+        pending = list(self.children)
+        while pending:
+            span = pending.pop()
+            if span.duration is not None:
+                totals[span.name] = totals.get(span.name, 0.0) + span.duration * 1000
+            pending.extend(span.children)
+        totals = {name: round(ms, 3) for name, ms in sorted(totals.items())}
+        totals["total"] = round((self.duration or 0.0) * 1000, 3)
+        return totals
+
+
+def current_span():
+    return _current_span.get()
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Open a child span of the current span. Outside of a trace no span is created and None is yielded.
+
+    Either way the step's latency, and whether it raised, is recorded in the metrics registry under
+    its "stage" attribute (defaults to the part of `name` before the first dot).
+    """
+    parent = _current_span.get()
+    if parent is None:
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield None
+        except Exception:
+            failed = True
+            raise
+        finally:
+            metrics.record_span(name, attributes.get("stage"), time.perf_counter() - start, error=failed)
+        return
+    child = Span(name, attributes, parent=parent, tracer=parent.tracer)
+    parent.children.append(child)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except Exception as e:
+        child.set_attribute("error", repr(e))
+        raise
+    finally:
+        child.end()
+        _current_span.reset(token)
+        metrics.record_span(name, attributes.get("stage"), child.duration, error="error" in child.attributes)
+
+
+def set_attributes(**attributes):
+    """Set attributes on the current span, if any."""
+    current = _current_span.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+
+def record_llm_usage(prompt_tokens=None, completion_tokens=None, model=None):
+    """Add the token usage of an LLM call to the current span, if any."""
+    current = _current_span.get()
+    if current is None:
+        return
+    if prompt_tokens is not None:
+        current.add_to_attribute("prompt_tokens", prompt_tokens)
+    if completion_tokens is not None:
+        current.add_to_attribute("completion_tokens", completion_tokens)
+    if model is not None:
+        current.set_attribute("model", model)
+
+
+class SpanExporter(ABC):
+    """Receives every finished root span of a `Tracer`."""
+
+    @abstractmethod
+    def export(self, span):
+        pass
+
+    def shutdown(self):
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the most recent root spans in memory, e.g. for tests or a debug endpoint."""
+
+    def __init__(self, max_spans=1000):
+        self._spans = deque(maxlen=max_spans)
+
+    def export(self, span):
+        self._spans.append(span)
+
+    @property
+    def spans(self):
+        return list(self._spans)
+
+    def clear(self):
+        self._spans.clear()
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Appends every root span, with its children, as one JSON line to a file."""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, span):
+        line = json.dumps(span.to_dict(), default=str, ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Replays finished span trees as OpenTelemetry spans of the configured tracer provider."""
+
+    def __init__(self, tracer_provider=None, instrumentation_name="mem0"):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "The 'opentelemetry-api' library is required. Please install it using 'pip install opentelemetry-api'."
+            )
+        self._trace = trace
+        self._tracer = trace.get_tracer(instrumentation_name, tracer_provider=tracer_provider)
+
+    def export(self, span):
+        self._replay(span, None)
+
+    def _replay(self, span, context):
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            start_time=int(span.start_time * 1e9),
+            attributes={key: value for key, value in span.attributes.items() if value is not None},
+        )
+        child_context = self._trace.set_span_in_context(otel_span)
+        for child in list(span.children):
+            self._replay(child, child_context)
+        otel_span.end(end_time=int((span.end_time or span.start_time) * 1e9))
+
+
+def create_exporter(name, path=None):
+    if name == "memory":
+        return InMemorySpanExporter()
+    if name == "jsonl":
+        from mem0.memory.base.setup import mem0_dir
+
+        return JsonLinesSpanExporter(path or os.path.join(mem0_dir, "traces.jsonl"))
+    if name == "otel":
+        return OpenTelemetrySpanExporter()
+    raise ValueError(f"Unsupported span exporter: {name}")
+
+
+class Tracer:
+    """
+    Opens the root span of an operation and hands it to the exporters once it finishes.
+
+    A disabled tracer opens no spans, so `span()` calls below it only update the metrics registry.
+    """
+
+    def __init__(self, exporters=None, enabled=True):
+        self.exporters = list(exporters or [])
+        self.enabled = enabled
+
+    @classmethod
+    def from_config(cls, config):
+        exporters = [create_exporter(name, config.path) for name in config.exporters]
+        return cls(exporters, enabled=config.enabled)
+
+    @contextmanager
+    def trace(self, name, **attributes):
+        """
+        Open a span for an operation. Inside an existing trace it becomes a child span; otherwise it is
+        a root span exported when it ends. Yields None when the tracer is disabled.
+
+        Top-level operations are timed in the metrics registry even when the tracer is disabled.
+        """
+        if _current_span.get() is not None:
+            with span(name, **attributes) as child:
+                yield child
+            return
+        root = Span(name, attributes, tracer=self) if self.enabled else None
+        token = _current_span.set(root) if root is not None else None
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield root
+        except Exception as e:
+            status = "error"
+            if root is not None:
+                root.set_attribute("error", repr(e))
+            raise
+        finally:
+            metrics.OPERATION_LATENCY.observe(time.perf_counter() - start, operation=name, status=status)
+            if root is not None:
+                root.end()
+                _current_span.reset(token)
+                self._export(root)
+
+    def add_exporter(self, exporter):
+        self.exporters.append(exporter)
+
+    def shutdown(self):
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    def _export(self, root):
+        for exporter in self.exporters:
+            try:
+                exporter.export(root)
+            except Exception as e:
+                logger.warning(f"Error exporting span {root.name}: {e}")
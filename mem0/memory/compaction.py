@@ -0,0 +1,236 @@
+import argparse
+import json
+import logging
+import threading
+import uuid
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("The 'numpy' library is required. Please install it using 'pip install numpy'.")
+
+from mem0.configs.prompts.base_prompts import get_merge_memory_messages
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text):
+    """Rough token count (about four characters per token) used for compaction reports."""
+    return max(1, len(text or "") // 4)
+
+
+def cluster_embeddings(embeddings, threshold=0.9, max_cluster_size=20, block_size=1024):
+    """
+    Group embeddings whose cosine similarity to a cluster leader is at least `threshold`.
+
+    Rows are visited in order and every unassigned row becomes the leader of a new cluster with all
+    still unassigned rows similar to it, so clusters never chain through intermediate members.
+    Similarities are computed one block of rows at a time, bounding memory to `block_size * n`.
+
+    Args:
+        embeddings (list): Embedding vectors.
+        threshold (float, optional): Minimum cosine similarity to the leader. Defaults to 0.9.
+        max_cluster_size (int, optional): Largest cluster; the most similar rows are kept. Defaults to 20.
+        block_size (int, optional): Rows per similarity block. Defaults to 1024.
+
+    Returns:
+        list: Clusters of two or more row indexes, each starting with its leader.
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim != 2 or len(matrix) < 2:
+        return []
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix = matrix / norms
+
+    assigned = np.zeros(len(matrix), dtype=bool)
+    clusters = []
+    for start in range(0, len(matrix), block_size):
+        similarities = matrix[start : start + block_size] @ matrix.T
+        for offset, row in enumerate(similarities):
+            leader = start + offset
+            if assigned[leader]:
+                continue
+            members = np.flatnonzero((row >= threshold) & ~assigned)
+            if len(members) > max_cluster_size:
+                members = members[np.argsort(-row[members], kind="stable")[:max_cluster_size]]
+            members = np.union1d(members, [leader])
+            assigned[members] = True
+            if len(members) > 1:
+                clusters.append([leader] + [int(member) for member in members if member != leader])
+    return clusters
+
+
+def compact(
+    memory,
+    user_id=None,
+    agent_id=None,
+    run_id=None,
+    threshold=0.9,
+    max_cluster_size=20,
+    dry_run=False,
+    max_concurrency=8,
+    page_size=1000,
+):
+    """
+    Merge near-duplicate memories of one session.
+
+    The memories are embedded in one batch, clustered by cosine similarity and every cluster is
+    merged with a single LLM call. The merged memory replaces the originals with one vector store
+    insert and one batch delete, and the history records an ADD for the merged memory and a MERGE
+    for every original.
+
+    Args:
+        memory (MemoryBase): Memory instance to compact.
+        user_id (str, optional): ID of the user to compact. Defaults to None.
+        agent_id (str, optional): ID of the agent to compact. Defaults to None.
+        run_id (str, optional): ID of the run to compact. Defaults to None.
+        threshold (float, optional): Minimum cosine similarity within a cluster. Defaults to 0.9.
+        max_cluster_size (int, optional): Maximum number of memories merged at once. Defaults to 20.
+        dry_run (bool, optional): Only report what would be merged. Defaults to False.
+        max_concurrency (int, optional): Maximum number of merge LLM calls in flight. Defaults to 8.
+        page_size (int, optional): Number of memories fetched per vector store request. Defaults to 1000.
+
+    Returns:
+        dict: Report with the memory and (estimated) token counts before and after, and the merges.
+    """
+    filters = {key: value for key, value in (("user_id", user_id), ("agent_id", agent_id), ("run_id", run_id)) if value}
+    if not filters:
+        raise ValueError("One of the filters: user_id, agent_id or run_id is required!")
+
+    with memory.executor.stage("vector_store"):
+        memories = list(memory.vector_store.iter_all(filters=filters, page_size=page_size))
+    texts = [mem.payload.get("data", "") for mem in memories]
+    embeddings = []
+    if len(texts) > 1:
+        with memory.executor.stage("embedder"):
+            embeddings = memory.embedding_model.embed_batch(texts)
+    clusters = cluster_embeddings(embeddings, threshold=threshold, max_cluster_size=max_cluster_size)
+    logger.info(f"Found {len(clusters)} clusters of near-duplicates among {len(memories)} memories")
+
+    tokens_before = sum(estimate_tokens(text) for text in texts)
+    if dry_run:
+        merged_texts = [None] * len(clusters)
+    else:
+        limiter = threading.BoundedSemaphore(max_concurrency)
+        merged_texts = memory._map_limited(
+            limiter, lambda cluster: _merge_cluster(memory, [texts[index] for index in cluster]), clusters
+        )
+
+    merges = []
+    tokens_saved = 0
+    for cluster, merged in zip(clusters, merged_texts):
+        if isinstance(merged, Exception) or (not dry_run and not merged):
+            continue
+        # A dry run has no merged text, so the merge is assumed to be as long as the longest original.
+        merged_tokens = estimate_tokens(merged) if merged else max(estimate_tokens(texts[index]) for index in cluster)
+        tokens_saved += sum(estimate_tokens(texts[index]) for index in cluster) - merged_tokens
+        merges.append({"originals": [memories[index] for index in cluster], "memory": merged})
+    if not dry_run and merges:
+        _replace_merged(memory, merges)
+
+    merged_count = sum(len(merge["originals"]) for merge in merges)
+    return {
+        "dry_run": dry_run,
+        "memories_before": len(memories),
+        "memories_after": len(memories) - merged_count + len(merges),
+        "memories_saved": merged_count - len(merges),
+        "tokens_before": tokens_before,
+        "tokens_after": tokens_before - tokens_saved,
+        "tokens_saved": tokens_saved,
+        "merges": [
+            {
+                "id": merge.get("id"),
+                "memory": merge["memory"],
+                "merged_ids": [str(original.id) for original in merge["originals"]],
+                "merged_memories": [original.payload.get("data") for original in merge["originals"]],
+            }
+            for merge in merges
+        ],
+    }
+
+
+def _merge_cluster(memory, texts):
+    with memory.executor.stage("llm"):
+        response = memory.llm.generate_response(
+            messages=[{"role": "user", "content": get_merge_memory_messages(texts)}],
+            response_format={"type": "json_object"},
+        )
+    return json.loads(response).get("memory", "").strip()
+
+
+def _replace_merged(memory, merges):
+    """Insert the merged memories, delete their originals and record both in the history."""
+    with memory.executor.stage("embedder"):
+        vectors = memory.embedding_model.embed_batch([merge["memory"] for merge in merges])
+
+    payloads = []
+    history = []
+    for merge in merges:
+        merge["id"] = str(uuid.uuid4())
+        # The merged memory belongs to the session of its cluster leader and keeps its metadata.
+        payload = memory._new_memory_payload(merge["memory"], merge["originals"][0].payload)
+        payloads.append(payload)
+        history.append(
+            {
+                "memory_id": merge["id"],
+                "old_memory": None,
+                "new_memory": merge["memory"],
+                "event": "ADD",
+                "created_at": payload["created_at"],
+                "updated_at": payload["updated_at"],
+            }
+        )
+        history.extend(
+            {
+                "memory_id": str(original.id),
+                "old_memory": original.payload.get("data"),
+                "new_memory": merge["memory"],
+                "event": "MERGE",
+                "created_at": original.payload.get("created_at"),
+                "updated_at": payload["updated_at"],
+                "is_deleted": 1,
+            }
+            for original in merge["originals"]
+        )
+
+    with memory.executor.stage("vector_store"):
+        memory.vector_store.insert(vectors=vectors, ids=[merge["id"] for merge in merges], payloads=payloads)
+        memory.vector_store.delete_batch([str(original.id) for merge in merges for original in merge["originals"]])
+    memory.db.add_history_many(history)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge near-duplicate memories of a user, agent or run.")
+    parser.add_argument("--config", help="Path of a JSON file with the Memory configuration")
+    parser.add_argument("--user-id")
+    parser.add_argument("--agent-id")
+    parser.add_argument("--run-id")
+    parser.add_argument("--threshold", type=float, default=0.9, help="Minimum cosine similarity within a cluster")
+    parser.add_argument("--max-cluster-size", type=int, default=20)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be merged")
+    args = parser.parse_args(argv)
+
+    from mem0.memory.memory import Memory
+
+    if args.config:
+        with open(args.config) as f:
+            memory = Memory.from_config(json.load(f))
+    else:
+        memory = Memory()
+    with memory:
+        report = memory.compact(
+            user_id=args.user_id,
+            agent_id=args.agent_id,
+            run_id=args.run_id,
+            threshold=args.threshold,
+            max_cluster_size=args.max_cluster_size,
+            dry_run=args.dry_run,
+            max_concurrency=args.max_concurrency,
+        )
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ from mem0.graphs.tools import (
     UPDATE_MEMORY_TOOL_GRAPH,
 )
 from mem0.graphs.utils import EXTRACT_ENTITIES_PROMPT, get_update_memory_messages
+from mem0.memory.base import tracing
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,12 @@ class MemoryGraph:
             self.config.graph_store.config.username,
             self.config.graph_store.config.password,
         )
-        self.embedding_model = EmbedderFactory.create(self.config.embedder.provider, self.config.embedder.config)
+        self.embedding_model = EmbedderFactory.create(
+            self.config.embedder.provider,
+            self.config.embedder.config,
+            self.config.embedder.cache,
+            self.config.embedder.cassette,
+        )
 
         self.llm_provider = "openai_structured"
         if self.config.llm.provider:
@@ -37,7 +43,9 @@ class MemoryGraph:
         if self.config.graph_store.llm:
             self.llm_provider = self.config.graph_store.llm.provider
 
-        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
+        self.llm = LlmFactory.create(
+            self.llm_provider, self.config.llm.config, self.config.llm.cache, self.config.llm.cassette
+        )
         self.user_id = None
         self.threshold = 0.7
 
@@ -76,10 +84,11 @@ class MemoryGraph:
         if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
             _tools = [ADD_MESSAGE_STRUCT_TOOL]
 
-        extracted_entities = self.llm.generate_response(
-            messages=messages,
-            tools=_tools,
-        )
+        with tracing.span("llm.extract_entities", stage="llm"):
+            extracted_entities = self.llm.generate_response(
+                messages=messages,
+                tools=_tools,
+            )
 
         if extracted_entities["tool_calls"]:
             extracted_entities = extracted_entities["tool_calls"][0]["arguments"]["entities"]
@@ -98,10 +107,11 @@ class MemoryGraph:
                 NOOP_STRUCT_TOOL,
             ]
 
-        memory_updates = self.llm.generate_response(
-            messages=update_memory_prompt,
-            tools=_tools,
-        )
+        with tracing.span("llm.update_graph", stage="llm"):
+            memory_updates = self.llm.generate_response(
+                messages=update_memory_prompt,
+                tools=_tools,
+            )
 
         to_be_added = []
 
@@ -120,6 +130,16 @@ class MemoryGraph:
 
         returned_entities = []
 
+        # Embed every node name of this batch in one call
+        node_names = []
+        for item in to_be_added:
+            for key in ("source", "destination"):
+                name = item[key].lower().replace(" ", "_")
+                if name not in node_names:
+                    node_names.append(name)
+        with tracing.span("embedder.embed_batch", stage="embedder", count=len(node_names)):
+            node_embeddings = dict(zip(node_names, self.embedding_model.embed_batch(node_names)))
+
         for item in to_be_added:
             source = item["source"].lower().replace(" ", "_")
             source_type = item["source_type"].lower().replace(" ", "_")
@@ -129,9 +149,8 @@ class MemoryGraph:
 
             returned_entities.append({"source": source, "relationship": relation, "target": destination})
 
-            # Create embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
+            source_embedding = node_embeddings[source]
+            dest_embedding = node_embeddings[destination]
 
             # Updated Cypher query to include node types and embeddings
             cypher = f"""
@@ -154,7 +173,8 @@ class MemoryGraph:
                 "user_id": filters["user_id"],
             }
 
-            _ = self.graph.query(cypher, params=params)
+            with tracing.span("graph.query"):
+                _ = self.graph.query(cypher, params=params)
 
         logger.info(f"Added {len(to_be_added)} new memories to the graph")
 
@@ -164,16 +184,17 @@ class MemoryGraph:
         _tools = [SEARCH_TOOL]
         if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
             _tools = [SEARCH_STRUCT_TOOL]
-        search_results = self.llm.generate_response(
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"You are a smart assistant who understands the entities, their types, and relations in a given text. If user message contains self reference such as 'I', 'me', 'my' etc. then use {filters['user_id']} as the source node. Extract the entities.",
-                },
-                {"role": "user", "content": query},
-            ],
-            tools=_tools,
-        )
+        with tracing.span("llm.search_entities", stage="llm"):
+            search_results = self.llm.generate_response(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"You are a smart assistant who understands the entities, their types, and relations in a given text. If user message contains self reference such as 'I', 'me', 'my' etc. then use {filters['user_id']} as the source node. Extract the entities.",
+                    },
+                    {"role": "user", "content": query},
+                ],
+                tools=_tools,
+            )
 
         node_list = []
         relation_list = []
@@ -194,9 +215,10 @@ class MemoryGraph:
         logger.debug(f"Node list for search query : {node_list}")
 
         result_relations = []
+        with tracing.span("embedder.embed_batch", stage="embedder", count=len(node_list)):
+            node_embeddings = self.embedding_model.embed_batch(node_list)
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
+        for node, n_embedding in zip(node_list, node_embeddings):
 
             cypher_query = """
             MATCH (n)
@@ -227,7 +249,8 @@ class MemoryGraph:
                 "user_id": filters["user_id"],
                 "limit": limit,
             }
-            ans = self.graph.query(cypher_query, params=params)
+            with tracing.span("graph.query"):
+                ans = self.graph.query(cypher_query, params=params)
             result_relations.extend(ans)
 
         return result_relations
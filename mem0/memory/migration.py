@@ -0,0 +1,94 @@
+import argparse
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_embeddings(source, target, filters=None, batch_size=100, page_size=1000):
+    """
+    Copy memories into another collection, re-embedding them with the target's embedder.
+
+    Use it to move an existing collection to a new embedding size, for example after lowering
+    `embedding_dims` of a text-embedding-3 embedder: vector store collections cannot change their
+    dimensions in place, so `target` must point at a new collection sized for its embedder. Memory IDs
+    and payloads are kept, so the history database stays valid for both collections.
+
+    Args:
+        source (MemoryBase): Memory instance reading the existing collection.
+        target (MemoryBase): Memory instance writing the new collection.
+        filters (dict, optional): Payload filters limiting the memories copied. Defaults to None.
+        batch_size (int, optional): Number of memories embedded and inserted at once. Defaults to 100.
+        page_size (int, optional): Number of memories fetched per vector store request. Defaults to 1000.
+
+    Returns:
+        dict: Report with the number of memories copied and the target's embedding dimensions.
+    """
+    source_config = source.config.vector_store
+    target_config = target.config.vector_store
+    if (source_config.provider, source_config.config.collection_name) == (
+        target_config.provider,
+        target_config.config.collection_name,
+    ):
+        raise ValueError("The target must use a different collection than the source")
+
+    copied = 0
+    batch = []
+    for memory in source.vector_store.iter_all(filters=filters, page_size=page_size):
+        batch.append(memory)
+        if len(batch) >= batch_size:
+            copied += _copy_batch(target, batch)
+            batch = []
+    if batch:
+        copied += _copy_batch(target, batch)
+
+    logger.info(f"Copied {copied} memories into {target_config.provider} collection {target.collection_name}")
+    return {
+        "copied": copied,
+        "collection_name": target.collection_name,
+        "embedding_dims": target.embedding_model.config.embedding_dims,
+    }
+
+
+def _copy_batch(target, memories):
+    with target.executor.stage("embedder"):
+        vectors = target.embedding_model.embed_batch([memory.payload.get("data", "") for memory in memories])
+    with target.executor.stage("vector_store"):
+        target.vector_store.insert(
+            vectors=vectors,
+            ids=[str(memory.id) for memory in memories],
+            payloads=[memory.payload for memory in memories],
+        )
+    return len(memories)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-embed memories into a new collection, e.g. with fewer dimensions.")
+    parser.add_argument(
+        "--source-config", required=True, help="Path of a JSON file with the current Memory configuration"
+    )
+    parser.add_argument("--target-config", required=True, help="Path of a JSON file with the new Memory configuration")
+    parser.add_argument("--user-id")
+    parser.add_argument("--agent-id")
+    parser.add_argument("--run-id")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    from mem0.memory.memory import Memory
+
+    filters = {
+        key: value
+        for key, value in (("user_id", args.user_id), ("agent_id", args.agent_id), ("run_id", args.run_id))
+        if value
+    }
+    with open(args.source_config) as f:
+        source = Memory.from_config(json.load(f))
+    with open(args.target_config) as f:
+        target = Memory.from_config(json.load(f))
+    with source, target:
+        report = migrate_embeddings(source, target, filters=filters or None, batch_size=args.batch_size)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 
 import json
 import logging
-import concurrent
+import concurrent.futures
+import threading
+import time
 import warnings
 from copy import deepcopy
 from pydantic import ValidationError
@@ -96,26 +98,11 @@ class AvaterMemory(Memory):
 
 
         """
-        if metadata is None:
-            metadata = {}
+        messages, metadata, filters = self._prepare_add(messages, user_id, agent_id, run_id, metadata, filters)
 
-        filters = filters or {}
-        if user_id:
-            filters["user_id"] = metadata["user_id"] = user_id
-        if agent_id:
-            filters["agent_id"] = metadata["agent_id"] = agent_id
-        if run_id:
-            filters["run_id"] = metadata["run_id"] = run_id
-
-        if not any(key in filters for key in ("user_id", "agent_id", "run_id")):
-            raise ValueError("One of the filters: user_id, agent_id or run_id is required!")
-
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(self._add_to_vector_store, messages, metadata, filters)
-            future2 = executor.submit(self._add_to_graph, messages, filters)
+        with self.tracer.trace("add", version=self.api_version) as trace:
+            future1 = self.executor.submit(self._add_to_vector_store, messages, metadata, filters)
+            future2 = self.executor.submit(self._add_to_graph, messages, filters)
 
             concurrent.futures.wait([future1, future2])
 
@@ -123,10 +110,13 @@ class AvaterMemory(Memory):
             graph_result = future2.result()
 
         if self.api_version == "v1.1":
-            return {
-                "results": vector_store_result,
-                "relations": graph_result,
-            }
+            return self._with_timings(
+                {
+                    "results": vector_store_result,
+                    "relations": graph_result,
+                },
+                trace,
+            )
         else:
             warnings.warn(
                 "The current add API output format is deprecated. "
@@ -136,7 +126,50 @@ class AvaterMemory(Memory):
                 stacklevel=2,
             )
             return vector_store_result
-    
+
+    def add_many(
+        self,
+        conversations,
+        user_ids=None,
+        agent_ids=None,
+        run_ids=None,
+        metadata=None,
+        filters=None,
+        max_concurrency=8,
+    ):
+        """
+        Create memories from many conversations at once.
+
+        Observation extraction and context explanation are per conversation, so each conversation
+        goes through the regular `add` pipeline; sessions run in parallel and the conversations of
+        one session are applied in input order.
+
+        Args:
+            conversations (list): Messages of each conversation (str or List[Dict[str, str]]).
+            user_ids (str or list, optional): User ID for all conversations, or one per conversation.
+            agent_ids (str or list, optional): Agent ID for all conversations, or one per conversation.
+            run_ids (str or list, optional): Run ID for all conversations, or one per conversation.
+            metadata (dict, optional): Metadata to store with every memory. Defaults to None.
+            filters (dict, optional): Filters to apply to every search. Defaults to None.
+            max_concurrency (int, optional): Maximum conversations processed concurrently. Defaults to 8.
+
+        Returns:
+            dict: "results" holds one entry per conversation, in input order; "stats" holds counts
+                and throughput.
+        """
+        start = time.perf_counter()
+        items = self._prepare_add_many(conversations, user_ids, agent_ids, run_ids, metadata, filters)
+
+        def add_one(index):
+            messages, item_metadata, item_filters = items[index]
+            results = self._add_to_vector_store(messages, item_metadata, item_filters)
+            relations = self._add_to_graph(messages, item_filters)
+            return {"results": results, "relations": relations}
+
+        results = self._run_partitioned(threading.BoundedSemaphore(max_concurrency), items, add_one)
+        stage_seconds = {"update": time.perf_counter() - start}
+        return {"results": results, "stats": self._add_many_stats(results, start, stage_seconds, None)}
+
     def get_context_explanation(self, messages, metadata):
         if not any(key in metadata for key in ("user_id", "agent_id", "run_id")):
             return messages
@@ -158,12 +191,13 @@ class AvaterMemory(Memory):
         out_messages = []
         for msg in messages:
             context_explain_prompt = CONTEXT_EXPLAIN_PROMPT.format(WHOLE_DOCUMENT=document_context, CHUNK_CONTENT=msg)
-            context_explain_response = self.llm.generate_response(
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": context_explain_prompt}
-                ],
-            )
+            with self.executor.stage("llm", "llm.explain_context"):
+                context_explain_response = self.llm.generate_response(
+                    messages=[
+                        {"role": "system", "content": "You are a helpful assistant."},
+                        {"role": "user", "content": context_explain_prompt}
+                    ],
+                )
             out_messages.append(msg + "\n" + f"chunk explanation:\n{context_explain_response}")
         return out_messages
 
@@ -200,18 +234,20 @@ class AvaterMemory(Memory):
     def _add_observation_to_vector_store(self, messages, metadata, filters):
         metadata['agent_id'] = 'observation'
 
-        new_retrieved_obs = self.memory_base_worker.get_observation(messages, metadata)
+        new_retrieved_obs = self._drop_known_facts(self.memory_base_worker.get_observation(messages, metadata), filters)
+        if not new_retrieved_obs:
+            return []
 
         retrieved_old_memory = []
-        new_message_embeddings = {}
-        for new_mem in new_retrieved_obs:
-            messages_embeddings = self.embedding_model.embed(new_mem)
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=messages_embeddings,
+        with self.executor.stage("embedder", "embedder.embed_batch", count=len(new_retrieved_obs)):
+            new_message_embeddings = dict(zip(new_retrieved_obs, self.embedding_model.embed_batch(new_retrieved_obs)))
+        with self.executor.stage("vector_store", "vector_store.search_batch", count=len(new_retrieved_obs)):
+            existing_memories_per_fact = self.vector_store.search_batch(
+                queries=[new_message_embeddings[new_mem] for new_mem in new_retrieved_obs],
                 limit=5,
                 filters=filters,
             )
+        for existing_memories in existing_memories_per_fact:
             for mem in existing_memories:
                 retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
 
@@ -225,58 +261,23 @@ class AvaterMemory(Memory):
 
         function_calling_prompt = get_update_memory_messages(retrieved_old_memory, new_retrieved_obs)
 
-        new_memories_with_actions = self.llm.generate_response(
-            messages=[{"role": "user", "content": function_calling_prompt}],
-            response_format={"type": "json_object"},
-        )
+        with self.executor.stage("llm", "llm.update_memory"):
+            new_memories_with_actions = self.llm.generate_response(
+                messages=[{"role": "user", "content": function_calling_prompt}],
+                response_format={"type": "json_object"},
+            )
         new_memories_with_actions = json.loads(new_memories_with_actions)
-
-        returned_memories = []
-        try:
-            for resp in new_memories_with_actions["memory"]:
-                logging.info(resp)
-                try:
-                    if resp["event"] == "ADD":
-                        memory_id = self._create_memory(
-                            data=resp["text"], existing_embeddings=new_message_embeddings, metadata=metadata
-                        )
-                        returned_memories.append(
-                            {
-                                "id": memory_id,
-                                "memory": resp["text"],
-                                "event": resp["event"],
-                            }
-                        )
-                    elif resp["event"] == "UPDATE":
-                        self._update_memory(
-                            memory_id=temp_uuid_mapping[resp["id"]],
-                            data=resp["text"],
-                            existing_embeddings=new_message_embeddings,
-                            metadata=metadata,
-                        )
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp["id"]],
-                                "memory": resp["text"],
-                                "event": resp["event"],
-                                "previous_memory": resp["old_memory"],
-                            }
-                        )
-                    elif resp["event"] == "DELETE":
-                        self._delete_memory(memory_id=temp_uuid_mapping[resp["id"]])
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp["id"]],
-                                "memory": resp["text"],
-                                "event": resp["event"],
-                            }
-                        )
-                    elif resp["event"] == "NONE":
-                        logging.info("NOOP for Memory.")
-                except Exception as e:
-                    logging.error(f"Error in new_memories_with_actions: {e}")
-        except Exception as e:
-            logging.error(f"Error in new_memories_with_actions: {e}")
+        self._embed_missing(new_memories_with_actions.get("memory", []), new_message_embeddings)
+
+        known_memories = {mem.id: mem for existing_memories in existing_memories_per_fact for mem in existing_memories}
+        returned_memories = self._apply_memory_actions(
+            new_memories_with_actions.get("memory", []),
+            new_message_embeddings,
+            metadata,
+            known_memories=known_memories,
+            id_mapping=temp_uuid_mapping,
+            include_ids=True,
+        )
 
         capture_event("mem0.add", self, {"version": self.api_version, "keys": list(filters.keys())})
 
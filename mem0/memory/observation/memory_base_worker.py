@@ -10,6 +10,7 @@ from typing import Any, Dict
 
 from mem0.configs.base import MemoryConfig, MemoryItem
 from mem0.configs.prompts import get_update_memory_messages
+from mem0.memory.base import tracing
 from mem0.memory.base.telemetry import capture_event
 from mem0.memory.utils import get_fact_retrieval_messages, parse_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory, VectorStoreFactory
@@ -22,7 +23,9 @@ class MemoryBaseWorker:
         self.config = config
 
         self.custom_prompt = self.config.custom_prompt
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.llm = LlmFactory.create(
+            self.config.llm.provider, self.config.llm.config, self.config.llm.cache, self.config.llm.cassette
+        )
         
         self.PATTERN_V1 = re.compile(r"<(.*?)>")
         
@@ -54,13 +57,14 @@ class MemoryBaseWorker:
         else:
             system_prompt, user_prompt = get_observation_prompts()
 
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            # response_format={"type": "json_object"},
-        )
+        with tracing.span("llm.extract_observations", stage="llm"):
+            response = self.llm.generate_response(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                # response_format={"type": "json_object"},
+            )
         
         def response_parse(response_text):
             print(response_text)
@@ -9,6 +9,7 @@ from mem0.configs.prompts import profile_prompts
 
 from mem0.database.profile.my_sql import Mysql
 from mem0.llms.azure_openai_structured import AzureOpenAIStructuredLLM
+from mem0.memory.base import tracing
 from mem0.utils.factory import ProfileDBFactory, LlmFactory
 
 
@@ -17,7 +18,9 @@ class MemoryProfile:
         self.config = config
 
         self.profile_schema_cls = self.config.profile_schema
-        self.llm: Union[AzureOpenAIStructuredLLM] = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.llm: Union[AzureOpenAIStructuredLLM] = LlmFactory.create(
+            self.config.llm.provider, self.config.llm.config, self.config.llm.cache, self.config.llm.cassette
+        )
         self.db: Union[Mysql] = ProfileDBFactory.create(
             self.config.profile_db.provider,
             self.config.profile_db.config
@@ -39,15 +42,17 @@ class MemoryProfile:
         Returns:
             profile_schema_cls: User profile data.
         """
-        profile = await self.db.get_profile(profile_id)
+        with tracing.span("profile_db.get_profile"):
+            profile = await self.db.get_profile(profile_id)
         return self.profile_schema_cls.from_json_str(profile)
 
     async def _set_profile(self, profile_id, profile):
-        old_profile = await self.db.get_profile(profile_id)
-        if old_profile is None:
-            await self.db.insert_profile(profile_id, profile)
-        else:
-            await self.db.update_profile(profile_id, profile)
+        with tracing.span("profile_db.set_profile"):
+            old_profile = await self.db.get_profile(profile_id)
+            if old_profile is None:
+                await self.db.insert_profile(profile_id, profile)
+            else:
+                await self.db.update_profile(profile_id, profile)
 
     async def _get_conflict_label(self, profile, messages: list):
         prompt = profile_prompts.CLASSIFY_CONFLICT_PROMPT.format(
@@ -57,12 +62,13 @@ class MemoryProfile:
             conversation=messages,
         )
         try:
-            response = self.llm.generate_response(
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": prompt},
-                ]
-            )
+            with tracing.span("llm.classify_conflict", stage="llm"):
+                response = self.llm.generate_response(
+                    messages=[
+                        {"role": "system", "content": "You are a helpful assistant."},
+                        {"role": "user", "content": prompt},
+                    ]
+                )
         except Exception as e:
             logging.error(f"[Profile Module] Error in get_conflict_label: {e}")
             response = None
@@ -83,12 +89,13 @@ class MemoryProfile:
         )
 
         try:
-            response = self.llm.generate_response(
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": prompt},
-                ]
-            )
+            with tracing.span("llm.classify_non_conflict", stage="llm"):
+                response = self.llm.generate_response(
+                    messages=[
+                        {"role": "system", "content": "You are a helpful assistant."},
+                        {"role": "user", "content": prompt},
+                    ]
+                )
         except Exception as e:
             logging.error(f"[Profile Module] Error in get_nonconflict_label: {e}")
             response = None
@@ -117,13 +124,14 @@ class MemoryProfile:
         )
 
         try:
-            response = self.llm.generate_response(
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={"type": "json_object"},
-            )
+            with tracing.span("llm.extract_profile", stage="llm"):
+                response = self.llm.generate_response(
+                    messages=[
+                        {"role": "system", "content": "You are a helpful assistant."},
+                        {"role": "user", "content": prompt},
+                    ],
+                    response_format={"type": "json_object"},
+                )
             profile_dict = json.loads(response)
         except Exception as e:
             logging.error(f"[Profile Module] Error in update_profile: {e}")
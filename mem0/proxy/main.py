@@ -23,6 +23,7 @@ except ImportError:
 
 from mem0 import Memory, MemoryClient
 from mem0.configs.prompts.base_prompts import MEMORY_ANSWER_PROMPT
+from mem0.memory.base.ingest import IngestionQueueFull
 from mem0.memory.base.telemetry import capture_client_event
 
 logger = logging.getLogger(__name__)
@@ -151,6 +152,20 @@ class Completions:
         return messages
 
     def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters):
+        if hasattr(self.mem0_client, "add_async"):
+            try:
+                self.mem0_client.add_async(
+                    messages=messages,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    run_id=run_id,
+                    metadata=metadata,
+                    filters=filters,
+                )
+            except IngestionQueueFull as e:
+                logger.warning(f"Skipping memory write: {e}")
+            return
+
         def add_task():
             logger.debug("Adding to memory asynchronously")
             self.mem0_client.add(
@@ -0,0 +1,41 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from mem0.configs.rerankers.base import BaseRerankerConfig
+
+
+class RerankerBase(ABC):
+    """Initialized a base reranker class
+
+    :param config: Reranker configuration option class, defaults to None
+    :type config: Optional[BaseRerankerConfig], optional
+    """
+
+    def __init__(self, config: Optional[BaseRerankerConfig] = None):
+        if config is None:
+            self.config = BaseRerankerConfig()
+        else:
+            self.config = config
+
+    @abstractmethod
+    def score(self, query, documents):
+        """
+        Score how relevant each document is to the query.
+
+        Args:
+            query (str): The search query.
+            documents (list): The texts to score.
+
+        Returns:
+            list: One relevance score per document, in the same order as `documents`. Higher is better.
+        """
+        pass
+
+    async def ascore(self, query, documents):
+        """
+        Asynchronously score how relevant each document is to the query.
+
+        The default runs `score` in a worker thread so the event loop is never blocked.
+        """
+        return await asyncio.to_thread(self.score, query, documents)
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class RerankerConfig(BaseModel):
+    provider: str = Field(
+        description="Provider of the reranker (e.g., 'sentence_transformer')",
+        default="sentence_transformer",
+    )
+    config: Optional[dict] = Field(description="Configuration for the specific reranker", default={})
+    candidates: int = Field(
+        description="Number of vector search candidates fetched and reranked (at least the search limit)",
+        default=50,
+        gt=0,
+    )
+    top_n: Optional[int] = Field(
+        description="Maximum number of reranked results returned (defaults to the search limit)", default=None, gt=0
+    )
+    score_threshold: Optional[float] = Field(
+        description="Drop reranked results scoring below this value; disabled when not set", default=None
+    )
+
+    @field_validator("config")
+    def validate_config(cls, v, values):
+        provider = values.data.get("provider")
+        if provider in ["sentence_transformer"]:
+            return v
+        else:
+            raise ValueError(f"Unsupported reranker provider: {provider}")
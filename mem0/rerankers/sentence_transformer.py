@@ -0,0 +1,50 @@
+from typing import Optional
+
+try:
+    from sentence_transformers import CrossEncoder
+except ImportError:
+    raise ImportError(
+        "The 'sentence-transformers' library is required. Please install it using 'pip install sentence-transformers'."
+    )
+
+from mem0.configs.rerankers.base import BaseRerankerConfig
+from mem0.rerankers.base import RerankerBase
+
+
+class SentenceTransformerReranker(RerankerBase):
+    def __init__(self, config: Optional[BaseRerankerConfig] = None):
+        super().__init__(config)
+
+        self.config.model = self.config.model or "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+        model_kwargs = dict(self.config.model_kwargs)
+        if self.config.backend != "torch":
+            # ONNX (and OpenVINO) backends need sentence-transformers>=3.2 and its optional extras.
+            model_kwargs["backend"] = self.config.backend
+        self.model = CrossEncoder(
+            self.config.model,
+            device=self.config.device,
+            max_length=self.config.max_length,
+            **model_kwargs,
+        )
+
+    def score(self, query, documents):
+        """
+        Score the documents against the query with a local cross-encoder.
+
+        Args:
+            query (str): The search query.
+            documents (list): The texts to score.
+
+        Returns:
+            list: One relevance score per document, in the same order as `documents`.
+        """
+        if not documents:
+            return []
+        scores = self.model.predict(
+            [(query, document) for document in documents],
+            batch_size=self.config.batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
+        return [float(score) for score in scores]
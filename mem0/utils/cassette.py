@@ -0,0 +1,77 @@
+import json
+import logging
+import os
+import threading
+
+from mem0.memory.base.setup import mem0_dir
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+class Cassette:
+    """
+    Append-only JSON-lines store of recorded provider exchanges, keyed by request hash.
+
+    Each line holds the key, the response and how long the provider took. The file is loaded once;
+    a key recorded twice keeps its latest response.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping unreadable line {line_number} of cassette {path}")
+                        continue
+                    self._entries[entry["key"]] = entry
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def get(self, key):
+        """
+        Returns:
+            dict: The entry ("key", "response", "latency") recorded for `key`, or None.
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def record(self, key, response, latency):
+        entry = {"key": key, "response": response, "latency": round(latency, 6)}
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._entries[key] = entry
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+_shared_cassettes = {}
+_shared_lock = threading.Lock()
+
+
+def get_cassette(config):
+    """
+    Return the process-wide cassette for the path of the given CassetteConfig, creating it on first use.
+
+    The LLM and the embedder may record into the same file; their keys never collide.
+    """
+    path = os.path.abspath(config.path or os.path.join(mem0_dir, "cassette.jsonl"))
+    with _shared_lock:
+        cassette = _shared_cassettes.get(path)
+        if cassette is None:
+            cassette = _shared_cassettes[path] = Cassette(path)
+        return cassette
@@ -2,6 +2,7 @@ import importlib
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.configs.llms.base import BaseLlmConfig
+from mem0.configs.rerankers.base import BaseRerankerConfig
 
 
 def load_class(class_type):
@@ -22,15 +23,35 @@ class LlmFactory:
         "openai_structured": "mem0.llms.openai_structured.OpenAIStructuredLLM",
         "anthropic": "mem0.llms.anthropic.AnthropicLLM",
         "azure_openai_structured": "mem0.llms.azure_openai_structured.AzureOpenAIStructuredLLM",
+        "fake": "mem0.llms.fake.FakeLLM",
     }
 
     @classmethod
-    def create(cls, provider_name, config):
+    def create(cls, provider_name, config, cache_config=None, cassette_config=None):
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             llm_instance = load_class(class_type)
             base_config = BaseLlmConfig(**config)
-            return llm_instance(base_config)
+            if cassette_config is not None:
+                from mem0.llms.cassette import CassetteLLM
+                from mem0.utils.cassette import get_cassette
+
+                llm = CassetteLLM(
+                    lambda: llm_instance(base_config),
+                    base_config,
+                    get_cassette(cassette_config),
+                    mode=cassette_config.mode,
+                    latency=cassette_config.latency,
+                    provider=provider_name,
+                )
+            else:
+                llm = llm_instance(base_config)
+                llm.provider = provider_name
+            if cache_config is not None:
+                from mem0.llms.cache import CachedLLM, get_llm_cache
+
+                llm = CachedLLM(llm, get_llm_cache(cache_config), provider=provider_name)
+            return llm
         else:
             raise ValueError(f"Unsupported Llm provider: {provider_name}")
 
@@ -43,19 +64,55 @@ class EmbedderFactory:
         "azure_openai": "mem0.embeddings.azure_openai.AzureOpenAIEmbedding",
         "gemini": "mem0.embeddings.gemini.GoogleGenAIEmbedding",
         "vertexai": "mem0.embeddings.vertexai.VertexAIEmbedding",
+        "fake": "mem0.embeddings.fake.FakeEmbedding",
     }
 
     @classmethod
-    def create(cls, provider_name, config):
+    def create(cls, provider_name, config, cache_config=None, cassette_config=None):
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            if cassette_config is not None:
+                from mem0.embeddings.cassette import CassetteEmbedding
+                from mem0.utils.cassette import get_cassette
+
+                embedder = CassetteEmbedding(
+                    lambda: embedder_instance(base_config),
+                    base_config,
+                    get_cassette(cassette_config),
+                    mode=cassette_config.mode,
+                    latency=cassette_config.latency,
+                    provider=provider_name,
+                )
+            else:
+                embedder = embedder_instance(base_config)
+                embedder.provider = provider_name
+            if cache_config is not None:
+                from mem0.embeddings.cache import CachedEmbedding, get_embedding_cache
+
+                embedder = CachedEmbedding(embedder, get_embedding_cache(cache_config), provider=provider_name)
+            return embedder
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
 
 
+class RerankerFactory:
+    provider_to_class = {
+        "sentence_transformer": "mem0.rerankers.sentence_transformer.SentenceTransformerReranker",
+    }
+
+    @classmethod
+    def create(cls, provider_name, config):
+        class_type = cls.provider_to_class.get(provider_name)
+        if class_type:
+            reranker_instance = load_class(class_type)
+            base_config = BaseRerankerConfig(**config)
+            return reranker_instance(base_config)
+        else:
+            raise ValueError(f"Unsupported Reranker provider: {provider_name}")
+
+
 class VectorStoreFactory:
     provider_to_class = {
         "qdrant": "mem0.vector_stores.qdrant.Qdrant",
@@ -63,6 +120,8 @@ class VectorStoreFactory:
         "pgvector": "mem0.vector_stores.pgvector.PGVector",
         "milvus": "mem0.vector_stores.milvus.MilvusDB",
         "esvector": "mem0.vector_stores.esvector.ESVector",
+        "numpy": "mem0.vector_stores.numpy.NumpyVectorStore",
+        "hnswlib": "mem0.vector_stores.hnswlib.HnswlibVectorStore",
     }
 
     @classmethod
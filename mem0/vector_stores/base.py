@@ -1,7 +1,13 @@
+import asyncio
 from abc import ABC, abstractmethod
 
+from mem0.vector_stores.keyword import bm25_scan
+
 
 class VectorStoreBase(ABC):
+    # Upper bound of the non-streaming `iter_all` fallback.
+    ITER_ALL_FALLBACK_LIMIT = 100000
+
     @abstractmethod
     def create_col(self, name, vector_size, distance):
         """Create a new collection."""
@@ -17,11 +23,93 @@ class VectorStoreBase(ABC):
         """Search for similar vectors."""
         pass
 
+    def search_batch(self, queries, limit=5, filters=None):
+        """
+        Search for similar vectors for several query vectors at once.
+
+        Backends with a native multi-search should override this so that all queries are
+        answered in a single round trip. The default issues one `search` per query.
+
+        Returns:
+            list: One list of search results per query, in the same order as `queries`.
+        """
+        return [self.search(query=query, limit=limit, filters=filters) for query in queries]
+
+    def keyword_search(self, query, limit=5, filters=None):
+        """
+        Search for memories whose text matches the keywords of `query`.
+
+        Backends with a native full-text index should override this. The default scores the
+        memories matching `filters` with BM25 while streaming them through `iter_all`.
+
+        Args:
+            query (str): Keyword query.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Payload filters. Defaults to None.
+
+        Returns:
+            list: The best matching memories with their keyword score, best first.
+        """
+        return bm25_scan(query, self.iter_all(filters=filters), limit)
+
     @abstractmethod
     def delete(self, name, vector_id):
         """Delete a vector by ID."""
         pass
 
+    def delete_batch(self, vector_ids):
+        """
+        Delete several vectors by ID.
+
+        Backends with a native multi-delete should override this. The default calls `delete`
+        once per ID.
+        """
+        for vector_id in vector_ids:
+            self.delete(vector_id=vector_id)
+
+    def update_batch(self, vector_ids, vectors=None, payloads=None):
+        """
+        Update several vectors and their payloads.
+
+        Backends with a native bulk upsert should override this. The default calls `update` once
+        per ID.
+
+        Args:
+            vector_ids (list): IDs of the vectors to update.
+            vectors (list, optional): Updated vectors, one per ID.
+            payloads (list, optional): Updated payloads, one per ID.
+        """
+        for i, vector_id in enumerate(vector_ids):
+            self.update(
+                vector_id=vector_id,
+                vector=vectors[i] if vectors else None,
+                payload=payloads[i] if payloads else None,
+            )
+
+    def delete_by_filter(self, filters):
+        """
+        Delete every vector whose payload matches `filters`.
+
+        Backends with a native filtered delete should override this so the whole selection is
+        removed in one request. The default repeatedly lists and deletes matching vectors by ID.
+
+        Args:
+            filters (dict): Payload filters; at least one is required.
+
+        Returns:
+            int or None: Number of deleted vectors, or None if the backend does not report it.
+        """
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter")
+        deleted = 0
+        while True:
+            memories = self.list(filters=filters, limit=1000)[0]
+            if not memories:
+                return deleted
+            for memory in memories:
+                self.delete(vector_id=memory.id)
+            deleted += len(memories)
+
     @abstractmethod
     def update(self, name, vector_id, vector=None, payload=None):
         """Update a vector and its payload."""
@@ -32,6 +120,20 @@ class VectorStoreBase(ABC):
         """Retrieve a vector by ID."""
         pass
 
+    def iter_all(self, filters=None, page_size=1000):
+        """
+        Yield every vector whose payload matches `filters`, fetching one page at a time.
+
+        Backends should override this with a native cursor so that memory use does not grow with
+        the size of the collection. The default reads a single `list` page of up to
+        `ITER_ALL_FALLBACK_LIMIT` vectors.
+
+        Args:
+            filters (dict, optional): Payload filters.
+            page_size (int, optional): Number of vectors fetched per request. Defaults to 1000.
+        """
+        yield from self.list(filters=filters, limit=self.ITER_ALL_FALLBACK_LIMIT)[0]
+
     @abstractmethod
     def list_cols(self):
         """List all collections."""
@@ -46,3 +148,48 @@ class VectorStoreBase(ABC):
     def col_info(self, name):
         """Get information about a collection."""
         pass
+
+    def close(self):
+        """
+        Release what the store holds open. Stores that buffer writes (e.g. an index snapshot) flush
+        them here; the default does nothing.
+        """
+
+    # Async counterparts used by AsyncMemory. Backends with an asyncio-native client override
+    # these; the defaults run the sync method in a worker thread so the event loop never blocks.
+
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        """Asynchronously insert vectors into a collection."""
+        return await asyncio.to_thread(self.insert, vectors=vectors, payloads=payloads, ids=ids)
+
+    async def asearch(self, query, limit=5, filters=None):
+        """Asynchronously search for similar vectors."""
+        return await asyncio.to_thread(self.search, query=query, limit=limit, filters=filters)
+
+    async def asearch_batch(self, queries, limit=5, filters=None):
+        """Asynchronously search for similar vectors for several query vectors at once."""
+        return await asyncio.to_thread(self.search_batch, queries=queries, limit=limit, filters=filters)
+
+    async def adelete(self, vector_id):
+        """Asynchronously delete a vector by ID."""
+        return await asyncio.to_thread(self.delete, vector_id=vector_id)
+
+    async def adelete_batch(self, vector_ids):
+        """Asynchronously delete several vectors by ID."""
+        return await asyncio.to_thread(self.delete_batch, vector_ids)
+
+    async def aupdate_batch(self, vector_ids, vectors=None, payloads=None):
+        """Asynchronously update several vectors and their payloads."""
+        return await asyncio.to_thread(self.update_batch, vector_ids, vectors=vectors, payloads=payloads)
+
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        """Asynchronously update a vector and its payload."""
+        return await asyncio.to_thread(self.update, vector_id=vector_id, vector=vector, payload=payload)
+
+    async def aget(self, vector_id):
+        """Asynchronously retrieve a vector by ID."""
+        return await asyncio.to_thread(self.get, vector_id=vector_id)
+
+    async def alist(self, filters=None, limit=100):
+        """Asynchronously list vectors in a collection."""
+        return await asyncio.to_thread(self.list, filters=filters, limit=limit)
@@ -133,6 +133,26 @@ class ChromaDB(VectorStoreBase):
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
         self.collection.add(ids=ids, embeddings=vectors, metadatas=payloads)
 
+    @staticmethod
+    def _generate_where(filters: Optional[Dict]) -> Optional[Dict]:
+        """
+        Convert flat filters into a Chroma where clause. List values match any of their elements
+        and several keys are combined with $and.
+
+        Args:
+            filters (Optional[Dict]): Filters to apply.
+
+        Returns:
+            Optional[Dict]: Where clause, or None when there are no filters.
+        """
+        if not filters:
+            return None
+        conditions = [
+            {key: {"$in": list(value)}} if isinstance(value, (list, tuple, set)) else {key: value}
+            for key, value in filters.items()
+        ]
+        return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
     def search(self, query: List[list], limit: int = 5, filters: Optional[Dict] = None) -> List[OutputData]:
         """
         Search for similar vectors.
@@ -145,10 +165,35 @@ class ChromaDB(VectorStoreBase):
         Returns:
             List[OutputData]: Search results.
         """
-        results = self.collection.query(query_embeddings=query, where=filters, n_results=limit)
+        results = self.collection.query(query_embeddings=query, where=self._generate_where(filters), n_results=limit)
         final_results = self._parse_output(results)
         return final_results
 
+    def search_batch(
+        self, queries: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search for similar vectors for several query vectors in one request.
+
+        Args:
+            queries (List[list]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: One list of search results per query.
+        """
+        if not queries:
+            return []
+        results = self.collection.query(
+            query_embeddings=queries, where=self._generate_where(filters), n_results=limit
+        )
+        keys = ["ids", "distances", "metadatas"]
+        return [
+            self._parse_output({key: [results[key][idx]] for key in keys if results.get(key)})
+            for idx in range(len(queries))
+        ]
+
     def delete(self, vector_id: str):
         """
         Delete a vector by ID.
@@ -158,6 +203,63 @@ class ChromaDB(VectorStoreBase):
         """
         self.collection.delete(ids=vector_id)
 
+    def iter_all(self, filters: Optional[Dict] = None, page_size: int = 1000):
+        """
+        Yield every vector matching the filters, one offset page at a time.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply to the list. Defaults to None.
+            page_size (int, optional): Number of vectors fetched per request. Defaults to 1000.
+        """
+        where = self._generate_where(filters)
+        offset = 0
+        while True:
+            page = self._parse_output(self.collection.get(where=where, limit=page_size, offset=offset))
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def delete_batch(self, vector_ids: List[str]):
+        """
+        Delete several vectors with a single request.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        self.collection.delete(ids=list(vector_ids))
+
+    def update_batch(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[List[float]]] = None,
+        payloads: Optional[List[Dict]] = None,
+    ):
+        """
+        Update several vectors and their payloads with a single request.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (Optional[List[List[float]]], optional): Updated vectors, one per ID.
+            payloads (Optional[List[Dict]], optional): Updated payloads, one per ID.
+        """
+        if not vector_ids:
+            return
+        self.collection.update(ids=list(vector_ids), embeddings=vectors, metadatas=payloads)
+
+    def delete_by_filter(self, filters: Dict):
+        """
+        Delete every vector whose metadata matches the filters with a single where-delete.
+
+        Args:
+            filters (Dict): Filters to apply; at least one is required.
+        """
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter")
+        self.collection.delete(where=self._generate_where(filters))
+
     def update(
         self,
         vector_id: str,
@@ -222,5 +324,5 @@ class ChromaDB(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        results = self.collection.get(where=filters, limit=limit)
+        results = self.collection.get(where=self._generate_where(filters), limit=limit)
         return [self._parse_output(results)]
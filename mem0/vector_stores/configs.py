@@ -16,6 +16,8 @@ class VectorStoreConfig(BaseModel):
         "pgvector": "PGVectorConfig",
         "milvus": "MilvusDBConfig",
         "esvector": "ESVectorConfig",
+        "numpy": "NumpyConfig",
+        "hnswlib": "HnswlibConfig",
     }
 
     @model_validator(mode="after")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import asyncio
 import logging
 from typing import Any, Dict, List, Literal, Optional, Union
 import uuid
@@ -6,14 +7,15 @@ import uuid
 from pydantic import BaseModel
 
 try:
-    from elasticsearch import Elasticsearch
-    from elasticsearch.helpers import BulkIndexError, bulk
+    from elasticsearch import AsyncElasticsearch, Elasticsearch, NotFoundError
+    from elasticsearch.helpers import BulkIndexError, async_bulk, bulk
 except ImportError:
     raise ImportError(
         "The 'Elasticsearch' library is required. Please install it using 'pip install elasticsearch'."
     )
 
 from mem0.configs.vector_stores.esvector import (
+    ApproxRetrievalStrategy,
     BaseRetrievalStrategy,
     DistanceStrategy,
     ESVectorConfig,
@@ -48,7 +50,12 @@ class ESVector(VectorStoreBase):
             ]
         ] = None,
         strategy: BaseRetrievalStrategy = ESVectorConfig.ApproxRetrievalStrategy(),
+        quantization: Optional[str] = None,
+        rescore: bool = True,
+        oversampling: float = 2.0,
     ):
+        self._async_client_params = None
+        self._async_client = None
         if client:
             self.client = client
         else:
@@ -56,6 +63,7 @@ class ESVector(VectorStoreBase):
                 endpoint,
                 api_key=api_key,
             )
+            self._async_client_params = {"hosts": endpoint, "api_key": api_key}
         self.index_name = collection_name
         self.query_field = query_field
         self.vector_query_field = vector_query_field
@@ -64,8 +72,29 @@ class ESVector(VectorStoreBase):
             if distance_strategy is None
             else DistanceStrategy[distance_strategy]
         )
+        if quantization and isinstance(strategy, ApproxRetrievalStrategy):
+            # A fresh strategy, so the shared default instance is never modified.
+            strategy = ApproxRetrievalStrategy(
+                query_model_id=strategy.query_model_id,
+                hybrid=strategy.hybrid,
+                rrf=strategy.rrf,
+                quantization=quantization,
+                rescore_oversample=oversampling if rescore else None,
+            )
+        elif quantization:
+            logger.warning(f"Quantization only applies to the approximate retrieval strategy, ignoring {quantization}")
         self.strategy = strategy
 
+    @property
+    def async_client(self):
+        """
+        Lazily created AsyncElasticsearch client with the sync client's endpoint and credentials, or None
+        when the store was built from an existing client.
+        """
+        if self._async_client is None and self._async_client_params is not None:
+            self._async_client = AsyncElasticsearch(**self._async_client_params)
+        return self._async_client
+
 
     def _parse_output(self, hit: Dict) -> List[OutputData]:
         payload = hit["_source"].get("metadata", {})
@@ -127,13 +156,41 @@ class ESVector(VectorStoreBase):
 
         bulk_kwargs = bulk_kwargs or {}
         ids = ids or [str(uuid.uuid4()) for _ in vectors]
-        requests = []
 
         if create_index_if_not_exists:
             self.create_col(self.index_name, len(vectors[0]))
 
+        requests = self._index_requests(vectors, payloads, ids)
+
+        if len(requests) > 0:
+            try:
+                success, failed = bulk(
+                    self.client,
+                    requests,
+                    stats_only=True,
+                    refresh=refresh_indices,
+                    **bulk_kwargs,
+                )
+                logger.info(
+                    f"Added {success} and failed to add {failed} vectors to index"
+                )
+
+                logger.info(f"added vectors {ids} to index")
+                return ids
+            except BulkIndexError as e:
+                logger.error(f"Error adding vectors: {e}")
+                firstError = e.errors[0].get("index", {}).get("error", {})
+                logger.error(f"First error reason: {firstError.get('reason')}")
+                raise e
+        else:
+            logger.info("No texts to add to index")
+            return []
+
+
+    def _index_requests(self, vectors, payloads, ids):
+        requests = []
         for i, vector in enumerate(vectors):
-            metadata = payloads[i] if payloads else {}
+            metadata = dict(payloads[i]) if payloads else {}
             query_text = metadata.pop("data")
 
             requests.append(
@@ -146,30 +203,27 @@ class ESVector(VectorStoreBase):
                     "_id": ids[i],
                 }
             )
+        return requests
+
+    def _search_body(self, query, limit, filters, fetch_k):
+        return self.strategy.query(
+            query_vector=query,
+            query=None,
+            k=limit,
+            fetch_k=fetch_k if fetch_k > limit else limit,
+            vector_query_field=self.vector_query_field,
+            text_field=self.query_field,
+            filter=self._parse_filters(filters or {}),
+            similarity=self.distance_strategy,
+        )
 
-            if len(requests) > 0:
-                try:
-                    success, failed = bulk(
-                        self.client,
-                        requests,
-                        stats_only=True,
-                        refresh=refresh_indices,
-                        **bulk_kwargs,
-                    )
-                    logger.info(
-                        f"Added {success} and failed to add {failed} vectors to index"
-                    )
-
-                    logger.info(f"added vectors {ids} to index")
-                    return ids
-                except BulkIndexError as e:
-                    logger.error(f"Error adding vectors: {e}")
-                    firstError = e.errors[0].get("index", {}).get("error", {})
-                    logger.error(f"First error reason: {firstError.get('reason')}")
-                    raise e
-            else:
-                logger.info("No texts to add to index")
-                return []
+    def _update_doc(self, vector, payload):
+        """Partial document for an update; the stored vector is kept unless a new one is given."""
+        payload = dict(payload)
+        doc = {self.query_field: payload.pop("data"), "metadata": payload}
+        if vector is not None:
+            doc[self.vector_query_field] = vector
+        return doc
 
 
     def search(
@@ -187,16 +241,7 @@ class ESVector(VectorStoreBase):
             self.query_field,
         ]
 
-        query_body = self.strategy.query(
-            query_vector=query,
-            query=None,
-            k=limit,
-            fetch_k=fetch_k if fetch_k > limit else limit,
-            vector_query_field=self.vector_query_field,
-            text_field=self.query_field,
-            filter=self._parse_filters(filters or {}),
-            similarity=self.distance_strategy,
-        )
+        query_body = self._search_body(query, limit, filters, fetch_k)
 
         logger.info(f"Query body: {query_body}")
 
@@ -215,10 +260,78 @@ class ESVector(VectorStoreBase):
         return search_res
 
 
+    def search_batch(
+        self,
+        queries: List[List[float]],
+        limit: int = 4,
+        filters: Optional[dict] = None,
+        fetch_k: int = 50,
+    ):
+        if not queries:
+            return []
+
+        self.create_col(self.index_name, len(queries[0]))
+
+        searches = self._msearch_body(queries, limit, filters, fetch_k)
+        response = self.client.msearch(searches=searches)
+
+        logger.info(f"Multi-search returned {len(response['responses'])} responses")
+
+        return [
+            [self._parse_output(hit) for hit in res.get("hits", {}).get("hits", [])]
+            for res in response["responses"]
+        ]
+
+
+    def _msearch_body(self, queries, limit, filters, fetch_k):
+        fields = ["metadata", "_id", self.query_field]
+        searches = []
+        for query in queries:
+            searches.append({"index": self.index_name})
+            query_body = self._search_body(query, limit, filters, fetch_k)
+            searches.append({**query_body, "size": limit, "_source": {"includes": fields}})
+        return searches
+
+
+    def keyword_search(self, query: str, limit: int = 5, filters: Optional[dict] = None):
+        """
+        Search the text field with the native BM25 scoring of Elasticsearch.
+
+        Args:
+            query (str): Keyword query.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Filters to apply. Defaults to None.
+
+        Returns:
+            list: The best matching documents with their BM25 score, best first.
+        """
+        query_body = ESVectorConfig.BM25RetrievalStrategy().query(
+            query_vector=None,
+            query=query,
+            k=limit,
+            fetch_k=limit,
+            vector_query_field=self.vector_query_field,
+            text_field=self.query_field,
+            filter=self._parse_filters(filters or {}),
+            similarity=None,
+        )
+        response = self.client.search(
+            index=self.index_name,
+            **query_body,
+            size=limit,
+            source_includes=["metadata", self.query_field],
+            ignore_unavailable=True,
+        )
+        return [self._parse_output(hit) for hit in response["hits"]["hits"]]
+
+
     def _parse_filters(self, filters: dict) -> list[dict]:
         _filters = []
 
         for key in filters:
+            if isinstance(filters[key], (list, tuple, set)):
+                _filters.append({'terms': {f"metadata.{key}.keyword": list(filters[key])}})
+                continue
             _filters.append({
                 'term': {
                         f"metadata.{key}.keyword": {
@@ -250,12 +363,97 @@ class ESVector(VectorStoreBase):
             raise e
 
 
+    def delete_batch(self, vector_ids: List[str], refresh_indices: Optional[bool] = True):
+        """
+        Delete several documents with a single bulk request.
+
+        Args:
+            vector_ids (List[str]): IDs of the documents to delete.
+            refresh_indices (bool, optional): Refresh the index after deleting. Defaults to True.
+        """
+        if not vector_ids:
+            return
+        body = self._delete_requests(vector_ids)
+        try:
+            bulk(self.client, body, refresh=refresh_indices, ignore_status=404)
+            logger.info(f"Deleted {len(body)} texts from index")
+        except BulkIndexError as e:
+            logger.error(f"Error deleting texts: {e}")
+            raise e
+
+    def update_batch(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[List[float]]] = None,
+        payloads: Optional[List[Dict]] = None,
+        refresh_indices: Optional[bool] = True,
+    ):
+        """
+        Update several documents with a single bulk request.
+
+        Args:
+            vector_ids (List[str]): IDs of the documents to update.
+            vectors (List[List[float]], optional): Updated vectors, one per ID. The stored vectors are
+                kept when None.
+            payloads (List[Dict], optional): Updated payloads, one per ID.
+            refresh_indices (bool, optional): Refresh the index after updating. Defaults to True.
+        """
+        if not vector_ids:
+            return
+        body = self._update_requests(vector_ids, vectors, payloads)
+        try:
+            bulk(self.client, body, refresh=refresh_indices)
+            logger.info(f"Updated {len(body)} texts in index")
+        except BulkIndexError as e:
+            logger.error(f"Error updating texts: {e}")
+            raise e
+
+    def _delete_requests(self, vector_ids: List[str]) -> List[Dict]:
+        return [{"_op_type": "delete", "_index": self.index_name, "_id": vector_id} for vector_id in vector_ids]
+
+    def _update_requests(
+        self, vector_ids: List[str], vectors: Optional[List[List[float]]], payloads: Optional[List[Dict]]
+    ) -> List[Dict]:
+        return [
+            {
+                "_op_type": "update",
+                "_index": self.index_name,
+                "_id": vector_id,
+                "doc": self._update_doc(vectors[i] if vectors else None, payloads[i]),
+            }
+            for i, vector_id in enumerate(vector_ids)
+        ]
+
+    def delete_by_filter(self, filters: dict, refresh_indices: Optional[bool] = True):
+        """
+        Delete every document whose metadata matches the filters with a single delete_by_query.
+
+        Args:
+            filters (dict): Filters to apply; at least one is required.
+            refresh_indices (bool, optional): Refresh the index after deleting. Defaults to True.
+
+        Returns:
+            int: Number of deleted documents.
+        """
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter")
+        response = self.client.delete_by_query(
+            index=self.index_name,
+            query={"bool": {"filter": self._parse_filters(filters)}},
+            refresh=refresh_indices,
+            conflicts="proceed",
+            ignore_unavailable=True,
+        )
+        logger.info(f"Deleted {response.get('deleted')} texts from index by filter")
+        return response.get("deleted")
+
     def update(
         self,
         vector_id: str,
         vector: Optional[list[float]] = None,
         payload: Optional[Dict] = None,
     ):
+        payload = dict(payload)
         doc = {
             "doc": {
                 self.vector_query_field: vector,
@@ -290,6 +488,61 @@ class ESVector(VectorStoreBase):
         return self._parse_output(result)
 
 
+    def list(self, filters: Optional[dict] = None, limit: int = 100):
+        """
+        List the documents matching the filters.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            limit (int, optional): Number of documents to return. Defaults to 100.
+
+        Returns:
+            list: A single-element list holding the matching documents.
+        """
+        response = self.client.search(
+            index=self.index_name,
+            query={"bool": {"filter": self._parse_filters(filters or {})}},
+            size=limit,
+            source_includes=["metadata", self.query_field],
+            ignore_unavailable=True,
+        )
+        return [[self._parse_output(hit) for hit in response["hits"]["hits"]]]
+
+    def iter_all(self, filters: Optional[dict] = None, page_size: int = 1000, keep_alive: str = "1m"):
+        """
+        Yield every document matching the filters, paging with search_after over a point in time.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            page_size (int, optional): Number of documents fetched per request. Defaults to 1000.
+            keep_alive (str, optional): How long the point in time is kept between pages. Defaults to "1m".
+        """
+        try:
+            pit_id = self.client.open_point_in_time(index=self.index_name, keep_alive=keep_alive)["id"]
+        except NotFoundError:
+            # The index is only created by the first insert or search.
+            return
+        search_after = None
+        try:
+            while True:
+                response = self.client.search(
+                    pit={"id": pit_id, "keep_alive": keep_alive},
+                    query={"bool": {"filter": self._parse_filters(filters or {})}},
+                    size=page_size,
+                    sort=[{"_shard_doc": "asc"}],
+                    search_after=search_after,
+                    source_includes=["metadata", self.query_field],
+                )
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+                for hit in hits:
+                    yield self._parse_output(hit)
+                if len(hits) < page_size:
+                    return
+                search_after = hits[-1]["sort"]
+        finally:
+            self.client.close_point_in_time(id=pit_id)
+
     def list_cols(self):
         raise NotImplementedError
 
@@ -310,3 +563,194 @@ class ESVector(VectorStoreBase):
             ignore_unavailable=True,
         )
         return response.get("_source", {})
+
+    async def _acreate_col(self, vector_size: int):
+        if (await self.async_client.indices.exists(index=self.index_name)).body:
+            return
+        # Index creation runs once per index and sets up the strategy with the sync client.
+        await asyncio.to_thread(self.create_col, self.index_name, vector_size)
+
+    async def ainsert(self, vectors: list, payloads: Optional[list] = None, ids: Optional[list] = None):
+        """
+        Asynchronously index documents with a single bulk request.
+
+        Args:
+            vectors (list): Vectors to insert.
+            payloads (list, optional): Payloads corresponding to the vectors. Defaults to None.
+            ids (list, optional): IDs corresponding to the vectors. Defaults to None.
+
+        Returns:
+            list: IDs of the indexed documents.
+        """
+        if self.async_client is None:
+            return await super().ainsert(vectors=vectors, payloads=payloads, ids=ids)
+        if not vectors:
+            return []
+        ids = ids or [str(uuid.uuid4()) for _ in vectors]
+        await self._acreate_col(len(vectors[0]))
+        try:
+            success, failed = await async_bulk(
+                self.async_client, self._index_requests(vectors, payloads, ids), stats_only=True, refresh=True
+            )
+        except BulkIndexError as e:
+            logger.error(f"Error adding vectors: {e}")
+            raise e
+        logger.info(f"Added {success} and failed to add {failed} vectors to index")
+        return ids
+
+    async def asearch(self, query: list, limit: int = 5, filters: Optional[dict] = None, fetch_k: int = 50):
+        """
+        Asynchronously search for similar vectors.
+
+        Args:
+            query (list): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Filters to apply. Defaults to None.
+            fetch_k (int, optional): Number of candidates considered by the kNN search. Defaults to 50.
+
+        Returns:
+            list: Search results.
+        """
+        if self.async_client is None:
+            return await super().asearch(query=query, limit=limit, filters=filters)
+        await self._acreate_col(len(query))
+        response = await self.async_client.search(
+            index=self.index_name,
+            **self._search_body(query, limit, filters, fetch_k),
+            size=limit,
+            source=True,
+            source_includes=["metadata", "_id", self.query_field],
+        )
+        return [self._parse_output(hit) for hit in response["hits"]["hits"]]
+
+    async def asearch_batch(self, queries: list, limit: int = 5, filters: Optional[dict] = None, fetch_k: int = 50):
+        """
+        Asynchronously search for several query vectors with a single msearch request.
+
+        Args:
+            queries (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters to apply to every query. Defaults to None.
+            fetch_k (int, optional): Number of candidates considered by each kNN search. Defaults to 50.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if self.async_client is None:
+            return await super().asearch_batch(queries=queries, limit=limit, filters=filters)
+        if not queries:
+            return []
+        await self._acreate_col(len(queries[0]))
+        response = await self.async_client.msearch(searches=self._msearch_body(queries, limit, filters, fetch_k))
+        return [
+            [self._parse_output(hit) for hit in res.get("hits", {}).get("hits", [])]
+            for res in response["responses"]
+        ]
+
+    async def adelete(self, vector_id: str):
+        """
+        Asynchronously delete a document by ID.
+
+        Args:
+            vector_id (str): ID of the document to delete.
+        """
+        if self.async_client is None:
+            return await super().adelete(vector_id=vector_id)
+        await self.async_client.options(ignore_status=404).delete(index=self.index_name, id=vector_id, refresh=True)
+        return True
+
+    async def aupdate(self, vector_id: str, vector: Optional[list] = None, payload: Optional[Dict] = None):
+        """
+        Asynchronously update a document's vector and payload.
+
+        Args:
+            vector_id (str): ID of the document to update.
+            vector (list, optional): Updated vector; the stored one is kept when None. Defaults to None.
+            payload (dict, optional): Updated payload. Defaults to None.
+        """
+        if self.async_client is None:
+            return await super().aupdate(vector_id=vector_id, vector=vector, payload=payload)
+        result = await self.async_client.update(
+            index=self.index_name, id=vector_id, doc=self._update_doc(vector, payload)
+        )
+        if result["result"] not in ("updated", "noop"):
+            raise ValueError(f"Update vector with ID {vector_id} error.")
+
+    async def adelete_batch(self, vector_ids: List[str]):
+        """
+        Asynchronously delete several documents with a single bulk request.
+
+        Args:
+            vector_ids (List[str]): IDs of the documents to delete.
+        """
+        if self.async_client is None:
+            return await super().adelete_batch(vector_ids)
+        if not vector_ids:
+            return
+        try:
+            await async_bulk(self.async_client, self._delete_requests(vector_ids), refresh=True, ignore_status=404)
+        except BulkIndexError as e:
+            logger.error(f"Error deleting texts: {e}")
+            raise e
+
+    async def aupdate_batch(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[List[float]]] = None,
+        payloads: Optional[List[Dict]] = None,
+    ):
+        """
+        Asynchronously update several documents with a single bulk request.
+
+        Args:
+            vector_ids (List[str]): IDs of the documents to update.
+            vectors (List[List[float]], optional): Updated vectors, one per ID. The stored vectors are
+                kept when None.
+            payloads (List[Dict], optional): Updated payloads, one per ID.
+        """
+        if self.async_client is None:
+            return await super().aupdate_batch(vector_ids, vectors=vectors, payloads=payloads)
+        if not vector_ids:
+            return
+        try:
+            await async_bulk(self.async_client, self._update_requests(vector_ids, vectors, payloads), refresh=True)
+        except BulkIndexError as e:
+            logger.error(f"Error updating texts: {e}")
+            raise e
+
+    async def aget(self, vector_id: str):
+        """
+        Asynchronously retrieve a document by ID.
+
+        Args:
+            vector_id (str): ID of the document to retrieve.
+
+        Returns:
+            OutputData: The retrieved document.
+        """
+        if self.async_client is None:
+            return await super().aget(vector_id=vector_id)
+        result = await self.async_client.get(index=self.index_name, id=vector_id)
+        return self._parse_output(result)
+
+    async def alist(self, filters: Optional[dict] = None, limit: int = 100):
+        """
+        Asynchronously list the documents matching the filters.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            limit (int, optional): Number of documents to return. Defaults to 100.
+
+        Returns:
+            list: A single-element list holding the matching documents.
+        """
+        if self.async_client is None:
+            return await super().alist(filters=filters, limit=limit)
+        response = await self.async_client.search(
+            index=self.index_name,
+            query={"bool": {"filter": self._parse_filters(filters or {})}},
+            size=limit,
+            source_includes=["metadata", self.query_field],
+            ignore_unavailable=True,
+        )
+        return [[self._parse_output(hit) for hit in response["hits"]["hits"]]]
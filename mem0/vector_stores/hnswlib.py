@@ -0,0 +1,627 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+try:
+    import hnswlib
+    import numpy as np
+except ImportError:
+    raise ImportError("The 'hnswlib' library is required. Please install it using 'pip install hnswlib'.")
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+# Payload keys stored in their own indexed columns; every other key is filtered through json_extract.
+INDEXED_KEYS = ("user_id", "agent_id", "run_id", "hash")
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # cosine similarity
+    payload: Optional[Dict]  # metadata
+
+
+class HnswlibVectorStore(VectorStoreBase):
+    """
+    Local approximate nearest neighbour store backed by an hnswlib graph and a SQLite payload table.
+
+    SQLite is the source of truth: every write commits the vector, its payload and a write sequence
+    number. The HNSW graph is updated in place, with deletes left as tombstones that later inserts
+    reuse. A background thread periodically snapshots the graph to disk and rebuilds it once too many
+    elements are tombstones. On startup the snapshot is loaded as is and only the writes made after it
+    are replayed, so a cold process serves without rebuilding the graph.
+
+    Selective filters are resolved in SQLite first; when they leave at most `brute_force_threshold`
+    vectors those are scored exactly, otherwise the graph is searched with the selection as a filter.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        embedding_model_dims: int,
+        path: str = "/tmp/hnswlib",
+        on_disk: bool = False,
+        M: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        max_elements: int = 10000,
+        brute_force_threshold: int = 1000,
+        compaction_threshold: float = 0.2,
+        maintenance_interval: Optional[float] = 60.0,
+    ):
+        """
+        Initialize the hnswlib vector store.
+
+        Args:
+            collection_name (str): Name of the collection.
+            embedding_model_dims (int): Dimensions of the embedding model.
+            path (str, optional): Directory holding the index and payload files. Defaults to "/tmp/hnswlib".
+            on_disk (bool, optional): Persist the collection under `path` across restarts. Defaults to False.
+            M (int, optional): Number of graph neighbours per element. Defaults to 16.
+            ef_construction (int, optional): Candidate list size while building the graph. Defaults to 200.
+            ef_search (int, optional): Candidate list size while searching. Defaults to 64.
+            max_elements (int, optional): Initial index capacity. Defaults to 10000.
+            brute_force_threshold (int, optional): Filters selecting at most this many vectors are answered
+                by exact search. Defaults to 1000.
+            compaction_threshold (float, optional): Rebuild the index once this fraction of its elements are
+                deleted. Defaults to 0.2.
+            maintenance_interval (float, optional): Seconds between background snapshots and compactions;
+                None disables the background thread. Defaults to 60.0.
+        """
+        self.collection_name = collection_name
+        self.embedding_model_dims = embedding_model_dims
+        self.path = path
+        self.on_disk = on_disk
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.max_elements = max_elements
+        self.brute_force_threshold = brute_force_threshold
+        self.compaction_threshold = compaction_threshold
+        self.maintenance_interval = maintenance_interval
+
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._maintainer = None
+        self._dirty = False
+
+        if on_disk:
+            os.makedirs(path, exist_ok=True)
+            self.connection = sqlite3.connect(self._file("db"), check_same_thread=False)
+        else:
+            self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self.create_col(embedding_model_dims)
+
+        if maintenance_interval is not None:
+            self._maintainer = threading.Thread(target=self._run_maintenance, name="mem0-hnswlib", daemon=True)
+            self._maintainer.start()
+
+    def _file(self, extension):
+        return os.path.join(self.path, f"{self.collection_name}.{extension}")
+
+    def create_col(self, vector_size: int, distance: str = "cosine"):
+        """
+        Create the payload table if needed and load (or build) the index.
+
+        Args:
+            vector_size (int): Size of the vectors to be stored.
+            distance (str, optional): Distance metric; only "cosine" is supported. Defaults to "cosine".
+        """
+        if distance != "cosine":
+            raise ValueError(f"Unsupported distance for HnswlibVectorStore: {distance}")
+        with self._lock, self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS points (
+                    label INTEGER PRIMARY KEY,
+                    id TEXT UNIQUE NOT NULL,
+                    vector BLOB NOT NULL,
+                    payload TEXT NOT NULL,
+                    user_id TEXT,
+                    agent_id TEXT,
+                    run_id TEXT,
+                    hash TEXT,
+                    seq INTEGER NOT NULL
+                )
+                """
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS points_partition ON points (user_id, agent_id, run_id)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS points_hash ON points (hash)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS points_seq ON points (seq)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            self.embedding_model_dims = vector_size
+            label, seq = self.connection.execute("SELECT MAX(label), MAX(seq) FROM points").fetchone()
+            self._next_label = (label or 0) + 1
+            self._seq = seq or 0
+            self._live = self.connection.execute("SELECT COUNT(*) FROM points").fetchone()[0]
+            self.index = self._load_index()
+
+    # Index lifecycle
+
+    def _new_index(self, capacity):
+        index = hnswlib.Index(space="cosine", dim=self.embedding_model_dims)
+        index.init_index(
+            max_elements=max(capacity, 1), ef_construction=self.ef_construction, M=self.M, allow_replace_deleted=True
+        )
+        index.set_ef(self.ef_search)
+        return index
+
+    def _load_index(self):
+        snapshot = self._file("bin")
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'snapshot_seq'").fetchone()
+        if self.on_disk and row is not None and os.path.exists(snapshot):
+            index = hnswlib.Index(space="cosine", dim=self.embedding_model_dims)
+            index.load_index(snapshot, max_elements=max(self.max_elements, self._live), allow_replace_deleted=True)
+            index.set_ef(self.ef_search)
+            replayed = self._catch_up(index, since_seq=row[0])
+            logger.info(f"Loaded index snapshot of {self.collection_name} and replayed {replayed} later writes")
+            return index
+        index = self._new_index(max(self.max_elements, self._live * 2))
+        self._catch_up(index, since_seq=-1)
+        self._dirty = self._live > 0
+        return index
+
+    def _catch_up(self, index, since_seq):
+        """
+        Apply to `index` every write committed after `since_seq` and tombstone the vectors deleted since.
+
+        Returns:
+            int: Number of vectors (re)added.
+        """
+        replayed = 0
+        cursor = self.connection.execute("SELECT label, vector FROM points WHERE seq > ? ORDER BY seq", (since_seq,))
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            self._reserve(index, len(rows))
+            labels = [label for label, _ in rows]
+            vectors = np.stack([np.frombuffer(blob, dtype=np.float32) for _, blob in rows])
+            index.add_items(vectors, labels)
+            replayed += len(rows)
+        live = {label for (label,) in self.connection.execute("SELECT label FROM points")}
+        for label in index.get_ids_list():
+            if label not in live:
+                try:
+                    index.mark_deleted(label)
+                except RuntimeError:
+                    pass  # already a tombstone
+        return replayed
+
+    @staticmethod
+    def _reserve(index, count):
+        needed = index.element_count + count
+        if needed > index.get_max_elements():
+            index.resize_index(max(needed, index.get_max_elements() * 2))
+
+    def tombstones(self):
+        """
+        Returns:
+            int: Number of deleted elements still held by the index.
+        """
+        with self._lock:
+            return self.index.element_count - self._live
+
+    def save(self):
+        """Snapshot the index to disk so the next start only replays later writes."""
+        if not self.on_disk:
+            return
+        with self._lock:
+            seq = self._seq
+            snapshot = self._file("bin")
+            self.index.save_index(f"{snapshot}.tmp")
+            os.replace(f"{snapshot}.tmp", snapshot)
+            with self.connection:
+                self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('snapshot_seq', ?)", (seq,))
+            self._dirty = False
+
+    def compact(self):
+        """
+        Rebuild the index from the live vectors, dropping every tombstone.
+
+        The new graph is built without holding the store lock; writes made meanwhile are replayed onto
+        it before it replaces the current one.
+        """
+        with self._lock:
+            build_seq = self._seq
+            live = self._live
+        index = self._new_index(max(self.max_elements, live * 2))
+        # A separate connection, so the build does not hold the shared one.
+        if self.on_disk:
+            reader = sqlite3.connect(self._file("db"))
+            try:
+                self._fill(index, reader, build_seq)
+            finally:
+                reader.close()
+        else:
+            with self._lock:
+                self._fill(index, self.connection, build_seq)
+        with self._lock:
+            self._catch_up(index, since_seq=build_seq)
+            self.index = index
+            self._dirty = True
+        logger.info(f"Compacted index of {self.collection_name} to {live} live vectors")
+
+    def _fill(self, index, connection, until_seq):
+        cursor = connection.execute("SELECT label, vector FROM points WHERE seq <= ?", (until_seq,))
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            self._reserve(index, len(rows))
+            index.add_items(np.stack([np.frombuffer(blob, dtype=np.float32) for _, blob in rows]), [r[0] for r in rows])
+
+    def maintain(self):
+        """Compact the index if enough of it is tombstones, then snapshot it if it changed."""
+        with self._lock:
+            elements = self.index.element_count
+            tombstones = elements - self._live
+        if elements and tombstones / elements >= self.compaction_threshold:
+            self.compact()
+        if self._dirty:
+            self.save()
+
+    def _run_maintenance(self):
+        while not self._stop.wait(self.maintenance_interval):
+            try:
+                self.maintain()
+            except Exception as e:
+                logger.error(f"Error in hnswlib index maintenance: {e}")
+
+    def close(self):
+        """Stop the background thread and take a final snapshot."""
+        self._stop.set()
+        if self._maintainer is not None:
+            self._maintainer.join()
+            self._maintainer = None
+        if self._dirty:
+            self.save()
+
+    # Filtering
+
+    @staticmethod
+    def _where(filters):
+        clauses, params = [], []
+        for key, value in (filters or {}).items():
+            if key in INDEXED_KEYS:
+                column, column_params = key, []
+            else:
+                column, column_params = "json_extract(payload, ?)", [f'$."{key}"']
+            if isinstance(value, dict) and "gte" in value and "lte" in value:
+                clauses.append(f"{column} BETWEEN ? AND ?")
+                params.extend(column_params + [value["gte"], value["lte"]])
+            elif isinstance(value, (list, tuple, set)):
+                values = list(value)
+                clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(column_params + values)
+            else:
+                clauses.append(f"{column} = ?")
+                params.extend(column_params + [value])
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _payloads(self, labels):
+        placeholders = ", ".join("?" for _ in labels)
+        rows = self.connection.execute(
+            f"SELECT label, id, payload FROM points WHERE label IN ({placeholders})", list(labels)
+        ).fetchall()
+        return {label: (vector_id, json.loads(payload)) for label, vector_id, payload in rows}
+
+    @staticmethod
+    def _unit(vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    # VectorStoreBase
+
+    def insert(self, vectors: list, payloads: list = None, ids: list = None):
+        """
+        Insert vectors into the collection, replacing vectors with the same ID.
+
+        Args:
+            vectors (list): List of vectors to insert.
+            payloads (list, optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        if not len(vectors):
+            return
+        vectors = self._unit(vectors)
+        if vectors.shape[1] != self.embedding_model_dims:
+            raise ValueError(f"Expected {self.embedding_model_dims}-dimensional vectors, got {vectors.shape[1]}")
+        with self._lock:
+            ids = [str(idx) for idx in range(len(vectors))] if ids is None else [str(vector_id) for vector_id in ids]
+            self.delete_batch(ids)
+            labels = list(range(self._next_label, self._next_label + len(ids)))
+            self._next_label += len(ids)
+            self._seq += 1
+            rows = []
+            for idx, (vector_id, label) in enumerate(zip(ids, labels)):
+                payload = payloads[idx] if payloads else {}
+                rows.append(
+                    (label, vector_id, vectors[idx].tobytes(), json.dumps(payload))
+                    + tuple(payload.get(key) for key in INDEXED_KEYS)
+                    + (self._seq,)
+                )
+            with self.connection:
+                self.connection.executemany("INSERT INTO points VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._reserve(self.index, len(labels))
+            self.index.add_items(vectors, labels, replace_deleted=True)
+            self._live += len(labels)
+            self._dirty = True
+
+    def search(self, query: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors.
+
+        Args:
+            query (list): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: Search results, most similar first.
+        """
+        return self.search_batch(queries=[query], limit=limit, filters=filters)[0]
+
+    def search_batch(self, queries: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors for several query vectors in one index query.
+
+        Args:
+            queries (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not len(queries):
+            return []
+        queries = self._unit(queries)
+        with self._lock:
+            allowed = None
+            if filters:
+                where, params = self._where(filters)
+                allowed = [label for (label,) in self.connection.execute(f"SELECT label FROM points{where}", params)]
+            candidates = self._live if allowed is None else len(allowed)
+            k = min(limit, candidates)
+            if k <= 0:
+                return [[] for _ in queries]
+            if allowed is not None and len(allowed) <= self.brute_force_threshold:
+                labels, scores = self._exact(queries, allowed, k)
+            else:
+                labels, scores = self._approximate(queries, allowed, k)
+            found = self._payloads({int(label) for row in labels for label in row})
+        return [
+            [
+                OutputData(id=found[label][0], score=score, payload=found[label][1])
+                for label, score in zip(row_labels, row_scores)
+                if label in found
+            ]
+            for row_labels, row_scores in zip(labels, scores)
+        ]
+
+    def _exact(self, queries, allowed, k):
+        vectors = np.asarray(self.index.get_items(allowed), dtype=np.float32)
+        scores = queries @ vectors.T
+        top = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+        labels = [[int(allowed[j]) for j in row] for row in top]
+        return labels, [[float(scores[i, j]) for j in row] for i, row in enumerate(top)]
+
+    def _approximate(self, queries, allowed, k):
+        self.index.set_ef(max(self.ef_search, k))
+        try:
+            if allowed is None:
+                labels, distances = self.index.knn_query(queries, k=k)
+            else:
+                # The filter is a Python callback, so extra threads would only contend for the GIL.
+                labels, distances = self.index.knn_query(queries, k=k, num_threads=1, filter=set(allowed).__contains__)
+        except RuntimeError:
+            # The graph walk could not collect k results (e.g. a very selective filter); score exactly.
+            if allowed is None:
+                allowed = [label for (label,) in self.connection.execute("SELECT label FROM points")]
+            return self._exact(queries, allowed, k)
+        return labels.astype(int).tolist(), (1.0 - distances).astype(float).tolist()
+
+    def delete(self, vector_id: str):
+        """
+        Delete a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        self.delete_batch([vector_id])
+
+    def delete_batch(self, vector_ids: list):
+        """
+        Delete several vectors, leaving tombstones in the index.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        ids = [str(vector_id) for vector_id in vector_ids]
+        with self._lock:
+            placeholders = ", ".join("?" for _ in ids)
+            labels = [
+                label
+                for (label,) in self.connection.execute(f"SELECT label FROM points WHERE id IN ({placeholders})", ids)
+            ]
+            self._remove(labels)
+
+    def _remove(self, labels):
+        if not labels:
+            return
+        placeholders = ", ".join("?" for _ in labels)
+        with self.connection:
+            self.connection.execute(f"DELETE FROM points WHERE label IN ({placeholders})", labels)
+        for label in labels:
+            self.index.mark_deleted(label)
+        self._live -= len(labels)
+        self._dirty = True
+
+    def delete_by_filter(self, filters: dict):
+        """
+        Delete every vector whose payload matches the filters.
+
+        Args:
+            filters (dict): Filters to apply; at least one is required.
+
+        Returns:
+            int: Number of deleted vectors.
+        """
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter")
+        where, params = self._where(filters)
+        with self._lock:
+            labels = [label for (label,) in self.connection.execute(f"SELECT label FROM points{where}", params)]
+            self._remove(labels)
+        return len(labels)
+
+    def update(self, vector_id: str, vector: list = None, payload: dict = None):
+        """
+        Update a vector and its payload.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (list, optional): Updated vector. Defaults to None.
+            payload (dict, optional): Updated payload. Defaults to None.
+        """
+        self.update_batch([vector_id], [vector], [payload])
+
+    def update_batch(self, vector_ids: list, vectors: list = None, payloads: list = None):
+        """
+        Update several vectors in place. A missing vector or payload keeps the stored one.
+
+        Args:
+            vector_ids (list): IDs of the vectors to update.
+            vectors (list, optional): Updated vectors, one per ID.
+            payloads (list, optional): Updated payloads, one per ID.
+        """
+        if not vector_ids:
+            return
+        with self._lock:
+            self._seq += 1
+            for idx, vector_id in enumerate(vector_ids):
+                row = self.connection.execute("SELECT label FROM points WHERE id = ?", (str(vector_id),)).fetchone()
+                if row is None:
+                    logger.warning(f"Cannot update vector {vector_id}: it does not exist")
+                    continue
+                label = row[0]
+                vector = vectors[idx] if vectors else None
+                payload = payloads[idx] if payloads else None
+                with self.connection:
+                    if vector is not None:
+                        vector = self._unit([vector])
+                        self.connection.execute(
+                            "UPDATE points SET vector = ?, seq = ? WHERE label = ?", (vector[0].tobytes(), self._seq, label)
+                        )
+                        # Re-adding an existing label overwrites its vector and relinks it in the graph.
+                        self.index.add_items(vector, [label])
+                    if payload is not None:
+                        self.connection.execute(
+                            "UPDATE points SET payload = ?, user_id = ?, agent_id = ?, run_id = ?, hash = ? WHERE label = ?",
+                            (json.dumps(payload),) + tuple(payload.get(key) for key in INDEXED_KEYS) + (label,),
+                        )
+            self._dirty = True
+
+    def get(self, vector_id: str) -> OutputData:
+        """
+        Retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector, or None if it does not exist.
+        """
+        with self._lock:
+            row = self.connection.execute("SELECT id, payload FROM points WHERE id = ?", (str(vector_id),)).fetchone()
+        return OutputData(id=row[0], score=None, payload=json.loads(row[1])) if row else None
+
+    def list_cols(self) -> list:
+        """
+        List all collections.
+
+        Returns:
+            list: The name of the collection held by this store.
+        """
+        return [self.collection_name]
+
+    def delete_col(self):
+        """Delete every vector of the collection and its snapshot."""
+        with self._lock:
+            with self.connection:
+                self.connection.execute("DELETE FROM points")
+                self.connection.execute("DELETE FROM meta")
+            if self.on_disk and os.path.exists(self._file("bin")):
+                os.remove(self._file("bin"))
+            self._live = 0
+            self.index = self._new_index(self.max_elements)
+            self._dirty = False
+
+    def col_info(self) -> dict:
+        """
+        Get information about the collection.
+
+        Returns:
+            dict: Collection information.
+        """
+        with self._lock:
+            return {
+                "name": self.collection_name,
+                "dims": self.embedding_model_dims,
+                "count": self._live,
+                "tombstones": self.index.element_count - self._live,
+                "max_elements": self.index.get_max_elements(),
+                "M": self.M,
+                "ef_search": self.ef_search,
+            }
+
+    def list(self, filters: dict = None, limit: int = 100) -> list:
+        """
+        List vectors in the collection in insertion order.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            list: A single-element list holding the matching vectors.
+        """
+        where, params = self._where(filters)
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT id, payload FROM points{where} ORDER BY label LIMIT ?", params + [limit]
+            ).fetchall()
+        return [[OutputData(id=vector_id, score=None, payload=json.loads(payload)) for vector_id, payload in rows]]
+
+    def iter_all(self, filters: dict = None, page_size: int = 1000):
+        """
+        Yield every vector matching the filters, one page of the payload table at a time.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            page_size (int, optional): Number of vectors fetched per query. Defaults to 1000.
+        """
+        where, params = self._where(filters)
+        where = f"{where} AND label > ?" if where else " WHERE label > ?"
+        last = 0
+        while True:
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT label, id, payload FROM points{where} ORDER BY label LIMIT ?", params + [last, page_size]
+                ).fetchall()
+            for _, vector_id, payload in rows:
+                yield OutputData(id=vector_id, score=None, payload=json.loads(payload))
+            if len(rows) < page_size:
+                return
+            last = rows[-1][0]
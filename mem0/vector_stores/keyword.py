@@ -0,0 +1,85 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+# CJK text has no spaces between words, so it is indexed as character unigrams and bigrams.
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+_TOKEN_RE = re.compile(rf"[{_CJK}]+|[^\W{_CJK}]+")
+_CJK_RE = re.compile(rf"[{_CJK}]")
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # BM25 score
+    payload: Optional[Dict]  # metadata
+
+
+def tokenize(text):
+    """
+    Split text into lowercase keyword tokens.
+
+    Latin words, numbers and codes such as "SKU-42" split on non-word characters; runs of CJK
+    characters produce their unigrams and bigrams.
+    """
+    tokens = []
+    for token in _TOKEN_RE.findall((text or "").lower()):
+        if _CJK_RE.match(token):
+            tokens.extend(token)
+            tokens.extend(token[i : i + 2] for i in range(len(token) - 1))
+        else:
+            tokens.append(token)
+    return tokens
+
+
+def bm25_scan(query, memories, limit, k1=1.5, b=0.75):
+    """
+    Rank memories against a keyword query with BM25 in a single pass.
+
+    Only the term frequencies of the query terms are kept, so memory use grows with the number of
+    matching memories rather than with the size of `memories`.
+
+    Args:
+        query (str): Keyword query.
+        memories (iterable): Memories (with `payload["data"]`) to rank, e.g. `VectorStoreBase.iter_all`.
+        limit (int): Number of results to return.
+        k1 (float, optional): BM25 term frequency saturation. Defaults to 1.5.
+        b (float, optional): BM25 length normalization. Defaults to 0.75.
+
+    Returns:
+        List[OutputData]: The best matching memories with their BM25 score, best first.
+    """
+    query_terms = set(tokenize(query))
+    if not query_terms:
+        return []
+
+    document_count = 0
+    total_length = 0
+    document_frequency = Counter()
+    matches = []
+    for memory in memories:
+        tokens = tokenize(memory.payload.get("data", ""))
+        document_count += 1
+        total_length += len(tokens)
+        term_frequency = Counter(token for token in tokens if token in query_terms)
+        if term_frequency:
+            document_frequency.update(term_frequency.keys())
+            matches.append((memory, len(tokens), term_frequency))
+
+    if not matches:
+        return []
+    average_length = total_length / document_count
+    idf = {
+        term: math.log(1 + (document_count - count + 0.5) / (count + 0.5)) for term, count in document_frequency.items()
+    }
+
+    def score(match):
+        _, length, term_frequency = match
+        norm = k1 * (1 - b + b * length / average_length)
+        return sum(idf[term] * tf * (k1 + 1) / (tf + norm) for term, tf in term_frequency.items())
+
+    ranked = heapq.nlargest(limit, ((score(match), index, match[0]) for index, match in enumerate(matches)))
+    return [OutputData(id=str(memory.id), score=value, payload=memory.payload) for value, _, memory in ranked]
@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import Dict, Optional
 
@@ -106,7 +107,9 @@ class MilvusDB(VectorStoreBase):
         """
         operands = []
         for key, value in filters.items():
-            if isinstance(value, str):
+            if isinstance(value, (list, tuple, set)):
+                operands.append(f'(metadata["{key}"] in {json.dumps(list(value))})')
+            elif isinstance(value, str):
                 operands.append(f'(metadata["{key}"] == "{value}")')
             else:
                 operands.append(f'(metadata["{key}"] == {value})')
@@ -160,6 +163,30 @@ class MilvusDB(VectorStoreBase):
         result = self._parse_output(data=hits[0])
         return result
 
+    def search_batch(self, queries: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors for several query vectors in one request.
+
+        Args:
+            queries (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        hits = self.client.search(
+            collection_name=self.collection_name,
+            data=list(queries),
+            limit=limit,
+            filter=query_filter,
+            output_fields=["*"],
+        )
+        return [self._parse_output(data=query_hits) for query_hits in hits]
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
@@ -169,6 +196,77 @@ class MilvusDB(VectorStoreBase):
         """
         self.client.delete(collection_name=self.collection_name, ids=vector_id)
 
+    def iter_all(self, filters: dict = None, page_size: int = 1000):
+        """
+        Yield every vector matching the filters through a Milvus query iterator.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+            page_size (int, optional): Number of vectors fetched per batch. Defaults to 1000.
+        """
+        iterator = self.client.query_iterator(
+            collection_name=self.collection_name,
+            batch_size=page_size,
+            filter=self._create_filter(filters) if filters else "",
+            output_fields=["id", "metadata"],
+        )
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    return
+                for data in batch:
+                    yield OutputData(id=data.get("id"), score=None, payload=data.get("metadata"))
+        finally:
+            iterator.close()
+
+    def delete_batch(self, vector_ids: list):
+        """
+        Delete several vectors with a single request.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        self.client.delete(collection_name=self.collection_name, ids=list(vector_ids))
+
+    def update_batch(self, vector_ids: list, vectors: list = None, payloads: list = None):
+        """
+        Update several vectors and their payloads with a single upsert.
+
+        Args:
+            vector_ids (list): IDs of the vectors to update.
+            vectors (list, optional): Updated vectors, one per ID.
+            payloads (list, optional): Updated payloads, one per ID.
+        """
+        if not vector_ids:
+            return
+        data = [
+            {
+                "id": vector_id,
+                "vectors": vectors[idx] if vectors else None,
+                "metadata": payloads[idx] if payloads else None,
+            }
+            for idx, vector_id in enumerate(vector_ids)
+        ]
+        self.client.upsert(collection_name=self.collection_name, data=data)
+
+    def delete_by_filter(self, filters: dict):
+        """
+        Delete every vector whose metadata matches the filters with a single filter expression.
+
+        Args:
+            filters (dict): Filters to apply; at least one is required.
+
+        Returns:
+            int or None: Number of deleted vectors when reported by the server.
+        """
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter")
+        result = self.client.delete(collection_name=self.collection_name, filter=self._create_filter(filters))
+        return result.get("delete_count") if isinstance(result, dict) else None
+
     def update(self, vector_id=None, vector=None, payload=None):
         """
         Update a vector and its payload.
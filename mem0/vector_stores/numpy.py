@@ -0,0 +1,655 @@
+import json
+import logging
+import math
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("The 'numpy' library is required. Please install it using 'pip install numpy'.")
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+# Payload keys that every memory call filters on; vectors are partitioned by their values.
+PARTITION_KEYS = ("user_id", "agent_id", "run_id")
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # cosine similarity
+    payload: Optional[Dict]  # metadata
+
+
+# Number of set bits of every byte value, for Hamming distances between packed binary codes.
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint16)
+
+
+class _Codec:
+    """
+    Encodes unit-length vectors into the rows stored by a partition and estimates cosine similarities
+    against them: float32 as is, float16 (2x smaller), int8 scaled by 127 (4x) or sign bits packed
+    eight to a byte (32x), scored by Hamming distance.
+    """
+
+    DTYPES = {None: np.float32, "float16": np.float16, "int8": np.int8, "binary": np.uint8}
+
+    def __init__(self, dims, quantization=None):
+        if quantization not in self.DTYPES:
+            raise ValueError(f"Unsupported quantization for NumpyVectorStore: {quantization}")
+        self.dims = dims
+        self.quantization = quantization
+        self.dtype = self.DTYPES[quantization]
+        self.width = math.ceil(dims / 8) if quantization == "binary" else dims
+
+    def encode(self, vectors):
+        if self.quantization == "float16":
+            return vectors.astype(np.float16)
+        if self.quantization == "int8":
+            return np.clip(np.rint(vectors * 127), -127, 127).astype(np.int8)
+        if self.quantization == "binary":
+            return np.packbits(vectors > 0, axis=-1)
+        return vectors
+
+    def score(self, queries, codes):
+        """
+        Returns:
+            np.ndarray: Estimated cosine similarity of every query (rows) to every code (columns).
+        """
+        if self.quantization == "binary":
+            bits = np.packbits(queries > 0, axis=-1)
+            hamming = np.stack([_POPCOUNT[np.bitwise_xor(codes, query)].sum(axis=1) for query in bits])
+            return 1.0 - 2.0 * hamming / self.dims
+        if self.quantization is None:
+            return queries @ codes.T
+        scores = queries @ codes.astype(np.float32).T
+        return scores / 127 if self.quantization == "int8" else scores
+
+
+class _Partition:
+    """
+    Contiguous matrix of the encoded unit-length vectors of one (user_id, agent_id, run_id) tenant,
+    plus their float32 originals when quantized results are rescored.
+    """
+
+    def __init__(self, codec, keep_originals=False, capacity=16):
+        self.codes = np.empty((capacity, codec.width), dtype=codec.dtype)
+        self.originals = np.empty((capacity, codec.dims), dtype=np.float32) if keep_originals else None
+        self.ids = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    @staticmethod
+    def _grow(matrix, rows):
+        grown = np.empty((matrix.shape[0] * 2, matrix.shape[1]), dtype=matrix.dtype)
+        grown[:rows] = matrix[:rows]
+        return grown
+
+    def append(self, vector_id, code, original=None):
+        if len(self.ids) == self.codes.shape[0]:
+            self.codes = self._grow(self.codes, len(self.ids))
+            if self.originals is not None:
+                self.originals = self._grow(self.originals, len(self.ids))
+        self.codes[len(self.ids)] = code
+        if self.originals is not None:
+            self.originals[len(self.ids)] = original
+        self.ids.append(vector_id)
+        return len(self.ids) - 1
+
+    def remove(self, row):
+        """
+        Remove `row` by moving the last row into its place.
+
+        Returns:
+            str or None: The ID of the vector that moved into `row`, if any.
+        """
+        last = len(self.ids) - 1
+        moved = None
+        if row != last:
+            self.codes[row] = self.codes[last]
+            if self.originals is not None:
+                self.originals[row] = self.originals[last]
+            self.ids[row] = moved = self.ids[last]
+        self.ids.pop()
+        return moved
+
+    def matrix(self):
+        return self.codes[: len(self.ids)]
+
+    def original_matrix(self):
+        return self.originals[: len(self.ids)]
+
+    def nbytes(self):
+        used = self.matrix().nbytes
+        return used + self.original_matrix().nbytes if self.originals is not None else used
+
+
+def _top_k(scores, k):
+    """
+    Returns:
+        np.ndarray: Column indices of the `k` highest scores of every row, best first.
+    """
+    if k < scores.shape[1]:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1)
+
+
+class NumpyVectorStore(VectorStoreBase):
+    """
+    In-process vector store for single-node deployments, tests and benchmarks.
+
+    Vectors are kept per tenant in contiguous float32 matrices, so a search is one matrix product over
+    the rows of the filtered tenants followed by an `argpartition` top-k. Other payload filters are
+    answered from per-key inverted indexes. With `on_disk`, the collection is loaded from `path` when
+    the store opens and snapshotted back to one `.npz` archive every `save_interval` seconds, on `flush`
+    and on `close`; writes since the last snapshot are lost if the process dies.
+
+    With `quantization`, the matrices hold float16, int8 or binary codes instead. Rescoring re-ranks
+    the best `oversampling` x `limit` candidates with float32 originals; those are kept alongside the
+    codes, so it is off by default here to keep the memory saving.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        embedding_model_dims: int,
+        path: Optional[str] = None,
+        on_disk: bool = False,
+        quantization: Optional[str] = None,
+        rescore: bool = False,
+        oversampling: float = 2.0,
+        save_interval: Optional[float] = 60.0,
+    ):
+        """
+        Initialize the NumPy vector store.
+
+        Args:
+            collection_name (str): Name of the collection.
+            embedding_model_dims (int): Dimensions of the embedding model.
+            path (str, optional): Directory holding the saved collection. Defaults to None.
+            on_disk (bool, optional): Load the collection from `path` and snapshot it there. Defaults to False.
+            quantization (str, optional): Store "float16", "int8" or "binary" codes. Defaults to None.
+            rescore (bool, optional): Keep float32 originals to rescore quantized candidates. Defaults to False.
+            oversampling (float, optional): Quantized candidates rescored per requested result. Defaults to 2.0.
+            save_interval (float, optional): Seconds between background snapshots, None to only snapshot on
+                `flush` and `close`. Defaults to 60.0.
+        """
+        if on_disk and not path:
+            raise ValueError("NumpyVectorStore needs a 'path' when 'on_disk' is enabled")
+        self.collection_name = collection_name
+        self.path = path
+        self.on_disk = on_disk
+        self.quantization = quantization
+        self.rescore = bool(quantization and rescore)
+        self.oversampling = oversampling
+        self.save_interval = save_interval
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._saver = None
+        self._dirty = False
+        self.create_col(embedding_model_dims)
+        if on_disk:
+            self._load()
+            if save_interval is not None:
+                self._saver = threading.Thread(target=self._run_saver, name="mem0-numpy", daemon=True)
+                self._saver.start()
+
+    def create_col(self, vector_size: int, distance: str = "cosine"):
+        """
+        Create an empty collection.
+
+        Args:
+            vector_size (int): Size of the vectors to be stored.
+            distance (str, optional): Distance metric; only "cosine" is supported. Defaults to "cosine".
+        """
+        if distance != "cosine":
+            raise ValueError(f"Unsupported distance for NumpyVectorStore: {distance}")
+        with self._lock:
+            self.embedding_model_dims = vector_size
+            self._codec = _Codec(vector_size, self.quantization)
+            self._partitions = {}
+            self._locations = {}
+            self._payloads = {}
+            self._index = defaultdict(lambda: defaultdict(set))
+
+    # Persistence
+
+    def _file(self):
+        return os.path.join(self.path, f"{self.collection_name}.npz")
+
+    def _load(self):
+        if not os.path.exists(self._file()):
+            return
+        with np.load(self._file(), allow_pickle=False) as saved:
+            codes = saved["codes"]
+            originals = saved["originals"] if "originals" in saved.files else None
+            payloads = json.loads(str(saved["payloads"]))
+        if payloads["ids"] and (codes.dtype != self._codec.dtype or codes.shape[1] != self._codec.width):
+            raise ValueError(
+                f"Collection {self.collection_name} holds {codes.shape[1]} {codes.dtype} values per vector, "
+                f"expected {self._codec.width} {np.dtype(self._codec.dtype)} for {self.embedding_model_dims} "
+                f"dimensions and quantization {self.quantization}"
+            )
+        if self.rescore and payloads["ids"] and originals is None:
+            raise ValueError(f"Collection {self.collection_name} was saved without the originals needed to rescore")
+        with self._lock:
+            for row, (vector_id, payload) in enumerate(zip(payloads["ids"], payloads["payloads"])):
+                self._add(vector_id, codes[row], None if originals is None else originals[row], payload)
+        logger.info(f"Loaded {len(payloads['ids'])} vectors into collection {self.collection_name}")
+
+    def flush(self):
+        """Snapshot the collection to `path` if it changed since the last snapshot."""
+        if not self.on_disk:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                partitions = list(self._partitions.values())
+                ids = [vector_id for partition in partitions for vector_id in partition.ids]
+                arrays = {
+                    "codes": (
+                        np.concatenate([partition.matrix() for partition in partitions])
+                        if partitions
+                        else np.empty((0, self._codec.width), self._codec.dtype)
+                    ),
+                    "payloads": np.array(
+                        json.dumps({"ids": ids, "payloads": [self._payloads[vector_id] for vector_id in ids]})
+                    ),
+                }
+                if self.rescore:
+                    arrays["originals"] = (
+                        np.concatenate([partition.original_matrix() for partition in partitions])
+                        if partitions
+                        else np.empty((0, self.embedding_model_dims), np.float32)
+                    )
+                self._dirty = False
+            # One archive written next to the target and renamed, so a crash leaves the previous snapshot intact.
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                with open(f"{self._file()}.tmp", "wb") as f:
+                    np.savez(f, **arrays)
+                os.replace(f"{self._file()}.tmp", self._file())
+            except Exception:
+                self._dirty = True
+                raise
+
+    def _run_saver(self):
+        while not self._stop.wait(self.save_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error saving collection {self.collection_name}: {e}")
+
+    def close(self):
+        """Stop the background thread and take a final snapshot."""
+        self._stop.set()
+        if self._saver is not None:
+            self._saver.join()
+            self._saver = None
+        self.flush()
+
+    # Row and index bookkeeping; callers hold the lock.
+
+    def _normalize(self, vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.shape[-1] != self.embedding_model_dims:
+            raise ValueError(f"Expected {self.embedding_model_dims}-dimensional vectors, got {vectors.shape[-1]}")
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def _add(self, vector_id, code, original, payload):
+        payload = dict(payload or {})
+        key = tuple(payload.get(name) for name in PARTITION_KEYS)
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = _Partition(self._codec, keep_originals=self.rescore)
+        self._locations[vector_id] = (key, partition.append(vector_id, code, original))
+        self._payloads[vector_id] = payload
+        for field, value in payload.items():
+            try:
+                self._index[field][value].add(vector_id)
+            except TypeError:
+                continue
+
+    def _remove(self, vector_id):
+        """
+        Returns:
+            tuple: The removed (code, original, payload), or None if the ID is unknown.
+        """
+        location = self._locations.pop(vector_id, None)
+        if location is None:
+            return None
+        key, row = location
+        partition = self._partitions[key]
+        code = partition.codes[row].copy()
+        original = partition.originals[row].copy() if partition.originals is not None else None
+        moved = partition.remove(row)
+        if moved is not None:
+            self._locations[moved] = (key, row)
+        if not len(partition):
+            del self._partitions[key]
+        payload = self._payloads.pop(vector_id)
+        for field, value in payload.items():
+            try:
+                ids = self._index[field][value]
+            except TypeError:
+                continue
+            ids.discard(vector_id)
+            if not ids:
+                del self._index[field][value]
+        return code, original, payload
+
+    # Filtering
+
+    @staticmethod
+    def _matches(value, condition):
+        if isinstance(condition, dict) and "gte" in condition and "lte" in condition:
+            try:
+                return value is not None and condition["gte"] <= value <= condition["lte"]
+            except TypeError:
+                return False
+        if isinstance(condition, (list, tuple, set)):
+            return value in condition
+        return value == condition
+
+    def _filter_ids(self, field, condition, candidates):
+        if isinstance(condition, dict) and "gte" in condition and "lte" in condition:
+            pool = candidates if candidates is not None else self._payloads.keys()
+            return {vector_id for vector_id in pool if self._matches(self._payloads[vector_id].get(field), condition)}
+        values = condition if isinstance(condition, (list, tuple, set)) else [condition]
+        matched = set()
+        for value in values:
+            try:
+                matched |= self._index[field].get(value, set())
+            except TypeError:
+                matched |= {vid for vid, payload in self._payloads.items() if payload.get(field) == value}
+        return matched if candidates is None else matched & candidates
+
+    def _select(self, filters):
+        """
+        Resolve `filters` to the rows they select.
+
+        Returns:
+            list: (partition, rows) pairs, where `rows` is None when the whole partition matches.
+        """
+        filters = filters or {}
+        partitions = [
+            (key, partition)
+            for key, partition in self._partitions.items()
+            if all(self._matches(key[i], filters[name]) for i, name in enumerate(PARTITION_KEYS) if name in filters)
+        ]
+        payload_filters = {field: condition for field, condition in filters.items() if field not in PARTITION_KEYS}
+        if not payload_filters:
+            return [(partition, None) for _, partition in partitions]
+
+        candidates = None
+        # Indexed equality filters first, so range filters only scan the surviving candidates.
+        for field, condition in sorted(payload_filters.items(), key=lambda item: isinstance(item[1], dict)):
+            candidates = self._filter_ids(field, condition, candidates)
+            if not candidates:
+                return []
+        rows = defaultdict(list)
+        for vector_id in candidates:
+            key, row = self._locations[vector_id]
+            rows[key].append(row)
+        return [
+            (partition, np.sort(np.array(rows[key], dtype=np.intp))) for key, partition in partitions if key in rows
+        ]
+
+    def _output(self, vector_id, score=None):
+        return OutputData(id=vector_id, score=score, payload=dict(self._payloads[vector_id]))
+
+    # VectorStoreBase
+
+    def insert(self, vectors: list, payloads: list = None, ids: list = None):
+        """
+        Insert vectors into the collection, replacing vectors with the same ID.
+
+        Args:
+            vectors (list): List of vectors to insert.
+            payloads (list, optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        if not len(vectors):
+            return
+        normalized = self._normalize(vectors)
+        codes = self._codec.encode(normalized)
+        with self._lock:
+            for idx, code in enumerate(codes):
+                vector_id = str(idx) if ids is None else ids[idx]
+                self._remove(vector_id)
+                self._add(vector_id, code, normalized[idx], payloads[idx] if payloads else None)
+            self._dirty = True
+
+    def search(self, query: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors.
+
+        Args:
+            query (list): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: Search results, most similar first.
+        """
+        return self.search_batch(queries=[query], limit=limit, filters=filters)[0]
+
+    def search_batch(self, queries: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors for several query vectors with one matrix product per partition.
+        Quantized candidates are rescored with their originals when `rescore` is enabled.
+
+        Args:
+            queries (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not len(queries):
+            return []
+        normalized = self._normalize(queries)
+        with self._lock:
+            scores, ids = [], []
+            for partition, rows in self._select(filters):
+                codes = partition.matrix() if rows is None else partition.codes[rows]
+                scores.append(self._codec.score(normalized, codes))
+                ids.extend(partition.ids if rows is None else [partition.ids[row] for row in rows])
+            if not ids or limit <= 0:
+                return [[] for _ in queries]
+            scores = np.concatenate(scores, axis=1)
+            candidates = max(limit, math.ceil(limit * self.oversampling)) if self.rescore else limit
+            top = _top_k(scores, min(candidates, len(ids)))
+            if not self.rescore:
+                return [[self._output(ids[j], float(scores[i, j])) for j in row] for i, row in enumerate(top)]
+            results = []
+            for query, row in zip(normalized, top):
+                originals = np.stack([self._original(ids[j]) for j in row])
+                exact = originals @ query
+                order = np.argsort(-exact, kind="stable")[:limit]
+                results.append([self._output(ids[row[o]], float(exact[o])) for o in order])
+            return results
+
+    def _original(self, vector_id):
+        key, row = self._locations[vector_id]
+        return self._partitions[key].originals[row]
+
+    def delete(self, vector_id: str):
+        """
+        Delete a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        self.delete_batch([vector_id])
+
+    def delete_batch(self, vector_ids: list):
+        """
+        Delete several vectors.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        with self._lock:
+            for vector_id in vector_ids:
+                self._remove(vector_id)
+            self._dirty = True
+
+    def delete_by_filter(self, filters: dict):
+        """
+        Delete every vector whose payload matches the filters.
+
+        Args:
+            filters (dict): Filters to apply; at least one is required.
+
+        Returns:
+            int: Number of deleted vectors.
+        """
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter")
+        with self._lock:
+            selected = [
+                vector_id
+                for partition, rows in self._select(filters)
+                for vector_id in (list(partition.ids) if rows is None else [partition.ids[row] for row in rows])
+            ]
+            for vector_id in selected:
+                self._remove(vector_id)
+            self._dirty = True
+            return len(selected)
+
+    def update(self, vector_id: str, vector: list = None, payload: dict = None):
+        """
+        Update a vector and its payload.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (list, optional): Updated vector. Defaults to None.
+            payload (dict, optional): Updated payload. Defaults to None.
+        """
+        self.update_batch([vector_id], [vector], [payload])
+
+    def update_batch(self, vector_ids: list, vectors: list = None, payloads: list = None):
+        """
+        Update several vectors. A missing vector or payload keeps the stored one.
+
+        Args:
+            vector_ids (list): IDs of the vectors to update.
+            vectors (list, optional): Updated vectors, one per ID.
+            payloads (list, optional): Updated payloads, one per ID.
+        """
+        if not vector_ids:
+            return
+        with self._lock:
+            for idx, vector_id in enumerate(vector_ids):
+                vector = vectors[idx] if vectors else None
+                payload = payloads[idx] if payloads else None
+                removed = self._remove(vector_id)
+                if removed is None and vector is None:
+                    logger.warning(f"Cannot update vector {vector_id} without a vector: it does not exist")
+                    continue
+                code, original, old_payload = removed if removed is not None else (None, None, None)
+                if vector is not None:
+                    original = self._normalize(vector)
+                    code = self._codec.encode(original)
+                self._add(vector_id, code, original, payload if payload is not None else old_payload)
+            self._dirty = True
+
+    def get(self, vector_id: str) -> OutputData:
+        """
+        Retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector, or None if it does not exist.
+        """
+        with self._lock:
+            if vector_id not in self._payloads:
+                return None
+            return self._output(vector_id)
+
+    def list_cols(self) -> list:
+        """
+        List all collections.
+
+        Returns:
+            list: The name of the collection held by this store.
+        """
+        return [self.collection_name]
+
+    def delete_col(self):
+        """Delete the collection and its saved snapshot."""
+        with self._save_lock, self._lock:
+            self.create_col(self.embedding_model_dims)
+            self._dirty = False
+            if self.on_disk and os.path.exists(self._file()):
+                os.remove(self._file())
+
+    def col_info(self) -> dict:
+        """
+        Get information about the collection.
+
+        Returns:
+            dict: Collection information.
+        """
+        with self._lock:
+            return {
+                "name": self.collection_name,
+                "dims": self.embedding_model_dims,
+                "count": len(self._payloads),
+                "partitions": len(self._partitions),
+                "quantization": self.quantization,
+                "bytes": sum(partition.nbytes() for partition in self._partitions.values()),
+            }
+
+    def list(self, filters: dict = None, limit: int = 100) -> list:
+        """
+        List vectors in the collection in insertion order.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            list: A single-element list holding the matching vectors.
+        """
+        results = []
+        for memory in self.iter_all(filters=filters):
+            if len(results) >= limit:
+                break
+            results.append(memory)
+        return [results]
+
+    def iter_all(self, filters: dict = None, page_size: int = 1000):
+        """
+        Yield every vector matching the filters, in insertion order.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            page_size (int, optional): Unused; the collection is already in memory.
+        """
+        with self._lock:
+            selected = set()
+            for partition, rows in self._select(filters):
+                selected.update(partition.ids if rows is None else [partition.ids[row] for row in rows])
+            matches = [self._output(vector_id) for vector_id in self._payloads if vector_id in selected]
+        yield from matches
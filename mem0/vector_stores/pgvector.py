@@ -1,5 +1,9 @@
+import asyncio
+import itertools
 import json
 import logging
+import math
+import re
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -11,6 +15,7 @@ except ImportError:
     raise ImportError("The 'psycopg2' library is required. Please install it using 'pip install psycopg2'.")
 
 from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.keyword import _CJK
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +26,29 @@ class OutputData(BaseModel):
     payload: Optional[dict]
 
 
+def _numbered(sql):
+    """Rewrite the psycopg2 `%s` placeholders of `sql` to the numbered `$n` placeholders of asyncpg."""
+    counter = itertools.count(1)
+    return re.sub(r"%s", lambda _: f"${next(counter)}", sql)
+
+
+async def _init_async_connection(conn):
+    """Exchange pgvector and JSONB values with asyncpg connections as Python lists and dicts."""
+    for type_name in ("vector", "halfvec"):
+        try:
+            await conn.set_type_codec(
+                type_name,
+                schema="public",
+                encoder=lambda vector: "[" + ",".join(str(float(value)) for value in vector) + "]",
+                decoder=lambda text: [float(value) for value in text[1:-1].split(",")] if len(text) > 2 else [],
+                format="text",
+            )
+        except ValueError:
+            # halfvec needs pgvector 0.7; stores that do not use it never exchange such values.
+            pass
+    await conn.set_type_codec("jsonb", schema="pg_catalog", encoder=json.dumps, decoder=json.loads, format="text")
+
+
 class PGVector(VectorStoreBase):
     def __init__(
         self,
@@ -32,6 +60,9 @@ class PGVector(VectorStoreBase):
         host,
         port,
         diskann,
+        quantization=None,
+        rescore=True,
+        oversampling=2.0,
     ):
         """
         Initialize the PGVector database.
@@ -45,16 +76,66 @@ class PGVector(VectorStoreBase):
             host (str, optional): Database host
             port (int, optional): Database port
             diskann (bool, optional): Use DiskANN for faster search
+            quantization (str, optional): "float16" stores halfvec columns; "binary" searches an HNSW index
+                over binary_quantize(vector). Defaults to None.
+            rescore (bool, optional): Rescore binary quantized candidates with the original vectors.
+                Defaults to True.
+            oversampling (float, optional): Binary quantized candidates fetched per requested result before
+                rescoring. Defaults to 2.0.
         """
         self.collection_name = collection_name
+        self.embedding_model_dims = embedding_model_dims
         self.use_diskann = diskann
+        self.quantization = quantization
+        self.rescore = rescore
+        self.oversampling = oversampling
+        self.vector_type = "halfvec" if quantization == "float16" else "vector"
 
         self.conn = psycopg2.connect(dbname=dbname, user=user, password=password, host=host, port=port)
         self.cur = self.conn.cursor()
+        self._async_connect_params = {
+            "database": dbname,
+            "user": user,
+            "password": password,
+            "host": host,
+            "port": port,
+        }
+        self._async_pool = None
+        self._async_pool_loop = None
 
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col(embedding_model_dims)
+        else:
+            self._match_existing_vector_type()
+            # Tables created by older versions get the indexes added since.
+            self._create_indexes(embedding_model_dims)
+
+    def _match_existing_vector_type(self):
+        """
+        Follow the column type of an existing table, whose storage cannot change in place: a "float16"
+        quantization is ignored on vector columns, and halfvec columns keep being searched as halfvec.
+        """
+        self.cur.execute(
+            """
+            SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+            WHERE attrelid = %s::regclass AND attname = 'vector'
+        """,
+            (self.collection_name,),
+        )
+        row = self.cur.fetchone()
+        existing_type = row[0].split("(")[0] if row else self.vector_type
+        if existing_type == self.vector_type:
+            return
+        logger.warning(
+            f"Collection {self.collection_name} stores {existing_type} vectors, so quantization={self.quantization!r} "
+            "is not applied. Copy it into a new collection with mem0-migrate-embeddings to change its storage."
+        )
+        self.vector_type = existing_type
+        if existing_type == "halfvec":
+            self.quantization = "float16"
+        elif self.quantization == "float16":
+            self.quantization = None
 
     def create_col(self, embedding_model_dims):
         """
@@ -69,26 +150,66 @@ class PGVector(VectorStoreBase):
             f"""
             CREATE TABLE IF NOT EXISTS {self.collection_name} (
                 id UUID PRIMARY KEY,
-                vector vector({embedding_model_dims}),
+                vector {self.vector_type}({embedding_model_dims}),
                 payload JSONB
             );
         """
         )
+        self._create_indexes(embedding_model_dims)
 
-        if self.use_diskann and embedding_model_dims < 2000:
+    def _create_indexes(self, embedding_model_dims):
+        """
+        Create the payload and vector indexes of the collection if they do not exist yet.
+
+        The indexes are built CONCURRENTLY, outside a transaction, so starting against a large existing
+        table does not block its writes while they build.
+
+        Args:
+            embedding_model_dims (int): Dimension of the embedding vector.
+        """
+        indexes = {
+            # Exact-duplicate lookups filter on the content hash of the memory.
+            f"{self.collection_name}_hash_idx": "((payload->>'hash'))",
+            # Keyword search matches this expression, so it must stay in sync with keyword_search.
+            f"{self.collection_name}_keywords_idx": (
+                "USING GIN (to_tsvector('simple', mem0_keyword_text(payload->>'data')))"
+            ),
+        }
+        if self.quantization == "float16":
+            indexes[f"{self.collection_name}_vector_idx"] = "USING hnsw (vector halfvec_cosine_ops)"
+        elif self.quantization == "binary":
+            # Only the index is quantized; the table keeps the original vectors for rescoring.
+            indexes[f"{self.collection_name}_vector_bq_idx"] = (
+                f"USING hnsw ((binary_quantize(vector)::bit({embedding_model_dims})) bit_hamming_ops)"
+            )
+        elif self.use_diskann and embedding_model_dims < 2000:
             # Check if vectorscale extension is installed
             self.cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
             if self.cur.fetchone():
                 # Create DiskANN index if extension is installed for faster search
-                self.cur.execute(
-                    f"""
-                    CREATE INDEX IF NOT EXISTS {self.collection_name}_vector_idx
-                    ON {self.collection_name}
-                    USING diskann (vector);
-                """
-                )
+                indexes[f"{self.collection_name}_vector_idx"] = "USING diskann (vector)"
 
         self.conn.commit()
+        self.conn.autocommit = True
+        try:
+            self._create_keyword_function()
+            # A concurrent build that failed leaves an invalid index, which IF NOT EXISTS would keep.
+            self.cur.execute(
+                """
+                SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE i.indrelid = %s::regclass AND NOT i.indisvalid
+            """,
+                (self.collection_name,),
+            )
+            for (name,) in self.cur.fetchall():
+                if name in indexes:
+                    self.cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
+            for name, definition in indexes.items():
+                self.cur.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {self.collection_name} {definition};"
+                )
+        finally:
+            self.conn.autocommit = False
 
     def insert(self, vectors, payloads=None, ids=None):
         """
@@ -110,31 +231,51 @@ class PGVector(VectorStoreBase):
         )
         self.conn.commit()
 
-    def search(self, query, limit=5, filters=None):
+    def _create_filter(self, filters):
         """
-        Search for similar vectors.
+        Build a WHERE clause over the JSON payload. List values match any of their elements.
 
         Args:
-            query (List[float]): Query vector.
-            limit (int, optional): Number of results to return. Defaults to 5.
-            filters (Dict, optional): Filters to apply to the search. Defaults to None.
+            filters (Dict, optional): Filters to apply.
 
         Returns:
-            list: Search results.
+            tuple: The WHERE clause (or an empty string) and its parameters.
         """
         filter_conditions = []
         filter_params = []
 
         if filters:
             for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+                if isinstance(v, (list, tuple, set)):
+                    filter_conditions.append("payload->>%s = ANY(%s)")
+                    filter_params.extend([k, [str(item) for item in v]])
+                else:
+                    filter_conditions.append("payload->>%s = %s")
+                    filter_params.extend([k, str(v)])
 
         filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
+
+    def search(self, query, limit=5, filters=None):
+        """
+        Search for similar vectors.
+
+        Args:
+            query (List[float]): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: Search results.
+        """
+        if self.quantization == "binary":
+            return self.search_batch([query], limit=limit, filters=filters)[0]
+
+        filter_clause, filter_params = self._create_filter(filters)
 
         self.cur.execute(
             f"""
-            SELECT id, vector <=> %s::vector AS distance, payload
+            SELECT id, vector <=> %s::{self.vector_type} AS distance, payload
             FROM {self.collection_name}
             {filter_clause}
             ORDER BY distance
@@ -146,6 +287,141 @@ class PGVector(VectorStoreBase):
         results = self.cur.fetchall()
         return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
+    def _create_keyword_function(self):
+        """
+        Create `mem0_keyword_text`, which tokenizes text like `mem0.vector_stores.keyword.tokenize`.
+
+        The text search parser keeps runs of CJK characters as single words, so without it a query only
+        matched memories containing the exact same run. The function splits those runs into unigrams
+        and bigrams, and is used on both the indexed text and the query.
+        """
+        self.cur.execute("SELECT 1 FROM pg_proc WHERE proname = 'mem0_keyword_text'")
+        if self.cur.fetchone():
+            return
+        self.cur.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION mem0_keyword_text(input text) RETURNS text
+            LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+                SELECT coalesce(string_agg(
+                    CASE WHEN m[1] ~ '^[{_CJK}]' THEN (
+                        SELECT string_agg(substr(m[1], i, 1) || ' ' || substr(m[1], i, 2), ' ')
+                        FROM generate_series(1, length(m[1])) AS i
+                    ) ELSE m[1] END, ' '), '')
+                FROM regexp_matches(lower(input), '[{_CJK}]+|[^{_CJK}]+', 'g') AS m
+            $$;
+        """
+        )
+
+    def keyword_search(self, query, limit=5, filters=None):
+        """
+        Full-text search over the memory text with a tsvector index, ranked by ts_rank_cd. CJK text is
+        matched on its character unigrams and bigrams.
+
+        Args:
+            query (str): Keyword query.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: The best matching memories with their rank, best first.
+        """
+        filter_clause, filter_params = self._create_filter(filters)
+        match_clause = "AND" if filter_clause else "WHERE"
+
+        self.cur.execute(
+            f"""
+            SELECT id, ts_rank_cd(to_tsvector('simple', mem0_keyword_text(payload->>'data')), q) AS rank, payload
+            FROM {self.collection_name}, plainto_tsquery('simple', mem0_keyword_text(%s)) AS q
+            {filter_clause} {match_clause} to_tsvector('simple', mem0_keyword_text(payload->>'data')) @@ q
+            ORDER BY rank DESC
+            LIMIT %s
+        """,
+            (query, *filter_params, limit),
+        )
+
+        results = self.cur.fetchall()
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
+
+    def search_batch(self, queries, limit=5, filters=None):
+        """
+        Search for similar vectors for several query vectors with a single LATERAL query.
+
+        Args:
+            queries (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+
+        self.cur.execute(*self._search_batch_query(queries, limit, filters))
+
+        batched_results = [[] for _ in queries]
+        for r in self.cur.fetchall():
+            batched_results[r[0]].append(OutputData(id=str(r[1]), score=float(r[2]), payload=r[3]))
+        return batched_results
+
+    def _search_batch_query(self, queries, limit, filters):
+        """
+        Returns:
+            tuple: The LATERAL nearest neighbour SQL for `queries` and its parameters.
+        """
+        filter_clause, filter_params = self._create_filter(filters)
+
+        query_values = ", ".join([f"(%s::int, %s::{self.vector_type})"] * len(queries))
+        query_params = [param for idx, query in enumerate(queries) for param in (idx, query)]
+
+        if self.quantization == "binary":
+            nearest, limit_params = self._binary_nearest(filter_clause, limit)
+        else:
+            nearest = f"""
+                SELECT id, vector <=> q.vec AS distance, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY distance
+                LIMIT %s
+            """
+            limit_params = (limit,)
+
+        sql = f"""
+            SELECT q.idx, r.id, r.distance, r.payload
+            FROM (VALUES {query_values}) AS q(idx, vec)
+            CROSS JOIN LATERAL ({nearest}) AS r
+            ORDER BY q.idx, r.distance
+        """
+        return sql, (*query_params, *filter_params, *limit_params)
+
+    def _binary_nearest(self, filter_clause, limit):
+        """
+        Nearest neighbours of `q.vec` through the binary quantized index: the closest codes by Hamming
+        distance, optionally re-ranked by the cosine distance of the original vectors.
+
+        Returns:
+            tuple: The SQL and the parameters following the filter parameters.
+        """
+        dims = self.embedding_model_dims
+        hamming = f"binary_quantize(vector)::bit({dims}) <~> binary_quantize(q.vec)"
+        if self.rescore:
+            distance, candidates = "vector <=> q.vec", max(limit, math.ceil(limit * self.oversampling))
+        else:
+            distance, candidates = f"({hamming})::float / {dims}", limit
+        sql = f"""
+            SELECT id, {distance} AS distance, payload
+            FROM (
+                SELECT id, vector, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY {hamming}
+                LIMIT %s
+            ) AS candidates
+            ORDER BY distance
+            LIMIT %s
+        """
+        return sql, (candidates, limit)
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
@@ -156,6 +432,71 @@ class PGVector(VectorStoreBase):
         self.cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
         self.conn.commit()
 
+    def delete_batch(self, vector_ids):
+        """
+        Delete several vectors with a single statement.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        self.cur.execute(
+            f"DELETE FROM {self.collection_name} WHERE id = ANY(%s::uuid[])",
+            ([str(vector_id) for vector_id in vector_ids],),
+        )
+        self.conn.commit()
+
+    def update_batch(self, vector_ids, vectors=None, payloads=None):
+        """
+        Update several vectors and their payloads with a single UPDATE ... FROM (VALUES ...).
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (List[List[float]], optional): Updated vectors, one per ID.
+            payloads (List[Dict], optional): Updated payloads, one per ID.
+        """
+        if not vector_ids:
+            return
+        data = [
+            (
+                str(vector_id),
+                vectors[idx] if vectors else None,
+                psycopg2.extras.Json(payloads[idx]) if payloads else None,
+            )
+            for idx, vector_id in enumerate(vector_ids)
+        ]
+        execute_values(
+            self.cur,
+            f"""
+            UPDATE {self.collection_name} AS t
+            SET vector = COALESCE(v.vector::{self.vector_type}, t.vector),
+                payload = COALESCE(v.payload::jsonb, t.payload)
+            FROM (VALUES %s) AS v(id, vector, payload)
+            WHERE t.id = v.id::uuid
+            """,
+            data,
+        )
+        self.conn.commit()
+
+    def delete_by_filter(self, filters):
+        """
+        Delete every vector whose payload matches the filters with a single DELETE statement.
+
+        Args:
+            filters (Dict): Filters to apply; at least one is required.
+
+        Returns:
+            int: Number of deleted vectors.
+        """
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter")
+        filter_clause, filter_params = self._create_filter(filters)
+        self.cur.execute(f"DELETE FROM {self.collection_name} {filter_clause}", filter_params)
+        deleted = self.cur.rowcount
+        self.conn.commit()
+        return deleted
+
     def update(self, vector_id, vector=None, payload=None):
         """
         Update a vector and its payload.
@@ -243,15 +584,7 @@ class PGVector(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        filter_clause, filter_params = self._create_filter(filters)
 
         query = f"""
             SELECT id, vector, payload
@@ -265,6 +598,211 @@ class PGVector(VectorStoreBase):
         results = self.cur.fetchall()
         return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
+    def iter_all(self, filters=None, page_size=1000):
+        """
+        Yield every vector matching the filters using keyset pagination on the primary key.
+
+        Args:
+            filters (Dict, optional): Filters to apply.
+            page_size (int, optional): Number of rows fetched per query. Defaults to 1000.
+        """
+        filter_clause, filter_params = self._create_filter(filters)
+        keyset_clause = "AND id > %s" if filter_clause else "WHERE id > %s"
+        last_id = None
+        while True:
+            if last_id is None:
+                query = f"SELECT id, payload FROM {self.collection_name} {filter_clause} ORDER BY id LIMIT %s"
+                params = (*filter_params, page_size)
+            else:
+                query = (
+                    f"SELECT id, payload FROM {self.collection_name} {filter_clause} {keyset_clause} "
+                    "ORDER BY id LIMIT %s"
+                )
+                params = (*filter_params, last_id, page_size)
+            self.cur.execute(query, params)
+            rows = self.cur.fetchall()
+            for row in rows:
+                yield OutputData(id=str(row[0]), score=None, payload=row[1])
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+
+    async def _apool(self):
+        """
+        Lazily created asyncpg pool for the async methods. A pool is bound to the event loop that created
+        it, so a new one is opened when called from another loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_pool is None or self._async_pool_loop is not loop:
+            try:
+                import asyncpg
+            except ImportError:
+                raise ImportError("The 'asyncpg' library is required. Please install it using 'pip install asyncpg'.")
+            self._async_pool = await asyncpg.create_pool(**self._async_connect_params, init=_init_async_connection)
+            self._async_pool_loop = loop
+        return self._async_pool
+
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        """
+        Asynchronously insert vectors into a collection.
+
+        Args:
+            vectors (List[List[float]]): List of vectors to insert.
+            payloads (List[Dict], optional): List of payloads corresponding to vectors.
+            ids (List[str], optional): List of IDs corresponding to vectors.
+        """
+        pool = await self._apool()
+        await pool.executemany(
+            f"""
+            INSERT INTO {self.collection_name} (id, vector, payload)
+            VALUES ($1::uuid, $2::{self.vector_type}, $3::jsonb)
+            """,
+            [(str(id), vector, payload) for id, vector, payload in zip(ids, vectors, payloads)],
+        )
+
+    async def asearch(self, query, limit=5, filters=None):
+        """
+        Asynchronously search for similar vectors.
+
+        Args:
+            query (List[float]): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: Search results.
+        """
+        return (await self.asearch_batch([query], limit=limit, filters=filters))[0]
+
+    async def asearch_batch(self, queries, limit=5, filters=None):
+        """
+        Asynchronously search for similar vectors for several query vectors with a single LATERAL query.
+
+        Args:
+            queries (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+        sql, params = self._search_batch_query(queries, limit, filters)
+        pool = await self._apool()
+        batched_results = [[] for _ in queries]
+        for r in await pool.fetch(_numbered(sql), *params):
+            batched_results[r[0]].append(OutputData(id=str(r[1]), score=float(r[2]), payload=r[3]))
+        return batched_results
+
+    async def adelete(self, vector_id):
+        """
+        Asynchronously delete a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        pool = await self._apool()
+        await pool.execute(f"DELETE FROM {self.collection_name} WHERE id = $1::uuid", str(vector_id))
+
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        """
+        Asynchronously update a vector and its payload in one statement.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (List[float], optional): Updated vector.
+            payload (Dict, optional): Updated payload.
+        """
+        pool = await self._apool()
+        await pool.execute(
+            f"""
+            UPDATE {self.collection_name}
+            SET vector = COALESCE($2::{self.vector_type}, vector), payload = COALESCE($3::jsonb, payload)
+            WHERE id = $1::uuid
+            """,
+            str(vector_id),
+            vector or None,
+            payload or None,
+        )
+
+    async def adelete_batch(self, vector_ids):
+        """
+        Asynchronously delete several vectors with a single statement.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        pool = await self._apool()
+        await pool.execute(
+            f"DELETE FROM {self.collection_name} WHERE id = ANY($1::uuid[])",
+            [str(vector_id) for vector_id in vector_ids],
+        )
+
+    async def aupdate_batch(self, vector_ids, vectors=None, payloads=None):
+        """
+        Asynchronously update several vectors and their payloads with one pipelined executemany.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (List[List[float]], optional): Updated vectors, one per ID.
+            payloads (List[Dict], optional): Updated payloads, one per ID.
+        """
+        if not vector_ids:
+            return
+        pool = await self._apool()
+        await pool.executemany(
+            f"""
+            UPDATE {self.collection_name}
+            SET vector = COALESCE($2::{self.vector_type}, vector), payload = COALESCE($3::jsonb, payload)
+            WHERE id = $1::uuid
+            """,
+            [
+                (str(vector_id), vectors[idx] if vectors else None, payloads[idx] if payloads else None)
+                for idx, vector_id in enumerate(vector_ids)
+            ],
+        )
+
+    async def aget(self, vector_id) -> OutputData:
+        """
+        Asynchronously retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector.
+        """
+        pool = await self._apool()
+        row = await pool.fetchrow(
+            f"SELECT id, payload FROM {self.collection_name} WHERE id = $1::uuid", str(vector_id)
+        )
+        if not row:
+            return None
+        return OutputData(id=str(row[0]), score=None, payload=row[1])
+
+    async def alist(self, filters=None, limit=100):
+        """
+        Asynchronously list the vectors in a collection.
+
+        Args:
+            filters (Dict, optional): Filters to apply to the list.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            List[OutputData]: List of vectors.
+        """
+        filter_clause, filter_params = self._create_filter(filters)
+        pool = await self._apool()
+        rows = await pool.fetch(
+            _numbered(f"SELECT id, payload FROM {self.collection_name} {filter_clause} LIMIT %s"),
+            *filter_params,
+            limit,
+        )
+        return [[OutputData(id=str(r[0]), score=None, payload=r[1]) for r in rows]]
+
     def __del__(self):
         """
         Close the database connection when the object is deleted.
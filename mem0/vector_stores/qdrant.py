@@ -2,22 +2,48 @@ import logging
 import os
 import shutil
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Datatype,
     Distance,
     FieldCondition,
     Filter,
+    FilterSelector,
+    HnswConfigDiff,
+    MatchAny,
     MatchValue,
+    PayloadSchemaType,
     PointIdsList,
     PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
     Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
     VectorParams,
 )
 
 from mem0.vector_stores.base import VectorStoreBase
 
+try:
+    from qdrant_client.models import KeywordIndexParams, KeywordIndexType
+except ImportError:
+    KeywordIndexParams = KeywordIndexType = None
+
 logger = logging.getLogger(__name__)
 
+# Tenant keyword indexes need qdrant-client 1.11; older clients get a plain keyword index instead.
+SUPPORTS_TENANT_INDEX = KeywordIndexParams is not None and "is_tenant" in (
+    getattr(KeywordIndexParams, "model_fields", None) or getattr(KeywordIndexParams, "__fields__", {})
+)
+
+# Session identifiers every memory query filters on, plus the content hash used for duplicate lookups.
+INDEXED_FIELDS = ("user_id", "agent_id", "run_id", "hash")
+
 
 class Qdrant(VectorStoreBase):
     def __init__(
@@ -31,6 +57,11 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        quantization: str = None,
+        rescore: bool = True,
+        oversampling: float = 2.0,
+        payload_indexes: list = None,
+        is_tenant: bool = False,
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,7 +76,32 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            quantization (str, optional): "float16" stores vectors at half precision; "int8" and "binary"
+                keep scalar or binary quantized copies in RAM for search. Defaults to None.
+            rescore (bool, optional): Rescore quantized candidates with the original vectors. Defaults to True.
+            oversampling (float, optional): Quantized candidates fetched per requested result before
+                rescoring. Defaults to 2.0.
+            payload_indexes (list, optional): Metadata fields to index as keywords in addition to the
+                session identifiers. Defaults to None.
+            is_tenant (bool, optional): Index user_id as a tenant key so Qdrant co-locates and searches
+                each user's points separately. Defaults to False.
         """
+        self.quantization = quantization
+        self.payload_indexes = list(payload_indexes or [])
+        self.is_tenant = is_tenant
+        if is_tenant and not SUPPORTS_TENANT_INDEX:
+            logger.warning(
+                "is_tenant requires qdrant-client>=1.11; indexing user_id as a plain keyword field instead."
+            )
+        self.search_params = None
+        if quantization in ("int8", "binary"):
+            self.search_params = SearchParams(
+                quantization=QuantizationSearchParams(rescore=rescore, oversampling=oversampling)
+            )
+        self._async_client_params = None
+        self._async_client = None
+        # Payload indexes have no effect in the local (path based) mode, which warns on every attempt.
+        self._local = False
         if client:
             self.client = client
         else:
@@ -62,12 +118,27 @@ class Qdrant(VectorStoreBase):
                 if not on_disk:
                     if os.path.exists(path) and os.path.isdir(path):
                         shutil.rmtree(path)
+                self._local = True
 
             self.client = QdrantClient(**params)
+            if "path" not in params:
+                # A local (path based) database is locked by the sync client, so only remote
+                # servers get a separate asyncio-native client.
+                self._async_client_params = params
 
         self.collection_name = collection_name
         self.create_col(embedding_model_dims, on_disk)
 
+    @property
+    def async_client(self):
+        """
+        Lazily created AsyncQdrantClient for remote servers, or None when the store was built
+        from an existing client or a local path.
+        """
+        if self._async_client is None and self._async_client_params is not None:
+            self._async_client = AsyncQdrantClient(**self._async_client_params)
+        return self._async_client
+
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
         """
         Create a new collection.
@@ -77,17 +148,77 @@ class Qdrant(VectorStoreBase):
             on_disk (bool): Enables persistent storage.
             distance (Distance, optional): Distance metric for vector similarity. Defaults to Distance.COSINE.
         """
-        # Skip creating collection if already exists
-        response = self.list_cols()
-        for collection in response.collections:
-            if collection.name == self.collection_name:
-                logging.debug(f"Collection {self.collection_name} already exists. Skipping creation.")
-                return
-
-        self.client.create_collection(
-            collection_name=self.collection_name,
-            vectors_config=VectorParams(size=vector_size, distance=distance, on_disk=on_disk),
+        if self.client.collection_exists(self.collection_name):
+            logger.debug(f"Collection {self.collection_name} already exists. Skipping creation.")
+            info = self.client.get_collection(self.collection_name)
+            self._match_existing_quantization(info)
+            # Collections created by older versions may lack some of the payload indexes.
+            if not self._local:
+                self._create_payload_indexes(skip=set(info.payload_schema or {}))
+            return
+
+        vectors_config = VectorParams(size=vector_size, distance=distance, on_disk=on_disk)
+        quantization_config = None
+        if self.quantization == "float16":
+            vectors_config.datatype = Datatype.FLOAT16
+        elif self.quantization == "int8":
+            quantization_config = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+        elif self.quantization == "binary":
+            quantization_config = BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        # Only non-default settings are passed, so plain collections are created as before.
+        extra = {"quantization_config": quantization_config} if quantization_config else {}
+        if self.is_tenant:
+            # Also link points within each indexed tenant, so filtered searches stay fast as tenants grow.
+            extra["hnsw_config"] = HnswConfigDiff(payload_m=16)
+        self.client.create_collection(collection_name=self.collection_name, vectors_config=vectors_config, **extra)
+        if not self._local:
+            self._create_payload_indexes()
+
+    def _match_existing_quantization(self, info):
+        """
+        Warn when the configured quantization differs from the one the existing collection was created
+        with, which cannot change in place, and search the collection as it is.
+        """
+        config = info.config
+        if isinstance(config.quantization_config, ScalarQuantization):
+            existing = "int8"
+        elif isinstance(config.quantization_config, BinaryQuantization):
+            existing = "binary"
+        elif getattr(config.params.vectors, "datatype", None) == Datatype.FLOAT16:
+            existing = "float16"
+        else:
+            existing = None
+        if existing == self.quantization:
+            return
+        logger.warning(
+            f"Collection {self.collection_name} was created with quantization={existing!r}, so "
+            f"quantization={self.quantization!r} is not applied. Copy it into a new collection with "
+            "mem0-migrate-embeddings to change it."
         )
+        self.quantization = existing
+        if existing not in ("int8", "binary"):
+            self.search_params = None
+
+    def _create_payload_indexes(self, skip=()):
+        """
+        Create keyword payload indexes for the session identifiers, the content hash and the configured
+        metadata fields, so filtered searches do not scan payloads.
+
+        Args:
+            skip (set, optional): Fields that are already indexed. Defaults to ().
+        """
+        for field_name in dict.fromkeys([*INDEXED_FIELDS, *self.payload_indexes]):
+            if field_name in skip:
+                continue
+            if field_name == "user_id" and self.is_tenant and SUPPORTS_TENANT_INDEX:
+                field_schema = KeywordIndexParams(type=KeywordIndexType.KEYWORD, is_tenant=True)
+            else:
+                field_schema = PayloadSchemaType.KEYWORD
+            self.client.create_payload_index(
+                collection_name=self.collection_name, field_name=field_name, field_schema=field_schema
+            )
 
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
         """
@@ -123,6 +254,8 @@ class Qdrant(VectorStoreBase):
         for key, value in filters.items():
             if isinstance(value, dict) and "gte" in value and "lte" in value:
                 conditions.append(FieldCondition(key=key, range=Range(gte=value["gte"], lte=value["lte"])))
+            elif isinstance(value, (list, tuple, set)):
+                conditions.append(FieldCondition(key=key, match=MatchAny(any=list(value))))
             else:
                 conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
         return Filter(must=conditions) if conditions else None
@@ -140,13 +273,37 @@ class Qdrant(VectorStoreBase):
             list: Search results.
         """
         query_filter = self._create_filter(filters) if filters else None
-        hits = self.client.search(
+        extra = {"search_params": self.search_params} if self.search_params else {}
+        response = self.client.query_points(
             collection_name=self.collection_name,
-            query_vector=query,
+            query=query,
             query_filter=query_filter,
             limit=limit,
+            **extra,
         )
-        return hits
+        return response.points
+
+    def search_batch(self, queries: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors for several query vectors in one request.
+
+        Args:
+            queries (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        requests = [
+            QueryRequest(query=query, filter=query_filter, params=self.search_params, limit=limit, with_payload=True)
+            for query in queries
+        ]
+        responses = self.client.query_batch_points(collection_name=self.collection_name, requests=requests)
+        return [response.points for response in responses]
 
     def delete(self, vector_id: int):
         """
@@ -162,6 +319,55 @@ class Qdrant(VectorStoreBase):
             ),
         )
 
+    def delete_batch(self, vector_ids: list):
+        """
+        Delete several points with a single request.
+
+        Args:
+            vector_ids (list): IDs of the points to delete.
+        """
+        if not vector_ids:
+            return
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=list(vector_ids)),
+        )
+
+    def update_batch(self, vector_ids: list, vectors: list = None, payloads: list = None):
+        """
+        Update several points with a single upsert.
+
+        Args:
+            vector_ids (list): IDs of the points to update.
+            vectors (list, optional): Updated vectors, one per ID.
+            payloads (list, optional): Updated payloads, one per ID.
+        """
+        if not vector_ids:
+            return
+        points = [
+            PointStruct(
+                id=vector_id,
+                vector=vectors[idx] if vectors else None,
+                payload=payloads[idx] if payloads else None,
+            )
+            for idx, vector_id in enumerate(vector_ids)
+        ]
+        self.client.upsert(collection_name=self.collection_name, points=points)
+
+    def delete_by_filter(self, filters: dict):
+        """
+        Delete every point whose payload matches the filters with a single filter-selector delete.
+
+        Args:
+            filters (dict): Filters to apply; at least one is required.
+        """
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter")
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(filter=self._create_filter(filters)),
+        )
+
     def update(self, vector_id: int, vector: list = None, payload: dict = None):
         """
         Update a vector and its payload.
@@ -229,3 +435,155 @@ class Qdrant(VectorStoreBase):
             with_vectors=False,
         )
         return result
+
+    def iter_all(self, filters: dict = None, page_size: int = 1000):
+        """
+        Yield every point matching the filters, following the scroll cursor page by page.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            page_size (int, optional): Number of points fetched per request. Defaults to 1000.
+        """
+        query_filter = self._create_filter(filters) if filters else None
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=query_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            yield from points
+            if offset is None:
+                return
+
+    async def ainsert(self, vectors: list, payloads: list = None, ids: list = None):
+        """
+        Asynchronously insert vectors into a collection.
+
+        Args:
+            vectors (list): List of vectors to insert.
+            payloads (list, optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        if self.async_client is None:
+            return await super().ainsert(vectors=vectors, payloads=payloads, ids=ids)
+        points = [
+            PointStruct(
+                id=idx if ids is None else ids[idx],
+                vector=vector,
+                payload=payloads[idx] if payloads else {},
+            )
+            for idx, vector in enumerate(vectors)
+        ]
+        await self.async_client.upsert(collection_name=self.collection_name, points=points)
+
+    async def asearch(self, query: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Asynchronously search for similar vectors.
+
+        Args:
+            query (list): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: Search results.
+        """
+        results = await self.asearch_batch(queries=[query], limit=limit, filters=filters)
+        return results[0] if results else []
+
+    async def asearch_batch(self, queries: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Asynchronously search for similar vectors for several query vectors in one request.
+
+        Args:
+            queries (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if self.async_client is None:
+            return await super().asearch_batch(queries=queries, limit=limit, filters=filters)
+        if not queries:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        requests = [
+            QueryRequest(query=query, filter=query_filter, params=self.search_params, limit=limit, with_payload=True)
+            for query in queries
+        ]
+        responses = await self.async_client.query_batch_points(collection_name=self.collection_name, requests=requests)
+        return [response.points for response in responses]
+
+    async def adelete(self, vector_id: int):
+        """
+        Asynchronously delete a vector by ID.
+
+        Args:
+            vector_id (int): ID of the vector to delete.
+        """
+        if self.async_client is None:
+            return await super().adelete(vector_id=vector_id)
+        await self.async_client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(
+                points=[vector_id],
+            ),
+        )
+
+    async def aupdate(self, vector_id: int, vector: list = None, payload: dict = None):
+        """
+        Asynchronously update a vector and its payload.
+
+        Args:
+            vector_id (int): ID of the vector to update.
+            vector (list, optional): Updated vector. Defaults to None.
+            payload (dict, optional): Updated payload. Defaults to None.
+        """
+        if self.async_client is None:
+            return await super().aupdate(vector_id=vector_id, vector=vector, payload=payload)
+        point = PointStruct(id=vector_id, vector=vector, payload=payload)
+        await self.async_client.upsert(collection_name=self.collection_name, points=[point])
+
+    async def aget(self, vector_id: int) -> dict:
+        """
+        Asynchronously retrieve a vector by ID.
+
+        Args:
+            vector_id (int): ID of the vector to retrieve.
+
+        Returns:
+            dict: Retrieved vector.
+        """
+        if self.async_client is None:
+            return await super().aget(vector_id=vector_id)
+        result = await self.async_client.retrieve(
+            collection_name=self.collection_name, ids=[vector_id], with_payload=True
+        )
+        return result[0] if result else None
+
+    async def alist(self, filters: dict = None, limit: int = 100) -> list:
+        """
+        Asynchronously list vectors in a collection.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            list: List of vectors.
+        """
+        if self.async_client is None:
+            return await super().alist(filters=filters, limit=limit)
+        query_filter = self._create_filter(filters) if filters else None
+        return await self.async_client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=query_filter,
+            limit=limit,
+            with_payload=True,
+            with_vectors=False,
+        )
@@ -44,3 +44,42 @@ def test_embed_text_with_newlines(mock_openai_client):
         input=["Hello, this is a test with newlines."], model="text-embedding-ada-002"
     )
     assert embedding == [0.4, 0.5, 0.6]
+
+
+def test_embed_text_with_dimensions(mock_openai_client):
+    config = BaseEmbedderConfig(model="text-embedding-3-small", embedding_dims=512)
+    embedder = AzureOpenAIEmbedding(config)
+
+    mock_embedding_response = Mock()
+    mock_embedding_response.data = [Mock(embedding=[0.1, 0.2, 0.3])]
+    mock_openai_client.embeddings.create.return_value = mock_embedding_response
+
+    embedder.embed("Hello")
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello"], model="text-embedding-3-small", dimensions=512
+    )
+
+
+def test_native_dimensions_for_deployment_names(mock_openai_client):
+    config = BaseEmbedderConfig(model="my-embeddings", embedding_dims=256, native_dimensions=True)
+    embedder = AzureOpenAIEmbedding(config)
+    mock_openai_client.embeddings.create.return_value = Mock(data=[Mock(embedding=[0.1] * 256)])
+
+    embedder.embed("Hello")
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello"], model="my-embeddings", dimensions=256
+    )
+
+
+def test_truncating_unknown_model_warns_once(mock_openai_client, caplog):
+    embedder = AzureOpenAIEmbedding(BaseEmbedderConfig(model="ada-deployment", embedding_dims=2))
+    mock_openai_client.embeddings.create.return_value = Mock(data=[Mock(embedding=[3.0, 4.0, 1.0])])
+
+    with caplog.at_level("WARNING", logger="mem0.embeddings.openai"):
+        assert embedder.embed("Hello") == [0.6, 0.8]
+        embedder.embed("Hello")
+
+    mock_openai_client.embeddings.create.assert_called_with(input=["Hello"], model="ada-deployment")
+    assert len([r for r in caplog.records if "Truncating ada-deployment" in r.message]) == 1
@@ -0,0 +1,67 @@
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.cache import CachedEmbedding, EmbeddingCache
+
+
+@pytest.fixture
+def inner_embedder():
+    embedder = Mock()
+    embedder.config = BaseEmbedderConfig(model="test-model", embedding_dims=2)
+    embedder.embed_batch.side_effect = lambda texts: [[float(len(text)), 0.5] for text in texts]
+    return embedder
+
+
+def test_embed_batch_only_embeds_misses(inner_embedder):
+    cached = CachedEmbedding(inner_embedder, EmbeddingCache(max_size=10), provider="openai")
+
+    assert cached.embed("alice") == [5.0, 0.5]
+    assert cached.embed_batch(["alice", "bob", "bob"]) == [[5.0, 0.5], [3.0, 0.5], [3.0, 0.5]]
+
+    assert inner_embedder.embed_batch.call_args_list[1].args == (["bob"],)
+    assert cached.stats()["hits"] == 1
+    assert cached.stats()["misses"] == 3
+
+
+def test_mutating_a_returned_vector_leaves_the_cache_intact(inner_embedder):
+    cached = CachedEmbedding(inner_embedder, EmbeddingCache(max_size=10), provider="openai")
+
+    cached.embed("alice").append(1.0)
+    hit = cached.embed("alice")
+    hit[0] = 0.0
+
+    assert cached.embed("alice") == [5.0, 0.5]
+
+
+def test_key_includes_model_and_dims(inner_embedder):
+    cache = EmbeddingCache(max_size=10)
+    CachedEmbedding(inner_embedder, cache, provider="openai").embed("alice")
+
+    other = Mock()
+    other.config = BaseEmbedderConfig(model="test-model", embedding_dims=3)
+    other.embed_batch.return_value = [[1.0, 2.0, 3.0]]
+
+    assert CachedEmbedding(other, cache, provider="openai").embed("alice") == [1.0, 2.0, 3.0]
+    other.embed_batch.assert_called_once()
+
+
+def test_lru_eviction(inner_embedder):
+    cache = EmbeddingCache(max_size=2)
+    cached = CachedEmbedding(inner_embedder, cache, provider="openai")
+    cached.embed_batch(["a", "bb", "ccc"])
+
+    assert cache.stats()["size"] == 2
+    cached.embed("a")
+    assert inner_embedder.embed_batch.call_args.args == (["a"],)
+
+
+def test_disk_tier_survives_restart(inner_embedder, tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    CachedEmbedding(inner_embedder, EmbeddingCache(max_size=10, path=path), provider="openai").embed("alice")
+
+    fresh = CachedEmbedding(inner_embedder, EmbeddingCache(max_size=10, path=path), provider="openai")
+    assert fresh.embed("alice") == [5.0, 0.5]
+    assert inner_embedder.embed_batch.call_count == 1
+    assert fresh.stats()["disk_hits"] == 1
@@ -0,0 +1,43 @@
+import pytest
+
+from mem0.configs.cassette import CassetteConfig
+from mem0.embeddings.cassette import CassetteEmbedding
+from mem0.utils.cassette import CassetteMiss
+from mem0.utils.factory import EmbedderFactory
+
+
+def _create(path, mode, latency="none"):
+    config = CassetteConfig(mode=mode, path=str(path), latency=latency)
+    return EmbedderFactory.create("fake", {"embedding_dims": 8}, cassette_config=config)
+
+
+def test_record_then_replay_is_exact(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    recorder = _create(path, "record")
+    vectors = recorder.embed_batch(["likes tea", "lives in Berlin"])
+
+    player = _create(path, "replay")
+    assert isinstance(player, CassetteEmbedding)
+    assert player.embed_batch(["lives in Berlin", "likes tea"]) == [vectors[1], vectors[0]]
+    assert player.embed("likes tea") == vectors[0]
+    assert player._embedder is None
+
+
+def test_replay_miss_raises(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    _create(path, "record").embed("likes tea")
+
+    with pytest.raises(CassetteMiss):
+        _create(path, "replay").embed_batch(["likes tea", "likes coffee"])
+
+
+def test_auto_mode_embeds_only_missing_texts(tmp_path, monkeypatch):
+    embedder = _create(tmp_path / "cassette.jsonl", "auto")
+    embedder.embed("likes tea")
+    calls = []
+    original = embedder.embedder.embed_batch
+    monkeypatch.setattr(embedder.embedder, "embed_batch", lambda texts: calls.append(texts) or original(texts))
+
+    embedder.embed_batch(["likes tea", "likes coffee", "likes coffee"])
+
+    assert calls == [["likes coffee"]]
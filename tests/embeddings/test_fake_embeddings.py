@@ -0,0 +1,27 @@
+import math
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.fake import FakeEmbedding
+
+
+def cosine(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+
+def test_vectors_are_deterministic_and_normalized():
+    embedder = FakeEmbedding(BaseEmbedderConfig(embedding_dims=32))
+
+    vector = embedder.embed("I like tennis")
+
+    assert len(vector) == 32
+    assert math.isclose(sum(value * value for value in vector), 1.0)
+    assert FakeEmbedding(BaseEmbedderConfig(embedding_dims=32)).embed("I like tennis") == vector
+
+
+def test_shared_words_give_similar_vectors():
+    embedder = FakeEmbedding(BaseEmbedderConfig(embedding_dims=256))
+    tennis, tennis_weekends, paris = embedder.embed_batch(
+        ["I like tennis", "I like tennis on weekends", "Lives in Paris"]
+    )
+
+    assert cosine(tennis, tennis_weekends) > cosine(tennis, paris)
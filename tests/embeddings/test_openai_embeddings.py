@@ -82,3 +82,58 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small"
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_batch_single_request(mock_openai_client):
+    config = BaseEmbedderConfig()
+    embedder = OpenAIEmbedding(config)
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.4, 0.5], index=1), Mock(embedding=[0.1, 0.2], index=0)]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["Hello\nworld", "Second text"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Second text"], model="text-embedding-3-small"
+    )
+    assert result == [[0.1, 0.2], [0.4, 0.5]]
+
+
+def test_embed_batch_empty(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig())
+
+    assert embedder.embed_batch([]) == []
+    mock_openai_client.embeddings.create.assert_not_called()
+
+
+def test_embed_requests_configured_dimensions(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(model="text-embedding-3-large", embedding_dims=256))
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.6, 0.8])]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed("Hello world")
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world"], model="text-embedding-3-large", dimensions=256
+    )
+    assert result == [0.6, 0.8]
+
+
+def test_default_dims_follow_the_model(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(model="text-embedding-3-large"))
+
+    assert embedder.config.embedding_dims == 3072
+    assert embedder.request_kwargs == {}
+
+
+def test_embed_batch_truncates_models_without_dimensions_parameter(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(model="text-embedding-ada-002", embedding_dims=2))
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[3.0, 4.0, 12.0], index=0)]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["Hello"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(input=["Hello"], model="text-embedding-ada-002")
+    assert result == [pytest.approx([0.6, 0.8])]
@@ -0,0 +1,36 @@
+import json
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.configs.prompts.base_prompts import get_update_memory_messages
+from mem0.llms.fake import FakeLLM
+
+
+def test_extracts_sentences_of_user_turns():
+    llm = FakeLLM(BaseLlmConfig())
+    messages = [
+        {"role": "system", "content": "Extract facts."},
+        {"role": "user", "content": "Input: user: I like tennis. I live in Paris!\nassistant: Nice.\n"},
+    ]
+
+    response = llm.generate_response(messages, response_format={"type": "json_object"})
+
+    assert json.loads(response) == {"facts": ["I like tennis", "I live in Paris"]}
+
+
+def test_update_step_is_deterministic():
+    llm = FakeLLM(BaseLlmConfig())
+    old_memories = [{"id": "0", "text": "I like tennis"}, {"id": "1", "text": "I live in Paris"}]
+    prompt = get_update_memory_messages(old_memories, ["I like tennis", "I live in Berlin", "My dog is Rex"])
+
+    actions = json.loads(llm.generate_response([{"role": "user", "content": prompt}]))["memory"]
+
+    assert [(action["id"], action["event"]) for action in actions] == [("0", "NONE"), ("1", "UPDATE"), ("4", "ADD")]
+    assert actions[1]["old_memory"] == "I live in Paris"
+
+
+def test_tool_calls_are_empty():
+    llm = FakeLLM(BaseLlmConfig())
+
+    response = llm.generate_response([{"role": "user", "content": "hi"}], tools=[{"name": "search"}])
+
+    assert response == {"content": None, "tool_calls": []}
@@ -0,0 +1,65 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.cache import CachedLLM, InMemoryLlmCache, SqliteLlmCache
+
+
+@pytest.fixture
+def inner_llm():
+    llm = Mock()
+    llm.config = BaseLlmConfig(model="gpt-4o", temperature=0)
+    llm.generate_response.side_effect = lambda messages, **kwargs: f"response {llm.generate_response.call_count}"
+    return llm
+
+
+MESSAGES = [{"role": "user", "content": "Extract facts"}]
+
+
+def test_identical_calls_are_served_from_cache(inner_llm):
+    cached = CachedLLM(inner_llm, InMemoryLlmCache(max_size=10), provider="openai")
+
+    first = cached.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+    second = cached.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+    third = cached.generate_response(messages=MESSAGES)
+
+    assert first == second == "response 1"
+    assert third == "response 2"
+    assert cached.stats()["hits"] == 1
+    assert cached.stats()["misses"] == 2
+
+
+def test_non_zero_temperature_bypasses_cache(inner_llm):
+    inner_llm.config.temperature = 0.7
+    cached = CachedLLM(inner_llm, InMemoryLlmCache(max_size=10), provider="openai")
+
+    cached.generate_response(messages=MESSAGES)
+    cached.generate_response(messages=MESSAGES)
+
+    assert inner_llm.generate_response.call_count == 2
+    assert cached.stats()["size"] == 0
+
+
+def test_ttl_expiry(inner_llm):
+    cached = CachedLLM(inner_llm, InMemoryLlmCache(max_size=10, ttl=60), provider="openai")
+    with patch("mem0.llms.cache.time.time", return_value=1000):
+        cached.generate_response(messages=MESSAGES)
+    with patch("mem0.llms.cache.time.time", return_value=1030):
+        cached.generate_response(messages=MESSAGES)
+    assert inner_llm.generate_response.call_count == 1
+    with patch("mem0.llms.cache.time.time", return_value=1061):
+        cached.generate_response(messages=MESSAGES)
+    assert inner_llm.generate_response.call_count == 2
+
+
+def test_sqlite_backend_is_size_bounded(inner_llm, tmp_path):
+    cache = SqliteLlmCache(str(tmp_path / "llm.db"), max_size=2)
+    cached = CachedLLM(inner_llm, cache, provider="openai")
+    for content in ("a", "b", "c"):
+        cached.generate_response(messages=[{"role": "user", "content": content}])
+
+    assert cache.size() == 2
+    reopened = CachedLLM(inner_llm, SqliteLlmCache(str(tmp_path / "llm.db"), max_size=2), provider="openai")
+    assert reopened.generate_response(messages=[{"role": "user", "content": "c"}]) == "response 3"
+    assert inner_llm.generate_response.call_count == 3
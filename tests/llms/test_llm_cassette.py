@@ -0,0 +1,91 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.configs.cassette import CassetteConfig
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.cassette import CassetteLLM
+from mem0.utils.cassette import Cassette, CassetteMiss
+from mem0.utils.factory import LlmFactory
+
+MESSAGES = [{"role": "user", "content": "Input:\nuser: I live in Berlin."}]
+
+
+def _cassette_llm(path, mode, latency="none", response="ok"):
+    inner = Mock()
+    inner.generate_response.return_value = response
+    factory = Mock(return_value=inner)
+    llm = CassetteLLM(factory, BaseLlmConfig(model="gpt-4o-mini"), Cassette(str(path)), mode=mode, latency=latency)
+    return llm, factory, inner
+
+
+def test_record_then_replay_without_building_the_provider(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    recorder, _, inner = _cassette_llm(path, "record", response='{"facts": ["Lives in Berlin"]}')
+    assert recorder.generate_response(messages=MESSAGES) == '{"facts": ["Lives in Berlin"]}'
+    inner.generate_response.assert_called_once()
+
+    player, factory, _ = _cassette_llm(path, "replay")
+    assert player.generate_response(messages=MESSAGES) == '{"facts": ["Lives in Berlin"]}'
+    factory.assert_not_called()
+
+
+def test_replay_miss_raises(tmp_path):
+    player, _, _ = _cassette_llm(tmp_path / "cassette.jsonl", "replay")
+    with pytest.raises(CassetteMiss):
+        player.generate_response(messages=MESSAGES)
+
+
+def test_tool_calls_round_trip_and_are_keyed_by_tools(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    tool_response = {"content": None, "tool_calls": [{"name": "add_graph_memory", "arguments": {"source": "alice"}}]}
+    tools = [{"type": "function", "function": {"name": "add_graph_memory"}}]
+    recorder, _, _ = _cassette_llm(path, "record", response=tool_response)
+    recorder.generate_response(messages=MESSAGES, tools=tools)
+
+    player, _, _ = _cassette_llm(path, "replay")
+    assert player.generate_response(messages=MESSAGES, tools=tools) == tool_response
+    with pytest.raises(CassetteMiss):
+        player.generate_response(messages=MESSAGES)
+
+
+def test_auto_mode_records_misses_only(tmp_path):
+    llm, _, inner = _cassette_llm(tmp_path / "cassette.jsonl", "auto")
+    llm.generate_response(messages=MESSAGES)
+    llm.generate_response(messages=MESSAGES)
+
+    inner.generate_response.assert_called_once()
+    assert len(llm.cassette) == 1
+
+
+def test_replay_with_recorded_latency(tmp_path, monkeypatch):
+    path = tmp_path / "cassette.jsonl"
+    Cassette(str(path)).record(
+        CassetteLLM(Mock(), BaseLlmConfig(model="gpt-4o-mini"), Mock())._key(MESSAGES, {}), "ok", 0.25
+    )
+    sleeps = []
+    monkeypatch.setattr("mem0.llms.cassette.time.sleep", sleeps.append)
+
+    _cassette_llm(path, "replay", latency="recorded")[0].generate_response(messages=MESSAGES)
+    _cassette_llm(path, "replay", latency="none")[0].generate_response(messages=MESSAGES)
+
+    assert sleeps == [0.25]
+
+
+def test_async_replay(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    _cassette_llm(path, "record", response="ok")[0].generate_response(messages=MESSAGES)
+
+    player, _, _ = _cassette_llm(path, "replay")
+    assert asyncio.run(player.agenerate_response(messages=MESSAGES)) == "ok"
+
+
+def test_factory_wraps_provider(tmp_path):
+    config = CassetteConfig(mode="auto", path=str(tmp_path / "cassette.jsonl"))
+    llm = LlmFactory.create("fake", {"model": "fake"}, cassette_config=config)
+
+    assert isinstance(llm, CassetteLLM)
+    first = llm.generate_response(messages=MESSAGES)
+    player = LlmFactory.create("fake", {"model": "fake"}, cassette_config=config.model_copy(update={"mode": "replay"}))
+    assert player.generate_response(messages=MESSAGES) == first
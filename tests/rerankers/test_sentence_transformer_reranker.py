@@ -0,0 +1,45 @@
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from mem0.configs.rerankers.base import BaseRerankerConfig
+from mem0.rerankers.sentence_transformer import SentenceTransformerReranker
+
+
+@pytest.fixture
+def mock_cross_encoder():
+    with patch("mem0.rerankers.sentence_transformer.CrossEncoder") as mock_encoder:
+        mock_model = Mock()
+        mock_encoder.return_value = mock_model
+        yield mock_encoder, mock_model
+
+
+def test_score_batches_pairs(mock_cross_encoder):
+    _, mock_model = mock_cross_encoder
+    mock_model.predict.return_value = np.array([0.2, 0.9])
+    reranker = SentenceTransformerReranker(BaseRerankerConfig(batch_size=16))
+
+    scores = reranker.score("sports", ["Likes tennis", "Lives in Paris"])
+
+    pairs = mock_model.predict.call_args.args[0]
+    assert pairs == [("sports", "Likes tennis"), ("sports", "Lives in Paris")]
+    assert mock_model.predict.call_args.kwargs["batch_size"] == 16
+    assert scores == pytest.approx([0.2, 0.9])
+
+
+def test_onnx_backend_is_passed_to_cross_encoder(mock_cross_encoder):
+    mock_encoder, _ = mock_cross_encoder
+
+    SentenceTransformerReranker(BaseRerankerConfig(backend="onnx", device="cpu"))
+
+    assert mock_encoder.call_args.args[0] == "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    assert mock_encoder.call_args.kwargs["backend"] == "onnx"
+    assert mock_encoder.call_args.kwargs["device"] == "cpu"
+
+
+def test_score_without_documents(mock_cross_encoder):
+    _, mock_model = mock_cross_encoder
+
+    assert SentenceTransformerReranker().score("sports", []) == []
+    mock_model.predict.assert_not_called()
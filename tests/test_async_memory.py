@@ -0,0 +1,160 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.async_memory import AsyncMemory
+
+
+@pytest.fixture
+def async_memory():
+    with patch("mem0.memory.base.base.EmbedderFactory") as mock_embedder, patch(
+        "mem0.memory.base.base.VectorStoreFactory"
+    ) as mock_vector_store, patch("mem0.memory.base.base.LlmFactory") as mock_llm, patch(
+        "mem0.memory.base.base.HistoryDBFactory"
+    ) as mock_db, patch("mem0.memory.base.base.capture_event"), patch("mem0.memory.async_memory.capture_event"):
+        mock_embedder.create.return_value = Mock()
+        mock_vector_store.create.return_value = Mock()
+        mock_llm.create.return_value = Mock()
+        mock_db.create.return_value = Mock()
+        yield AsyncMemory(MemoryConfig(version="v1.1"))
+
+
+def test_add_uses_async_providers(async_memory):
+    async_memory.llm.agenerate_response = AsyncMock(
+        side_effect=[
+            json.dumps({"facts": ["Likes tennis"]}),
+            json.dumps({"memory": [{"id": "0", "text": "Likes tennis", "event": "ADD"}]}),
+        ]
+    )
+    async_memory.embedding_model.aembed_batch = AsyncMock(return_value=[[0.1, 0.2]])
+    async_memory.vector_store.asearch_batch = AsyncMock(return_value=[[]])
+    async_memory.vector_store.ainsert = AsyncMock()
+    async_memory.vector_store.alist = AsyncMock(return_value=[[]])
+
+    result = asyncio.run(async_memory.add("I like tennis", user_id="alice"))
+
+    assert result == {"results": [{"memory": "Likes tennis", "event": "ADD"}], "relations": []}
+    async_memory.embedding_model.aembed_batch.assert_awaited_once_with(["Likes tennis"])
+    insert_kwargs = async_memory.vector_store.ainsert.await_args.kwargs
+    assert insert_kwargs["vectors"] == [[0.1, 0.2]]
+    assert insert_kwargs["payloads"][0]["user_id"] == "alice"
+    async_memory.db.add_history_many.assert_called_once()
+
+
+def test_add_async_runs_writes_on_one_event_loop(async_memory):
+    loops = []
+
+    async def extract(*args, **kwargs):
+        loops.append(asyncio.get_running_loop())
+        return json.dumps({"facts": []})
+
+    async_memory.llm.agenerate_response = extract
+
+    handles = [async_memory.add_async(f"I like sport number {i}", user_id="alice") for i in range(3)]
+    for handle in handles:
+        assert handle.result(timeout=5) == {"results": [], "relations": []}
+    async_memory.close()
+
+    assert len(loops) == 3 and len(set(map(id, loops))) == 1
+    assert loops[0].is_closed()
+
+
+def test_add_async_does_not_retry_after_writing(async_memory):
+    async_memory.config.ingestion.backoff_base = 0.001
+    async_memory.llm.agenerate_response = AsyncMock(
+        side_effect=[
+            json.dumps({"facts": ["Likes tennis"]}),
+            json.dumps({"memory": [{"id": "0", "text": "Likes tennis", "event": "ADD"}]}),
+        ]
+    )
+    async_memory.embedding_model.aembed_batch = AsyncMock(return_value=[[0.1, 0.2]])
+    async_memory.vector_store.asearch_batch = AsyncMock(return_value=[[]])
+    async_memory.vector_store.ainsert = AsyncMock()
+    async_memory.vector_store.alist = AsyncMock(return_value=[[]])
+    async_memory._enforce_retention = Mock(side_effect=RuntimeError("retention down"))
+
+    handle = async_memory.add_async("I like tennis", user_id="alice")
+    with pytest.raises(RuntimeError):
+        handle.result(timeout=5)
+    async_memory.close()
+
+    assert handle.failed_stage == "write"
+    async_memory.vector_store.ainsert.assert_awaited_once()
+
+
+def test_add_batches_memory_actions(async_memory):
+    existing = [
+        Mock(id=memory_id, score=0.9, payload={"data": text, "hash": "h", "created_at": "t", "user_id": "alice"})
+        for memory_id, text in (("m1", "Likes tennis"), ("m2", "Lives in Paris"))
+    ]
+    async_memory.llm.agenerate_response = AsyncMock(
+        side_effect=[
+            json.dumps({"facts": ["Loves tennis", "Lives in Berlin"]}),
+            json.dumps(
+                {
+                    "memory": [
+                        {"id": "m1", "text": "Loves tennis", "event": "UPDATE", "old_memory": "Likes tennis"},
+                        {"id": "m2", "text": "Lives in Paris", "event": "DELETE"},
+                        {"id": "2", "text": "Lives in Berlin", "event": "ADD"},
+                    ]
+                }
+            ),
+        ]
+    )
+    async_memory.embedding_model.aembed_batch = AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+    async_memory.vector_store.asearch_batch = AsyncMock(return_value=[existing, existing])
+    async_memory.vector_store.alist = AsyncMock(return_value=[[]])
+    async_memory.vector_store.ainsert = AsyncMock()
+    async_memory.vector_store.aupdate_batch = AsyncMock()
+    async_memory.vector_store.adelete_batch = AsyncMock()
+    async_memory.vector_store.aget = AsyncMock()
+
+    result = asyncio.run(async_memory.add("I moved to Berlin", user_id="alice"))
+
+    assert [r["event"] for r in result["results"]] == ["UPDATE", "DELETE", "ADD"]
+    async_memory.vector_store.aget.assert_not_awaited()
+    async_memory.vector_store.ainsert.assert_awaited_once()
+    assert async_memory.vector_store.aupdate_batch.await_args.args[0] == ["m1"]
+    async_memory.vector_store.adelete_batch.assert_awaited_once_with(["m2"])
+    history = async_memory.db.add_history_many.call_args.args[0]
+    assert len(history) == 3
+    async_memory.db.add_history.assert_not_called()
+
+
+def test_search_requires_filters(async_memory):
+    with pytest.raises(ValueError):
+        asyncio.run(async_memory.search("tennis"))
+
+
+def test_search(async_memory):
+    async_memory.embedding_model.aembed = AsyncMock(return_value=[0.1, 0.2])
+    async_memory.vector_store.asearch = AsyncMock(
+        return_value=[Mock(id="1", score=0.9, payload={"data": "Likes tennis", "user_id": "alice"})]
+    )
+
+    result = asyncio.run(async_memory.search("tennis", user_id="alice", limit=3))
+
+    async_memory.vector_store.asearch.assert_awaited_once_with(
+        query=[0.1, 0.2], limit=3, filters={"user_id": "alice"}
+    )
+    assert result["results"][0]["memory"] == "Likes tennis"
+    assert result["results"][0]["score"] == 0.9
+    assert result["results"][0]["user_id"] == "alice"
+
+
+def test_batch_operations_are_awaitable(async_memory):
+    memories = [Mock(id=str(i), payload={"data": f"memory {i}", "user_id": "alice"}) for i in range(3)]
+    async_memory.vector_store.iter_all = Mock(side_effect=lambda filters, page_size: iter(memories))
+    async_memory.vector_store.delete_batch = Mock(side_effect=lambda ids: memories.clear())
+
+    async def run():
+        listed = [memory["id"] async for memory in async_memory.iter_all(user_id="alice", page_size=2)]
+        await async_memory.delete_all(user_id="alice")
+        return listed
+
+    assert asyncio.run(run()) == ["0", "1", "2"]
+    async_memory.vector_store.delete_batch.assert_called_once_with(["0", "1", "2"])
+    assert asyncio.run(async_memory.sweep()) == 0
@@ -0,0 +1,52 @@
+import json
+
+from mem0.benchmarks.harness import load_demo_workload, main, percentile, run_benchmark, synthetic_workload
+
+
+def test_synthetic_workload_is_reproducible():
+    assert synthetic_workload(3, turns=2, queries=1, seed=7) == synthetic_workload(3, turns=2, queries=1, seed=7)
+    assert synthetic_workload(3, seed=7) != synthetic_workload(3, seed=8)
+
+
+def test_demo_workload_pairs_user_and_assistant_turns():
+    workload = load_demo_workload()
+
+    assert workload
+    first_turn = workload[0]["turns"][0]
+    assert [message["role"] for message in first_turn] == ["user", "assistant"]
+
+
+def test_percentile_interpolates():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([5], 99) == 5
+    assert percentile([], 50) is None
+
+
+def test_run_benchmark_reports_throughput_and_stages():
+    report = run_benchmark("memory", synthetic_workload(2, turns=2, queries=2), embedding_dims=16)
+
+    assert report["add"]["ops"] == 4
+    assert report["add"]["errors"] == 0
+    assert report["search"]["ops"] == 4
+    assert report["search"]["errors"] == 0
+    assert {"llm.extract_facts", "embedder.embed", "vector_store.search"} <= set(report["stages"])
+    assert report["stages"]["llm.extract_facts"]["count"] == 4
+    assert report["peak_rss_mb"] > 0
+
+
+def test_run_benchmark_with_numpy_store():
+    report = run_benchmark("memory", synthetic_workload(2, turns=2, queries=2), concurrency=2, vector_store="numpy")
+
+    assert report["add"]["errors"] == 0
+    assert report["search"]["errors"] == 0
+    assert report["stages"]["vector_store.search"]["count"] == 4
+
+
+def test_main_writes_json_report(tmp_path, capsys):
+    path = tmp_path / "report.json"
+
+    main(["--target", "memory", "--no-demo", "--conversations", "1", "--turns", "1", "--json", str(path)])
+
+    reports = json.loads(path.read_text())
+    assert reports[0]["target"] == "memory"
+    assert "ops/s" in capsys.readouterr().out
@@ -0,0 +1,81 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.memory.compaction import cluster_embeddings, compact
+
+
+def test_cluster_embeddings_groups_similar_rows_without_chaining():
+    embeddings = [[1.0, 0.0], [0.99, 0.1], [0.0, 1.0], [0.7, 0.7], [0.1, 0.99]]
+
+    clusters = cluster_embeddings(embeddings, threshold=0.95, block_size=2)
+
+    assert clusters == [[0, 1], [2, 4]]
+
+
+def test_cluster_embeddings_caps_cluster_size():
+    embeddings = [[1.0, 0.0], [0.9, 0.1], [0.99, 0.01], [0.95, 0.05]]
+
+    clusters = cluster_embeddings(embeddings, threshold=0.9, max_cluster_size=2)
+
+    assert clusters[0] == [0, 2]
+
+
+@pytest.fixture
+def memory():
+    memory = Mock()
+    memory.executor.stage.return_value.__enter__ = Mock()
+    memory.executor.stage.return_value.__exit__ = Mock(return_value=False)
+    memory._map_limited = lambda limiter, fn, items: [fn(item) for item in items]
+    memory._new_memory_payload = lambda data, metadata: {
+        **metadata,
+        "data": data,
+        "created_at": "now",
+        "updated_at": "now",
+    }
+    memories = [
+        Mock(id="1", payload={"data": "Likes tennis", "user_id": "alice", "created_at": "a"}),
+        Mock(id="2", payload={"data": "Likes playing tennis", "user_id": "alice", "created_at": "b"}),
+        Mock(id="3", payload={"data": "Lives in Paris", "user_id": "alice", "created_at": "c"}),
+    ]
+    memory.vector_store.iter_all.return_value = iter(memories)
+    memory.embedding_model.embed_batch.side_effect = lambda texts: [
+        [1.0, 0.0] if "tennis" in text else [0.0, 1.0] for text in texts
+    ]
+    memory.llm.generate_response.return_value = json.dumps({"memory": "Likes playing tennis"})
+    return memory
+
+
+def test_dry_run_reports_savings_without_writing(memory):
+    report = compact(memory, user_id="alice", dry_run=True)
+
+    assert report["memories_before"] == 3
+    assert report["memories_after"] == 2
+    assert report["memories_saved"] == 1
+    assert report["tokens_saved"] > 0
+    assert report["merges"][0]["merged_ids"] == ["1", "2"]
+    memory.llm.generate_response.assert_not_called()
+    memory.vector_store.insert.assert_not_called()
+    memory.vector_store.delete_batch.assert_not_called()
+
+
+def test_compact_replaces_cluster_with_merged_memory(memory):
+    report = compact(memory, user_id="alice")
+
+    memory.llm.generate_response.assert_called_once()
+    payloads = memory.vector_store.insert.call_args.kwargs["payloads"]
+    assert payloads[0]["data"] == "Likes playing tennis"
+    assert payloads[0]["user_id"] == "alice"
+    memory.vector_store.delete_batch.assert_called_once_with(["1", "2"])
+    history = memory.db.add_history_many.call_args.args[0]
+    assert [(entry["memory_id"], entry["event"]) for entry in history] == [
+        (report["merges"][0]["id"], "ADD"),
+        ("1", "MERGE"),
+        ("2", "MERGE"),
+    ]
+
+
+def test_compact_requires_a_session():
+    with pytest.raises(ValueError):
+        compact(Mock())
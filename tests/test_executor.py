@@ -0,0 +1,103 @@
+import contextvars
+import threading
+import time
+
+import pytest
+
+from mem0.configs.base import ExecutorConfig
+from mem0.memory.base.executor import MemoryExecutor, get_shared_executor
+
+
+def test_submit_propagates_context():
+    var = contextvars.ContextVar("var", default=None)
+    executor = MemoryExecutor(max_workers=2)
+    var.set("request-1")
+    try:
+        assert executor.submit(var.get).result() == "request-1"
+    finally:
+        executor.shutdown()
+
+
+def test_stage_limit_caps_concurrency():
+    executor = MemoryExecutor(max_workers=8, stage_limits={"llm": 2})
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def call_llm():
+        with executor.stage("llm"):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+
+    try:
+        for future in [executor.submit(call_llm) for _ in range(8)]:
+            future.result()
+    finally:
+        executor.shutdown()
+
+    assert active["peak"] == 2
+
+
+def test_queue_depth_blocks_submit():
+    executor = MemoryExecutor(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+    executor.submit(release.wait)
+
+    submitted = threading.Event()
+    thread = threading.Thread(target=lambda: (executor.submit(lambda: None), submitted.set()))
+    thread.start()
+    assert not submitted.wait(0.05)
+
+    release.set()
+    thread.join(1)
+    assert submitted.is_set()
+    executor.shutdown()
+
+
+def test_unknown_stage_rejected():
+    with pytest.raises(ValueError):
+        MemoryExecutor(stage_limits={"tokenizer": 1})
+
+
+def test_submit_after_shutdown_raises():
+    executor = MemoryExecutor(max_workers=1)
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+def test_submit_runs_inline_once_the_pool_refuses_work():
+    executor = MemoryExecutor(max_workers=1, max_queue_size=1)
+    # What concurrent.futures does to every pool when the interpreter starts shutting down.
+    executor._pool.shutdown()
+
+    assert executor.submit(threading.current_thread).result() is threading.current_thread()
+    assert executor.submit(lambda: 42).result() == 42
+
+
+def test_shared_executor_is_reused_per_config():
+    config = ExecutorConfig(max_workers=3, llm_concurrency=1)
+    assert get_shared_executor(config) is get_shared_executor(ExecutorConfig(max_workers=3, llm_concurrency=1))
+    assert get_shared_executor(config) is not get_shared_executor(ExecutorConfig(max_workers=4))
+
+
+@pytest.mark.parametrize("settings", [{"max_workers": 1}, {"max_workers": 4, "max_queue_size": 1}])
+def test_nested_submit_runs_inline(settings):
+    executor = MemoryExecutor(**settings)
+
+    def outer():
+        inner = executor.submit(threading.current_thread)
+        return inner.result(timeout=2) is threading.current_thread()
+
+    def failing():
+        raise ValueError("boom")
+
+    try:
+        assert executor.submit(outer).result(timeout=5)
+        with pytest.raises(ValueError):
+            executor.submit(lambda: executor.submit(failing).result()).result(timeout=5)
+    finally:
+        executor.shutdown()
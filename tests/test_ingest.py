@@ -0,0 +1,162 @@
+import contextvars
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from mem0.memory.base.ingest import IngestionDropped, IngestionQueue, IngestionQueueFull, mark_write_started
+
+
+def test_submit_returns_handle_with_result():
+    queue = IngestionQueue(lambda x: x * 2, workers=1)
+    try:
+        assert queue.submit(21).result(timeout=1) == 42
+        assert queue.stats()["completed"] == 1
+    finally:
+        queue.close()
+
+
+def test_failed_writes_are_retried():
+    attempts = []
+
+    def flaky(x):
+        attempts.append(x)
+        if len(attempts) < 3:
+            raise RuntimeError("transient")
+        return x
+
+    queue = IngestionQueue(flaky, workers=1, max_retries=3, backoff_base=0.001)
+    try:
+        handle = queue.submit("a")
+        assert handle.result(timeout=1) == "a"
+        assert queue.stats()["retries"] == 2
+        assert handle.failed_stage == "prepare"
+    finally:
+        queue.close()
+
+
+def test_gives_up_after_max_retries():
+    def broken():
+        raise RuntimeError("down")
+
+    queue = IngestionQueue(broken, workers=1, max_retries=1, backoff_base=0.001)
+    try:
+        with pytest.raises(RuntimeError):
+            queue.submit().result(timeout=1)
+        assert queue.stats()["failed"] == 1
+    finally:
+        queue.close()
+
+
+def test_failures_after_the_write_started_are_not_retried():
+    attempts = []
+
+    def partial_write(x):
+        attempts.append(x)
+        mark_write_started()
+        raise RuntimeError("history down")
+
+    queue = IngestionQueue(partial_write, workers=1, max_retries=3, backoff_base=0.001)
+    try:
+        handle = queue.submit("a")
+        with pytest.raises(RuntimeError):
+            handle.result(timeout=1)
+        assert attempts == ["a"]
+        assert handle.failed_stage == "write"
+        assert queue.stats()["retries"] == 0
+    finally:
+        queue.close()
+
+
+def test_write_stage_is_tracked_across_threads():
+    def fan_out():
+        worker = threading.Thread(target=contextvars.copy_context().run, args=(mark_write_started,))
+        worker.start()
+        worker.join()
+        raise RuntimeError("graph down")
+
+    queue = IngestionQueue(fan_out, workers=1, max_retries=3, backoff_base=0.001)
+    try:
+        handle = queue.submit()
+        with pytest.raises(RuntimeError):
+            handle.result(timeout=1)
+        assert handle.attempts == 1
+    finally:
+        queue.close()
+
+
+def _blocked_queue(overflow, **kwargs):
+    release = threading.Event()
+    queue = IngestionQueue(lambda x: release.wait(1) and x, max_size=1, workers=1, overflow=overflow, **kwargs)
+    queue.submit("running")
+    while queue.stats()["in_flight"] == 0:
+        time.sleep(0.001)
+    return queue, release
+
+
+def test_reject_policy():
+    queue, release = _blocked_queue("reject")
+    queue.submit("queued")
+    with pytest.raises(IngestionQueueFull):
+        queue.submit("overflow")
+    assert queue.stats()["rejected"] == 1
+    release.set()
+    queue.close()
+
+
+def test_drop_oldest_policy():
+    queue, release = _blocked_queue("drop_oldest")
+    oldest = queue.submit("oldest")
+    newest = queue.submit("newest")
+    with pytest.raises(IngestionDropped):
+        oldest.result(timeout=1)
+    release.set()
+    assert newest.result(timeout=1) == "newest"
+    queue.close()
+
+
+def test_block_policy_times_out():
+    queue, release = _blocked_queue("block", block_timeout=0.01)
+    queue.submit("queued")
+    with pytest.raises(IngestionQueueFull):
+        queue.submit("overflow")
+    release.set()
+    queue.close()
+
+
+def test_close_drains_queue():
+    done = []
+    queue = IngestionQueue(lambda x: time.sleep(0.01) or done.append(x), workers=1)
+    for i in range(5):
+        queue.submit(i)
+    assert queue.close(wait=True)
+    assert done == [0, 1, 2, 3, 4]
+    with pytest.raises(IngestionQueueFull):
+        queue.submit(5)
+
+
+def test_pending_writes_are_persisted_at_interpreter_exit(tmp_path):
+    script = textwrap.dedent(
+        """
+        import sys
+
+        from mem0.benchmarks.harness import build_config
+        from mem0.memory.base.base import MemoryBase
+
+        config = build_config(sys.argv[1], vector_store="numpy")
+        memory = MemoryBase(config)
+        for i in range(4):
+            memory.add_async(f"I like sport number {i}", user_id=f"user{i}")
+        """
+    )
+    env = {**os.environ, "MEM0_TELEMETRY": "False"}
+    subprocess.run([sys.executable, "-c", script, str(tmp_path)], check=True, env=env, timeout=120)
+
+    with sqlite3.connect(tmp_path / "history.db") as connection:
+        events = connection.execute("SELECT event, COUNT(*) FROM mem_history GROUP BY event").fetchall()
+    assert events == [("ADD", 4)]
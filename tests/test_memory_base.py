@@ -0,0 +1,359 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.base import MemoryConfig, RetentionConfig, RetentionPolicy, TracingConfig
+from mem0.memory.base import metrics
+from mem0.memory.base.base import MemoryBase
+from mem0.memory.base.retention import RetentionManager
+from mem0.memory.base.tracing import Tracer
+from mem0.rerankers.configs import RerankerConfig
+
+
+@pytest.fixture
+def memory():
+    with patch("mem0.memory.base.base.EmbedderFactory") as mock_embedder, patch(
+        "mem0.memory.base.base.VectorStoreFactory"
+    ) as mock_vector_store, patch("mem0.memory.base.base.LlmFactory") as mock_llm, patch(
+        "mem0.memory.base.base.HistoryDBFactory"
+    ) as mock_db, patch("mem0.memory.base.base.capture_event"):
+        mock_embedder.create.return_value = Mock()
+        mock_vector_store.create.return_value = Mock()
+        mock_llm.create.return_value = Mock()
+        mock_db.create.return_value = Mock()
+        memory = MemoryBase(MemoryConfig(version="v1.1"))
+        memory.vector_store.list.return_value = [[]]
+        yield memory
+
+
+CONVERSATIONS = ["I like tennis", "I like golf", "I live in Paris"]
+
+
+def fake_llm(messages, response_format=None):
+    prompt = messages[-1]["content"]
+    fact = next(text for text in CONVERSATIONS if text in prompt)
+    if prompt.startswith("Input:"):
+        return json.dumps({"facts": [fact]})
+    return json.dumps({"memory": [{"id": "0", "text": fact, "event": "ADD"}]})
+
+
+def test_add_many_batches_embeddings_and_keeps_per_user_order(memory):
+    memory.llm.generate_response = Mock(side_effect=fake_llm)
+    memory.embedding_model.embed_batch = Mock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+    searched = []
+    memory.vector_store.search_batch = Mock(
+        side_effect=lambda queries, limit, filters: searched.append((filters["user_id"], queries)) or [[]]
+    )
+    inserted = []
+    memory.vector_store.insert = Mock(side_effect=lambda vectors, ids, payloads: inserted.extend(payloads))
+
+    result = memory.add_many(
+        CONVERSATIONS,
+        user_ids=["alice", "bob", "alice"],
+    )
+
+    assert len(result["results"]) == 3
+    assert all("error" not in item for item in result["results"])
+    assert result["stats"]["conversations"] == 3
+    assert result["stats"]["failed"] == 0
+
+    # All extracted facts are embedded in a single call.
+    assert memory.embedding_model.embed_batch.call_count == 1
+    assert [user for user, _ in searched].count("alice") == 2
+    alice_queries = [queries for user, queries in searched if user == "alice"]
+    assert alice_queries == [[[float(len("I like tennis"))]], [[float(len("I live in Paris"))]]]
+    assert {payload["user_id"] for payload in inserted} == {"alice", "bob"}
+
+
+def test_add_many_reports_failures_per_conversation(memory):
+    def flaky_llm(messages, response_format=None):
+        if "I like golf" in messages[-1]["content"]:
+            raise RuntimeError("rate limited")
+        return fake_llm(messages, response_format)
+
+    memory.llm.generate_response = Mock(side_effect=flaky_llm)
+    memory.embedding_model.embed_batch = Mock(side_effect=lambda texts: [[1.0] for _ in texts])
+    memory.vector_store.search_batch = Mock(return_value=[[]])
+
+    result = memory.add_many(CONVERSATIONS, user_ids="alice", max_concurrency=1)
+
+    assert result["stats"]["conversations"] == 3
+    assert result["stats"]["failed"] == 1
+    assert result["results"][1] == {"error": "rate limited"}
+    assert result["results"][2]["results"] == [{"memory": "I live in Paris", "event": "ADD"}]
+
+
+def test_add_many_requires_session_ids(memory):
+    with pytest.raises(ValueError):
+        memory.add_many(["hello"])
+
+
+def test_exact_duplicate_facts_skip_update_llm(memory):
+    existing = Mock(id="1", payload={"data": "Likes tennis", "hash": MemoryBase._hash("Likes tennis")})
+    memory.llm.generate_response = Mock(return_value=json.dumps({"facts": ["Likes tennis", "Likes tennis"]}))
+    memory.embedding_model.embed_batch = Mock()
+    memory.vector_store.list.return_value = [[existing]]
+
+    assert memory._add_to_vector_store([{"role": "user", "content": "I like tennis"}], {}, {"user_id": "alice"}) == []
+
+    memory.vector_store.list.assert_called_once_with(
+        filters={"user_id": "alice", "hash": [MemoryBase._hash("Likes tennis")]}, limit=5
+    )
+    memory.llm.generate_response.assert_called_once()
+    memory.embedding_model.embed_batch.assert_not_called()
+
+
+def test_duplicate_lookup_is_skipped_without_list(memory):
+    del memory.vector_store.list
+
+    assert memory._drop_known_facts(["Likes tennis", "Likes tennis"], {"user_id": "alice"}) == ["Likes tennis"]
+
+
+def test_update_recomputes_hash(memory):
+    memory.vector_store.get.return_value = Mock(
+        payload={"data": "Likes tennis", "hash": MemoryBase._hash("Likes tennis"), "user_id": "alice"}
+    )
+    memory.embedding_model.embed.return_value = [0.1]
+
+    memory._update_memory("1", "Likes golf")
+
+    payload = memory.vector_store.update.call_args.kwargs["payload"]
+    assert payload["hash"] == MemoryBase._hash("Likes golf")
+    assert payload["user_id"] == "alice"
+
+
+def test_actions_are_applied_with_one_write_per_kind(memory):
+    existing = [
+        Mock(id=str(i), payload={"data": f"memory {i}", "created_at": "2024-01-01", "user_id": "alice"})
+        for i in range(3)
+    ]
+    memory.vector_store.search_batch = Mock(return_value=[existing])
+    memory.embedding_model.embed_batch = Mock(side_effect=lambda texts: [[1.0] for _ in texts])
+    actions = [
+        {"id": "0", "text": "memory 0 changed", "event": "UPDATE", "old_memory": "memory 0"},
+        {"id": "1", "text": "memory 1", "event": "DELETE"},
+        {"id": "2", "text": "memory 2", "event": "NONE"},
+        {"id": "3", "text": "Likes golf", "event": "ADD"},
+        {"id": "4", "text": "Likes tennis", "event": "ADD"},
+    ]
+    memory.llm.generate_response = Mock(return_value=json.dumps({"memory": actions}))
+
+    results = memory._add_facts_to_vector_store(
+        ["Likes golf", "Likes tennis"], {"Likes golf": [0.1], "Likes tennis": [0.2]}, {"user_id": "alice"}, {}
+    )
+
+    assert [result["event"] for result in results] == ["UPDATE", "DELETE", "ADD", "ADD"]
+    memory.vector_store.insert.assert_called_once()
+    assert memory.vector_store.insert.call_args.kwargs["vectors"] == [[0.1], [0.2]]
+    memory.vector_store.update_batch.assert_called_once()
+    assert memory.vector_store.update_batch.call_args.args[0] == ["0"]
+    memory.vector_store.delete_batch.assert_called_once_with(["1"])
+    memory.vector_store.get.assert_not_called()
+    entries = memory.db.add_history_many.call_args.args[0]
+    assert [(entry["memory_id"], entry["event"]) for entry in entries][:2] == [("0", "UPDATE"), ("1", "DELETE")]
+    assert entries[0]["old_memory"] == "memory 0"
+    memory.db.add_history.assert_not_called()
+
+
+def test_failed_write_drops_only_its_group(memory):
+    existing = Mock(id="0", payload={"data": "memory 0", "created_at": "2024-01-01"})
+    memory.vector_store.search_batch = Mock(return_value=[[existing]])
+    memory.vector_store.delete_batch.side_effect = RuntimeError("unavailable")
+    actions = [
+        {"id": "0", "text": "memory 0", "event": "DELETE"},
+        {"id": "1", "text": "Likes golf", "event": "ADD"},
+    ]
+    memory.llm.generate_response = Mock(return_value=json.dumps({"memory": actions}))
+
+    results = memory._add_facts_to_vector_store(["Likes golf"], {"Likes golf": [0.1]}, {}, {})
+
+    assert results == [{"memory": "Likes golf", "event": "ADD"}]
+    entries = memory.db.add_history_many.call_args.args[0]
+    assert [entry["event"] for entry in entries] == ["ADD"]
+
+
+def test_delete_all_deletes_and_records_one_page_at_a_time(memory):
+    memories = [
+        Mock(id=str(i), payload={"data": f"memory {i}", "created_at": "2024-01-01", "user_id": "alice"})
+        for i in range(5)
+    ]
+    remaining = list(memories)
+
+    def iter_all(filters, page_size):
+        yield from list(remaining)
+
+    def delete_batch(ids):
+        remaining[:] = [mem for mem in remaining if mem.id not in ids]
+
+    memory._DELETE_ALL_PAGE_SIZE = 2
+    memory.vector_store.iter_all.side_effect = iter_all
+    memory.vector_store.delete_batch.side_effect = delete_batch
+
+    memory.delete_all(user_id="alice")
+
+    assert [call.args[0] for call in memory.vector_store.delete_batch.call_args_list] == [["0", "1"], ["2", "3"], ["4"]]
+    memory.vector_store.iter_all.assert_called_with(filters={"user_id": "alice"}, page_size=2)
+    memory.vector_store.delete_by_filter.assert_not_called()
+    pages = [call.args[0] for call in memory.db.add_history_many.call_args_list]
+    assert [[entry["memory_id"] for entry in page] for page in pages] == [["0", "1"], ["2", "3"], ["4"]]
+    assert all(entry["event"] == "DELETE" and entry["is_deleted"] == 1 for page in pages for entry in page)
+    memory.db.add_history.assert_not_called()
+
+
+def test_delete_all_stops_when_deletes_do_not_take_effect(memory):
+    memory.vector_store.iter_all.side_effect = lambda filters, page_size: iter([Mock(id="1", payload={})])
+
+    with pytest.raises(RuntimeError):
+        memory.delete_all(user_id="alice")
+
+    memory.vector_store.delete_batch.assert_called_once_with(["1"])
+
+
+def test_iter_all_streams_formatted_memories(memory):
+    pages = [Mock(id=str(i), payload={"data": f"memory {i}", "user_id": "alice", "topic": "sport"}) for i in range(3)]
+    memory.vector_store.iter_all.return_value = iter(pages)
+
+    memories = memory.iter_all(user_id="alice", page_size=2)
+
+    first = next(memories)
+    assert first["memory"] == "memory 0"
+    assert first["user_id"] == "alice"
+    assert first["metadata"] == {"topic": "sport"}
+    assert [mem["id"] for mem in memories] == ["1", "2"]
+    memory.vector_store.iter_all.assert_called_once_with(filters={"user_id": "alice"}, page_size=2)
+
+
+def test_search_reranks_over_fetched_candidates(memory):
+    memory.config.reranker = RerankerConfig(candidates=10, top_n=2, score_threshold=0.5)
+    memory.reranker = Mock()
+    memory.embedding_model.embed.return_value = [0.1]
+    hits = [Mock(id=str(i), score=0.9 - i / 10, payload={"data": f"memory {i}", "user_id": "alice"}) for i in range(4)]
+    memory.vector_store.search.return_value = hits
+    memory.reranker.score.return_value = [0.1, 0.7, 0.9, 0.6]
+
+    results = memory._search_vector_store("sports", {"user_id": "alice"}, limit=5)
+
+    assert memory.vector_store.search.call_args.kwargs["limit"] == 10
+    assert [(mem["id"], mem["score"]) for mem in results] == [("2", 0.9), ("1", 0.7)]
+
+
+def test_hybrid_search_fuses_vector_and_keyword_hits(memory):
+    memory.embedding_model.embed.return_value = [0.1]
+    vector_hits = [Mock(id=str(i), score=0.9, payload={"data": f"memory {i}", "user_id": "alice"}) for i in range(3)]
+    keyword_hits = [Mock(id="2", score=3.0, payload=vector_hits[2].payload)]
+    memory.vector_store.search.return_value = vector_hits
+    memory.vector_store.keyword_search.return_value = keyword_hits
+
+    results = memory._search_vector_store("SKU-42", {"user_id": "alice"}, limit=2, mode="hybrid")
+
+    assert memory.vector_store.search.call_args.kwargs["limit"] == memory.config.hybrid_search.candidates
+    memory.vector_store.keyword_search.assert_called_once_with(
+        "SKU-42", limit=memory.config.hybrid_search.candidates, filters={"user_id": "alice"}
+    )
+    assert [mem["id"] for mem in results] == ["2", "0"]
+
+
+def test_search_rejects_unknown_mode(memory):
+    with pytest.raises(ValueError):
+        memory.search("tennis", user_id="alice", mode="keyword")
+
+
+def test_retention_evicts_least_recently_retrieved_over_capacity(memory):
+    config = RetentionConfig(partitions={"context": RetentionPolicy(max_memories=2)})
+    memory._retention = RetentionManager(memory, config)
+    memories = [
+        Mock(
+            id=str(i),
+            payload={
+                "data": f"memory {i}",
+                "user_id": "alice",
+                "agent_id": "context",
+                "updated_at": f"2024-01-0{i + 1}T00:00:00+00:00",
+            },
+        )
+        for i in range(3)
+    ]
+    memory.vector_store.iter_all.return_value = iter(memories)
+    memory._retention.record_retrieved(["0"])
+
+    memory._enforce_retention([{"user_id": "alice", "agent_id": "context"}])
+
+    memory.vector_store.iter_all.assert_called_once_with(
+        filters={"user_id": "alice", "agent_id": "context"}, page_size=1000
+    )
+    memory.vector_store.delete_batch.assert_called_once_with(["1"])
+    assert memory.db.add_history_many.call_args.args[0][0]["memory_id"] == "1"
+
+
+def test_retention_counts_writes_before_listing_again(memory):
+    memory._retention = RetentionManager(memory, RetentionConfig(default=RetentionPolicy(max_memories=5)))
+    memory.vector_store.iter_all.return_value = iter([])
+
+    memory._enforce_retention([{"user_id": "alice"}])
+    memory._enforce_retention([{"user_id": "alice"}] * 4)
+
+    assert memory.vector_store.iter_all.call_count == 1
+    memory.vector_store.delete_batch.assert_not_called()
+
+
+def test_sweep_deletes_expired_memories(memory):
+    memory._retention = RetentionManager(memory, RetentionConfig(default=RetentionPolicy(ttl=3600)))
+    expired = Mock(id="1", payload={"data": "old", "user_id": "alice", "updated_at": "2020-01-01T00:00:00+00:00"})
+    now = datetime.now(timezone.utc).isoformat()
+    fresh = Mock(id="2", payload={"data": "new", "user_id": "alice", "updated_at": now})
+    memory.vector_store.iter_all.return_value = iter([expired, fresh])
+
+    assert memory.sweep() == 1
+    memory.vector_store.delete_batch.assert_called_once_with(["1"])
+
+
+def test_search_attaches_timing_breakdown(memory):
+    memory.config.tracing = TracingConfig(enabled=True, include_timings=True)
+    memory.tracer = Tracer.from_config(memory.config.tracing)
+    memory.embedding_model.embed.return_value = [0.1]
+    memory.vector_store.search.return_value = [Mock(id="1", score=0.9, payload={"data": "Likes tennis"})]
+
+    result = memory.search("sports", user_id="alice")
+
+    assert [mem["id"] for mem in result["results"]] == ["1"]
+    assert {"embedder.embed", "vector_store.search", "total"} <= set(result["timings"])
+
+
+def test_search_omits_timings_by_default(memory):
+    memory.embedding_model.embed.return_value = [0.1]
+    memory.vector_store.search.return_value = []
+
+    assert "timings" not in memory.search("sports", user_id="alice")
+
+
+def test_applied_actions_are_counted_by_event(memory):
+    metrics.REGISTRY.clear()
+    memory.vector_store.get.return_value = Mock(id="1", payload={"data": "Likes tennis", "user_id": "alice"})
+    actions = [
+        {"id": "0", "text": "Likes golf", "event": "ADD"},
+        {"id": "1", "text": "Likes tennis", "event": "NONE"},
+        {"id": "1", "text": "Likes tennis", "event": "DELETE"},
+    ]
+
+    memory._apply_memory_actions(actions, {"Likes golf": [0.1]}, {"user_id": "alice"})
+
+    assert metrics.MEMORY_EVENTS.get(event="ADD") == 1
+    assert metrics.MEMORY_EVENTS.get(event="DELETE") == 1
+    assert metrics.MEMORY_EVENTS.get(event="NONE") == 1
+    assert 'mem0_memory_events_total{event="ADD"} 1' in memory.render_metrics()
+
+
+@pytest.mark.parametrize("vector_config, expected", [({}, 256), ({"embedding_model_dims": 1536}, 1536)])
+def test_vector_store_follows_embedder_dims_unless_set(vector_config, expected):
+    config = MemoryConfig(vector_store={"provider": "qdrant", "config": vector_config})
+    with patch("mem0.memory.base.base.EmbedderFactory") as mock_embedder, patch(
+        "mem0.memory.base.base.VectorStoreFactory"
+    ) as mock_vector_store, patch("mem0.memory.base.base.LlmFactory"), patch(
+        "mem0.memory.base.base.HistoryDBFactory"
+    ), patch("mem0.memory.base.base.capture_event"):
+        mock_embedder.create.return_value.config.embedding_dims = 256
+        MemoryBase(config)
+
+    assert mock_vector_store.create.call_args.args[1].embedding_model_dims == expected
@@ -0,0 +1,122 @@
+import json
+import threading
+import urllib.request
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.configs.base import MetricsConfig
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.cache import CachedLLM, InMemoryLlmCache
+from mem0.memory.base import metrics, tracing
+from mem0.memory.base.executor import MemoryExecutor
+from mem0.memory.base.metrics import MetricsRegistry
+from mem0.memory.base.tracing import Tracer
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    metrics.REGISTRY.clear()
+    yield
+    metrics.REGISTRY.clear()
+
+
+def test_render_uses_prometheus_text_format():
+    registry = MetricsRegistry()
+    calls = registry.counter("mem0_test_calls_total", "Test calls", ("provider",))
+    latency = registry.histogram("mem0_test_seconds", "Test latency", ("stage",), buckets=(0.1, 1.0))
+    calls.inc(provider="openai")
+    calls.inc(2, provider="openai")
+    latency.observe(0.5, stage="llm")
+
+    text = registry.render()
+
+    assert "# TYPE mem0_test_calls_total counter" in text
+    assert 'mem0_test_calls_total{provider="openai"} 3' in text
+    assert "# TYPE mem0_test_seconds histogram" in text
+    assert 'mem0_test_seconds_bucket{stage="llm",le="0.1"} 0' in text
+    assert 'mem0_test_seconds_bucket{stage="llm",le="1.0"} 1' in text
+    assert 'mem0_test_seconds_bucket{stage="llm",le="+Inf"} 1' in text
+    assert 'mem0_test_seconds_count{stage="llm"} 1' in text
+
+
+def test_labels_must_match_registration():
+    registry = MetricsRegistry()
+    counter = registry.counter("mem0_test_total", "Test", ("event",))
+    with pytest.raises(ValueError):
+        counter.inc(stage="llm")
+    with pytest.raises(ValueError):
+        registry.gauge("mem0_test_total", "Test", ("event",))
+
+
+def test_spans_record_stage_latency_and_errors_without_a_trace():
+    with tracing.span("vector_store.search", stage="vector_store"):
+        pass
+    with pytest.raises(RuntimeError):
+        with tracing.span("vector_store.insert", stage="vector_store"):
+            raise RuntimeError("connection refused")
+
+    assert metrics.STAGE_LATENCY.get(stage="vector_store", operation="vector_store.search")["count"] == 1
+    assert metrics.STAGE_ERRORS.get(stage="vector_store", operation="vector_store.insert") == 1
+    assert metrics.STAGE_ERRORS.get(stage="vector_store", operation="vector_store.search") == 0
+
+
+def test_disabled_tracer_still_times_operations():
+    with Tracer(enabled=False).trace("search"):
+        pass
+
+    assert metrics.OPERATION_LATENCY.get(operation="search", status="ok")["count"] == 1
+
+
+def test_executor_reports_queue_depth():
+    executor = MemoryExecutor(max_workers=1)
+    release = threading.Event()
+    try:
+        futures = [executor.submit(release.wait) for _ in range(3)]
+        assert metrics.QUEUE_DEPTH.get(queue="executor") == 3
+        release.set()
+        for future in futures:
+            future.result()
+    finally:
+        executor.shutdown()
+
+    assert metrics.QUEUE_DEPTH.get(queue="executor") == 0
+
+
+def test_llm_cache_lookups_are_counted():
+    llm = Mock()
+    llm.config = BaseLlmConfig(model="gpt-4o-mini", temperature=0)
+    llm.generate_response.return_value = json.dumps({"facts": []})
+    cached = CachedLLM(llm, InMemoryLlmCache(), provider="openai")
+
+    for _ in range(2):
+        cached.generate_response(messages=[{"role": "user", "content": "hi"}])
+
+    assert metrics.CACHE_LOOKUPS.get(cache="llm", result="miss") == 1
+    assert metrics.CACHE_LOOKUPS.get(cache="llm", result="hit") == 1
+
+
+def test_record_memory_events():
+    metrics.record_memory_events(["ADD", "ADD", "NONE"])
+
+    assert metrics.MEMORY_EVENTS.get(event="ADD") == 2
+    assert metrics.MEMORY_EVENTS.get(event="NONE") == 1
+
+
+def test_http_server_serves_metrics():
+    metrics.MEMORY_EVENTS.inc(event="DELETE")
+    server = metrics.start_http_server(0)
+    try:
+        assert server.server_address[0] == "127.0.0.1"
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            assert response.headers["Content-Type"] == metrics.CONTENT_TYPE
+    finally:
+        server.shutdown()
+
+    assert 'mem0_memory_events_total{event="DELETE"} 1' in body
+
+
+def test_metrics_endpoint_binds_to_localhost_by_default():
+    assert MetricsConfig(port=9464).host == "127.0.0.1"
@@ -0,0 +1,40 @@
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.memory.migration import migrate_embeddings
+
+
+def _memory(provider, collection_name):
+    memory = Mock()
+    memory.executor.stage.return_value.__enter__ = Mock()
+    memory.executor.stage.return_value.__exit__ = Mock(return_value=False)
+    memory.config.vector_store.provider = provider
+    memory.config.vector_store.config.collection_name = collection_name
+    memory.collection_name = collection_name
+    return memory
+
+
+def test_migrate_reembeds_into_target_in_batches():
+    source = _memory("qdrant", "mem0")
+    source.vector_store.iter_all.return_value = iter(
+        [Mock(id=str(index), payload={"data": f"memory {index}", "user_id": "alice"}) for index in range(5)]
+    )
+    target = _memory("qdrant", "mem0_256")
+    target.embedding_model.config.embedding_dims = 256
+    target.embedding_model.embed_batch.side_effect = lambda texts: [[0.0] * 256 for _ in texts]
+
+    report = migrate_embeddings(source, target, filters={"user_id": "alice"}, batch_size=2)
+
+    assert report == {"copied": 5, "collection_name": "mem0_256", "embedding_dims": 256}
+    source.vector_store.iter_all.assert_called_once_with(filters={"user_id": "alice"}, page_size=1000)
+    assert [len(call.kwargs["ids"]) for call in target.vector_store.insert.call_args_list] == [2, 2, 1]
+    first = target.vector_store.insert.call_args_list[0].kwargs
+    assert first["ids"] == ["0", "1"]
+    assert first["payloads"][1] == {"data": "memory 1", "user_id": "alice"}
+    target.embedding_model.embed_batch.assert_any_call(["memory 0", "memory 1"])
+
+
+def test_migrate_rejects_same_collection():
+    with pytest.raises(ValueError):
+        migrate_embeddings(_memory("qdrant", "mem0"), _memory("qdrant", "mem0"))
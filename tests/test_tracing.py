@@ -0,0 +1,88 @@
+import json
+from unittest.mock import Mock
+
+from mem0.memory.base import tracing
+from mem0.memory.base.executor import MemoryExecutor
+from mem0.memory.base.tracing import InMemorySpanExporter, JsonLinesSpanExporter, Tracer
+
+
+def test_span_is_noop_outside_trace():
+    with tracing.span("llm.extract_facts") as current:
+        assert current is None
+    tracing.record_llm_usage(10, 5)
+
+
+def test_spans_nest_across_executor_threads():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer([exporter])
+    executor = MemoryExecutor(max_workers=2, stage_limits={"llm": 1})
+
+    def call_llm():
+        with executor.stage("llm", "llm.extract_facts"):
+            tracing.record_llm_usage(prompt_tokens=12, completion_tokens=3, model="gpt-4o-mini")
+
+    try:
+        with tracer.trace("add") as root:
+            for future in [executor.submit(call_llm) for _ in range(2)]:
+                future.result()
+    finally:
+        executor.shutdown()
+
+    assert exporter.spans == [root]
+    assert [child.name for child in root.children] == ["llm.extract_facts", "llm.extract_facts"]
+    child = root.children[0]
+    assert child.attributes["stage"] == "llm"
+    assert child.attributes["prompt_tokens"] == 12
+    assert child.attributes["completion_tokens"] == 3
+    assert "wait_ms" in child.attributes
+
+    breakdown = root.breakdown()
+    assert set(breakdown) == {"llm.extract_facts", "total"}
+    assert breakdown["total"] >= 0
+
+
+def test_nested_trace_becomes_child_span():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer([exporter])
+
+    with tracer.trace("add") as root:
+        with tracer.trace("search") as inner:
+            pass
+
+    assert inner.parent is root
+    assert exporter.spans == [root]
+
+
+def test_disabled_tracer_opens_no_spans():
+    exporter = InMemorySpanExporter()
+    with Tracer([exporter], enabled=False).trace("add") as root:
+        assert root is None
+        assert tracing.current_span() is None
+    assert exporter.spans == []
+
+
+def test_jsonl_exporter_writes_one_line_per_trace(tmp_path):
+    path = tmp_path / "traces" / "traces.jsonl"
+    tracer = Tracer([JsonLinesSpanExporter(str(path))])
+
+    for _ in range(2):
+        with tracer.trace("search", mode="vector"):
+            with tracing.span("vector_store.search", stage="vector_store"):
+                pass
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["name"] == "search"
+    assert lines[0]["attributes"] == {"mode": "vector"}
+    assert lines[0]["children"][0]["name"] == "vector_store.search"
+
+
+def test_failing_exporter_does_not_break_the_call():
+    exporter = Mock()
+    exporter.export.side_effect = RuntimeError("collector down")
+    memory_exporter = InMemorySpanExporter()
+
+    with Tracer([exporter, memory_exporter]).trace("add"):
+        pass
+
+    assert len(memory_exporter.spans) == 1
@@ -0,0 +1,190 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from elasticsearch import NotFoundError
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.base.base import MemoryBase
+from mem0.vector_stores.esvector import ESVector
+
+
+@pytest.fixture
+def es():
+    with patch("mem0.vector_stores.esvector.Elasticsearch"), patch(
+        "mem0.vector_stores.esvector.AsyncElasticsearch"
+    ) as mock_async_es:
+        async_client = MagicMock()
+        async_client.indices.exists = AsyncMock(return_value=MagicMock(body=True))
+        for method in ("search", "msearch", "get", "update", "delete"):
+            setattr(async_client, method, AsyncMock())
+        async_client.options.return_value = async_client
+        mock_async_es.return_value = async_client
+        yield ESVector(collection_name="mem0", endpoint="http://localhost:9200", api_key="key")
+
+
+def hit(doc_id, text):
+    return {"_id": doc_id, "_score": 1.0, "_source": {"text": text, "metadata": {"user_id": "alice"}}}
+
+
+def test_async_client_uses_sync_credentials(es):
+    with patch("mem0.vector_stores.esvector.AsyncElasticsearch") as mock_async_es:
+        es._async_client = None
+        es.async_client
+    mock_async_es.assert_called_once_with(hosts="http://localhost:9200", api_key="key")
+
+
+def test_ainsert_bulk_indexes_on_async_client(es):
+    with patch("mem0.vector_stores.esvector.async_bulk", AsyncMock(return_value=(1, 0))) as mock_bulk:
+        ids = asyncio.run(es.ainsert([[0.1, 0.2]], [{"data": "Likes tennis", "user_id": "alice"}], ["1"]))
+
+    assert ids == ["1"]
+    client, requests = mock_bulk.await_args.args
+    assert client is es.async_client
+    assert requests[0]["text"] == "Likes tennis"
+    assert requests[0]["metadata"] == {"user_id": "alice"}
+
+
+def test_asearch_parses_hits(es):
+    es.async_client.search.return_value = {"hits": {"hits": [hit("1", "Likes tennis")]}}
+
+    results = asyncio.run(es.asearch([0.1, 0.2], limit=1, filters={"user_id": "alice"}))
+
+    assert results[0].id == "1"
+    assert results[0].payload == {"user_id": "alice", "data": "Likes tennis"}
+    es.client.search.assert_not_called()
+
+
+def test_asearch_batch_uses_one_msearch(es):
+    es.async_client.msearch.return_value = {
+        "responses": [{"hits": {"hits": [hit("1", "a")]}}, {"hits": {"hits": [hit("2", "b")]}}]
+    }
+
+    results = asyncio.run(es.asearch_batch([[0.1, 0.2], [0.3, 0.4]], limit=1))
+
+    assert [[r.id for r in res] for res in results] == [["1"], ["2"]]
+    assert len(es.async_client.msearch.await_args.kwargs["searches"]) == 4
+
+
+def test_aupdate_keeps_vector_when_none(es):
+    es.async_client.update.return_value = {"result": "updated"}
+
+    asyncio.run(es.aupdate("1", payload={"data": "Likes golf", "user_id": "alice"}))
+
+    doc = es.async_client.update.await_args.kwargs["doc"]
+    assert doc == {"text": "Likes golf", "metadata": {"user_id": "alice"}}
+
+
+def test_aget_adelete_and_alist(es):
+    es.async_client.get.return_value = hit("1", "Likes tennis")
+    es.async_client.search.return_value = {"hits": {"hits": [hit("1", "Likes tennis")]}}
+
+    assert asyncio.run(es.aget("1")).id == "1"
+    assert [r.id for r in asyncio.run(es.alist(filters={"user_id": "alice"}))[0]] == ["1"]
+    asyncio.run(es.adelete("1"))
+    es.async_client.delete.assert_awaited_once_with(index="mem0", id="1", refresh=True)
+
+
+def test_existing_client_falls_back_to_threads():
+    store = ESVector(collection_name="mem0", client=MagicMock())
+    store.client.get.return_value = hit("1", "Likes tennis")
+
+    assert store.async_client is None
+    assert asyncio.run(store.aget("1")).id == "1"
+
+
+def test_update_batch_without_vectors_keeps_stored_vectors(es):
+    with patch("mem0.vector_stores.esvector.bulk") as mock_bulk:
+        es.update_batch(["1", "2"], payloads=[{"data": "a", "user_id": "alice"}, {"data": "b"}])
+
+    docs = [action["doc"] for action in mock_bulk.call_args.args[1]]
+    assert docs == [{"text": "a", "metadata": {"user_id": "alice"}}, {"text": "b", "metadata": {}}]
+
+    with patch("mem0.vector_stores.esvector.bulk") as mock_bulk:
+        es.update_batch(["1"], vectors=[[0.1, 0.2]], payloads=[{"data": "a"}])
+
+    assert mock_bulk.call_args.args[1][0]["doc"]["vector"] == [0.1, 0.2]
+
+
+def test_aupdate_batch_and_adelete_batch_use_one_bulk_request(es):
+    with patch("mem0.vector_stores.esvector.async_bulk", AsyncMock(return_value=(2, 0))) as mock_bulk:
+        asyncio.run(es.aupdate_batch(["1", "2"], payloads=[{"data": "a"}, {"data": "b"}]))
+        client, requests = mock_bulk.await_args.args
+        assert client is es.async_client
+        assert [action["doc"] for action in requests] == [
+            {"text": "a", "metadata": {}},
+            {"text": "b", "metadata": {}},
+        ]
+
+        asyncio.run(es.adelete_batch(["1", "2"]))
+        assert [action["_id"] for action in mock_bulk.await_args.args[1]] == ["1", "2"]
+        assert mock_bulk.await_args.kwargs["ignore_status"] == 404
+    assert mock_bulk.await_count == 2
+
+
+class MissingIndexClient:
+    """Elasticsearch client whose index does not exist until it is created."""
+
+    def __init__(self):
+        self.created = False
+        self.indices = MagicMock()
+        self.indices.exists.side_effect = lambda index: MagicMock(body=self.created)
+        self.indices.create.side_effect = lambda **kwargs: setattr(self, "created", True)
+
+    def _check(self, kwargs=None):
+        if not self.created and not (kwargs or {}).get("ignore_unavailable"):
+            raise NotFoundError("index_not_found_exception", Mock(status=404), {})
+
+    def search(self, **kwargs):
+        self._check(kwargs)
+        return {"hits": {"hits": []}}
+
+    def msearch(self, searches):
+        self._check()
+        return {"responses": [{"hits": {"hits": []}} for _ in searches[::2]]}
+
+    def open_point_in_time(self, **kwargs):
+        self._check()
+        return {"id": "pit"}
+
+
+@pytest.fixture
+def memory_on_missing_index():
+    store = ESVector(collection_name="mem0", client=MissingIndexClient())
+    with patch("mem0.memory.base.base.EmbedderFactory") as mock_embedder, patch(
+        "mem0.memory.base.base.VectorStoreFactory"
+    ) as mock_vector_store, patch("mem0.memory.base.base.LlmFactory") as mock_llm, patch(
+        "mem0.memory.base.base.HistoryDBFactory"
+    ) as mock_db, patch("mem0.memory.base.base.capture_event"):
+        mock_embedder.create.return_value = Mock()
+        mock_vector_store.create.return_value = store
+        mock_llm.create.return_value = Mock()
+        mock_db.create.return_value = Mock()
+        yield MemoryBase(MemoryConfig(version="v1.1"))
+
+
+def test_reads_on_a_missing_index_are_empty(memory_on_missing_index):
+    store = memory_on_missing_index.vector_store
+
+    assert memory_on_missing_index.get_all(user_id="alice") == {"results": []}
+    assert store.keyword_search("tennis", filters={"user_id": "alice"}) == []
+    assert list(store.iter_all(filters={"user_id": "alice"})) == []
+
+
+def test_first_add_on_a_missing_index(memory_on_missing_index):
+    memory = memory_on_missing_index
+    memory.llm.generate_response = Mock(
+        side_effect=[
+            json.dumps({"facts": ["Likes tennis"]}),
+            json.dumps({"memory": [{"id": "0", "text": "Likes tennis", "event": "ADD"}]}),
+        ]
+    )
+    memory.embedding_model.embed_batch = Mock(return_value=[[0.1, 0.2]])
+
+    with patch("mem0.vector_stores.esvector.bulk", return_value=(1, 0)) as mock_bulk:
+        result = memory.add("I like tennis", user_id="alice")
+
+    assert result["results"] == [{"memory": "Likes tennis", "event": "ADD"}]
+    assert memory.vector_store.client.created
+    assert mock_bulk.call_args.args[1][0]["text"] == "Likes tennis"
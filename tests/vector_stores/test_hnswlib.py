@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from mem0.vector_stores.configs import VectorStoreConfig
+from mem0.vector_stores.hnswlib import HnswlibVectorStore
+
+
+def _store(**kwargs):
+    kwargs.setdefault("maintenance_interval", None)
+    return HnswlibVectorStore(collection_name="test", embedding_model_dims=3, max_elements=4, **kwargs)
+
+
+@pytest.fixture
+def store():
+    store = _store()
+    store.insert(
+        vectors=[[1, 0, 0], [0.9, 0.1, 0], [0, 1, 0], [0, 0, 1]],
+        payloads=[
+            {"user_id": "alice", "data": "likes tea", "hash": "a"},
+            {"user_id": "alice", "data": "likes green tea", "hash": "b", "category": "drinks"},
+            {"user_id": "alice", "data": "lives in Berlin", "hash": "c"},
+            {"user_id": "bob", "data": "likes tea", "hash": "a"},
+        ],
+        ids=["1", "2", "3", "4"],
+    )
+    return store
+
+
+def test_search_ranks_by_cosine_similarity(store):
+    results = store.search(query=[2, 0, 0], limit=2)
+
+    assert [result.id for result in results] == ["1", "2"]
+    assert results[0].score == pytest.approx(1.0)
+
+
+def test_filtered_search_uses_payload_table(store):
+    assert [r.id for r in store.search(query=[1, 0, 0], limit=2, filters={"user_id": "alice"})] == ["1", "2"]
+    assert [r.id for r in store.search(query=[1, 0, 0], filters={"category": "drinks"})] == ["2"]
+    assert [r.id for r in store.search(query=[0, 1, 0], filters={"hash": ["a", "c"], "user_id": "alice"})] == [
+        "3",
+        "1",
+    ]
+    assert store.search(query=[1, 0, 0], filters={"user_id": "carol"}) == []
+
+
+def test_filtered_search_through_the_graph(store):
+    store.brute_force_threshold = 0
+
+    results = store.search_batch(queries=[[1, 0, 0], [0, 1, 0]], limit=1, filters={"user_id": "alice"})
+
+    assert [[r.id for r in rows] for rows in results] == [["1"], ["3"]]
+
+
+def test_delete_leaves_tombstones_until_compaction(store):
+    store.delete(vector_id="1")
+    assert store.delete_by_filter({"user_id": "bob"}) == 1
+
+    assert store.get("1") is None
+    assert store.tombstones() == 2
+    assert [r.id for r in store.search(query=[1, 0, 0], limit=5)] == ["2", "3"]
+
+    store.compact()
+
+    assert store.tombstones() == 0
+    assert [r.id for r in store.search(query=[1, 0, 0], limit=5)] == ["2", "3"]
+
+
+def test_inserts_reuse_tombstones_and_grow_the_index(store):
+    store.delete(vector_id="4")
+    store.insert(vectors=[[0, 0, 1], [0, 0.5, 0.5]], payloads=[{"user_id": "bob"}, {"user_id": "bob"}], ids=["5", "6"])
+
+    assert store.tombstones() == 0
+    assert store.col_info()["count"] == 5
+    assert [r.id for r in store.search(query=[0, 0, 1], limit=2, filters={"user_id": "bob"})] == ["5", "6"]
+
+
+def test_update_vector_and_payload(store):
+    store.update(vector_id="3", vector=[0, 0, 1], payload={"user_id": "bob", "data": "lives in Paris", "hash": "d"})
+
+    assert store.get("3").payload["data"] == "lives in Paris"
+    results = store.search(query=[0, 0, 1], limit=2, filters={"user_id": "bob"})
+    assert {r.id for r in results} == {"3", "4"}
+    assert all(r.score == pytest.approx(1.0) for r in results)
+
+
+def test_list_and_iter_all(store):
+    assert [memory.id for memory in store.list(filters={"user_id": "alice"}, limit=2)[0]] == ["1", "2"]
+    assert [memory.id for memory in store.iter_all(filters={"data": "likes tea"}, page_size=1)] == ["1", "4"]
+
+
+def test_snapshot_is_loaded_and_later_writes_replayed(tmp_path):
+    store = _store(path=str(tmp_path), on_disk=True)
+    store.insert(vectors=[[1, 0, 0], [0, 1, 0]], payloads=[{"user_id": "alice"}, {"user_id": "bob"}], ids=["1", "2"])
+    store.save()
+    store.insert(vectors=[[0, 0, 1]], payloads=[{"user_id": "alice"}], ids=["3"])
+    store.delete(vector_id="2")
+
+    reopened = _store(path=str(tmp_path), on_disk=True)
+
+    assert reopened.col_info()["count"] == 2
+    assert [r.id for r in reopened.search(query=[0, 0, 1], limit=1)] == ["3"]
+    assert [r.id for r in reopened.search(query=[1, 0, 0], limit=5)] == ["1", "3"]
+    assert reopened.get("2") is None
+
+
+def test_background_maintenance_snapshots_changes(tmp_path):
+    store = _store(path=str(tmp_path), on_disk=True, maintenance_interval=0.01)
+    store.insert(vectors=np.eye(3).tolist(), ids=["1", "2", "3"])
+    store.close()
+
+    assert (tmp_path / "test.bin").exists()
+    assert store._dirty is False
+
+
+def test_config_exposes_search_tuning():
+    config = VectorStoreConfig(provider="hnswlib", config={"embedding_model_dims": 3, "ef_search": 128})
+
+    assert config.config.ef_search == 128
+    assert config.config.on_disk is False
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+
+from mem0.vector_stores.keyword import bm25_scan, tokenize
+
+
+def memory(id, data):
+    return SimpleNamespace(id=id, payload={"data": data})
+
+
+def test_tokenize_splits_codes_and_cjk():
+    assert tokenize("Order SKU-42") == ["order", "sku", "42"]
+    assert tokenize("住在北京") == ["住", "在", "北", "京", "住在", "在北", "北京"]
+
+
+def test_bm25_scan_ranks_matching_memories():
+    memories = [
+        memory(1, "Likes tennis"),
+        memory(2, "Ordered SKU-42 last week"),
+        memory(3, "Lives in Paris"),
+        memory(4, "Plays tennis and coaches tennis"),
+    ]
+
+    results = bm25_scan("tennis", iter(memories), limit=5)
+
+    assert [hit.id for hit in results] == ["4", "1"]
+    assert results[0].score > results[1].score
+
+
+def test_bm25_scan_without_matches():
+    assert bm25_scan("golf", [memory(1, "Likes tennis")], limit=5) == []
+    assert bm25_scan("", [memory(1, "Likes tennis")], limit=5) == []
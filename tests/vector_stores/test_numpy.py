@@ -0,0 +1,170 @@
+import time
+
+import numpy as np
+import pytest
+
+from mem0.vector_stores.configs import VectorStoreConfig
+from mem0.vector_stores.numpy import NumpyVectorStore
+
+
+@pytest.fixture
+def store():
+    store = NumpyVectorStore(collection_name="test", embedding_model_dims=3)
+    store.insert(
+        vectors=[[1, 0, 0], [0.9, 0.1, 0], [0, 1, 0], [0, 0, 1]],
+        payloads=[
+            {"user_id": "alice", "data": "likes tea", "hash": "a"},
+            {"user_id": "alice", "data": "likes green tea", "hash": "b", "agent_id": "helper"},
+            {"user_id": "alice", "data": "lives in Berlin", "hash": "c"},
+            {"user_id": "bob", "data": "likes tea", "hash": "a"},
+        ],
+        ids=["1", "2", "3", "4"],
+    )
+    return store
+
+
+def test_search_ranks_by_cosine_similarity_within_filters(store):
+    results = store.search(query=[2, 0, 0], limit=2, filters={"user_id": "alice"})
+
+    assert [result.id for result in results] == ["1", "2"]
+    assert results[0].score == pytest.approx(1.0)
+    assert store.search(query=[1, 0, 0], limit=5, filters={"user_id": "carol"}) == []
+
+
+def test_search_with_partition_and_payload_filters(store):
+    assert [r.id for r in store.search(query=[1, 0, 0], filters={"user_id": "alice", "agent_id": "helper"})] == ["2"]
+    assert [r.id for r in store.search(query=[1, 0, 0], filters={"hash": "a"})] == ["1", "4"]
+    assert [r.id for r in store.search(query=[1, 0, 0], filters={"hash": ["b", "c"], "user_id": "alice"})] == [
+        "2",
+        "3",
+    ]
+
+
+def test_search_batch_answers_each_query(store):
+    results = store.search_batch(queries=[[1, 0, 0], [0, 1, 0]], limit=1, filters={"user_id": "alice"})
+
+    assert [[r.id for r in rows] for rows in results] == [["1"], ["3"]]
+
+
+def test_update_moves_vector_between_partitions(store):
+    store.update(vector_id="3", payload={"user_id": "bob", "data": "lives in Paris", "hash": "d"})
+
+    assert store.get("3").payload["data"] == "lives in Paris"
+    assert [r.id for r in store.search(query=[0, 1, 0], limit=1, filters={"user_id": "bob"})] == ["3"]
+    assert store.search(query=[0, 1, 0], limit=5, filters={"hash": "c"}) == []
+
+
+def test_delete_keeps_remaining_rows_addressable(store):
+    store.delete(vector_id="1")
+
+    assert store.get("1") is None
+    assert [r.id for r in store.search(query=[1, 0, 0], limit=5, filters={"user_id": "alice"})] == ["2", "3"]
+    assert store.delete_by_filter({"user_id": "alice"}) == 2
+    assert [memory.id for memory in store.list()[0]] == ["4"]
+
+
+def test_list_and_iter_all_apply_filters(store):
+    assert [memory.id for memory in store.list(filters={"user_id": "alice"}, limit=2)[0]] == ["1", "2"]
+    assert [memory.id for memory in store.iter_all(filters={"data": "likes tea"})] == ["1", "4"]
+    assert store.col_info()["partitions"] == 3
+
+
+def test_on_disk_collection_survives_reopening(tmp_path):
+    store = NumpyVectorStore(collection_name="test", embedding_model_dims=3, path=str(tmp_path), on_disk=True)
+    store.insert(vectors=[[1, 0, 0], [0, 1, 0]], payloads=[{"user_id": "alice"}, {"user_id": "bob"}], ids=["1", "2"])
+    store.delete(vector_id="2")
+    store.close()
+
+    reopened = NumpyVectorStore(collection_name="test", embedding_model_dims=3, path=str(tmp_path), on_disk=True)
+
+    assert [r.id for r in reopened.search(query=[1, 0, 0], filters={"user_id": "alice"})] == ["1"]
+    assert reopened.get("2") is None
+
+
+def test_writes_are_snapshotted_on_flush_not_on_every_write(tmp_path):
+    options = {"path": str(tmp_path), "on_disk": True, "save_interval": None}
+    store = NumpyVectorStore(collection_name="test", embedding_model_dims=3, **options)
+    store.insert(vectors=[[1, 0, 0]], payloads=[{"user_id": "alice"}], ids=["1"])
+
+    assert not (tmp_path / "test.npz").exists()
+
+    store.flush()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["test.npz"]
+    store.insert(vectors=[[0, 1, 0]], payloads=[{"user_id": "alice"}], ids=["2"])
+
+    reopened = NumpyVectorStore(collection_name="test", embedding_model_dims=3, **options)
+    assert [memory.id for memory in reopened.list()[0]] == ["1"]
+
+
+def test_background_snapshots(tmp_path):
+    store = NumpyVectorStore(
+        collection_name="test", embedding_model_dims=3, path=str(tmp_path), on_disk=True, save_interval=0.01
+    )
+    store.insert(vectors=[[1, 0, 0]], payloads=[{"user_id": "alice"}], ids=["1"])
+
+    deadline = time.monotonic() + 5
+    while not (tmp_path / "test.npz").exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    store.close()
+
+    assert (tmp_path / "test.npz").exists()
+    assert store._saver is None
+
+
+def test_rejects_vectors_of_the_wrong_size(store):
+    with pytest.raises(ValueError):
+        store.insert(vectors=[[1, 0]], ids=["5"])
+
+
+def test_config_is_registered():
+    config = VectorStoreConfig(provider="numpy", config={"collection_name": "test", "embedding_model_dims": 3})
+
+    assert config.config.on_disk is False
+
+
+def _random_store(quantization=None, **kwargs):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(500, 64))
+    store = NumpyVectorStore(collection_name="test", embedding_model_dims=64, quantization=quantization, **kwargs)
+    store.insert(vectors=vectors, payloads=[{"user_id": "alice"}] * 500, ids=[str(i) for i in range(500)])
+    queries = vectors[:20] + rng.normal(scale=0.3, size=(20, 64))
+    return store, queries
+
+
+@pytest.mark.parametrize("quantization, ratio", [("float16", 2), ("int8", 4), ("binary", 32)])
+def test_quantization_shrinks_vectors(quantization, ratio):
+    full, _ = _random_store()
+    quantized, _ = _random_store(quantization)
+
+    assert full.col_info()["bytes"] == quantized.col_info()["bytes"] * ratio
+
+
+@pytest.mark.parametrize("quantization, rescore", [("float16", False), ("int8", False), ("binary", True)])
+def test_quantized_search_keeps_recall(quantization, rescore):
+    store, queries = _random_store(quantization, rescore=rescore, oversampling=4.0)
+
+    results = store.search_batch(queries=queries, limit=1, filters={"user_id": "alice"})
+
+    hits = sum(rows[0].id == str(i) for i, rows in enumerate(results))
+    assert hits >= 19
+
+
+def test_rescoring_returns_exact_scores():
+    store, queries = _random_store("binary", rescore=True)
+    query = queries[0] / np.linalg.norm(queries[0])
+
+    for result in store.search(query=query.tolist(), limit=3):
+        assert result.score == pytest.approx(float(store._original(result.id) @ query), abs=1e-5)
+
+
+def test_quantized_collection_survives_reopening(tmp_path):
+    options = {"path": str(tmp_path), "on_disk": True, "quantization": "int8"}
+    store = NumpyVectorStore(collection_name="test", embedding_model_dims=3, **options)
+    store.insert(vectors=[[1, 0, 0], [0, 1, 0]], payloads=[{"user_id": "alice"}] * 2, ids=["1", "2"])
+    store.close()
+
+    reopened = NumpyVectorStore(collection_name="test", embedding_model_dims=3, **options)
+
+    assert [r.id for r in reopened.search(query=[0, 1, 0], limit=1)] == ["2"]
+    with pytest.raises(ValueError):
+        NumpyVectorStore(collection_name="test", embedding_model_dims=3, path=str(tmp_path), on_disk=True)
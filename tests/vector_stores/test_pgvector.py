@@ -0,0 +1,185 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mem0.vector_stores.pgvector import PGVector, _numbered
+
+pytest.importorskip("asyncpg")
+
+
+@pytest.fixture
+def pg():
+    with patch("mem0.vector_stores.pgvector.psycopg2.connect") as mock_connect:
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("mem0",)]
+        cursor.fetchone.return_value = ("vector(3)",)
+        mock_connect.return_value.cursor.return_value = cursor
+        store = PGVector(
+            dbname="postgres",
+            collection_name="mem0",
+            embedding_model_dims=3,
+            user="user",
+            password="password",
+            host="localhost",
+            port=5432,
+            diskann=False,
+        )
+    pool = MagicMock()
+    for method in ("execute", "executemany", "fetch", "fetchrow"):
+        setattr(pool, method, AsyncMock())
+    with patch("asyncpg.create_pool", AsyncMock(return_value=pool)) as mock_create_pool:
+        store.mock_create_pool = mock_create_pool
+        yield store, pool
+
+
+def test_numbered_placeholders():
+    assert _numbered("SELECT %s, %s::vector WHERE id = %s") == "SELECT $1, $2::vector WHERE id = $3"
+
+
+def test_ainsert_uses_asyncpg_pool(pg):
+    store, pool = pg
+
+    asyncio.run(store.ainsert([[0.1, 0.2, 0.3]], [{"data": "Likes tennis"}], ["00000000-0000-0000-0000-000000000001"]))
+
+    store.mock_create_pool.assert_awaited_once()
+    assert store.mock_create_pool.await_args.kwargs["database"] == "postgres"
+    sql, rows = pool.executemany.await_args.args
+    assert "$2::vector" in sql
+    assert rows == [("00000000-0000-0000-0000-000000000001", [0.1, 0.2, 0.3], {"data": "Likes tennis"})]
+
+
+def test_asearch_batch_runs_one_lateral_query(pg):
+    store, pool = pg
+    pool.fetch.return_value = [(0, "1", 0.1, {"data": "a"}), (1, "2", 0.2, {"data": "b"})]
+
+    queries = [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]]
+    results = asyncio.run(store.asearch_batch(queries, limit=1, filters={"user_id": "alice"}))
+
+    assert [[r.id for r in res] for res in results] == [["1"], ["2"]]
+    sql, *params = pool.fetch.await_args.args
+    assert "%s" not in sql and "CROSS JOIN LATERAL" in sql
+    assert params == [0, [0.1, 0.2, 0.3], 1, [0.3, 0.2, 0.1], "user_id", "alice", 1]
+
+
+def test_aget_aupdate_adelete_alist(pg):
+    store, pool = pg
+    pool.fetchrow.return_value = ("1", {"data": "Likes tennis"})
+    pool.fetch.return_value = [("1", {"data": "Likes tennis"})]
+
+    assert asyncio.run(store.aget("1")).payload == {"data": "Likes tennis"}
+    assert [r.id for r in asyncio.run(store.alist(filters={"user_id": "alice"}, limit=10))[0]] == ["1"]
+    assert pool.fetch.await_args.args[1:] == ("user_id", "alice", 10)
+    asyncio.run(store.aupdate("1", payload={"data": "Likes golf"}))
+    assert pool.execute.await_args.args[1:] == ("1", None, {"data": "Likes golf"})
+    asyncio.run(store.adelete("1"))
+    assert pool.execute.await_args.args[1:] == ("1",)
+
+
+def test_aupdate_batch_and_adelete_batch(pg):
+    store, pool = pg
+
+    asyncio.run(store.aupdate_batch(["1", "2"], payloads=[{"data": "a"}, {"data": "b"}]))
+    assert pool.executemany.await_args.args[1] == [("1", None, {"data": "a"}), ("2", None, {"data": "b"})]
+    asyncio.run(store.adelete_batch(["1", "2"]))
+    sql, ids = pool.execute.await_args.args
+    assert "ANY($1::uuid[])" in sql and ids == ["1", "2"]
+
+
+def test_pool_is_reopened_for_a_new_event_loop(pg):
+    store, pool = pg
+
+    asyncio.run(store.adelete("1"))
+    asyncio.run(store.adelete("2"))
+
+    assert store.mock_create_pool.await_count == 2
+
+
+def test_connection_codecs_exchange_lists_and_dicts():
+    from mem0.vector_stores.pgvector import _init_async_connection
+
+    conn = MagicMock()
+    conn.set_type_codec = AsyncMock()
+    asyncio.run(_init_async_connection(conn))
+
+    vector_codec = conn.set_type_codec.await_args_list[0].kwargs
+    assert vector_codec["encoder"]([0.5, 1]) == "[0.5,1.0]"
+    assert vector_codec["decoder"]("[0.5,1]") == [0.5, 1.0]
+    jsonb_codec = conn.set_type_codec.await_args_list[-1].kwargs
+    assert jsonb_codec["encoder"]({"a": 1}) == json.dumps({"a": 1})
+
+
+def test_existing_table_gets_missing_indexes(pg):
+    store, _ = pg
+    executed = [call.args[0] for call in store.cur.execute.call_args_list]
+
+    assert not any("CREATE TABLE" in sql for sql in executed)
+    assert any("CREATE INDEX CONCURRENTLY IF NOT EXISTS mem0_hash_idx" in sql for sql in executed)
+    assert any("CREATE INDEX CONCURRENTLY IF NOT EXISTS mem0_keywords_idx" in sql for sql in executed)
+    assert not any("DROP INDEX" in sql for sql in executed)
+
+
+def test_indexes_are_built_outside_a_transaction():
+    with patch("mem0.vector_stores.pgvector.psycopg2.connect") as mock_connect:
+        conn = mock_connect.return_value
+        conn.autocommit = False
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = [("mem0",)]
+        cursor.fetchone.return_value = ("vector(3)",)
+        autocommit = {}
+        cursor.execute.side_effect = lambda sql, *args: autocommit.setdefault(sql.split(" ON ")[0], conn.autocommit)
+        PGVector(
+            dbname="postgres",
+            collection_name="mem0",
+            embedding_model_dims=3,
+            user="user",
+            password="password",
+            host="localhost",
+            port=5432,
+            diskann=False,
+        )
+
+    assert autocommit["CREATE INDEX CONCURRENTLY IF NOT EXISTS mem0_hash_idx"] is True
+    assert conn.autocommit is False
+
+
+def test_keyword_search_tokenizes_query_and_text_alike(pg):
+    store, _ = pg
+    store.cur.fetchall.return_value = [("1", 0.5, {"data": "住在東京"})]
+
+    results = store.keyword_search("東京", limit=3, filters={"user_id": "alice"})
+
+    sql, params = store.cur.execute.call_args.args
+    assert "plainto_tsquery('simple', mem0_keyword_text(%s))" in sql
+    assert "to_tsvector('simple', mem0_keyword_text(payload->>'data')) @@ q" in sql
+    assert params == ("東京", "user_id", "alice", 3)
+    assert [(r.id, r.score) for r in results] == [("1", 0.5)]
+
+
+def test_float16_on_an_existing_vector_table_falls_back(caplog):
+    with patch("mem0.vector_stores.pgvector.psycopg2.connect") as mock_connect:
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("mem0",)]
+        cursor.fetchone.return_value = ("vector(3)",)
+        mock_connect.return_value.cursor.return_value = cursor
+        with caplog.at_level("WARNING", logger="mem0.vector_stores.pgvector"):
+            store = PGVector(
+                dbname="postgres",
+                collection_name="mem0",
+                embedding_model_dims=3,
+                user="user",
+                password="password",
+                host="localhost",
+                port=5432,
+                diskann=False,
+                quantization="float16",
+            )
+
+    assert (store.vector_type, store.quantization) == ("vector", None)
+    assert "mem0-migrate-embeddings" in caplog.text
+    executed = [call.args[0] for call in cursor.execute.call_args_list]
+    assert not any("halfvec_cosine_ops" in sql for sql in executed)
+    cursor.fetchall.return_value = []
+    store.search([0.1, 0.2, 0.3], limit=1)
+    assert "::vector" in cursor.execute.call_args.args[0]
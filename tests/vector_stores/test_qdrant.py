@@ -3,17 +3,26 @@ from unittest.mock import MagicMock, patch
 import uuid
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    Datatype,
     Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    MatchValue,
     PointStruct,
     VectorParams,
     PointIdsList,
+    PayloadSchemaType,
 )
-from mem0.vector_stores.qdrant import Qdrant
+from mem0.vector_stores.qdrant import SUPPORTS_TENANT_INDEX, Qdrant
 
 
 class TestQdrant(unittest.TestCase):
     def setUp(self):
         self.client_mock = MagicMock(spec=QdrantClient)
+        self.client_mock.collection_exists.return_value = True
+        self.client_mock.get_collection.return_value = MagicMock(payload_schema={})
         self.qdrant = Qdrant(
             collection_name="test_collection",
             embedding_model_dims=128,
@@ -21,9 +30,10 @@ class TestQdrant(unittest.TestCase):
             path="test_path",
             on_disk=True,
         )
+        self.client_mock.reset_mock()
 
     def test_create_col(self):
-        self.client_mock.get_collections.return_value = MagicMock(collections=[])
+        self.client_mock.collection_exists.return_value = False
 
         self.qdrant.create_col(vector_size=128, on_disk=True)
 
@@ -32,6 +42,47 @@ class TestQdrant(unittest.TestCase):
         self.client_mock.create_collection.assert_called_with(
             collection_name="test_collection", vectors_config=expected_config
         )
+        self.client_mock.get_collections.assert_not_called()
+        indexed = [call.kwargs["field_name"] for call in self.client_mock.create_payload_index.call_args_list]
+        self.assertEqual(indexed, ["user_id", "agent_id", "run_id", "hash"])
+
+    def test_existing_collection_only_adds_missing_indexes(self):
+        self.client_mock.get_collection.return_value = MagicMock(payload_schema={"user_id": None, "hash": None})
+
+        Qdrant(
+            collection_name="test_collection",
+            embedding_model_dims=128,
+            client=self.client_mock,
+            payload_indexes=["category"],
+        )
+
+        self.client_mock.create_collection.assert_not_called()
+        indexed = [call.kwargs["field_name"] for call in self.client_mock.create_payload_index.call_args_list]
+        self.assertEqual(indexed, ["agent_id", "run_id", "category"])
+
+    @unittest.skipUnless(SUPPORTS_TENANT_INDEX, "tenant indexes need qdrant-client>=1.11")
+    def test_tenant_index_on_user_id(self):
+        self.client_mock.collection_exists.return_value = False
+
+        Qdrant(collection_name="test_collection", embedding_model_dims=128, client=self.client_mock, is_tenant=True)
+
+        self.assertEqual(self.client_mock.create_collection.call_args.kwargs["hnsw_config"].payload_m, 16)
+        user_index = self.client_mock.create_payload_index.call_args_list[0].kwargs
+        self.assertEqual(user_index["field_name"], "user_id")
+        self.assertTrue(user_index["field_schema"].is_tenant)
+
+    def test_tenant_index_falls_back_to_keyword_on_old_clients(self):
+        self.client_mock.collection_exists.return_value = False
+
+        with patch("mem0.vector_stores.qdrant.SUPPORTS_TENANT_INDEX", False), self.assertLogs(
+            "mem0.vector_stores.qdrant", level="WARNING"
+        ):
+            Qdrant(collection_name="test_collection", embedding_model_dims=128, client=self.client_mock, is_tenant=True)
+
+        self.assertEqual(self.client_mock.create_collection.call_args.kwargs["hnsw_config"].payload_m, 16)
+        user_index = self.client_mock.create_payload_index.call_args_list[0].kwargs
+        self.assertEqual(user_index["field_name"], "user_id")
+        self.assertEqual(user_index["field_schema"], PayloadSchemaType.KEYWORD)
 
     def test_insert(self):
         vectors = [[0.1, 0.2], [0.3, 0.4]]
@@ -51,15 +102,15 @@ class TestQdrant(unittest.TestCase):
 
     def test_search(self):
         query_vector = [0.1, 0.2]
-        self.client_mock.search.return_value = [
-            {"id": str(uuid.uuid4()), "score": 0.95, "payload": {"key": "value"}}
-        ]
+        self.client_mock.query_points.return_value = MagicMock(
+            points=[{"id": str(uuid.uuid4()), "score": 0.95, "payload": {"key": "value"}}]
+        )
 
         results = self.qdrant.search(query=query_vector, limit=1)
 
-        self.client_mock.search.assert_called_once_with(
+        self.client_mock.query_points.assert_called_once_with(
             collection_name="test_collection",
-            query_vector=query_vector,
+            query=query_vector,
             query_filter=None,
             limit=1,
         )
@@ -69,6 +120,66 @@ class TestQdrant(unittest.TestCase):
         self.assertIn("score", results[0])
         self.assertIn("payload", results[0])
 
+    def test_quantized_collection_searches_with_rescoring(self):
+        self.client_mock.collection_exists.return_value = False
+        qdrant = Qdrant(
+            collection_name="test_collection",
+            embedding_model_dims=128,
+            client=self.client_mock,
+            quantization="binary",
+            oversampling=3.0,
+        )
+
+        quantization_config = self.client_mock.create_collection.call_args.kwargs["quantization_config"]
+        self.assertIsInstance(quantization_config, BinaryQuantization)
+        self.client_mock.query_points.return_value = MagicMock(points=[])
+        qdrant.search(query=[0.1, 0.2], limit=1)
+        search_params = self.client_mock.query_points.call_args.kwargs["search_params"]
+        self.assertTrue(search_params.quantization.rescore)
+        self.assertEqual(search_params.quantization.oversampling, 3.0)
+
+    def test_float16_collection(self):
+        self.client_mock.collection_exists.return_value = False
+
+        Qdrant(
+            collection_name="test_collection",
+            embedding_model_dims=128,
+            client=self.client_mock,
+            quantization="float16",
+        )
+
+        vectors_config = self.client_mock.create_collection.call_args.kwargs["vectors_config"]
+        self.assertEqual(vectors_config.datatype, Datatype.FLOAT16)
+        self.assertNotIn("quantization_config", self.client_mock.create_collection.call_args.kwargs)
+
+    def test_quantization_of_an_existing_collection_is_kept(self):
+        with self.assertLogs("mem0.vector_stores.qdrant", level="WARNING") as logs:
+            qdrant = Qdrant(
+                collection_name="test_collection",
+                embedding_model_dims=128,
+                client=self.client_mock,
+                quantization="int8",
+            )
+
+        self.assertIn("mem0-migrate-embeddings", logs.output[0])
+        self.client_mock.create_collection.assert_not_called()
+        self.assertIsNone(qdrant.quantization)
+        self.assertIsNone(qdrant.search_params)
+
+    def test_search_batch(self):
+        queries = [[0.1, 0.2], [0.3, 0.4]]
+        self.client_mock.query_batch_points.return_value = [MagicMock(points=["hit1"]), MagicMock(points=["hit2"])]
+
+        results = self.qdrant.search_batch(queries=queries, limit=5, filters={"user_id": "alice"})
+
+        self.client_mock.query_batch_points.assert_called_once()
+        requests = self.client_mock.query_batch_points.call_args[1]["requests"]
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[0].query, queries[0])
+        self.assertEqual(requests[1].limit, 5)
+        self.assertEqual(requests[0].filter.must[0].key, "user_id")
+        self.assertEqual(results, [["hit1"], ["hit2"]])
+
     def test_delete(self):
         vector_id = str(uuid.uuid4())
         self.qdrant.delete(vector_id=vector_id)
@@ -78,6 +189,52 @@ class TestQdrant(unittest.TestCase):
             points_selector=PointIdsList(points=[vector_id]),
         )
 
+    def test_delete_by_filter(self):
+        self.qdrant.delete_by_filter({"user_id": "alice"})
+
+        self.client_mock.delete.assert_called_once_with(
+            collection_name="test_collection",
+            points_selector=FilterSelector(
+                filter=Filter(must=[FieldCondition(key="user_id", match=MatchValue(value="alice"))])
+            ),
+        )
+
+    def test_delete_by_filter_requires_filters(self):
+        with self.assertRaises(ValueError):
+            self.qdrant.delete_by_filter({})
+
+    def test_iter_all_follows_scroll_offset(self):
+        first = [MagicMock(id="1"), MagicMock(id="2")]
+        second = [MagicMock(id="3")]
+        self.client_mock.scroll.side_effect = [(first, "3"), (second, None)]
+
+        result = list(self.qdrant.iter_all(filters={"user_id": "alice"}, page_size=2))
+
+        self.assertEqual([point.id for point in result], ["1", "2", "3"])
+        self.assertEqual(self.client_mock.scroll.call_count, 2)
+        self.assertIsNone(self.client_mock.scroll.call_args_list[0].kwargs["offset"])
+        self.assertEqual(self.client_mock.scroll.call_args_list[1].kwargs["offset"], "3")
+
+    def test_delete_batch(self):
+        ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+
+        self.qdrant.delete_batch(ids)
+
+        self.client_mock.delete.assert_called_once_with(
+            collection_name="test_collection",
+            points_selector=PointIdsList(points=ids),
+        )
+
+    def test_update_batch(self):
+        ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+
+        self.qdrant.update_batch(ids, vectors=[[0.1], [0.2]], payloads=[{"data": "a"}, {"data": "b"}])
+
+        self.client_mock.upsert.assert_called_once()
+        points = self.client_mock.upsert.call_args[1]["points"]
+        self.assertEqual([point.id for point in points], ids)
+        self.assertEqual([point.payload for point in points], [{"data": "a"}, {"data": "b"}])
+
     def test_update(self):
         vector_id = str(uuid.uuid4())
         updated_vector = [0.2, 0.3]